@@ -0,0 +1,219 @@
+"""
+Module: ack_hub.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Dedicated ACK routing service for all CMB channels.
+
+Channel routers no longer bind an ACK socket. They PUSH resolved ACKs as
+[dest_identity][payload] to the hub ingress (tcp, or inproc when the router
+runs in the same process). The hub shards ACKs by destination identity:
+
+    routers --PUSH--> ingress PULL (frontend thread)
+                         |  crc32(dest) % shards
+                         v
+                  shard i: inproc PULL -> egress ROUTER (port + i) --> module ACK DEALER
+
+Each shard owns its own egress socket and thread, so ACK delivery is no
+longer serialized through one ROUTER bind, and per-target ordering is kept
+(one target always maps to one shard). Modules connect their ACK socket to
+ack_egress_port(base, module_id, shards).
+"""
+
+from __future__ import annotations
+
+import threading
+import zlib
+from typing import List, Optional
+
+import zmq
+
+from src.core.cmb.cmb_channel_config import (
+    CMB_ACK_HUB_EGRESS_PORT,
+    CMB_ACK_HUB_INGRESS_PORT,
+    CMB_ACK_HUB_INPROC,
+    CMB_ACK_HUB_SHARDS,
+)
+from src.core.monitoring.metrics import metrics_registry
+from src.core.logging.log_manager import Logger
+from src.core.logging.log_hub import log_hub
+
+
+# ----------------------------
+# Shard mapping (shared with ModuleEndpoint)
+# ----------------------------
+
+def ack_shard(identity: str | bytes, shards: int) -> int:
+    """Stable shard index for a module identity."""
+    if shards <= 1:
+        return 0
+    if isinstance(identity, str):
+        identity = identity.encode("utf-8")
+    return zlib.crc32(identity) % shards
+
+
+def ack_egress_port(base_port: int, identity: str | bytes, shards: int) -> int:
+    """Egress port of the hub shard that delivers ACKs to this identity."""
+    return base_port + ack_shard(identity, shards)
+
+
+# ----------------------------
+# ACK hub
+# ----------------------------
+
+class AckHub:
+    def __init__(
+        self,
+        host: str = "localhost",
+        *,
+        ingress_port: int = CMB_ACK_HUB_INGRESS_PORT,
+        egress_port: int = CMB_ACK_HUB_EGRESS_PORT,
+        shards: int = CMB_ACK_HUB_SHARDS,
+        inproc_address: Optional[str] = CMB_ACK_HUB_INPROC,
+    ):
+        if shards < 1:
+            raise ValueError("AckHub needs at least one shard")
+
+        self.host = host
+        self.ingress_port = ingress_port
+        self.egress_port = egress_port
+        self.shards = shards
+        self.inproc_address = inproc_address
+
+        self._stop_evt = threading.Event()
+        self._threads: List[threading.Thread] = []
+        # Unique per instance so several hubs can share Context.instance()
+        self._shard_prefix = f"inproc://cmb.ack_hub.{id(self):x}.shard"
+
+        # Logging
+        self.log_manager = log_hub()
+        self.logger = Logger("ACK_HUB", self.log_manager)
+
+        # Metrics (each counter has a single writer thread)
+        metrics = metrics_registry()
+        self._m_ingress = metrics.counter(
+            "cmb_ack_hub_received_total", "ACKs received from channel routers"
+        )
+        self._m_invalid = metrics.counter(
+            "cmb_ack_hub_invalid_total", "Malformed ACK frames dropped by the hub"
+        )
+        self._m_forwarded = [
+            metrics.counter(
+                "cmb_ack_hub_forwarded_total",
+                "ACKs delivered to module ACK sockets",
+                shard=str(i),
+            )
+            for i in range(shards)
+        ]
+
+    # --------------------------
+    # Lifecycle
+    # --------------------------
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop_evt.clear()
+
+        # Shards bind their inproc sockets before the frontend connects
+        ready = [threading.Event() for _ in range(self.shards)]
+        for i in range(self.shards):
+            t = threading.Thread(
+                target=self._run_shard,
+                args=(i, ready[i]),
+                name=f"AckHubShard[{i}]",
+                daemon=False,
+            )
+            t.start()
+            self._threads.append(t)
+        for evt in ready:
+            evt.wait(timeout=2.0)
+
+        frontend = threading.Thread(target=self._run_frontend, name="AckHubFrontend", daemon=False)
+        frontend.start()
+        self._threads.append(frontend)
+
+        self.logger.info(
+            event_type="ACK_HUB_START",
+            message=f"ACK hub started: ingress {self.ingress_port}, egress {self.egress_port}..{self.egress_port + self.shards - 1}",
+            payload={
+                "shards": self.shards,
+                "inproc": self.inproc_address,
+            },
+        )
+
+    def stop(self) -> None:
+        self._stop_evt.set()
+        for t in self._threads:
+            t.join(timeout=2.0)
+        self._threads = []
+
+        self.logger.info(
+            event_type="ACK_HUB_STOP",
+            message="ACK hub stopped",
+        )
+        self.log_manager.flush(timeout=1.0)
+
+    # --------------------------
+    # Threads
+    # --------------------------
+
+    def _run_frontend(self) -> None:
+        ctx = zmq.Context.instance()
+        ingress = ctx.socket(zmq.PULL)
+        ingress.bind(f"tcp://{self.host}:{self.ingress_port}")
+        if self.inproc_address:
+            ingress.bind(self.inproc_address)
+
+        shard_socks = []
+        for i in range(self.shards):
+            sock = ctx.socket(zmq.PUSH)
+            sock.connect(f"{self._shard_prefix}.{i}")
+            shard_socks.append(sock)
+
+        poller = zmq.Poller()
+        poller.register(ingress, zmq.POLLIN)
+
+        try:
+            while not self._stop_evt.is_set():
+                if not poller.poll(100):
+                    continue
+
+                # [dest][payload]
+                frames = ingress.recv_multipart(copy=False)
+                self._m_ingress.inc()
+                if len(frames) < 2 or not len(frames[0]):
+                    self._m_invalid.inc()
+                    continue
+
+                shard = ack_shard(frames[0].bytes, self.shards)
+                shard_socks[shard].send_multipart(frames, copy=False)
+        finally:
+            ingress.close(linger=0)
+            for sock in shard_socks:
+                sock.close(linger=0)
+
+    def _run_shard(self, index: int, ready: threading.Event) -> None:
+        ctx = zmq.Context.instance()
+        inbox = ctx.socket(zmq.PULL)
+        inbox.bind(f"{self._shard_prefix}.{index}")
+
+        egress = ctx.socket(zmq.ROUTER)
+        egress.bind(f"tcp://{self.host}:{self.egress_port + index}")
+        ready.set()
+
+        forwarded = self._m_forwarded[index]
+        poller = zmq.Poller()
+        poller.register(inbox, zmq.POLLIN)
+
+        try:
+            while not self._stop_evt.is_set():
+                if not poller.poll(100):
+                    continue
+                dest, *rest = inbox.recv_multipart(copy=False)
+                # ROUTER -> DEALER: [dest_identity][empty][payload]
+                egress.send_multipart([dest, b"", *rest], copy=False)
+                forwarded.inc()
+        finally:
+            inbox.close(linger=0)
+            egress.close(linger=0)
@@ -0,0 +1,31 @@
+# src/core/cmb/ack_hub_entry.py
+
+import argparse
+import time
+from src.core.cmb.ack_hub import AckHub
+from src.core.cmb.cmb_channel_config import CMB_ACK_HUB_SHARDS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="CMB ACK hub")
+    parser.add_argument("--shards", type=int, default=CMB_ACK_HUB_SHARDS, help="Egress shards (ports 6102..6102+N-1)")
+    parser.add_argument("--host", default="localhost")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+
+    hub = AckHub(host=args.host, shards=args.shards)
+    hub.start()
+
+    # Block until interrupted so SIGINT (e.g. from the supervisor) drains cleanly
+    try:
+        while True:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        hub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Module: aux_frames.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Explicit layout of the binary frames that follow a CMB message payload.
+
+Whenever a message carries aux frames, the frame right after the payload
+is a layout frame with one kind byte per aux frame:
+
+    [payload][layout "TBBQH"][tensor header][buf 0][buf 1][seq][trace]
+
+Receivers and routers read each frame's role from the layout instead of
+sniffing its leading bytes, so a tensor or chunk buffer that happens to
+start like a trailer is never misparsed. Routers forward the layout with
+the aux frames and rewrite it only when they strip or add the trace.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence, Tuple
+
+
+AUX_TENSOR_HEADER = "T"     # tensor_frames header
+AUX_TENSOR_BUFFER = "B"     # tensor_frames buffer
+AUX_COMPRESSED = "Z"        # compression: compressed payload
+AUX_CHUNK = "C"             # chunking: chunk data
+AUX_SEQ = "Q"               # sequencing: sequence trailer
+AUX_TRACE = "H"             # hop_trace: hop trace trailer
+
+AUX_KINDS = frozenset(AUX_TENSOR_HEADER + AUX_TENSOR_BUFFER + AUX_COMPRESSED + AUX_CHUNK + AUX_SEQ + AUX_TRACE)
+
+
+def pack_aux(kinds: str, frames: Sequence[Any]) -> list:
+    """[layout, *frames] for a message's aux frames ([] when there are none)."""
+    if len(kinds) != len(frames):
+        raise ValueError(f"Aux layout {kinds!r} does not match {len(frames)} frames")
+    if not frames:
+        return []
+    return [kinds.encode("ascii"), *frames]
+
+
+def unpack_aux(frames: Sequence[Any]) -> Tuple[str, list]:
+    """
+    (kinds, aux frames) from the frames after a payload.
+
+    Raises ValueError for a layout that does not describe the frames.
+    """
+    if not frames:
+        return "", []
+    layout = frames[0]
+    try:
+        kinds = (layout if isinstance(layout, (bytes, bytearray)) else layout.bytes).decode("ascii")
+    except UnicodeDecodeError:
+        raise ValueError("Aux layout frame is not ASCII") from None
+    if len(kinds) != len(frames) - 1 or not AUX_KINDS.issuperset(kinds):
+        raise ValueError(f"Aux layout {kinds!r} does not match {len(frames) - 1} frames")
+    return kinds, list(frames[1:])
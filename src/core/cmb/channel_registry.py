@@ -13,6 +13,17 @@ from typing import Dict
 
 import zmq
 
+from src.core.cmb.compression import CompressionSettings
+from src.core.cmb.delivery_policy import DeliveryPolicy
+from src.core.cmb.schema_registry import SchemaValidation, ValidationPoint
+from src.core.cmb.transport_qos import (
+    BULK_QOS,
+    CONTROL_QOS,
+    DEFAULT_QOS,
+    STREAM_QOS,
+    TransportQoS,
+)
+
 from src.core.logging.log_manager import LogManager, Logger
 from src.core.logging.log_entry import LogEntry
 from src.core.logging.log_severity import LogSeverity
@@ -55,6 +66,21 @@ class ChannelConfig:
     ack_port: int | None = None
     ack_socket_type: int = zmq.DEALER
 
+    # Socket tuning / IO-thread pool, applied by router and endpoints
+    qos: TransportQoS = DEFAULT_QOS
+
+    # ACK policy for messages that do not set their own (see delivery_policy.py)
+    delivery: DeliveryPolicy = DeliveryPolicy.END_TO_END
+
+    # Sequence numbers + receiver reordering per (source, channel, target)
+    ordered: bool = False
+
+    # Adaptive payload compression (see compression.py); None = off
+    compression: CompressionSettings | None = None
+
+    # Payload schema validation (see schema_registry.py); None = off
+    validation: SchemaValidation | None = None
+
 # ----------------------------
 # Legacy port assignments
 # ----------------------------
@@ -112,6 +138,65 @@ CMB_ACK_EGRESS_PORTS = {
     "TC":  6102    # Threat Channel
 }
 
+# Transport QoS profile per channel (see transport_qos.py)
+CMB_CHANNEL_QOS = {
+    "CC":   CONTROL_QOS,
+    "SMC":  DEFAULT_QOS,
+    "VB":   BULK_QOS,
+    "BFC":  DEFAULT_QOS,
+    "DAC":  DEFAULT_QOS,
+    "EIG":  DEFAULT_QOS,
+    "PC":   STREAM_QOS,
+    "MC":   BULK_QOS,
+    "IC":   CONTROL_QOS,
+    "TC":   CONTROL_QOS
+}
+
+
+def channel_qos(channel_name: str) -> TransportQoS:
+    return CMB_CHANNEL_QOS.get(channel_name, DEFAULT_QOS)
+
+
+# Default delivery policy per channel; DAC carries telemetry (metric
+# samples, diagnostics) where a lost sample is cheaper than two ACKs each
+CMB_CHANNEL_DELIVERY = {
+    "DAC":  DeliveryPolicy.NONE,
+}
+
+
+def channel_delivery(channel_name: str) -> DeliveryPolicy:
+    return CMB_CHANNEL_DELIVERY.get(channel_name, DeliveryPolicy.END_TO_END)
+
+
+# Channels whose messages are sequenced and delivered in send order per
+# (source, target): control traffic such as EXEC task queue updates
+CMB_ORDERED_CHANNELS = {"CC", "TC"}
+
+
+# Channels carrying verbose JSON payloads (plans, task queues, intents)
+# compressed above a size threshold with the schema-trained dictionary
+CMB_CHANNEL_COMPRESSION = {
+    "CC":   CompressionSettings(),
+    "SMC":  CompressionSettings(),
+}
+
+
+def channel_compression(channel_name: str) -> CompressionSettings | None:
+    return CMB_CHANNEL_COMPRESSION.get(channel_name)
+
+
+# Payload schema validation: control-plane messages (directives, intents,
+# plans, task queues) are checked by the receiving endpoint; message types
+# without a registered schema pass unchecked
+CMB_CHANNEL_VALIDATION = {
+    "CC":   SchemaValidation(at=ValidationPoint.RECEIVER),
+}
+
+
+def channel_validation(channel_name: str) -> SchemaValidation | None:
+    return CMB_CHANNEL_VALIDATION.get(channel_name)
+
+
 CMB_ACK_PORT = 6102        # Shared ACK ingress/egress (current policy)
 SUBSCRIPTION_OFFSET = 1000
 
@@ -149,6 +234,10 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["CC"],
                 ack_port=CMB_ACK_EGRESS_PORTS["CC"],
+                qos=CMB_CHANNEL_QOS["CC"],
+                ordered="CC" in CMB_ORDERED_CHANNELS,
+                compression=channel_compression("CC"),
+                validation=channel_validation("CC"),
             ),
 
             "SMC": ChannelConfig(
@@ -157,6 +246,8 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["SMC"],
                 ack_port=CMB_ACK_EGRESS_PORTS["SMC"],
+                qos=CMB_CHANNEL_QOS["SMC"],
+                compression=channel_compression("SMC"),
             ),
 
             "VB": ChannelConfig(
@@ -165,6 +256,7 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["VB"],
                 ack_port=CMB_ACK_PORT,
+                qos=CMB_CHANNEL_QOS["VB"],
             ),
 
             "BFC": ChannelConfig(
@@ -173,6 +265,7 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["BFC"],
                 ack_port=CMB_ACK_PORT,
+                qos=CMB_CHANNEL_QOS["BFC"],
             ),
 
             "DAC": ChannelConfig(
@@ -181,6 +274,8 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["DAC"],
                 ack_port=CMB_ACK_PORT,
+                qos=CMB_CHANNEL_QOS["DAC"],
+                delivery=CMB_CHANNEL_DELIVERY["DAC"],
             ),
 
             "IC": ChannelConfig(
@@ -189,6 +284,7 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["IC"],
                 ack_port=CMB_ACK_PORT,
+                qos=CMB_CHANNEL_QOS["IC"],
             ),
 
             "TC": ChannelConfig(
@@ -197,6 +293,8 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.DIRECTED,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["TC"],
                 ack_port=CMB_ACK_PORT,
+                qos=CMB_CHANNEL_QOS["TC"],
+                ordered="TC" in CMB_ORDERED_CHANNELS,
             ),
 
             # Broadcast-style channels
@@ -206,6 +304,7 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.BROADCAST,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["PC"] + SUBSCRIPTION_OFFSET,
                 ack_port=None,
+                qos=CMB_CHANNEL_QOS["PC"],
             ),
 
             "MC": ChannelConfig(
@@ -214,6 +313,7 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.BROADCAST,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["MC"] + SUBSCRIPTION_OFFSET,
                 ack_port=None,
+                qos=CMB_CHANNEL_QOS["MC"],
             ),
 
             "EIG": ChannelConfig(
@@ -222,6 +322,7 @@ class ChannelRegistry:
                 inbound_delivery=InboundDelivery.BROADCAST,
                 inbound_port=CMB_CHANNEL_EGRESS_PORTS["EIG"] + SUBSCRIPTION_OFFSET,
                 ack_port=None,
+                qos=CMB_CHANNEL_QOS["EIG"],
             ),
         }
 
@@ -0,0 +1,398 @@
+"""
+Module: chunking.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Chunked transfer of large messages over the CMB.
+
+Large payloads are split into chunks that travel as ordinary routed
+messages, so they interleave with small control traffic at the endpoint
+and the router instead of occupying both while one huge frame is copied:
+
+    [chunk envelope JSON][layout "C"][chunk bytes]
+
+The envelope is CognitiveMessage-shaped (msg_type CHUNK_MSG_TYPE, the
+original message_id, source and targets) so routers route it unchanged;
+the chunk itself is a separate zero-copy frame. On ordered channels the
+transfer takes its sequence number when it starts; the first chunk (and
+an abort notice) carries it as a sequence frame, so the receiver can hold
+later messages until the transfer is delivered. Envelope payload:
+
+    {"mode": "message" | "stream", "seq": n, "last": bool,
+     "window": w,               # seq 0: sender's window
+     "header": {...},           # stream mode, seq 0: the message dict
+     "abort": reason}           # sender gave up; no chunk frame follows
+
+Two modes:
+
+- "message": transparent chunking of a serialized message above the
+  endpoint's threshold; the receiver reassembles (bounded) and delivers the
+  original message.
+- "stream": ModuleEndpoint.send_stream(); the receiver delivers the header
+  message at once with msg.stream, a ChunkStream that yields chunks as they
+  arrive, so the payload never has to be materialised.
+
+Flow control: a sender keeps at most `window` chunks of a stream
+unacknowledged. Receivers send CHUNK_WINDOW_ACK (on the ACK path) every
+window // 2 chunks - on receipt in message mode, on consumption in stream
+mode, which bounds a stream's buffered chunks by the window.
+
+A sender that drops a transfer sends an abort envelope; receivers also
+expire transfers idle for longer than the stall timeout (Reassembler.tick),
+so a dead sender cannot hold reassembly buffer space.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.core.cmb.aux_frames import AUX_CHUNK, AUX_SEQ, pack_aux
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+CHUNK_MSG_TYPE = "CMB_CHUNK"
+WINDOW_ACK_TYPE = "CHUNK_WINDOW_ACK"
+
+MODE_MESSAGE = "message"
+MODE_STREAM = "stream"
+
+
+def ack_interval(window: int) -> int:
+    """Chunks between window ACKs (half a window keeps the pipe full)."""
+    return max(1, window // 2)
+
+
+def iter_chunks(data: Union[bytes, bytearray, memoryview, Iterable[bytes]], chunk_size: int) -> Iterator[memoryview]:
+    """Zero-copy slices of at most chunk_size bytes."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = (data,)
+    for piece in data:
+        view = memoryview(piece)
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+
+
+def envelope_fields(message: dict) -> dict:
+    """The routing fields of a message dict (drops the possibly large payload)."""
+    return {
+        k: message[k]
+        for k in ("message_id", "schema_version", "source", "targets", "context_tag", "priority", "ttl", "delivery")
+        if k in message
+    }
+
+
+def chunk_envelope(
+    message: dict,
+    *,
+    mode: str,
+    seq: int,
+    last: bool,
+    header: Optional[dict] = None,
+    window: Optional[int] = None,
+    abort: Optional[str] = None,
+) -> bytes:
+    """Envelope for one chunk of `message` (a CognitiveMessage dict)."""
+    payload = {"mode": mode, "seq": seq, "last": last}
+    if window is not None:
+        payload["window"] = window
+    if header is not None:
+        payload["header"] = header
+    if abort is not None:
+        payload["abort"] = abort
+    return json.dumps({
+        "message_id": message["message_id"],
+        "schema_version": message.get("schema_version", CognitiveMessage.get_schema_version()),
+        "msg_type": CHUNK_MSG_TYPE,
+        "msg_version": "0.1.0",
+        "source": message["source"],
+        "targets": message.get("targets", []),
+        "context_tag": message.get("context_tag"),
+        "correlation_id": message["message_id"],
+        "payload": payload,
+        "priority": message.get("priority", 50),
+        "timestamp": time.time(),
+        "ttl": message.get("ttl", 10.0),
+        "signature": None,
+        "delivery": message.get("delivery"),
+    }).encode("utf-8")
+
+
+# ----------------------------
+# Sender side
+# ----------------------------
+
+class OutboundStream:
+    """
+    One chunked transfer being sent. Owned by the endpoint thread.
+
+    The chunk source is pulled lazily (one chunk of lookahead to know which
+    chunk is last), so generator sources are only read as the window allows.
+    A source that raises sets `error`; the transfer must then be aborted.
+    `seq` is the transfer's sequence frame on ordered channels.
+    """
+
+    def __init__(
+        self,
+        *,
+        channel: str,
+        message: dict,
+        mode: str,
+        data,
+        chunk_size: int,
+        window: int,
+        seq: Optional[bytes] = None,
+    ):
+        self.channel = channel
+        self.message = message
+        self.message_id = message["message_id"]
+        self.mode = mode
+        self.window = window
+        self.seq = seq
+
+        self.error: Optional[str] = None
+        self._chunks = iter_chunks(data, chunk_size)
+        self._current = self._pull() or memoryview(b"")         # Empty data: one empty chunk
+        self._upcoming = self._pull()
+        self.next_seq = 0
+        self.acked = 0                  # Chunks confirmed by the receiver
+        self.last_progress = time.monotonic()
+        self.done = False               # Last chunk handed to ZMQ
+
+    def _pull(self) -> Optional[memoryview]:
+        if self.error is not None:
+            return None
+        try:
+            return next(self._chunks, None)
+        except Exception as e:
+            # Runs on the endpoint thread: a failing user iterable must not
+            # escape into it
+            self.error = repr(e)
+            return None
+
+    def can_send(self) -> bool:
+        return not self.done and self.error is None and self.next_seq - self.acked < self.window
+
+    def next_frames(self) -> list:
+        """Frames for the next chunk; call commit() once they were sent."""
+        first = self.next_seq == 0
+        envelope = chunk_envelope(
+            self.message,
+            mode=self.mode,
+            seq=self.next_seq,
+            last=self._upcoming is None,
+            header=self.message if (first and self.mode == MODE_STREAM) else None,
+            window=self.window if first else None,
+        )
+        if first and self.seq is not None:
+            return [envelope, *pack_aux(AUX_CHUNK + AUX_SEQ, [self._current, self.seq])]
+        return [envelope, *pack_aux(AUX_CHUNK, [self._current])]
+
+    def abort_frames(self, reason: str) -> list:
+        """Frames telling the receiver this transfer was dropped."""
+        envelope = chunk_envelope(self.message, mode=self.mode, seq=self.next_seq, last=True, abort=reason)
+        if self.seq is not None:
+            return [envelope, *pack_aux(AUX_SEQ, [self.seq])]
+        return [envelope]
+
+    def commit(self) -> None:
+        self.next_seq += 1
+        if self._upcoming is None:
+            self.done = True
+            return
+        self._current = self._upcoming
+        self._upcoming = self._pull()
+
+    def on_window_ack(self, received: int) -> None:
+        if received > self.acked:
+            self.acked = received
+            self.last_progress = time.monotonic()
+
+
+# ----------------------------
+# Receiver side
+# ----------------------------
+
+class ChunkStream:
+    """
+    Iterator over the chunks of a streamed message (msg.stream).
+
+    Chunks are handed over as they arrive; iteration blocks until the next
+    chunk or the end of the stream. Consuming chunks opens the sender's
+    window, so a slow handler slows the sender instead of growing buffers.
+    """
+
+    def __init__(self, message_id: str, on_consumed: Callable[[int], None], timeout_s: float = 30.0):
+        self.message_id = message_id
+        self.timeout_s = timeout_s
+        self._q: "queue.Queue[object]" = queue.Queue()
+        self._on_consumed = on_consumed
+        self._consumed = 0
+        self._finished = False
+
+    # Endpoint thread
+    def _put(self, chunk: memoryview) -> None:
+        self._q.put(chunk)
+
+    def _end(self, error: Optional[str] = None) -> None:
+        self._q.put(StreamAborted(error) if error else _END)
+
+    # Module thread
+    def __iter__(self) -> "ChunkStream":
+        return self
+
+    def __next__(self) -> memoryview:
+        if self._finished:
+            raise StopIteration
+        try:
+            item = self._q.get(timeout=self.timeout_s)
+        except queue.Empty:
+            raise StreamAborted(f"no chunk for {self.timeout_s}s") from None
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, StreamAborted):
+            self._finished = True
+            raise item
+        self._consumed += 1
+        self._on_consumed(self._consumed)
+        return item
+
+    def read_all(self) -> bytes:
+        return b"".join(bytes(chunk) for chunk in self)
+
+
+class StreamAborted(Exception):
+    """A chunked transfer ended early (gap, overflow or timeout)."""
+
+
+_END = object()
+
+
+class _InboundTransfer:
+    def __init__(self, mode: str, channel: str, window: int):
+        self.mode = mode
+        self.channel = channel
+        self.ack_every = ack_interval(window)
+        self.next_seq = 0
+        self.parts: List[memoryview] = []
+        self.size = 0
+        self.stream: Optional[ChunkStream] = None
+        self.last_activity = time.monotonic()       # Last chunk received or consumed
+
+
+class Reassembler:
+    """
+    Receiver-side state of inbound chunked transfers. Owned by the endpoint
+    thread; keyed by (source, message_id).
+
+    Message-mode buffers are bounded by max_buffered_bytes across all
+    transfers; a transfer that would exceed it is aborted. Stream mode
+    buffers at most one window per transfer (ACKs follow consumption).
+    Transfers idle for stream_timeout_s are dropped by tick().
+    """
+
+    def __init__(
+        self,
+        max_buffered_bytes: int,
+        on_window_ack: Callable[[tuple, str, int], None],
+        stream_timeout_s: float = 30.0,
+    ):
+        self.max_buffered_bytes = max_buffered_bytes
+        self.buffered_bytes = 0
+        self._on_window_ack = on_window_ack
+        self._stream_timeout_s = stream_timeout_s
+        self._transfers: Dict[tuple, _InboundTransfer] = {}
+
+    def __len__(self) -> int:
+        return len(self._transfers)
+
+    def on_chunk(self, key: tuple, channel: str, envelope: dict, chunk: memoryview) -> tuple:
+        """
+        Apply one chunk. Returns (event, value):
+
+            ("stream", (header dict, ChunkStream))  first chunk of a stream
+            ("progress", None)                      chunk stored
+            ("message", bytes)                      message mode complete
+            ("aborted", reason)                     transfer dropped
+
+        Window ACKs are requested through on_window_ack(key, channel, count).
+        """
+        seq = envelope["seq"]
+        if "abort" in envelope:
+            reason = f"sender aborted: {envelope['abort']}"
+            self.abort(key, reason)
+            return ("aborted", reason)
+        transfer = self._transfers.get(key)
+        if transfer is None:
+            if seq != 0:
+                return ("aborted", f"chunk {seq} without a transfer")
+            transfer = _InboundTransfer(envelope["mode"], channel, envelope.get("window", 1))
+            self._transfers[key] = transfer
+
+        if seq != transfer.next_seq:
+            reason = f"expected chunk {transfer.next_seq}, got {seq}"
+            self.abort(key, reason)
+            return ("aborted", reason)
+        transfer.next_seq += 1
+        transfer.last_activity = time.monotonic()
+        last = envelope["last"]
+
+        if transfer.mode == MODE_STREAM:
+            started = None
+            if seq == 0:
+                transfer.stream = ChunkStream(
+                    key[1],
+                    on_consumed=lambda n, t=transfer: self._consumed(key, t, n),
+                    timeout_s=self._stream_timeout_s,
+                )
+                started = (envelope["header"], transfer.stream)
+            if len(chunk):
+                transfer.stream._put(chunk)
+            if last:
+                transfer.stream._end()
+                del self._transfers[key]
+            return ("stream", started) if started else ("progress", None)
+
+        if self.buffered_bytes + len(chunk) > self.max_buffered_bytes:
+            self.abort(key, "reassembly buffer full")
+            return ("aborted", "reassembly buffer full")
+        transfer.parts.append(chunk)
+        transfer.size += len(chunk)
+        self.buffered_bytes += len(chunk)
+
+        if not last:
+            if transfer.next_seq % transfer.ack_every == 0:
+                self._on_window_ack(key, channel, transfer.next_seq)
+            return ("progress", None)
+
+        del self._transfers[key]
+        self.buffered_bytes -= transfer.size
+        return ("message", b"".join(transfer.parts))
+
+    def _consumed(self, key: tuple, transfer: _InboundTransfer, count: int) -> None:
+        # Called from the consuming (module) thread
+        transfer.last_activity = time.monotonic()
+        if count % transfer.ack_every == 0:
+            self._on_window_ack(key, transfer.channel, count)
+
+    def tick(self, now: float) -> List[Tuple[tuple, str]]:
+        """Abort transfers idle for stream_timeout_s; returns (key, reason) of each."""
+        expired = [
+            key for key, transfer in self._transfers.items()
+            if now - transfer.last_activity > self._stream_timeout_s
+        ]
+        reason = f"no chunk for {self._stream_timeout_s}s"
+        for key in expired:
+            self.abort(key, reason)
+        return [(key, reason) for key in expired]
+
+    def abort(self, key: tuple, reason: str) -> None:
+        transfer = self._transfers.pop(key, None)
+        if transfer is None:
+            return
+        self.buffered_bytes -= transfer.size
+        if transfer.stream is not None:
+            transfer.stream._end(reason)
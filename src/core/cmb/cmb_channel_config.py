@@ -61,6 +61,15 @@ CMB_ACK_EGRESS_PORTS = {
 }
 
 
+# ACK hub: routers push ACKs to the hub ingress; modules receive them on the
+# hub egress. With N shards, shard i binds CMB_ACK_HUB_EGRESS_PORT + i and
+# serves the module identities that hash to it (see ack_hub.ack_shard).
+CMB_ACK_HUB_INGRESS_PORT = 6101
+CMB_ACK_HUB_EGRESS_PORT = 6102
+CMB_ACK_HUB_SHARDS = 1
+CMB_ACK_HUB_INPROC = "inproc://cmb.ack_hub"   # In-process routers (all-in-one mode)
+
+
 # Ports offset by 1000 for Subscription channels
 def get_subscription_offset():
     return 1000
@@ -7,8 +7,27 @@ ROUTER-based channel router for the Cognitive Message Bus (CMB).
 - One router per channel
 - Ingress ROUTER: receives from module outbound DEALER sockets
 - Module egress ROUTER: forwards to module inbound DEALER sockets
-- ACK egress ROUTER: forwards ACKs to module ACK DEALER sockets
+- ACK PUSH: hands ACKs ([dest][payload]) to the ACK hub, which owns
+  delivery to module ACK DEALER sockets for all channels (see ack_hub.py)
 - Sends immediate ROUTER_ACK **only for non-ACK messages**
+- Forwards trailing binary frames (e.g. tensor buffers) untouched
+- Stamps ingress/egress hop times into sampled messages' trace trailer
+- Optional federation with peer routers of the same channel on other hosts:
+  identities learned by presence gossip are reached over one link per peer,
+  and ACKs for them travel back the same way (see federation.py)
+- Expands "@<group>" targets into registered delivery group members and
+  lists the members in the ROUTER_ACK (see delivery_groups.py)
+- Answers endpoint HELLO (ingress) and presence (egress) frames with READY,
+  completing the endpoints' readiness handshake (see handshake.py)
+- Applies the channel's transport QoS profile (HWM, buffers, linger, IO
+  pool) to its ingress/egress sockets (see transport_qos.py)
+- Skips the ROUTER_ACK for fire-and-forget messages (DeliveryPolicy.NONE,
+  per message or as the channel default; see delivery_policy.py)
+- Routes the chunks of large transfers like any message, with one
+  ROUTER_ACK per transfer on its first chunk (see chunking.py)
+- Optionally validates payloads against their registered schema on
+  ingress and drops invalid messages (SchemaValidation at ROUTER; see
+  schema_registry.py)
 
 This is a lightly corrected version of your current router to avoid emitting
 ROUTER_ACK for ACK messages (which can create ack-of-ack loops) and to avoid
@@ -18,46 +37,140 @@ referencing an undefined `msg` when processing ACKs.
 from __future__ import annotations
 
 import json
+import socket
 import threading
-from core.cmb.channel_registry import ChannelRegistry
+import time
+from typing import Iterable, Mapping
+from src.core.cmb.channel_registry import ChannelRegistry, channel_delivery, channel_qos, channel_validation
+from src.core.cmb.compression import ENCODING_KEY
+from src.core.cmb.schema_registry import PayloadValidator, SchemaValidation, ValidationPoint
+from src.core.cmb.delivery_policy import DeliveryPolicy
+from src.core.cmb.transport_qos import TransportQoS, io_context
+from src.core.cmb.hop_trace import Hop, split_hop_trace
+from src.core.cmb.aux_frames import AUX_TRACE, pack_aux, unpack_aux
+from src.core.cmb.federation import PRESENCE_TAG, RouterFederation
+from src.core.cmb.chunking import CHUNK_MSG_TYPE
+from src.core.cmb.handshake import HELLO_TAG, READY_TAG
+from src.core.cmb.delivery_groups import DeliveryGroups, is_group_address
+from src.core.monitoring.metrics import metrics_registry
 import zmq
 
 from src.core.messages.cognitive_message import CognitiveMessage
 from src.core.messages.ack_message import AckMessage
+from src.core.messages.message_id import require_node_id
 from src.core.cmb.cmb_channel_config import (
+    CMB_ACK_HUB_INGRESS_PORT,
     get_channel_ingress_port,
-    get_ack_egress_port,
     get_channel_egress_port,
 )
 
-from src.core.logging.log_manager import LogManager, Logger
+from src.core.logging.log_manager import Logger
 from src.core.logging.log_entry import LogEntry
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
+from src.core.logging.log_hub import log_hub
 
 class ChannelRouter:
-    def __init__(self, channel_name: str, host: str = "localhost"):
+    def __init__(
+        self,
+        channel_name: str,
+        host: str = "localhost",
+        *,
+        router_port: int | None = None,
+        module_egress_port: int | None = None,
+        ack_hub_address: str | None = None,
+        federation_port: int | None = None,
+        federation_peers: Iterable[str] = (),
+        federation_advertise: str | None = None,
+        gossip_interval_s: float = 1.0,
+        groups: Mapping[str, Iterable[str]] | None = None,
+        qos: TransportQoS | None = None,
+        delivery: DeliveryPolicy | None = None,
+        validation: SchemaValidation | None = None,
+    ):
         self.channel_name = channel_name
         self.host = host
 
-        self.router_port = get_channel_ingress_port(channel_name)
-        self.module_egress_port = get_channel_egress_port(channel_name)
-        self.ack_port = get_ack_egress_port(channel_name)
+        # Ports default to the CMB channel map; overrides allow several
+        # isolated routers per host (tests, benchmarks).
+        self.router_port = router_port or get_channel_ingress_port(channel_name)
+        self.module_egress_port = module_egress_port or get_channel_egress_port(channel_name)
+        # tcp://... by default; inproc://... when the hub runs in this process
+        self.ack_hub_address = ack_hub_address or f"tcp://{host}:{CMB_ACK_HUB_INGRESS_PORT}"
+        self.qos = qos or channel_qos(channel_name)
+        self.delivery = delivery or channel_delivery(channel_name)
+        self.validation = validation or channel_validation(channel_name)
+
+        # Federation (disabled unless a federation port is given). The node id
+        # is the address peers dial, so it must match their peer lists.
+        self.federation_port = federation_port
+        self.federation_peers = list(federation_peers)
+        self.federation_advertise = federation_advertise or (
+            f"tcp://{socket.gethostname()}:{federation_port}" if federation_port else None
+        )
+        self.gossip_interval_s = gossip_interval_s
+        if federation_port:
+            # Message ids from federated hosts meet here; they need distinct nodes
+            require_node_id("on federated routers")
+
+        # Delivery groups; may be changed while running (register/unregister)
+        self.groups = DeliveryGroups(groups)
 
         self._stop_evt = threading.Event()
         self._thread = None
 
         # Logging
-        self.log_manager = LogManager(min_severity=LogSeverity.INFO)
-        self.log_manager.register_sink(
-        FileLogSink("logs/system.jsonl")
-        )
+        self.log_manager = log_hub()
 
         self.logger = Logger(self.channel_name, self.log_manager)
 
+        # Metrics (router thread is the only writer)
+        metrics = metrics_registry()
+        self._m_ingress = {
+            kind: metrics.counter(
+                "cmb_router_messages_total",
+                "Messages received on router ingress",
+                channel=self.channel_name,
+                kind=kind,
+            )
+            for kind in ("message", "ack")
+        }
+        self._m_deliveries = metrics.counter(
+            "cmb_router_deliveries_total",
+            "Per-target forwards to module egress",
+            channel=self.channel_name,
+        )
+        self._m_ack_dropped = metrics.counter(
+            "cmb_router_ack_dropped_total",
+            "ACKs dropped because the ACK hub queue was full",
+            channel=self.channel_name,
+        )
+        self._m_federated = {
+            kind: metrics.counter(
+                "cmb_router_federated_total",
+                "Frames sent to peer routers",
+                channel=self.channel_name,
+                kind=name,
+            )
+            for kind, name in (("G", "gossip"), ("M", "message"), ("A", "ack"))
+        }
+        self._m_federation_dropped = metrics.counter(
+            "cmb_router_federation_dropped_total",
+            "Frames dropped because a peer link queue was full",
+            channel=self.channel_name,
+        )
+        self._m_invalid = metrics.counter(
+            "cmb_router_invalid_total",
+            "Ingress frames dropped as invalid",
+            channel=self.channel_name,
+        )
+        self._validator = (
+            PayloadValidator(self.validation, channel=self.channel_name)
+            if self.validation is not None and self.validation.at is ValidationPoint.ROUTER
+            else None
+        )
+
         self.logger.info(
             event_type="ROUTER_INIT",
-            message=f"Router {self.channel_name} port: {self.router_port} ack: {self.ack_port} module_egress: {self.module_egress_port}",
+            message=f"Router {self.channel_name} port: {self.router_port} ack hub: {self.ack_hub_address} module_egress: {self.module_egress_port}",
             payload={
                 "note": "no payload"
             }
@@ -94,24 +207,84 @@ class ChannelRouter:
                     "note": "no payload"
                 }
             )
+        self.log_manager.flush(timeout=1.0)
+
+    def _send_router_ack(self, ack_sock, sender_id: bytes, msg: CognitiveMessage, status: str, payload: dict) -> None:
+        router_ack = AckMessage.create(
+            msg_type="ACK",
+            ack_type="ROUTER_ACK",
+            status=status,
+            source="CMB_ROUTER",
+            targets=[msg.source],
+            correlation_id=msg.message_id,
+            payload={
+                "channel": self.channel_name,
+                "message_id": msg.message_id,
+                **payload,
+            },
+        )
+        self._push_ack(ack_sock, sender_id, router_ack.to_bytes())
+
+    def _push_ack(self, ack_sock, dest: bytes, payload: bytes) -> None:
+        # Never block routing on the hub; drop (and count) if its queue is full
+        try:
+            ack_sock.send_multipart([dest, payload], flags=zmq.NOBLOCK)
+        except zmq.Again:
+            self._m_ack_dropped.inc()
+
+    def _drain_presence(self, module_egress_sock, fed, now: float) -> None:
+        # [identity][PRESENCE_TAG] from endpoint inbound sockets
+        while True:
+            try:
+                frames = module_egress_sock.recv_multipart(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                return
+            if len(frames) < 2 or frames[-1] != PRESENCE_TAG:
+                continue
+            # Egress link is routable now: complete the endpoint's handshake
+            module_egress_sock.send_multipart([frames[0], READY_TAG])
+            if fed is not None:
+                fed.note_local(frames[0], now)
 
     def _run(self) -> None:
-        ctx = zmq.Context.instance()
+        # Channel traffic runs on the channel's IO pool; the ACK push stays on
+        # the default context so an inproc ACK hub address keeps working.
+        ctx = io_context(self.qos.io_pool)
         router_sock = ctx.socket(zmq.ROUTER)
+        self.qos.apply(router_sock)
         router_sock.bind(f"tcp://{self.host}:{self.router_port}")
 
         module_egress_sock = ctx.socket(zmq.ROUTER)
+        self.qos.apply(module_egress_sock)
         module_egress_sock.bind(f"tcp://{self.host}:{self.module_egress_port}")
 
-        ack_sock = ctx.socket(zmq.ROUTER)
-        ack_sock.bind(f"tcp://{self.host}:{self.ack_port}")
+        ack_sock = zmq.Context.instance().socket(zmq.PUSH)
+        ack_sock.connect(self.ack_hub_address)
 
         poller = zmq.Poller()
         poller.register(router_sock, zmq.POLLIN)
+        # Endpoints announce presence on their inbound sockets
+        poller.register(module_egress_sock, zmq.POLLIN)
+
+        fed = None
+        if self.federation_port is not None:
+            fed = RouterFederation(
+                node_id=self.federation_advertise,
+                bind_address=f"tcp://*:{self.federation_port}",
+                peers=self.federation_peers,
+                gossip_interval_s=self.gossip_interval_s,
+                on_forward=lambda peer, kind: self._m_federated[kind].inc(),
+            )
+            fed.open(ctx)
+            poller.register(fed.socket, zmq.POLLIN)
+
+        def deliver_local(target: bytes, payload: bytes, aux: list) -> None:
+            module_egress_sock.send_multipart([target, b"", payload, *aux], copy=not aux)
+            self._m_deliveries.inc()
 
         self.logger.info(
                 event_type="ROUTER_START_RUN",
-                message=f"[Router.{self.channel_name}] ROUTER ingress on {self.router_port}, egress on {self.module_egress_port}, ACK on {self.ack_port}",
+                message=f"[Router.{self.channel_name}] ROUTER ingress on {self.router_port}, egress on {self.module_egress_port}, ACK hub {self.ack_hub_address}",
                 payload={
                     "note": "no payload"
                 }
@@ -120,18 +293,55 @@ class ChannelRouter:
         try:
             while not self._stop_evt.is_set():
                 events = dict(poller.poll(100))
+                now = time.monotonic()
+
+                if module_egress_sock in events:
+                    self._drain_presence(module_egress_sock, fed, now)
+
+                if fed is not None:
+                    if fed.socket in events:
+                        fed.handle_incoming(
+                            now,
+                            deliver=deliver_local,
+                            deliver_ack=lambda dest, p: self._push_ack(ack_sock, dest, p),
+                        )
+                    fed.maybe_gossip(now)
+
                 if router_sock not in events:
                     continue
 
-                frames = router_sock.recv_multipart()
-                sender_id = frames[0]
-                payload = frames[-1]
+                # [sender_id][payload][layout][aux...]
+                # Aux frames are kept as zmq.Frame and re-sent without copying.
+                frames = router_sock.recv_multipart(copy=False)
+                sender_id = frames[0].bytes
+                payload = frames[1].bytes
+                try:
+                    kinds, aux = unpack_aux(frames[2:])
+                except ValueError as e:
+                    self._m_invalid.inc()
+                    self.logger.error(
+                        event_type="ROUTER_INVALID_AUX",
+                        message=f"Invalid aux frames: {e}",
+                        payload={
+                            "sender": sender_id.decode("utf-8", "replace")
+                        }
+                    )
+                    continue
+                trace, kinds, aux = split_hop_trace(kinds, aux)
+                if trace is not None:
+                    trace.stamp(Hop.ROUTER_INGRESS)
+                if fed is not None:
+                    fed.note_local(sender_id, now)
+
+                if payload == HELLO_TAG:
+                    router_sock.send_multipart([sender_id, READY_TAG])
+                    continue
 
                 try:
                     obj = json.loads(payload.decode("utf-8"))
                 except Exception as e:
-                
-                    self.logger.info(
+                    self._m_invalid.inc()
+                    self.logger.error(
                         event_type="ROUTER_EXCEPTIOM_ERROR",
                         message=f"Invalid JSON message: {e}",
                         payload={
@@ -142,26 +352,14 @@ class ChannelRouter:
                     continue
 
                 msg_type = obj.get("msg_type")
+                self._m_ingress["ack" if msg_type == "ACK" else "message"].inc()
 
-                # --- ACK messages: forward only ---
+                # --- ACK messages: hand to the ACK hub ---
                 if msg_type == "ACK":
-                    try:
-                        ack = AckMessage.from_dict(obj)
-                    except Exception as e:
-                        
-                        self.logger.info(
-                            event_type="ROUTER_EXCEPTIOM_ERROR",
-                            message=f"[Router.{self.channel_name} ERROR] Invalid ACK message: {e}",
-                            payload={
-                                "note": "no payload"
-                            }
-                        )
-
-                        continue
-
-                    if not ack.targets:
+                    targets = obj.get("targets")
+                    if not targets:
                        
-                        self.logger.info(
+                        self.logger.error(
                             event_type="ROUTER_NO_ACK_TARGETS_ERROR",
                             message=f"[Router.{self.channel_name} ERROR] ACK has no targets",
                             payload={
@@ -171,16 +369,21 @@ class ChannelRouter:
 
                         continue
 
-                    dest = ack.targets[0].encode("utf-8")
-                    ack_sock.send_multipart([dest, b"", payload])
+                    dest = targets[0].encode("utf-8")
+                    peer = fed.route(dest, now) if fed is not None else None
+                    if peer is None:
+                        self._push_ack(ack_sock, dest, payload)
+                    elif not fed.forward_ack(peer, dest, payload):
+                        self._m_federation_dropped.inc()
                     continue
 
                 # --- Non-ACK messages: forward to targets + emit ROUTER_ACK ---
                 try:
                     msg = CognitiveMessage.from_dict(obj)
+                    policy = DeliveryPolicy.resolve(msg.delivery, self.delivery)
                 except Exception as e:
-                    
-                    self.logger.info(
+                    self._m_invalid.inc()
+                    self.logger.error(
                             event_type="ROUTER_INVALID_MESSAGE_ERROR",
                             message=f"[Router.{self.channel_name} invalid message not Cognitive Message {e}",
                             payload={
@@ -190,38 +393,79 @@ class ChannelRouter:
                     
                     continue
 
-                for target in msg.targets:
-                    module_egress_sock.send_multipart([
-                        target.encode("utf-8"),
-                        b"",
-                        payload,
-                    ])
+                # Compressed payloads are opaque here; their receivers validate
+                if self._validator is not None and ENCODING_KEY not in obj:
+                    error = self._validator.check(msg.msg_type, msg.msg_version, msg.payload)
+                    if error is not None:
+                        self._m_invalid.inc()
+                        self.logger.warning(
+                            event_type="ROUTER_SCHEMA_INVALID",
+                            message=f"[Router.{self.channel_name}] dropped {msg.msg_type} message {msg.message_id} from {msg.source}: {error}",
+                            payload={
+                                "msg_type": msg.msg_type,
+                                "error": error
+                            }
+                        )
+                        if policy.router_ack:
+                            # Fail the sender's transaction now rather than on its timeout
+                            self._send_router_ack(ack_sock, sender_id, msg, "ERROR", {
+                                "status": "rejected",
+                                "error": error,
+                            })
+                        continue
 
-                # Immediate ROUTER_ACK to the sender (logical sender = msg.source)
-                router_ack = AckMessage.create(
-                    msg_type="ACK",
-                    ack_type="ROUTER_ACK",
-                    status="SUCCESS",
-                    source="CMB_ROUTER",
-                    targets=[msg.source],
-                    correlation_id=msg.message_id,
-                    payload={
-                        "channel": self.channel_name,
-                        "status": "published",
-                        "message_id": msg.message_id,
-                    },
-                )
+                targets = msg.targets
+                expanded = any(is_group_address(t) for t in targets)
+                if expanded:
+                    targets, unknown = self.groups.expand(targets)
+                    if unknown:
+                        self._m_invalid.inc()
+                        self.logger.warning(
+                            event_type="ROUTER_UNKNOWN_GROUP",
+                            message=f"[Router.{self.channel_name}] unknown delivery group(s) {unknown} in message {msg.message_id}",
+                            payload={
+                                "groups": unknown
+                            }
+                        )
+
+                for target in targets:
+                    target_id = target.encode("utf-8")
+                    peer = fed.route(target_id, now) if fed is not None else None
+                    if peer is not None:
+                        # Behind a peer router; hop timestamps are not carried across hosts
+                        if not fed.forward_message(peer, target_id, payload, pack_aux(kinds, aux)):
+                            self._m_federation_dropped.inc()
+                        continue
 
-                ack_sock.send_multipart([
-                    sender_id,
-                    b"",
-                    router_ack.to_bytes(),
-                ])
+                    if trace is not None:
+                        trace.stamp(Hop.ROUTER_EGRESS)
+                        out_aux = pack_aux(kinds + AUX_TRACE, [*aux, trace.to_frame()])
+                        trace.stamps.pop()
+                    else:
+                        out_aux = pack_aux(kinds, aux)
+
+                    module_egress_sock.send_multipart([target_id, b"", payload, *out_aux], copy=not aux)
+                    self._m_deliveries.inc()
+
+                if msg.msg_type == CHUNK_MSG_TYPE and msg.payload.get("seq") != 0:
+                    # One ROUTER_ACK per chunked transfer, on its first chunk
+                    continue
+                if not policy.router_ack:
+                    continue
+
+                # Immediate ROUTER_ACK to the sender (logical sender = msg.source)
+                ack_payload = {"status": "published"}
+                if expanded:
+                    # Members the sender aggregates delivery ACKs for
+                    ack_payload["targets"] = targets
+                self._send_router_ack(ack_sock, sender_id, msg, "SUCCESS", ack_payload)
 
         finally:
             router_sock.close()
             module_egress_sock.close()
-            ack_sock.close()
+            ack_sock.close(linger=0)
+            if fed is not None:
+                fed.close()
             # Do not ctx.term() when using Context.instance() in multi-thread/process environments
             
             self.logger.info(
@@ -1,16 +1,41 @@
 # src/core/cmb/cmb_router_entry.py
 
 import argparse
+import time
 from src.core.cmb.cmb_router import ChannelRouter  # or whatever your class is named
 
 def main():
     parser = argparse.ArgumentParser(description="CMB Channel Router")
     parser.add_argument("--channel", required=True, help="Channel name (e.g. CC, VB)")
+    parser.add_argument("--ack-hub", default=None, help="ACK hub ingress address (default tcp://localhost:6101)")
+    parser.add_argument("--federation-port", type=int, default=None, help="Bind port for peer routers (enables federation)")
+    parser.add_argument("--peer", action="append", default=[], help="Peer router federation address, e.g. tcp://host-b:6201 (repeatable)")
+    parser.add_argument("--advertise", default=None, help="Address peers use to reach this router (default tcp://<hostname>:<federation-port>)")
+    parser.add_argument("--group", action="append", default=[], help="Delivery group NAME=member1,member2 (repeatable)")
     args = parser.parse_args()
 
-    router = ChannelRouter(channel_name=args.channel)
-    router.start()   # or start(), loop(), etc.
-    
+    groups = {}
+    for spec in args.group:
+        name, _, members = spec.partition("=")
+        groups[name] = [m for m in members.split(",") if m]
+
+    router = ChannelRouter(
+        channel_name=args.channel,
+        ack_hub_address=args.ack_hub,
+        federation_port=args.federation_port,
+        federation_peers=args.peer,
+        federation_advertise=args.advertise,
+        groups=groups,
+    )
+    router.start()
+
+    # Block until interrupted so SIGINT (e.g. from the supervisor) drains cleanly
+    try:
+        while True:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        router.stop()
+
 
 if __name__ == "__main__":
     main()
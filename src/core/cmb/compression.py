@@ -0,0 +1,259 @@
+"""
+Module: compression.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Adaptive per-channel payload compression.
+
+On channels with CompressionSettings, the sending endpoint compresses the
+`payload` of messages whose serialized payload exceeds threshold_bytes.
+The envelope stays plain JSON - routers read source/targets/msg_type as
+usual and forward the compressed frame untouched - and describes the
+encoding for the receiver:
+
+    [envelope JSON: ..., "payload": {}, "encoding": {"codec", "dict", "size"}]
+    [COMPRESSED_TAG | compressed payload JSON]     (aux kind AUX_COMPRESSED)
+
+Codecs: "zlib" (stdlib, always available) and "zstd" (optional, needs the
+zstandard package). Both accept a shared dictionary registered under an
+id; DEFAULT_DICTIONARY_ID is trained from the bus's own message schemas
+(plans, task queues, intents), see train_dictionary().
+
+ChannelCompressor measures compression time against the bytes saved
+(valued at link_bytes_per_s) over a window of messages and switches itself
+off for backoff_s when compressing costs more time than it saves on the
+wire, then probes again.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSED_TAG = b"CMBZ\x01"
+ENCODING_KEY = "encoding"
+
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+DEFAULT_DICTIONARY_ID = "cmb-schema-v1"
+
+
+@dataclass(frozen=True)
+class CompressionSettings:
+    codec: str = CODEC_ZLIB
+    level: int = 6
+    threshold_bytes: int = 1024             # Serialized payload size below which nothing is compressed
+    dictionary: Optional[str] = DEFAULT_DICTIONARY_ID
+    link_bytes_per_s: float = 100e6         # What a saved byte is worth in time (~1 Gbit/s)
+    sample_window: int = 64                 # Messages per cost/benefit evaluation
+    backoff_s: float = 30.0                 # Off-time after a losing window
+
+
+def codec_available(codec: str) -> bool:
+    return codec == CODEC_ZLIB or (codec == CODEC_ZSTD and zstandard is not None)
+
+
+# ----------------------------
+# Shared dictionaries
+# ----------------------------
+
+_dict_lock = threading.Lock()
+_dictionaries: Dict[str, bytes] = {}
+
+_TOKEN = re.compile(rb'"[^"\\]{1,64}": |"[^"\\]{1,64}"|-?\d+\.\d+')
+
+
+def train_dictionary(samples: Iterable[bytes], size: int = 16 * 1024) -> bytes:
+    """
+    Raw-content dictionary from sample JSON documents: the keys and values
+    that save the most bytes (count * length), most valuable last since
+    zlib reaches the end of a preset dictionary most cheaply.
+    """
+    counts: Counter = Counter()
+    for sample in samples:
+        counts.update(tok for tok in _TOKEN.findall(sample) if len(tok) >= 4)
+
+    picked = []
+    total = 0
+    for token, count in sorted(counts.items(), key=lambda kv: kv[1] * len(kv[0]), reverse=True):
+        if count < 2 or total + len(token) > size:
+            continue
+        picked.append(token)
+        total += len(token)
+    return b"".join(reversed(picked))
+
+
+def register_dictionary(dict_id: str, data: bytes) -> None:
+    with _dict_lock:
+        _dictionaries[dict_id] = data
+
+
+def get_dictionary(dict_id: str) -> bytes:
+    with _dict_lock:
+        data = _dictionaries.get(dict_id)
+    if data is None and dict_id == DEFAULT_DICTIONARY_ID:
+        data = train_dictionary(_schema_samples())
+        register_dictionary(dict_id, data)
+    if data is None:
+        raise KeyError(f"Unknown compression dictionary: {dict_id}")
+    return data
+
+
+def _schema_samples() -> list:
+    """Representative payloads of the bus's verbose message types."""
+    uid = "00000000-0000-4000-8000-000000000000"
+    step = {"step_id": "step-1", "description": "Analyze directive", "assigned_module": "EXECUTIVE"}
+    task = {
+        "task_id": uid, "task_index": 1, "name": "Analyze directive",
+        "assigned_module": "behavior", "created_at": 1700000000.0, "status": "QUEUED",
+    }
+    plan = {
+        "plan_id": uid, "created_at": 1700000000.0, "source_directive": "",
+        "steps": [step, step], "status": "READY",
+    }
+    queue = {
+        "queue_id": uid, "created_at": 1700000000.0, "plan_id": uid,
+        "task_count": 2, "tasks": [task, task], "status": "READY",
+    }
+    intent = {
+        "intent_id": uid, "directive_text": "", "directive_source": "GUI",
+        "intent": {"intent_id": uid, "intent_type": "", "confidence": 0.9, "entities": {}, "constraints": {}},
+        "nlp_received_at": 1700000000.0,
+    }
+    payloads = [{"plan": plan}, {"task_queue": queue, "plan": plan}, intent]
+    return [json.dumps(p).encode("utf-8") for p in payloads for _ in range(2)]
+
+
+# ----------------------------
+# Codecs
+# ----------------------------
+
+def compress_bytes(data: bytes, codec: str, level: int, dictionary: Optional[bytes]) -> bytes:
+    if codec == CODEC_ZLIB:
+        # Window sized to data + dictionary: the default 32 KiB window costs
+        # more to set up than compressing a few-KiB message (the stream
+        # header records the size, decompressors need no hint)
+        wbits = min(15, max(9, (len(data) + len(dictionary or b"")).bit_length()))
+        args = (level, zlib.DEFLATED, wbits, min(8, wbits - 7))
+        comp = zlib.compressobj(*args, zdict=dictionary) if dictionary else zlib.compressobj(*args)
+        return comp.compress(data) + comp.flush()
+    if codec == CODEC_ZSTD and zstandard is not None:
+        zdict = zstandard.ZstdCompressionDict(dictionary, dict_type=zstandard.DICT_TYPE_RAWCONTENT) if dictionary else None
+        return zstandard.ZstdCompressor(level=level, dict_data=zdict).compress(data)
+    raise ValueError(f"Compression codec not available: {codec}")
+
+
+def decompress_bytes(data: bytes, codec: str, dictionary: Optional[bytes]) -> bytes:
+    if codec == CODEC_ZLIB:
+        decomp = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+        return decomp.decompress(data) + decomp.flush()
+    if codec == CODEC_ZSTD and zstandard is not None:
+        zdict = zstandard.ZstdCompressionDict(dictionary, dict_type=zstandard.DICT_TYPE_RAWCONTENT) if dictionary else None
+        return zstandard.ZstdDecompressor(dict_data=zdict).decompress(data)
+    raise ValueError(f"Compression codec not available: {codec}")
+
+
+def decode_message(envelope: dict, frame) -> dict:
+    """Restore the payload of a compressed message dict (envelope is modified)."""
+    data = memoryview(frame if isinstance(frame, (bytes, bytearray)) else frame.buffer)
+    encoding = envelope.pop(ENCODING_KEY)
+    dict_id = encoding.get("dict")
+    dictionary = get_dictionary(dict_id) if dict_id else None
+    raw = decompress_bytes(data[len(COMPRESSED_TAG):], encoding["codec"], dictionary)
+    envelope["payload"] = json.loads(raw)
+    return envelope
+
+
+# ----------------------------
+# Adaptive per-channel compressor
+# ----------------------------
+
+class ChannelCompressor:
+    """
+    Compression state of one channel on the sending side (endpoint thread).
+
+    on_disable(stats) is called when a window's compression time exceeds
+    the transfer time it saved.
+    """
+
+    def __init__(
+        self,
+        settings: CompressionSettings,
+        on_disable: Optional[Callable[[dict], None]] = None,
+    ):
+        if not codec_available(settings.codec):
+            raise ValueError(f"Compression codec not available: {settings.codec}")
+        self.settings = settings
+        self._on_disable = on_disable
+        self._dictionary = get_dictionary(settings.dictionary) if settings.dictionary else None
+        self.disabled_until = 0.0
+
+        # Totals (metrics) and the current evaluation window
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._w_count = 0
+        self._w_in = 0
+        self._w_out = 0
+        self._w_ns = 0
+
+    def active(self, now: float) -> bool:
+        return now >= self.disabled_until
+
+    def ratio(self) -> float:
+        return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+    def compress(self, message: dict, now: float) -> Optional[Tuple[bytes, bytes]]:
+        """(envelope, compressed frame) for `message`, or None to send it as is."""
+        if not self.active(now):
+            return None
+        started = time.perf_counter_ns()
+        raw = json.dumps(message.get("payload")).encode("utf-8")
+        if len(raw) < self.settings.threshold_bytes:
+            return None
+
+        s = self.settings
+        packed = compress_bytes(raw, s.codec, s.level, self._dictionary)
+        envelope = dict(message)
+        envelope["payload"] = {}
+        envelope[ENCODING_KEY] = {"codec": s.codec, "dict": s.dictionary, "size": len(raw)}
+        self._record(len(raw), len(packed), time.perf_counter_ns() - started, now)
+
+        if len(packed) >= len(raw):
+            return None
+        return json.dumps(envelope).encode("utf-8"), COMPRESSED_TAG + packed
+
+    def _record(self, raw: int, packed: int, ns: int, now: float) -> None:
+        self.bytes_in += raw
+        self.bytes_out += min(raw, packed)
+        self._w_count += 1
+        self._w_in += raw
+        self._w_out += min(raw, packed)
+        self._w_ns += ns
+        if self._w_count < self.settings.sample_window:
+            return
+
+        cost_s = self._w_ns / 1e9
+        saved_s = (self._w_in - self._w_out) / self.settings.link_bytes_per_s
+        if cost_s > saved_s:
+            self.disabled_until = now + self.settings.backoff_s
+            if self._on_disable is not None:
+                self._on_disable({
+                    "ratio": round(self._w_out / self._w_in, 4),
+                    "cost_s": cost_s,
+                    "saved_s": saved_s,
+                    "messages": self._w_count,
+                })
+        self._w_count = self._w_in = self._w_out = self._w_ns = 0
@@ -0,0 +1,128 @@
+"""
+Module: delivery_groups.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Named delivery groups (multicast addressing) for the CMB.
+
+A message target of the form "@<group>" addresses every member of a group
+registered with the channel router. The sender still sends one message;
+the router expands the group, delivers one copy per member and returns the
+expanded member list in its ROUTER_ACK. The sender's TransactionRecord
+then aggregates the members' MESSAGE_DELIVERED_ACKs and completes once
+according to a GroupCompletion policy (all / any / quorum).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+GROUP_PREFIX = "@"
+
+
+def is_group_address(target: str) -> bool:
+    return target.startswith(GROUP_PREFIX)
+
+
+def group_name(target: str) -> str:
+    return target[len(GROUP_PREFIX):]
+
+
+# ----------------------------
+# Completion policy
+# ----------------------------
+
+@dataclass(frozen=True)
+class GroupCompletion:
+    """How many member deliveries complete a group transaction."""
+
+    mode: str = "all"                 # all | any | quorum
+    quorum: Optional[int] = None      # required for mode == "quorum"
+
+    def __post_init__(self):
+        if self.mode not in ("all", "any", "quorum"):
+            raise ValueError(f"Unknown group completion mode: {self.mode!r}")
+        if self.mode == "quorum" and (self.quorum is None or self.quorum < 1):
+            raise ValueError("Quorum completion needs quorum >= 1")
+
+    @classmethod
+    def parse(cls, spec: "str | GroupCompletion") -> "GroupCompletion":
+        """Accepts "all", "any", "quorum:<n>" or an existing policy."""
+        if isinstance(spec, GroupCompletion):
+            return spec
+        mode, _, count = spec.partition(":")
+        return cls(mode=mode, quorum=int(count) if count else None)
+
+    def required(self, members: int) -> int:
+        """Deliveries needed out of `members` (may exceed members for quorum)."""
+        if self.mode == "all":
+            return members
+        if self.mode == "any":
+            return min(1, members)
+        return self.quorum
+
+
+# ----------------------------
+# Router-side registry
+# ----------------------------
+
+class DeliveryGroups:
+    """
+    Group name -> member identities.
+
+    Writes replace the whole mapping, so the router thread can read without
+    locking while groups are changed from other threads.
+    """
+
+    def __init__(self, groups: Optional[Mapping[str, Iterable[str]]] = None):
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Tuple[str, ...]] = {
+            name: tuple(members) for name, members in (groups or {}).items()
+        }
+
+    def register(self, name: str, members: Iterable[str]) -> None:
+        with self._lock:
+            groups = dict(self._groups)
+            groups[name] = tuple(members)
+            self._groups = groups
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            groups = dict(self._groups)
+            groups.pop(name, None)
+            self._groups = groups
+
+    def members(self, name: str) -> Tuple[str, ...]:
+        return self._groups.get(name, ())
+
+    def names(self) -> List[str]:
+        return sorted(self._groups)
+
+    def expand(self, targets: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        Expand group addresses into member identities.
+
+        Returns (identities in first-seen order without duplicates,
+        unknown group names).
+        """
+        groups = self._groups
+        out: List[str] = []
+        seen = set()
+        unknown: List[str] = []
+        for target in targets:
+            if is_group_address(target):
+                name = group_name(target)
+                members = groups.get(name)
+                if members is None:
+                    unknown.append(name)
+                    continue
+            else:
+                members = (target,)
+            for member in members:
+                if member not in seen:
+                    seen.add(member)
+                    out.append(member)
+        return out, unknown
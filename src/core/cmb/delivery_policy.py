@@ -0,0 +1,53 @@
+"""
+Module: delivery_policy.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Delivery (ACK) policies for CMB messages.
+
+- END_TO_END: transaction, ROUTER_ACK and MESSAGE_DELIVERED_ACK (default)
+- ROUTER_ONLY: transaction completes on the ROUTER_ACK; receivers do not
+  ACK delivery
+- NONE: fire-and-forget for telemetry / log-style traffic: no transaction
+  on either side and no ACKs
+
+Each ChannelConfig has a default policy; a message can override it with
+its `delivery` field. Sender endpoint, router and receiver endpoint all
+resolve the same effective policy from (message field, channel default).
+The field comes off the wire: resolve() raises ValueError for unknown
+values and callers drop such messages as invalid.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Optional, Union
+
+
+class DeliveryPolicy(Enum):
+    NONE = "NONE"
+    ROUTER_ONLY = "ROUTER_ONLY"
+    END_TO_END = "END_TO_END"
+
+    @property
+    def router_ack(self) -> bool:
+        return self is not DeliveryPolicy.NONE
+
+    @property
+    def delivered_ack(self) -> bool:
+        return self is DeliveryPolicy.END_TO_END
+
+    @classmethod
+    def resolve(
+        cls,
+        message_policy: Optional[Union[str, "DeliveryPolicy"]],
+        channel_default: "DeliveryPolicy",
+    ) -> "DeliveryPolicy":
+        """
+        Effective policy: the message's own policy if set, else the channel's.
+
+        Raises ValueError for an unknown message policy.
+        """
+        if message_policy is None:
+            return channel_default
+        return cls(message_policy)
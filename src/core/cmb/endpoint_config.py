@@ -3,10 +3,12 @@ from typing import Dict, Iterable, Optional
 
 import zmq
 from src.core.cmb.channel_registry import ChannelRegistry, ChannelConfig, InboundDelivery
-from src.core.logging.log_manager import LogManager, Logger
-from src.core.logging.log_entry import LogEntry
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
+from src.core.cmb.cmb_channel_config import CMB_ACK_HUB_SHARDS
+from src.core.utils.component_env import getenv
+
+# Default hop-trace sampling for endpoints built with from_channel_names(),
+# e.g. "0.01"; set per component through the topology's "env".
+TRACE_SAMPLE_RATE_ENV = "AGI_TRACE_SAMPLE_RATE"
 
 @dataclass(frozen=True)
 class ChannelEndpointConfig:
@@ -40,22 +42,44 @@ class MultiChannelEndpointConfig:
     channels: Dict[str, ChannelConfig]    # resolved ChannelConfig objects
     host: str = "localhost"
     poll_timeout_ms: int = 50
-
-    # Logging
-    log_manager = LogManager(min_severity=LogSeverity.INFO)
-    log_manager.register_sink(
-    FileLogSink("logs/system.jsonl")
-    )
-
-    logger = Logger("endpoint_config", log_manager)
-
-    logger.info(
-    event_type="ENDPOINT_CONFIG_INIT",
-    message=f"Endpoint configuration ",
-    payload={
-        "note": "no payload"
-    }
-)
+    trace_sample_rate: float = 0.0        # Fraction of sends carrying hop timestamps
+
+    # Socket lifecycle: outbound/ACK sockets connect on first send; inbound
+    # sockets connect only for subscribed channels (None = all channels).
+    subscribe: Optional[tuple[str, ...]] = None
+    idle_disconnect_s: Optional[float] = 300.0   # Close unused outbound sockets (None = never)
+
+    # ACK hub sharding: channel ack_port is the hub egress base port; this
+    # module's ACKs arrive on the shard its identity hashes to.
+    ack_shards: int = CMB_ACK_HUB_SHARDS
+
+    # Presence heartbeat on DIRECTED inbound sockets so federated routers
+    # know which identities they serve (None = only once on connect).
+    presence_interval_s: Optional[float] = 5.0
+
+    # HELLO/READY handshake per router link; sends issued before READY are
+    # buffered (up to ready_buffer_limit per channel, oldest dropped first;
+    # a dropped send_request() or group send is failed, not left waiting).
+    hello_interval_s: float = 0.5
+    ready_buffer_limit: int = 10_000
+
+    # Chunked transfer (see chunking.py): messages above the threshold are
+    # sent as windowed chunks (None = never chunk); inbound reassembly is
+    # bounded by max_reassembly_bytes across transfers. Transfers idle for
+    # chunk_stall_timeout_s are dropped on both sides.
+    chunk_threshold_bytes: Optional[int] = 4 * 1024 * 1024
+    chunk_size_bytes: int = 256 * 1024
+    chunk_window: int = 8
+    max_reassembly_bytes: int = 256 * 1024 * 1024
+    chunk_stall_timeout_s: float = 30.0
+
+    # Ordered channels (see sequencing.py): early messages wait in the
+    # reorder buffer until the gap fills, reorder_gap_timeout_s passes or
+    # reorder_window messages are held for one stream. Streams with nothing
+    # held are forgotten after reorder_idle_timeout_s.
+    reorder_window: int = 1024
+    reorder_gap_timeout_s: float = 0.5
+    reorder_idle_timeout_s: float = 60.0
 
     @classmethod
     def from_channel_names(
@@ -65,11 +89,22 @@ class MultiChannelEndpointConfig:
         channel_names: Iterable[str],
         host: str = "localhost",
         poll_timeout_ms: int = 50,
+        trace_sample_rate: Optional[float] = None,
+        subscribe: Optional[Iterable[str]] = None,
+        idle_disconnect_s: Optional[float] = 300.0,
+        ack_shards: int = CMB_ACK_HUB_SHARDS,
+        presence_interval_s: Optional[float] = 5.0,
     ) -> "MultiChannelEndpointConfig":
         """
         Factory method that builds endpoint configuration
         from ChannelRegistry channel names.
+
+        trace_sample_rate defaults to AGI_TRACE_SAMPLE_RATE (else 0.0).
         """
+        if trace_sample_rate is None:
+            trace_sample_rate = float(getenv(TRACE_SAMPLE_RATE_ENV) or 0.0)
+        if not 0.0 <= trace_sample_rate <= 1.0:
+            raise ValueError(f"trace_sample_rate must be in 0..1, got {trace_sample_rate}")
 
         channels: Dict[str, ChannelConfig] = {}
         ChannelRegistry.initialize()
@@ -81,11 +116,22 @@ class MultiChannelEndpointConfig:
             channels=channels,
             host=host,
             poll_timeout_ms=poll_timeout_ms,
+            trace_sample_rate=trace_sample_rate,
+            subscribe=tuple(subscribe) if subscribe is not None else None,
+            idle_disconnect_s=idle_disconnect_s,
+            ack_shards=ack_shards,
+            presence_interval_s=presence_interval_s,
         )
 
     def channel_names(self) -> list[str]:
         return list(self.channels.keys())
 
+    def subscribed_channels(self) -> list[str]:
+        """Channels whose inbound sockets are connected at endpoint start."""
+        if self.subscribe is None:
+            return self.channel_names()
+        return [name for name in self.subscribe if name in self.channels]
+
     def get_channel(self, name: str) -> ChannelConfig:
         if name not in self.channels:
             raise KeyError(
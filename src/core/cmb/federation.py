@@ -0,0 +1,233 @@
+"""
+Module: federation.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Router-to-router federation for one CMB channel.
+
+Each ChannelRouter may federate with peer routers of the same channel on
+other hosts:
+
+- Presence: endpoints announce their identity on their inbound socket
+  (PRESENCE_TAG, repeated as a heartbeat); a router also treats any sender
+  on its ingress as local. Local identities expire after presence_ttl_s.
+- Gossip: every gossip_interval_s a router sends its local identity set to
+  each peer. Peers map identity -> owning router and expire entries after
+  three missed rounds.
+- Links: one persistent DEALER per configured peer carries all traffic to
+  it, multiplexed by a kind frame:
+
+      [b"G"][gossip json]            presence gossip
+      [b"M"][target][payload][aux..] message for an identity behind the peer
+      [b"A"][dest][payload]          ACK for an identity behind the peer
+
+A router's node id is the federation address its peers dial (e.g.
+"tcp://host-a:6201"), so gossip from a node maps directly onto the link used
+to reach it. Forwarding is single-hop: traffic received from a peer is only
+delivered locally, so peers must form a full mesh per channel.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, Dict, Iterable, List, Optional
+
+import zmq
+
+
+PRESENCE_TAG = b"CMBP\x01"
+
+KIND_GOSSIP = b"G"
+KIND_MESSAGE = b"M"
+KIND_ACK = b"A"
+
+
+# ----------------------------
+# Presence table
+# ----------------------------
+
+class PresenceTable:
+    """identity -> owner with expiry (owner is a node id, or "local")."""
+
+    def __init__(self, ttl_s: float):
+        self.ttl_s = ttl_s
+        self._entries: Dict[bytes, tuple[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, owner: str, identities: Iterable[bytes], now: float) -> None:
+        expires = now + self.ttl_s
+        for identity in identities:
+            self._entries[identity] = (owner, expires)
+
+    def replace_owner(self, owner: str, identities: Iterable[bytes], now: float) -> None:
+        """Full-state update: owner now serves exactly these identities."""
+        identities = set(identities)
+        for identity, (current, _) in list(self._entries.items()):
+            if current == owner and identity not in identities:
+                del self._entries[identity]
+        self.update(owner, identities, now)
+
+    def lookup(self, identity: bytes, now: float) -> Optional[str]:
+        entry = self._entries.get(identity)
+        if entry is None:
+            return None
+        owner, expires = entry
+        if now >= expires:
+            del self._entries[identity]
+            return None
+        return owner
+
+    def identities(self, now: float) -> List[bytes]:
+        self.expire(now)
+        return list(self._entries)
+
+    def expire(self, now: float) -> None:
+        for identity, (_, expires) in list(self._entries.items()):
+            if now >= expires:
+                del self._entries[identity]
+
+
+def encode_gossip(node_id: str, identities: Iterable[bytes]) -> list[bytes]:
+    body = {
+        "node": node_id,
+        "identities": sorted(i.decode("utf-8", "replace") for i in identities),
+    }
+    return [KIND_GOSSIP, json.dumps(body).encode("utf-8")]
+
+
+def decode_gossip(frame: bytes) -> tuple[str, list[bytes]]:
+    body = json.loads(frame.decode("utf-8"))
+    return body["node"], [i.encode("utf-8") for i in body["identities"]]
+
+
+# ----------------------------
+# Router-side federation state
+# ----------------------------
+
+class RouterFederation:
+    """
+    Federation sockets and routing tables for one ChannelRouter.
+
+    Created and used only inside the router thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        node_id: str,
+        bind_address: str,
+        peers: Iterable[str] = (),
+        gossip_interval_s: float = 1.0,
+        presence_ttl_s: float = 15.0,
+        on_forward: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.node_id = node_id
+        self.bind_address = bind_address
+        self.peers = [p for p in peers if p != node_id]
+        self.gossip_interval_s = gossip_interval_s
+
+        self.local = PresenceTable(presence_ttl_s)
+        self.remote = PresenceTable(gossip_interval_s * 3)
+
+        self._on_forward = on_forward or (lambda peer, kind: None)
+        self._sock: Optional[zmq.Socket] = None
+        self._links: Dict[str, zmq.Socket] = {}
+        self._dialers: set[str] = set()     # Peers that dialed us without being configured
+        self._next_gossip = 0.0
+
+    # --------------------------
+    # Sockets
+    # --------------------------
+
+    @property
+    def socket(self) -> Optional[zmq.Socket]:
+        return self._sock
+
+    def open(self, ctx: zmq.Context) -> None:
+        self._sock = ctx.socket(zmq.ROUTER)
+        self._sock.bind(self.bind_address)
+
+        for peer in self.peers:
+            link = ctx.socket(zmq.DEALER)
+            link.setsockopt_string(zmq.IDENTITY, self.node_id)
+            link.connect(peer)
+            self._links[peer] = link
+
+    def close(self) -> None:
+        for link in self._links.values():
+            link.close(linger=0)
+        self._links.clear()
+        if self._sock is not None:
+            self._sock.close(linger=0)
+            self._sock = None
+
+    # --------------------------
+    # Routing
+    # --------------------------
+
+    def note_local(self, identity: bytes, now: float) -> None:
+        self.local.update("local", [identity], now)
+
+    def route(self, identity: bytes, now: float) -> Optional[str]:
+        """Peer node serving identity, or None to deliver locally."""
+        if self.local.lookup(identity, now) is not None:
+            return None
+        return self.remote.lookup(identity, now)
+
+    def forward_message(self, peer: str, target: bytes, payload: bytes, aux: list) -> bool:
+        return self._send(peer, [KIND_MESSAGE, target, payload, *aux], copy=not aux)
+
+    def forward_ack(self, peer: str, dest: bytes, payload: bytes) -> bool:
+        return self._send(peer, [KIND_ACK, dest, payload])
+
+    def _send(self, peer: str, frames: list, copy: bool = True) -> bool:
+        link = self._links.get(peer)
+        try:
+            if link is not None:
+                link.send_multipart(frames, flags=zmq.NOBLOCK, copy=copy)
+            else:
+                # Peer dialed us but is not in our peer list: reply on our ROUTER
+                self._sock.send_multipart([peer.encode("utf-8"), *frames], flags=zmq.NOBLOCK, copy=copy)
+        except zmq.Again:
+            return False
+        self._on_forward(peer, frames[0].decode("ascii"))
+        return True
+
+    # --------------------------
+    # Gossip / inbound
+    # --------------------------
+
+    def maybe_gossip(self, now: float) -> None:
+        if now < self._next_gossip:
+            return
+        self._next_gossip = now + self.gossip_interval_s
+
+        frames = encode_gossip(self.node_id, self.local.identities(now))
+        self.remote.expire(now)
+        for peer in set(self._links) | self._dialers:
+            self._send(peer, frames)
+
+    def handle_incoming(
+        self,
+        now: float,
+        deliver: Callable[[bytes, bytes, list], None],
+        deliver_ack: Callable[[bytes, bytes], None],
+    ) -> None:
+        """Process one frame set from the federation socket."""
+        frames = self._sock.recv_multipart(copy=False)
+        if len(frames) < 3:
+            return
+        kind = frames[1].bytes
+
+        if kind == KIND_GOSSIP:
+            node, identities = decode_gossip(frames[2].bytes)
+            if node != self.node_id:
+                self.remote.replace_owner(node, identities, now)
+                if node not in self._links:
+                    self._dialers.add(node)
+        elif kind == KIND_MESSAGE and len(frames) >= 4:
+            deliver(frames[2].bytes, frames[3].bytes, frames[4:])
+        elif kind == KIND_ACK and len(frames) >= 4:
+            deliver_ack(frames[2].bytes, frames[3].bytes)
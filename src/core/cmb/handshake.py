@@ -0,0 +1,82 @@
+"""
+Module: handshake.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+HELLO/READY readiness handshake between module endpoints and routers.
+
+ZMQ connects are asynchronous: a DEALER returns from connect() before the
+TCP session exists, and a router that is not up yet simply never sees the
+frames queued for it. Endpoints therefore handshake each socket they
+connect to a router:
+
+    outbound DEALER -> ingress ROUTER   [HELLO_TAG]
+    ingress ROUTER  -> outbound DEALER  [READY_TAG]
+
+    inbound DEALER  -> egress ROUTER    [PRESENCE_TAG]   (see federation.py)
+    egress ROUTER   -> inbound DEALER   [READY_TAG]
+
+The HELLO is repeated every hello_interval_s until READY arrives (the
+router may still be starting). Sends for a channel whose outbound link is
+not ready are buffered by the endpoint and flushed in order once READY
+arrives; the HELLO -> READY time is recorded as the connect latency.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional
+
+
+HELLO_TAG = b"CMBS\x01"
+READY_TAG = b"CMBR\x01"
+
+
+@dataclass
+class _LinkState:
+    connected_at: float
+    next_hello: float
+    ready_at: Optional[float] = None
+
+
+class LinkReadiness:
+    """
+    Handshake state per link (any hashable key, e.g. ("out", "CC")).
+
+    Pure bookkeeping: the endpoint sends HELLOs for hello_due() keys and
+    reports READY frames via on_ready().
+    """
+
+    def __init__(self, hello_interval_s: float = 0.5):
+        self.hello_interval_s = hello_interval_s
+        self._links: Dict[Hashable, _LinkState] = {}
+
+    def on_connect(self, key: Hashable, now: float) -> None:
+        self._links[key] = _LinkState(connected_at=now, next_hello=now)
+
+    def on_disconnect(self, key: Hashable) -> None:
+        self._links.pop(key, None)
+
+    def hello_due(self, now: float) -> List[Hashable]:
+        """Links still waiting for READY whose HELLO should be (re)sent now."""
+        due = []
+        for key, link in self._links.items():
+            if link.ready_at is None and now >= link.next_hello:
+                link.next_hello = now + self.hello_interval_s
+                due.append(key)
+        return due
+
+    def on_ready(self, key: Hashable, now: float) -> Optional[float]:
+        """Mark a link ready; returns the connect latency on the first READY only."""
+        link = self._links.get(key)
+        if link is None or link.ready_at is not None:
+            return None
+        link.ready_at = now
+        return now - link.connected_at
+
+    def is_ready(self, key: Hashable) -> bool:
+        link = self._links.get(key)
+        return link is not None and link.ready_at is not None
+
+    def is_connected(self, key: Hashable) -> bool:
+        return key in self._links
@@ -0,0 +1,155 @@
+"""
+Module: hop_trace.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Optional per-hop latency tracing for CMB messages.
+
+A sampled message carries a compact binary trailer frame (never the JSON
+payload; kind AUX_TRACE, last in the aux layout) that each hop appends a
+timestamp to:
+
+    ENDPOINT_ENQUEUE -> WIRE_SEND -> ROUTER_INGRESS -> ROUTER_EGRESS
+        -> RECEIVER_POLL -> HANDLER_START -> HANDLER_END
+
+Trailer layout:
+    TRACE_TRAILER_TAG | u8 count | count * (u8 hop, u64 epoch_ns)
+
+Receivers fold finished traces into per-channel, per-segment latency
+histograms held by the process-wide HopLatencyStats.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, Iterator, Optional
+
+from src.core.cmb.aux_frames import AUX_TRACE
+from src.core.monitoring.histogram import LatencyHistogram
+
+
+TRACE_TRAILER_TAG = b"CMBH\x01"
+
+_COUNT = struct.Struct("<B")
+_STAMP = struct.Struct("<BQ")
+
+
+class Hop(IntEnum):
+    ENDPOINT_ENQUEUE = 1    # ModuleEndpoint.send() called by module logic
+    WIRE_SEND = 2           # Endpoint thread hands frames to the DEALER socket
+    ROUTER_INGRESS = 3      # Router received frames on its ingress ROUTER
+    ROUTER_EGRESS = 4       # Router forwards to the target's inbound socket
+    RECEIVER_POLL = 5       # Receiving endpoint thread read the frames
+    HANDLER_START = 6       # Module handler invoked
+    HANDLER_END = 7         # Module handler returned
+
+
+# Named segments between consecutive hops
+SEGMENTS = {
+    (Hop.ENDPOINT_ENQUEUE, Hop.WIRE_SEND): "endpoint_queue",
+    (Hop.WIRE_SEND, Hop.ROUTER_INGRESS): "wire_to_router",
+    (Hop.ROUTER_INGRESS, Hop.ROUTER_EGRESS): "router_forward",
+    (Hop.ROUTER_EGRESS, Hop.RECEIVER_POLL): "router_to_receiver",
+    (Hop.RECEIVER_POLL, Hop.HANDLER_START): "receiver_queue",
+    (Hop.HANDLER_START, Hop.HANDLER_END): "handler",
+}
+
+
+@dataclass
+class HopTrace:
+    """Hop timestamps for one sampled message."""
+
+    stamps: list[tuple[int, int]] = field(default_factory=list)  # (hop, epoch ns)
+    channel: Optional[str] = None                                # Set by the receiving endpoint
+
+    def stamp(self, hop: Hop) -> None:
+        self.stamps.append((int(hop), time.time_ns()))
+
+    def to_frame(self) -> bytes:
+        parts = [TRACE_TRAILER_TAG, _COUNT.pack(len(self.stamps))]
+        parts.extend(_STAMP.pack(h, t) for h, t in self.stamps)
+        return b"".join(parts)
+
+    @classmethod
+    def from_frame(cls, frame: Any) -> "HopTrace":
+        data = frame if isinstance(frame, (bytes, bytearray)) else frame.bytes
+        offset = len(TRACE_TRAILER_TAG)
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+
+        stamps = []
+        for _ in range(count):
+            stamps.append(_STAMP.unpack_from(data, offset))
+            offset += _STAMP.size
+        return cls(stamps=stamps)
+
+    def segments(self) -> Iterator[tuple[str, int]]:
+        """Yield (segment_name, duration_ns) for consecutive known hops."""
+        for (h0, t0), (h1, t1) in zip(self.stamps, self.stamps[1:]):
+            name = SEGMENTS.get((h0, h1))
+            if name is not None:
+                yield name, max(0, t1 - t0)
+        if len(self.stamps) >= 2:
+            yield "end_to_end", max(0, self.stamps[-1][1] - self.stamps[0][1])
+
+
+def split_hop_trace(kinds: str, aux: list) -> tuple[Optional[HopTrace], str, list]:
+    """
+    Detach the trailing trace frame from aux frames (see aux_frames).
+
+    Returns (trace or None, remaining kinds, remaining aux frames).
+    """
+    if kinds.endswith(AUX_TRACE):
+        return HopTrace.from_frame(aux[-1]), kinds[:-1], aux[:-1]
+    return None, kinds, aux
+
+
+class HopLatencyStats:
+    """
+    Per-process aggregation of hop traces.
+
+    Histograms are keyed by (channel, segment). Only sampled messages reach
+    record(), so a single lock is sufficient here.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hist: Dict[tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, trace: HopTrace) -> None:
+        channel = trace.channel or "?"
+        with self._lock:
+            for segment, duration_ns in trace.segments():
+                key = (channel, segment)
+                hist = self._hist.get(key)
+                if hist is None:
+                    hist = self._hist[key] = LatencyHistogram()
+                hist.record(duration_ns)
+
+    def histograms(self) -> Dict[tuple[str, str], LatencyHistogram]:
+        with self._lock:
+            return dict(self._hist)
+
+    def snapshot(self) -> Dict[str, Dict[str, dict]]:
+        """{channel: {segment: summary in microseconds}}"""
+        out: Dict[str, Dict[str, dict]] = {}
+        with self._lock:
+            for (channel, segment), hist in sorted(self._hist.items()):
+                out.setdefault(channel, {})[segment] = hist.snapshot(scale=1e-3)
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hist.clear()
+
+
+_HOP_STATS = HopLatencyStats()
+
+
+def hop_latency_stats() -> HopLatencyStats:
+    """Process-wide hop latency aggregator."""
+    return _HOP_STATS
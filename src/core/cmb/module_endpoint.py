@@ -4,21 +4,58 @@ from __future__ import annotations
 import threading
 import time
 import queue
+import random
+from collections import deque
 from typing import Optional, Callable, Any
 from typing import Dict
 import zmq
 import json
 
-from src.core.cmb.utils import extract_message_id
+from src.core.cmb.utils import extract_routing, split_inbound_frames
+from src.core.cmb.aux_frames import (
+    AUX_COMPRESSED,
+    AUX_SEQ,
+    AUX_TENSOR_BUFFER,
+    AUX_TENSOR_HEADER,
+    AUX_TRACE,
+    pack_aux,
+    unpack_aux,
+)
+from src.core.cmb.tensor_frames import (
+    encode_tensor_frames,
+    decode_tensor_frames,
+)
+from src.core.cmb.hop_trace import Hop, HopTrace, split_hop_trace
+from src.core.cmb.sequencing import ReorderBuffer, seq_frame, split_seq
+from src.core.cmb.compression import ChannelCompressor, decode_message
+from src.core.cmb.schema_registry import PayloadValidator, ValidationPoint
+from src.core.cmb.ack_hub import ack_egress_port
+from src.core.cmb.federation import PRESENCE_TAG
+from src.core.cmb.delivery_groups import GroupCompletion, is_group_address
+from src.core.cmb.delivery_policy import DeliveryPolicy
+from src.core.cmb.transport_qos import io_context
+from src.core.cmb.handshake import HELLO_TAG, READY_TAG, LinkReadiness
+from src.core.cmb.chunking import (
+    CHUNK_MSG_TYPE,
+    MODE_MESSAGE,
+    MODE_STREAM,
+    WINDOW_ACK_TYPE,
+    OutboundStream,
+    Reassembler,
+    envelope_fields,
+)
+from src.core.cmb.progress import PROGRESS_ACK_TYPE, ResultStream, progress_ack
+from src.core.cmb.transport_state_machine import AckState
+from src.core.monitoring.metrics import metrics_registry
 from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
 from src.core.cmb.channel_registry import InboundDelivery
 from src.core.cmb.transaction_registry import TransactionRegistry
+from src.core.cmb.cmb_exceptions import TransportError
 from src.core.messages.ack_message import AckMessage
 from src.core.messages.cognitive_message import CognitiveMessage
-from src.core.logging.log_manager import LogManager, Logger
+from src.core.logging.log_manager import Logger
 from src.core.logging.log_entry import LogEntry
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
+from src.core.logging.log_hub import log_hub
 
 
 class ModuleEndpoint:
@@ -34,6 +71,8 @@ class ModuleEndpoint:
       - _send_q: module logic -> endpoint (outbound messages)
       - _in_q: endpoint -> module logic (inbound messages)
       - _ack_q: endpoint -> module logic (ACK messages)
+      - _stream_q: module logic -> endpoint (send_stream() transfers)
+      - _result_streams: endpoint -> module logic (send_request() partial results)
     """
 
     def __init__(
@@ -48,10 +87,7 @@ class ModuleEndpoint:
         self.cfg = config
 
         # Logging
-        self.log_manager = LogManager(min_severity=LogSeverity.INFO)
-        self.log_manager.register_sink(
-        FileLogSink("logs/system.jsonl")
-        )
+        self.log_manager = log_hub()
         self.logger = Logger(self.cfg.module_id, self.log_manager)
 
         # Old logger function fallback
@@ -61,7 +97,7 @@ class ModuleEndpoint:
         self._to_bytes = serializer or (lambda x: x if isinstance(x, (bytes, bytearray)) else str(x).encode("utf-8"))
         self._from_bytes = deserializer or (lambda b: b)
 
-        self._send_q: "queue.Queue[tuple[str,bytes, bytes]]" = queue.Queue()
+        self._send_q: "queue.Queue[tuple[str, bytes, bytes, list, Optional[HopTrace], Optional[GroupCompletion]]]" = queue.Queue()
         self._in_q: "queue.Queue[Any]" = queue.Queue()
         self._ack_q: "queue.Queue[Any]" = queue.Queue()
 
@@ -72,14 +108,178 @@ class ModuleEndpoint:
         self._ctx = None
         self._out_socks: dict[str, zmq.Socket] = {}
         self._in_socks: dict[str, zmq.Socket] = {}
-        self._ack_socks: dict[str, zmq.Socket] = {}
+        self._ack_socks: dict[int, zmq.Socket] = {}     # by ACK hub port (shared across channels)
+        self._ack_refs: dict[int, int] = {}             # outbound channels using each ACK socket
+        self._out_last_used: dict[str, float] = {}
         self._poller = None
 
         self._sock_to_channel: dict[zmq.Socket, str] = {}
         self._sock_is_ack: dict[zmq.Socket, bool] = {}
 
+        # Inbound subscriptions; changes requested from module threads are
+        # applied by the endpoint thread via _ctl_q.
+        self._subscribed: set[str] = set(self.cfg.subscribed_channels())
+        self._ctl_q: "queue.Queue[tuple[str, str]]" = queue.Queue()
+        self._next_idle_check = 0.0
+        self._next_presence = 0.0
+
+        # Readiness handshake: link keys are ("out" | "in", channel). The
+        # endpoint thread owns _readiness/_pending; _ready_links mirrors ready
+        # links for wait_ready() callers.
+        self._readiness = LinkReadiness(self.cfg.hello_interval_s)
+        self._pending: dict[str, deque] = {}
+        self._out_sock_channel: dict[zmq.Socket, str] = {}
+        self._ready_cv = threading.Condition()
+        self._ready_links: set[tuple[str, str]] = set()
+
+        # Progress protocol: partial-result streams of our send_request()s,
+        # and per-request progress sequence numbers for send_progress()
+        self._result_streams: dict[str, ResultStream] = {}
+        self._progress_seq: dict[str, int] = {}
+        self._progress_lock = threading.Lock()
+
+        # Ordered channels: our per-(channel, target) sequence numbers,
+        # reordering of sequenced inbound streams, and the reorder slot of
+        # each sequenced inbound chunked transfer by (source, message_id)
+        self._seq_epoch = random.getrandbits(32)
+        self._next_seq: dict[tuple[str, bytes], int] = {}
+        self._transfer_seqs: dict[tuple, tuple] = {}
+        self._reorder = ReorderBuffer(
+            self.cfg.reorder_window,
+            self.cfg.reorder_gap_timeout_s,
+            self.cfg.reorder_idle_timeout_s,
+            on_gap=self._on_sequence_gap,
+            on_duplicate=lambda key, seq: self._m_seq_duplicates.inc(),
+        )
+
+        # Payload compression state per channel (endpoint thread)
+        self._compressors: dict[str, ChannelCompressor] = {}
+
+        # Inbound payload schema validation per channel (endpoint thread)
+        self._validators: dict[str, Optional[PayloadValidator]] = {}
+
+        # Chunked transfers: outbound streams by message_id (endpoint thread),
+        # send_stream() requests from module threads, inbound reassembly.
+        self._out_streams: dict[str, OutboundStream] = {}
+        self._stream_q: "queue.Queue[tuple[str, str, dict, Any]]" = queue.Queue()
+        self._reassembler = Reassembler(
+            self.cfg.max_reassembly_bytes,
+            on_window_ack=self._send_window_ack,
+            stream_timeout_s=self.cfg.chunk_stall_timeout_s,
+        )
+
         self._tx_registry = TransactionRegistry()
 
+        self._init_metrics()
+
+    def _init_metrics(self) -> None:
+        """Register endpoint series once; hot paths only touch cached handles."""
+        metrics = metrics_registry()
+        module = self.cfg.module_id
+
+        for queue_name, q in (("send", self._send_q), ("in", self._in_q), ("ack", self._ack_q)):
+            metrics.gauge(
+                "cmb_endpoint_queue_depth",
+                "Messages waiting in ModuleEndpoint queues",
+                fn=q.qsize,
+                module=module,
+                queue=queue_name,
+            )
+
+        for state in AckState:
+            metrics.gauge(
+                "cmb_transactions",
+                "Endpoint transactions by ACK state",
+                fn=lambda name=state.name: self._tx_registry.state_counts().get(name, 0),
+                module=module,
+                state=state.name,
+            )
+
+        metrics.gauge(
+            "cmb_endpoint_sockets",
+            "Open ZMQ sockets held by the endpoint",
+            fn=lambda: len(self._out_socks) + len(self._in_socks) + len(self._ack_socks),
+            module=module,
+        )
+
+        self._m_sent = metrics.counter(
+            "cmb_endpoint_sent_total", "Frames written to outbound sockets", module=module
+        )
+        self._m_received = metrics.counter(
+            "cmb_endpoint_received_total", "Inbound messages delivered to module logic", module=module
+        )
+        self._m_invalid = metrics.counter(
+            "cmb_endpoint_invalid_total", "Messages dropped as invalid (e.g. unknown delivery policy)", module=module
+        )
+        self._m_ready_dropped = metrics.counter(
+            "cmb_endpoint_ready_buffer_dropped_total",
+            "Sends dropped because a not-yet-ready channel's buffer was full",
+            module=module,
+        )
+        metrics.gauge(
+            "cmb_endpoint_ready_buffered",
+            "Sends buffered until their channel's router link is READY",
+            fn=lambda: sum(len(d) for d in list(self._pending.values())),
+            module=module,
+        )
+        self._m_connect_latency = {
+            direction: metrics.histogram(
+                "cmb_endpoint_connect_latency_seconds",
+                "Time from socket connect to the router's READY",
+                module=module,
+                direction=direction,
+            )
+            for direction in ("out", "in")
+        }
+        self._m_seq_gaps = metrics.counter(
+            "cmb_endpoint_sequence_gaps_total",
+            "Sequence numbers skipped on ordered streams (lost or too late)",
+            module=module,
+        )
+        self._m_seq_duplicates = metrics.counter(
+            "cmb_endpoint_sequence_duplicates_total", "Duplicate sequenced messages dropped", module=module
+        )
+        metrics.gauge(
+            "cmb_endpoint_reorder_buffered",
+            "Inbound messages held back waiting for earlier sequence numbers",
+            fn=lambda: self._reorder.buffered(),
+            module=module,
+        )
+        self._m_chunks_sent = metrics.counter(
+            "cmb_endpoint_chunks_sent_total", "Chunks of large messages / streams sent", module=module
+        )
+        self._m_chunk_aborts = metrics.counter(
+            "cmb_endpoint_chunk_transfers_aborted_total", "Chunked transfers dropped (gap, overflow, stall)", module=module
+        )
+        metrics.gauge(
+            "cmb_endpoint_reassembly_bytes",
+            "Bytes buffered for inbound chunked messages",
+            fn=lambda: self._reassembler.buffered_bytes,
+            module=module,
+        )
+        self._m_compressed_saved = metrics.counter(
+            "cmb_endpoint_compression_saved_bytes_total",
+            "Payload bytes saved on the wire by channel compression",
+            module=module,
+        )
+        self._m_compression_disabled = metrics.counter(
+            "cmb_endpoint_compression_disabled_total",
+            "Times a channel switched compression off (CPU cost above bandwidth saved)",
+            module=module,
+        )
+        self._m_conflated = metrics.counter(
+            "cmb_endpoint_conflated_total", "Inbound messages superseded on conflating channels", module=module
+        )
+        self._m_ack_latency = {
+            ack_type: metrics.histogram(
+                "cmb_ack_latency_seconds",
+                "Time from transaction creation to ACK receipt",
+                module=module,
+                ack_type=ack_type,
+            )
+            for ack_type in ("ROUTER_ACK", "MESSAGE_DELIVERED_ACK")
+        }
+
     # --------------------------
     # Public API (module side)
     # --------------------------
@@ -111,16 +311,181 @@ class ModuleEndpoint:
                 "channels": list(self.cfg.channels.keys())
             }
         )
+        self.log_manager.flush(timeout=1.0)
 
     
-    def send(self, channel: str, target_id: str, payload: bytes) -> None:
+    def send(
+        self,
+        channel: str,
+        target_id: str,
+        payload: bytes,
+        *,
+        complete_on: "str | GroupCompletion | None" = None,
+    ) -> None:
+        """
+        Queue a message for sending.
+
+        target_id "@<group>" addresses a router-registered delivery group:
+        members' delivery ACKs are aggregated and a single
+        MESSAGE_DELIVERED_ACK is surfaced once complete_on ("all" by
+        default, "any" or "quorum:<n>") is met.
+        """
         if not isinstance(payload, (bytes, bytearray)):
             raise TypeError(
                 f"ModuleEndpoint.send expects bytes, got {type(payload)}"
             )
         dest = target_id.encode("utf-8")
-        self._send_q.put((channel, dest, payload))
+        completion = self._group_completion(target_id, complete_on)
+        self._send_q.put((channel, dest, payload, [], self._maybe_trace(), completion))
+
+    def send_tensors(
+        self,
+        channel: str,
+        target_id: str,
+        payload: bytes,
+        tensors: Dict[str, Any],
+    ) -> None:
+        """
+        Send a message with ndarray attachments as separate binary frames.
 
+        The JSON payload stays small; array buffers follow it as raw frames
+        and are sent zero-copy. Receivers find them on msg.tensors.
+        """
+        if not isinstance(payload, (bytes, bytearray)):
+            raise TypeError(
+                f"ModuleEndpoint.send_tensors expects bytes, got {type(payload)}"
+            )
+        aux = encode_tensor_frames(tensors)
+        dest = target_id.encode("utf-8")
+        completion = self._group_completion(target_id, None)
+        self._send_q.put((channel, dest, payload, aux, self._maybe_trace(), completion))
+
+    def send_stream(self, channel: str, target_id: str, payload: bytes, data: Any) -> None:
+        """
+        Send a header message followed by `data` (bytes or an iterable of
+        bytes) as a chunk stream. The receiver gets the header message at
+        once with msg.stream yielding the chunks as they arrive.
+
+        Iterables are read lazily from the endpoint thread as the sender
+        window opens.
+        """
+        if not isinstance(payload, (bytes, bytearray)):
+            raise TypeError(
+                f"ModuleEndpoint.send_stream expects bytes, got {type(payload)}"
+            )
+        if is_group_address(target_id):
+            raise ValueError("Streams cannot target delivery groups")
+        if self.cfg.get_channel(channel).ack_port is None:
+            raise ValueError(f"Channel {channel} has no ACK path for stream flow control")
+        self._stream_q.put((channel, target_id, json.loads(payload), data))
+
+    def send_request(
+        self,
+        channel: str,
+        target_id: str,
+        payload: bytes,
+        *,
+        timeout_s: float = 30.0,
+    ) -> ResultStream:
+        """
+        Send a request to a long-running handler and return a ResultStream
+        of its partial results (see send_progress()).
+
+        timeout_s is the execution deadline; every progress ACK extends it.
+        """
+        if not isinstance(payload, (bytes, bytearray)):
+            raise TypeError(
+                f"ModuleEndpoint.send_request expects bytes, got {type(payload)}"
+            )
+        if is_group_address(target_id):
+            raise ValueError("Requests cannot target delivery groups")
+        message_id, msg_type, delivery = extract_routing(payload)
+        if self._send_policy(channel, msg_type, delivery) is not DeliveryPolicy.END_TO_END:
+            raise ValueError("send_request needs END_TO_END delivery")
+        stream = ResultStream(message_id, timeout_s)
+        self._result_streams[message_id] = stream
+        self._send_q.put((channel, target_id.encode("utf-8"), payload, [], self._maybe_trace(), None))
+        return stream
+
+    def send_progress(
+        self,
+        request: CognitiveMessage,
+        partial: Any,
+        *,
+        final: bool = False,
+        channel: str = "CC",
+    ) -> None:
+        """
+        Report a partial result for `request` back to its sender. Call with
+        final=True once (with the last part, or None) to complete it.
+        """
+        with self._progress_lock:
+            seq = self._progress_seq.get(request.message_id, 0)
+            if final:
+                self._progress_seq.pop(request.message_id, None)
+            else:
+                self._progress_seq[request.message_id] = seq + 1
+        ack = progress_ack(self.cfg.module_id, request.source, request.message_id, seq, partial, final)
+        self.send(channel, request.source, ack.to_bytes())
+
+    @staticmethod
+    def _group_completion(target_id: str, complete_on) -> Optional[GroupCompletion]:
+        if not is_group_address(target_id):
+            if complete_on is not None:
+                raise ValueError("complete_on applies to group targets ('@<group>') only")
+            return None
+        return GroupCompletion.parse(complete_on or "all")
+
+    def _maybe_trace(self) -> Optional[HopTrace]:
+        """Start a hop trace for this send if it falls in the sample."""
+        rate = self.cfg.trace_sample_rate
+        if rate <= 0.0 or (rate < 1.0 and random.random() >= rate):
+            return None
+        trace = HopTrace()
+        trace.stamp(Hop.ENDPOINT_ENQUEUE)
+        return trace
+
+
+    def wait_ready(self, timeout: Optional[float] = None, channels: Optional[list[str]] = None) -> bool:
+        """
+        Block until the router links of `channels` (default: subscribed
+        channels) completed the HELLO/READY handshake.
+
+        Outbound sockets of those channels are connected now rather than on
+        first send. Returns False on timeout.
+        """
+        channels = list(channels) if channels is not None else self.cfg.subscribed_channels()
+        keys = []
+        for ch_name in channels:
+            ch_cfg = self.cfg.get_channel(ch_name)
+            self._ctl_q.put(("connect", ch_name))
+            keys.append(("out", ch_name))
+            if (
+                ch_name in self._subscribed
+                and ch_cfg.inbound_port is not None
+                and ch_cfg.inbound_delivery != InboundDelivery.BROADCAST
+            ):
+                keys.append(("in", ch_name))
+
+        with self._ready_cv:
+            return self._ready_cv.wait_for(
+                lambda: all(k in self._ready_links for k in keys),
+                timeout=timeout,
+            )
+
+    def is_ready(self, channel: str) -> bool:
+        """True once sends on `channel` go straight to the router."""
+        with self._ready_cv:
+            return ("out", channel) in self._ready_links
+
+    def subscribe(self, channel: str) -> None:
+        """Connect the inbound socket for a channel (no-op if already subscribed)."""
+        self.cfg.get_channel(channel)
+        self._ctl_q.put(("subscribe", channel))
+
+    def unsubscribe(self, channel: str) -> None:
+        """Disconnect the inbound socket for a channel."""
+        self._ctl_q.put(("unsubscribe", channel))
 
     def recv(self, timeout: Optional[float] = None) -> Optional[Any]:
         """Receive a normal inbound message (not ACK)."""
@@ -158,12 +523,16 @@ class ModuleEndpoint:
     # Endpoint thread internals
     # --------------------------
 
+    def _channels_payload(self) -> dict:
+        # Deferred log payload: only built when the entry is logged
+        return {"channels": list(self.cfg.channels.keys())}
+
     def _run(self) -> None:
         try:
             self._setup_zmq()
             self._loop()
         except Exception as e:
-            self.logger.info(
+            self.logger.error(
                 event_type="ENDPOINT_EXCEPTION",
                 message=f"ModuleEndpoint exception in {self.cfg.module_id}: {e!r}",
                 payload={
@@ -173,6 +542,8 @@ class ModuleEndpoint:
      
         finally:
             self._teardown_zmq()
+            for message_id in list(self._result_streams):
+                self._end_result(message_id, "endpoint stopped")
             self.logger.info(
                     event_type="ENDPOINT_TEARDOWN",
                     message=f"ModuleEndpoint {self.cfg.module_id}  teardown complete ",
@@ -183,7 +554,10 @@ class ModuleEndpoint:
 
     def _setup_zmq(self) -> None:
         """
-        Create and connect ZMQ sockets for all configured channels.
+        Create the poller and connect inbound sockets for subscribed channels.
+        Outbound and ACK sockets are connected on first send to a channel
+        (see _ensure_outbound), so socket count and poller cost scale with the
+        channels a module actually uses.
         Runs exclusively inside the endpoint thread.
         """
         self._ctx = zmq.Context.instance()
@@ -191,96 +565,232 @@ class ModuleEndpoint:
         # Poller for all inbound + ACK sockets
         self._poller = zmq.Poller()
 
-        for ch_name, ch_cfg in self.cfg.channels.items():
-            # ---------------------------
-            # Outbound socket (DEALER -> ROUTER)
-            # ---------------------------
-            out_sock = self._ctx.socket(ch_cfg.outbound_socket_type)
-            out_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
-            out_sock.connect(f"tcp://{self.cfg.host}:{ch_cfg.router_port}")
+        for ch_name in sorted(self._subscribed):
+            self._connect_inbound(ch_name)
 
-            self._out_socks[ch_name] = out_sock
+    def _connect_inbound(self, ch_name: str) -> None:
+        ch_cfg = self.cfg.channels.get(ch_name)
+        if ch_cfg is None or ch_cfg.inbound_port is None or ch_name in self._in_socks:
+            return
 
-            self.logger.info(
-                event_type="ENDPOINT_OUTBOUND_SETUP",
-                message=f"ModuleEndpoint {self.cfg.module_id} setup outbound {ch_name} ",
-                payload={
-                    "channels": list(self.cfg.channels.keys())
-                }
-            )
+        ctx = io_context(ch_cfg.qos.io_pool)
+        if ch_cfg.inbound_delivery == InboundDelivery.BROADCAST:
+            in_sock = ctx.socket(zmq.SUB)
+            in_sock.setsockopt(zmq.SUBSCRIBE, b"")
+        else:
+            in_sock = ctx.socket(zmq.DEALER)
+        ch_cfg.qos.apply(in_sock)
 
-            # ---------------------------
-            # Inbound socket (optional)
-            # ---------------------------
-            if ch_cfg.inbound_port is not None:
-                if ch_cfg.inbound_delivery == InboundDelivery.BROADCAST:
-                    in_sock = self._ctx.socket(zmq.SUB)
-                    in_sock.setsockopt(zmq.SUBSCRIBE, b"")
-                else:
-                    in_sock = self._ctx.socket(zmq.DEALER)
-                    in_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
+        # Identity is required for DEALER, ignored for SUB
+        in_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
+        in_sock.connect(f"tcp://{self.cfg.host}:{ch_cfg.inbound_port}")
+
+        self._in_socks[ch_name] = in_sock
+        self._sock_to_channel[in_sock] = ch_name
+        self._sock_is_ack[in_sock] = False
+        self._poller.register(in_sock, zmq.POLLIN)
+        if ch_cfg.inbound_delivery != InboundDelivery.BROADCAST:
+            # Presence frames double as this link's HELLO
+            self._readiness.on_connect(("in", ch_name), time.monotonic())
+
+        self.logger.info(
+            event_type="ENDPOINT_INBOUND_SETUP",
+            message=f"ModuleEndpoint {self.cfg.module_id} setup inbound {ch_name} ",
+            payload={
+                "channel": ch_name
+            }
+        )
 
+    def _announce(self, in_sock: zmq.Socket) -> None:
+        # Presence frame; the router learns our identity from the envelope
+        try:
+            in_sock.send(PRESENCE_TAG, flags=zmq.NOBLOCK)
+        except zmq.Again:
+            pass
 
-                # Identity is required for DEALER, ignored for SUB
-                in_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
+    def _send_presence(self, now: float) -> None:
+        interval = self.cfg.presence_interval_s
+        if interval is None or now < self._next_presence:
+            return
+        self._next_presence = now + interval
+        for ch_name, in_sock in self._in_socks.items():
+            if self.cfg.channels[ch_name].inbound_delivery != InboundDelivery.BROADCAST:
+                self._announce(in_sock)
+
+    def _disconnect_inbound(self, ch_name: str) -> None:
+        in_sock = self._in_socks.pop(ch_name, None)
+        if in_sock is None:
+            return
+        self._close_socket(in_sock)
+        self._link_down(("in", ch_name))
 
-                # SUB sockets must subscribe explicitly
-                if ch_cfg.inbound_delivery.name == "BROADCAST":
-                    in_sock.setsockopt(zmq.SUBSCRIBE, b"")
+        self.logger.info(
+            event_type="ENDPOINT_INBOUND_CLOSED",
+            message=f"ModuleEndpoint {self.cfg.module_id} closed inbound {ch_name} ",
+            payload={
+                "channel": ch_name
+            }
+        )
 
-                in_sock.connect(f"tcp://{self.cfg.host}:{ch_cfg.inbound_port}")
+    def _ensure_outbound(self, ch_name: str) -> Optional[zmq.Socket]:
+        """Return the outbound socket for a channel, connecting it (and its ACK path) on first use."""
+        out_sock = self._out_socks.get(ch_name)
+        if out_sock is not None:
+            self._out_last_used[ch_name] = time.monotonic()
+            return out_sock
 
-                self._in_socks[ch_name] = in_sock
-                self._sock_to_channel[in_sock] = ch_name
-                self._sock_is_ack[in_sock] = False
-                self._poller.register(in_sock, zmq.POLLIN)
+        ch_cfg = self.cfg.channels.get(ch_name)
+        if ch_cfg is None or self._ctx is None:
+            return None
 
-                self.logger.info(
-                    event_type="ENDPOINT_INBOUND_SETUP",
-                    message=f"ModuleEndpoint {self.cfg.module_id} setup inbound {ch_name} ",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
-                )
+        # ---------------------------
+        # Outbound socket (DEALER -> ROUTER)
+        # ---------------------------
+        out_sock = io_context(ch_cfg.qos.io_pool).socket(ch_cfg.outbound_socket_type)
+        ch_cfg.qos.apply(out_sock)
+        out_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
+        out_sock.connect(f"tcp://{self.cfg.host}:{ch_cfg.router_port}")
+
+        self._out_socks[ch_name] = out_sock
+        self._out_last_used[ch_name] = time.monotonic()
 
+        # Polled only for the router's READY reply
+        self._out_sock_channel[out_sock] = ch_name
+        self._sock_to_channel[out_sock] = ch_name
+        self._sock_is_ack[out_sock] = False
+        self._poller.register(out_sock, zmq.POLLIN)
+        self._readiness.on_connect(("out", ch_name), time.monotonic())
 
-            # ---------------------------
-            # ACK socket (optional, DIRECTED only)
-            # ---------------------------
-            if ch_cfg.ack_port is not None:
-                ack_sock = self._ctx.socket(ch_cfg.ack_socket_type)
-                ack_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
-                ack_sock.connect(f"tcp://{self.cfg.host}:{ch_cfg.ack_port}")
+        self.logger.info(
+            event_type="ENDPOINT_OUTBOUND_SETUP",
+            message=f"ModuleEndpoint {self.cfg.module_id} setup outbound {ch_name} ",
+            payload={
+                "channel": ch_name
+            }
+        )
 
-                self._ack_socks[ch_name] = ack_sock
-                self._sock_to_channel[ack_sock] = ch_name
-                self._sock_is_ack[ack_sock] = True
-                self._poller.register(ack_sock, zmq.POLLIN)
+        # ---------------------------
+        # ACK socket (optional, DIRECTED only; shared by channels on one ACK port)
+        # ---------------------------
+        if ch_cfg.ack_port is not None:
+            self._acquire_ack(ch_name, ch_cfg)
 
-                self.logger.info(
-                    event_type="ENDPOINT_ACK_SETUP",
-                    message=f"ModuleEndpoint {self.cfg.module_id} setup ACK {ch_name} ",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
-                )
+        return out_sock
 
+    def _ack_port(self, ch_name: str) -> int:
+        # ACK hub shard serving this module's identity
+        base = self.cfg.channels[ch_name].ack_port
+        return ack_egress_port(base, self.cfg.module_id, self.cfg.ack_shards)
+
+    def _acquire_ack(self, ch_name: str, ch_cfg) -> None:
+        port = self._ack_port(ch_name)
+        if port in self._ack_socks:
+            self._ack_refs[port] += 1
+            return
+
+        ack_sock = self._ctx.socket(ch_cfg.ack_socket_type)
+        ack_sock.setsockopt_string(zmq.IDENTITY, self.cfg.module_id)
+        ack_sock.connect(f"tcp://{self.cfg.host}:{port}")
+
+        self._ack_socks[port] = ack_sock
+        self._ack_refs[port] = 1
+        self._sock_to_channel[ack_sock] = ch_name
+        self._sock_is_ack[ack_sock] = True
+        self._poller.register(ack_sock, zmq.POLLIN)
+
+        self.logger.info(
+            event_type="ENDPOINT_ACK_SETUP",
+            message=f"ModuleEndpoint {self.cfg.module_id} setup ACK {ch_name} ",
+            payload={
+                "channel": ch_name,
+                "ack_port": port
+            }
+        )
+
+    def _release_ack(self, port: int) -> None:
+        if port not in self._ack_refs:
+            return
+        self._ack_refs[port] -= 1
+        if self._ack_refs[port] > 0:
+            return
+        del self._ack_refs[port]
+        self._close_socket(self._ack_socks.pop(port))
+
+    def _close_idle_channels(self, now: float) -> None:
+        """Disconnect outbound sockets (and unused ACK sockets) idle for idle_disconnect_s."""
+        idle_s = self.cfg.idle_disconnect_s
+        if idle_s is None or now < self._next_idle_check:
+            return
+        self._next_idle_check = now + min(idle_s, 1.0)
+
+        for ch_name, last_used in list(self._out_last_used.items()):
+            if now - last_used < idle_s:
+                continue
+
+            del self._out_last_used[ch_name]
+            # Linger briefly so frames already handed to ZMQ still go out
+            self._close_socket(self._out_socks.pop(ch_name), linger_ms=1000)
+            # Sends still buffered for the channel wait for its next use
+            self._link_down(("out", ch_name))
+
+            if self.cfg.channels[ch_name].ack_port is not None:
+                self._release_ack(self._ack_port(ch_name))
+
+            self.logger.info(
+                event_type="ENDPOINT_CHANNEL_IDLE_DISCONNECT",
+                message=f"ModuleEndpoint {self.cfg.module_id} closed idle outbound {ch_name} ",
+                payload={
+                    "channel": ch_name,
+                    "idle_s": round(now - last_used, 3)
+                }
+            )
+
+    def _apply_control(self) -> None:
+        while True:
+            try:
+                op, ch_name = self._ctl_q.get_nowait()
+            except queue.Empty:
+                return
+            if op == "subscribe":
+                self._subscribed.add(ch_name)
+                self._connect_inbound(ch_name)
+            elif op == "unsubscribe":
+                self._subscribed.discard(ch_name)
+                self._disconnect_inbound(ch_name)
+            elif op == "connect":
+                self._ensure_outbound(ch_name)
+
+    def _close_socket(self, sock: zmq.Socket, linger_ms: int = 0) -> None:
+        if self._poller is not None and sock in self._sock_to_channel:
+            try:
+                self._poller.unregister(sock)
+            except KeyError:
+                pass
+        self._sock_to_channel.pop(sock, None)
+        self._sock_is_ack.pop(sock, None)
+        self._out_sock_channel.pop(sock, None)
+        try:
+            sock.close(linger=linger_ms)
+        except Exception:
+            pass
 
     def _teardown_zmq(self) -> None:
         # Close sockets created in thread
         for sock_dict in (self._out_socks, self._in_socks, self._ack_socks):
-            if not sock_dict:
-                continue
             for sock in sock_dict.values():
                 try:
                     sock.close(linger=0)
                 except Exception:
                     pass
-
-
-        self._out_socks = None
-        self._in_socks = None
-        self._ack_socks = None
+            sock_dict.clear()
+
+        self._ack_refs.clear()
+        self._out_last_used.clear()
+        self._sock_to_channel.clear()
+        self._sock_is_ack.clear()
+        self._out_sock_channel.clear()
+        with self._ready_cv:
+            self._ready_links.clear()
         self._poller = None
 
         # Do NOT terminate Context.instance() here; other endpoints may use it.
@@ -298,20 +808,44 @@ class ModuleEndpoint:
             self._tx_registry.cleanup_completed()
             """
 
-            # 1) Flush outbound messages (fair, bounded)
+            # 0) Apply subscription changes, drop idle outbound channels,
+            #    handshake new router links, refresh presence
+            now = time.monotonic()
+            self._apply_control()
+            self._close_idle_channels(now)
+            self._send_hellos(now)
+            self._send_presence(now)
+            self._check_result_deadlines()
+            for item in self._reorder.expire(now):
+                if item is not None:
+                    self._deliver(*item)
+            for key, reason in self._reassembler.tick(now):
+                self._deliver_transfer(key, None)
+                self._reassembly_aborted(key, None, reason)
+
+            # 1) Flush outbound messages (fair, bounded), then interleave a
+            #    bounded number of chunks from large transfers
             self._flush_outbound(max_per_tick=50)
+            self._start_queued_streams()
+            self._pump_streams(max_chunks=8, now=now)
 
             # 2) Poll inbound + ACK sockets
             if self._poller is None:
                 time.sleep(0.01)
                 continue
+            if not self._sock_to_channel:
+                # Nothing connected for inbound yet; zmq.Poller would return at once
+                time.sleep(self.cfg.poll_timeout_ms / 1000.0)
+                continue
 
+            # Don't sleep in poll while a stream still has window to send
+            timeout_ms = 0 if self._streams_sendable() else self.cfg.poll_timeout_ms
             try:
-                events = dict(self._poller.poll(self.cfg.poll_timeout_ms))
+                events = dict(self._poller.poll(timeout_ms))
             except zmq.ZMQError as e: 
                 # Context terminated or shutting down
 
-                self.logger.info(
+                self.logger.error(
                     event_type="ENDPOINT_ZMQ_ERROR",
                     message=f"ModuleEndpoint {self.cfg.module_id} poller error : {e!r}",
                     payload={
@@ -323,6 +857,10 @@ class ModuleEndpoint:
 
             # 3) Dispatch ready sockets
             for sock in events:
+                out_channel = self._out_sock_channel.get(sock)
+                if out_channel is not None:
+                    self._handle_outbound_reply(sock, out_channel)
+                    continue
                 is_ack = self._sock_is_ack.get(sock, False)
                 self._handle_inbound(sock, is_ack=is_ack)
 
@@ -330,22 +868,24 @@ class ModuleEndpoint:
     def _flush_outbound(self, max_per_tick: int) -> None:
         """
         Flush outbound messages across all channels.
-        Respects backpressure and preserves message ordering per channel.
+        Respects backpressure and preserves message ordering per channel:
+        sends for a channel whose router link is not READY (or that still
+        has buffered sends) are buffered and flushed once it is.
         """
-        sent = 0
+        sent = self._flush_pending(max_per_tick)
 
         while sent < max_per_tick:
             try:
-                ch_name, dest, payload = self._send_q.get_nowait()
-
+                item = self._send_q.get_nowait()
             except queue.Empty:
                 return
+            ch_name = item[0]
 
-            # Get outbound socket for channel
-            out_sock = self._out_socks.get(ch_name)
+            # Get (or lazily connect) outbound socket for channel
+            out_sock = self._ensure_outbound(ch_name)
             if out_sock is None:
 
-                self.logger.info(
+                self.logger.warning(
                     event_type="ENDPOINT_NO_OUTBOUND_SOCKET",
                     message=f"ModuleEndpoint {self.cfg.module_id} out_sock None {ch_name} ",
                     payload={
@@ -355,76 +895,330 @@ class ModuleEndpoint:
 
                 continue
 
-            # Send message
-            try:                
-                message_id = extract_message_id(payload)
-                tx = self._tx_registry.create(
+            if self._pending.get(ch_name) or not self._readiness.is_ready(("out", ch_name)):
+                self._buffer_until_ready(ch_name, item)
+                continue
+
+            if self._should_chunk(item):
+                try:
+                    message = json.loads(item[2])
+                except ValueError as e:
+                    self._m_invalid.inc()
+                    self._drop_unsent(ch_name, item, f"invalid message: {e}")
+                    continue
+                self._start_stream(ch_name, item[1], message, MODE_MESSAGE, item[2], item[5])
+                continue
+
+            if not self._send_item(out_sock, item):
+                # Backpressure: keep it first in line for this channel
+                self._pending.setdefault(ch_name, deque()).append(item)
+                return
+            sent += 1
+
+    def _flush_pending(self, budget: int) -> int:
+        """Send buffered items of READY channels in order; returns count sent."""
+        sent = 0
+        for ch_name, items in self._pending.items():
+            if not items or not self._readiness.is_ready(("out", ch_name)):
+                continue
+            out_sock = self._out_socks.get(ch_name)
+            while items and sent < budget:
+                if not self._send_item(out_sock, items[0]):
+                    break
+                items.popleft()
+                sent += 1
+        return sent
+
+    def _buffer_until_ready(self, ch_name: str, item: tuple) -> None:
+        items = self._pending.setdefault(ch_name, deque())
+        if len(items) >= self.cfg.ready_buffer_limit:
+            self._drop_unsent(ch_name, items.popleft(), "ready buffer full")
+            self._m_ready_dropped.inc()
+        items.append(item)
+
+    def _drop_unsent(self, ch_name: str, item: tuple, reason: str) -> None:
+        """
+        Give up on a queued send that never reached the wire. It has no
+        transaction yet, so its waiters are failed here: a send_request()
+        stream ends with an error, a group send gets a FAILURE completion.
+        """
+        _, dest, payload, _, _, completion = item
+        try:
+            message_id = extract_routing(payload)[0]
+        except ValueError:
+            message_id = None
+
+        self.logger.warning(
+            event_type="ENDPOINT_SEND_DROPPED",
+            message=f"ModuleEndpoint {self.cfg.module_id} dropped unsent message_id={message_id} on {ch_name}: {reason}",
+            payload={
+                "channel": ch_name,
+                "target": dest.decode("utf-8"),
+                "reason": reason,
+            }
+        )
+        if message_id is None:
+            return
+        self._end_result(message_id, reason)
+        if completion is not None:
+            self._ack_q.put(AckMessage.create(
+                msg_type="ACK",
+                ack_type="MESSAGE_DELIVERED_ACK",
+                status="FAILURE",
+                source=dest.decode("utf-8"),
+                targets=[self.cfg.module_id],
+                correlation_id=message_id,
+                payload={
+                    "group": dest.decode("utf-8"),
+                    "reason": reason,
+                    "delivered": [],
+                },
+            ))
+
+    def _send_item(self, out_sock: zmq.Socket, item: tuple) -> bool:
+        """Write one queued send to its channel socket; False on backpressure."""
+        ch_name, dest, payload, aux, trace, completion = item
+
+        try:
+            message_id, msg_type, delivery = extract_routing(payload)
+            policy = self._send_policy(ch_name, msg_type, delivery)
+        except ValueError as e:
+            # Consumed: an invalid message must not stall the channel
+            self._m_invalid.inc()
+            self._drop_unsent(ch_name, item, f"invalid message: {e}")
+            return True
+
+        # Send message
+        try:
+            if policy.router_ack and self._tx_registry.get(message_id) is None:
+                self._tx_registry.create(
                     message_id=message_id,
                     channel=ch_name,
                     source=self.cfg.module_id,
                     target=dest.decode("utf-8"),
                     payload=payload,
+                    completion=completion,
+                    delivery=policy,
+                    **self._result_policy(message_id),
                 )
 
-                
                 self.logger.info(
                     event_type="ENDPOINT_TRANSACTION_CREATED",
-                    message=f"ModuleEndpoint {self.cfg.module_id} channel: {ch_name} outgoing message_id={message_id}",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
+                    message="ModuleEndpoint %s channel: %s outgoing message_id=%s",
+                    args=(self.cfg.module_id, ch_name, message_id),
+                    payload=self._channels_payload
                 )
 
-                # ROUTER addressing pattern:
-                # [dest_identity][empty][payload]
-                out_sock.send_multipart(
-                    [payload],
-                    flags=zmq.NOBLOCK
-                )
+            # ROUTER addressing pattern:
+            # [dest_identity][empty][payload][layout][aux...][seq?][trace?]
+            # Queued aux frames are tensor frames (send_tensors), sent zero-copy.
+            kinds = AUX_TENSOR_HEADER + AUX_TENSOR_BUFFER * (len(aux) - 1) if aux else ""
+            extra = list(aux)
+            if not aux and msg_type != "ACK":
+                compressed = self._compress(ch_name, payload)
+                if compressed is not None:
+                    payload, frame = compressed
+                    kinds, extra = AUX_COMPRESSED, [frame]
+            seq_key = None
+            if msg_type != "ACK" and self.cfg.channels[ch_name].ordered:
+                seq_key = (ch_name, dest)
+                kinds += AUX_SEQ
+                extra.append(seq_frame(self._seq_epoch, self._next_seq.get(seq_key, 0), dest))
+            if trace is not None:
+                trace.stamp(Hop.WIRE_SEND)
+                kinds += AUX_TRACE
+                extra.append(trace.to_frame())
+
+            out_sock.send_multipart(
+                [payload, *pack_aux(kinds, extra)],
+                flags=zmq.NOBLOCK,
+                copy=not aux,
+            )
 
-                sent += 1
+        except zmq.Again:
+            if trace is not None:
+                trace.stamps.pop()
+            return False
 
-                self.logger.info(
-                    event_type="ENDPOINT_SENT_MESSAGE",
-                    message=f"ModuleEndpoint {self.cfg.module_id} sent message on channel {ch_name} to {dest!r}",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
-                )
-                
+        if seq_key is not None:
+            # Only consumed once sent, so backpressure retries keep the number
+            self._next_seq[seq_key] = self._next_seq.get(seq_key, 0) + 1
+        self._out_last_used[ch_name] = time.monotonic()
+        self._m_sent.inc()
+
+        self.logger.info(
+            event_type="ENDPOINT_SENT_MESSAGE",
+            message="ModuleEndpoint %s sent message on channel %s to %r",
+            args=(self.cfg.module_id, ch_name, dest),
+            payload=self._channels_payload
+        )
+        return True
+
+    # --------------------------
+    # Readiness handshake
+    # --------------------------
 
+    def _send_hellos(self, now: float) -> None:
+        for key in self._readiness.hello_due(now):
+            direction, ch_name = key
+            if direction == "out":
+                sock, tag = self._out_socks.get(ch_name), HELLO_TAG
+            else:
+                sock, tag = self._in_socks.get(ch_name), PRESENCE_TAG
+            if sock is None:
+                continue
+            try:
+                sock.send(tag, flags=zmq.NOBLOCK)
+            except zmq.Again:
+                pass
+
+    def _handle_outbound_reply(self, sock: zmq.Socket, ch_name: str) -> None:
+        # Routers only ever answer HELLO on the outbound link
+        while True:
+            try:
+                frames = sock.recv_multipart(flags=zmq.NOBLOCK)
             except zmq.Again:
-                # Backpressure: requeue and retry next loop
-                self._send_q.put((ch_name, dest, payload))
                 return
+            if frames == [READY_TAG]:
+                self._mark_ready(("out", ch_name))
+
+    def _mark_ready(self, key: tuple[str, str]) -> None:
+        latency = self._readiness.on_ready(key, time.monotonic())
+        if latency is None:
+            return
+        direction, ch_name = key
+        self._m_connect_latency[direction].observe(int(latency * 1e9))
+
+        with self._ready_cv:
+            self._ready_links.add(key)
+            self._ready_cv.notify_all()
+
+        self.logger.info(
+            event_type="ENDPOINT_CHANNEL_READY",
+            message=f"ModuleEndpoint {self.cfg.module_id} {direction} link ready on {ch_name}",
+            payload={
+                "channel": ch_name,
+                "direction": direction,
+                "connect_ms": round(latency * 1000.0, 3),
+                "buffered": len(self._pending.get(ch_name, ())) if direction == "out" else 0,
+            }
+        )
+
+    def _link_down(self, key: tuple[str, str]) -> None:
+        self._readiness.on_disconnect(key)
+        with self._ready_cv:
+            self._ready_links.discard(key)
+
+    def _latest_if_conflating(self, sock, frames: list) -> list:
+        """On conflating channels keep only the newest queued message."""
+        ch_cfg = self.cfg.channels.get(self._sock_to_channel.get(sock))
+        if ch_cfg is None or not ch_cfg.qos.conflate:
+            return frames
+        while True:
+            try:
+                newer = sock.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                return frames
+            frames = newer
+            self._m_conflated.inc()
+
+    def _surface_group_ack(self, tx, ack: AckMessage, event) -> None:
+        """
+        Group sends surface the ROUTER_ACK and one aggregated completion;
+        individual member ACKs stay inside the transaction record.
+        """
+        if ack.ack_type == "ROUTER_ACK":
+            self._ack_q.put(ack)
+
+        if event.old_state == event.new_state or not tx.is_complete():
+            return
+
+        details = event.details or {}
+        self._ack_q.put(AckMessage.create(
+            msg_type="ACK",
+            ack_type="MESSAGE_DELIVERED_ACK",
+            status="SUCCESS" if event.new_state == "COMPLETED" else "FAILURE",
+            source=tx.target,
+            targets=[self.cfg.module_id],
+            correlation_id=tx.message_id,
+            payload={
+                "group": tx.target,
+                "reason": event.reason,
+                "completion": details.get("completion"),
+                "expected": details.get("expected", []),
+                "delivered": details.get("delivered", []),
+            },
+        ))
 
     def _handle_inbound(self, sock, *, is_ack: bool) -> None:
         """
         Handles typical ROUTER->DEALER frames:
-          [identity][empty?][payload]
+          [empty?][payload][aux...]
         We keep this tolerant because your framing is still evolving.
+        Frames are received without copying so tensor buffers can be
+        wrapped as ndarrays in place.
         """
-        frames = sock.recv_multipart()
-        payload = frames[-1]
+        frames = sock.recv_multipart(copy=False)
+        if not is_ack:
+            if len(frames) == 1 and frames[0].bytes == READY_TAG:
+                self._mark_ready(("in", self._sock_to_channel.get(sock)))
+                return
+            frames = self._latest_if_conflating(sock, frames)
+        payload_frame, aux = split_inbound_frames(frames)
+        payload = payload_frame.bytes
+        try:
+            kinds, aux = unpack_aux(aux)
+        except ValueError as e:
+            self._m_invalid.inc()
+            self.logger.warning(
+                event_type="ENDPOINT_INVALID_MESSAGE",
+                message=f"ModuleEndpoint {self.cfg.module_id} dropped message with bad aux frames: {e}",
+                payload={
+                    "channel": self._sock_to_channel.get(sock)
+                }
+            )
+            return
+        trace, kinds, aux = split_hop_trace(kinds, aux)
+        seq, kinds, aux = split_seq(kinds, aux)
 
 
         if is_ack:
             ack = AckMessage.from_bytes(payload)
-            event = self._tx_registry.apply_ack(ack)
+            if ack.ack_type == WINDOW_ACK_TYPE:
+                stream = self._out_streams.get(ack.correlation_id)
+                if stream is not None:
+                    stream.on_window_ack(ack.payload.get("received", 0))
+                return
+
+            hist = self._m_ack_latency.get(ack.ack_type)
+            tx = self._tx_registry.get(ack.correlation_id)
+            if tx is not None and hist is not None:
+                hist.observe(int((time.monotonic() - tx.created_at) * 1e9))
+
+            try:
+                event = self._tx_registry.apply_ack(ack)
+            except TransportError as e:
+                # Unknown transaction (e.g. sender and receiver disagree on
+                # the delivery policy): report it, keep the endpoint alive
+                event = str(e)
             
             self.logger.info(
                     event_type="ENDPOINT_RECEIVED_ACK",
-                    message=f"ModuleEndpoint {self.cfg.module_id} received ACK for correlation_id={ack.correlation_id}, event={event} ack type = {ack.ack_type}",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
+                    message="ModuleEndpoint %s received ACK for correlation_id=%s, event=%s ack type = %s",
+                    args=(self.cfg.module_id, ack.correlation_id, event, ack.ack_type),
+                    payload=self._channels_payload
                 )
             
             if event != "ERROR 1" and event != "ERROR 2":
-                self._ack_q.put(ack)
+                if self._result_streams and self._route_result(ack, event):
+                    pass
+                elif tx is not None and tx.is_group():
+                    self._surface_group_ack(tx, ack, event)
+                else:
+                    self._ack_q.put(ack)
             else:
                                 
-                self.logger.info(
+                self.logger.warning(
                     event_type="ENDPOINT_ERROR_INVALID_ACK",
                     message=f"ModuleEndpoint {self.cfg.module_id} Received invalid ACK: {ack!r}",
                     payload={
@@ -433,58 +1227,501 @@ class ModuleEndpoint:
                 )
 
         else:
-            msg_obj = CognitiveMessage.from_bytes(payload)
-            self._in_q.put(msg_obj)
-            message_id = msg_obj.message_id
-            tx = self._tx_registry.create(
+            # Routers cannot validate what they cannot read
+            router_checked = not kinds.startswith(AUX_COMPRESSED)
+            if not router_checked:
+                msg_obj = self._decompress(payload, aux[0])
+                if msg_obj is None:
+                    return
+                kinds, aux = kinds[1:], aux[1:]
+            else:
+                msg_obj = CognitiveMessage.from_bytes(payload)
+            if msg_obj.msg_type == CHUNK_MSG_TYPE:
+                self._handle_chunk(msg_obj, aux, self._sock_to_channel.get(sock), seq)
+                return
+            if kinds.startswith(AUX_TENSOR_HEADER):
+                msg_obj.tensors = decode_tensor_frames(aux)
+            if trace is not None:
+                trace.channel = self._sock_to_channel.get(sock)
+                trace.stamp(Hop.RECEIVER_POLL)
+                msg_obj.trace = trace
+            ch_name = self._sock_to_channel.get(sock)
+            if seq is None:
+                self._deliver(msg_obj, payload, ch_name, router_checked)
+                return
+            # Ordered stream: deliver whatever is now in sequence
+            epoch, seqno, target = seq
+            self._deliver_sequenced((msg_obj.source, ch_name, target), epoch, seqno, (msg_obj, payload, ch_name, router_checked))
+
+    def _send_policy(self, ch_name: str, msg_type: Optional[str], delivery: Optional[str]) -> DeliveryPolicy:
+        """Effective delivery policy of an outbound message."""
+        if msg_type == "ACK":
+            # ACKs are never acknowledged themselves: nothing to track
+            return DeliveryPolicy.NONE
+        ch_cfg = self.cfg.channels.get(ch_name)
+        default = ch_cfg.delivery if ch_cfg is not None else DeliveryPolicy.END_TO_END
+        return DeliveryPolicy.resolve(delivery, default)
+
+    def _deliver(
+        self,
+        msg_obj: CognitiveMessage,
+        payload: bytes,
+        ch_name: Optional[str],
+        router_checked: bool = True,
+    ) -> None:
+        """Hand an inbound message to the module and ACK its delivery."""
+        if not self._valid_payload(msg_obj, ch_name, router_checked):
+            return
+        ch_cfg = self.cfg.channels.get(ch_name)
+        default = ch_cfg.delivery if ch_cfg is not None else DeliveryPolicy.END_TO_END
+        try:
+            policy = DeliveryPolicy.resolve(msg_obj.delivery, default)
+        except ValueError as e:
+            self._m_invalid.inc()
+            self.logger.warning(
+                event_type="ENDPOINT_INVALID_MESSAGE",
+                message=f"ModuleEndpoint {self.cfg.module_id} dropped message_id={msg_obj.message_id} from {msg_obj.source}: {e}",
+                payload={
+                    "channel": ch_name,
+                    "delivery": msg_obj.delivery
+                }
+            )
+            return
+        self._in_q.put(msg_obj)
+        self._m_received.inc()
+
+        if not policy.delivered_ack:
+            return
+        message_id = msg_obj.message_id
+        try:
+            self._tx_registry.create(
                     message_id=message_id,
                     channel = None,
                     source=msg_obj.source,
                     target=msg_obj.targets,
                     payload=payload,
                 )
-            
+        except ValueError as e:
+            # Retransmission, or an id reused by another process: the message
+            # is still delivered and ACKed, only the transaction is not reopened
+            self.logger.warning(
+                event_type="ENDPOINT_DUPLICATE_TRANSACTION",
+                message=f"ModuleEndpoint {self.cfg.module_id} duplicate incoming message_id={message_id} from {msg_obj.source}: {e}",
+                payload=self._channels_payload
+            )
+        else:
             self.logger.info(
                     event_type="ENDPOINT_CREATED_TRANSACTION",
-                    message=f"ModuleEndpoint {self.cfg.module_id}  Created transaction for incoming message_id={message_id}",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
+                    message="ModuleEndpoint %s  Created transaction for incoming message_id=%s",
+                    args=(self.cfg.module_id, message_id),
+                    payload=self._channels_payload
             )
-            
-            # send ACK back
+        
+        # send ACK back
+        try:
+            ack = AckMessage.create(
+                msg_type="ACK",
+                ack_type="MESSAGE_DELIVERED_ACK",
+                status="SUCCESS",
+                source=self.cfg.module_id,
+                targets=[msg_obj.source],
+                correlation_id=msg_obj.message_id,
+                payload={ 
+                    "status": "published",
+                    "message_id": msg_obj.message_id
+                }
+            )
+
+            self.send("CC", msg_obj.source, ack.to_bytes())
+
+            self.logger.info(
+                event_type="ENDPOINT_SENT_ACK",
+                message="ModuleEndpoint %s sent ACK to %s",
+                args=(self.cfg.module_id, msg_obj.source),
+                payload=self._channels_payload
+            )
+
+        except Exception as e:
+            self.logger.error(
+                event_type="ENDPOINT_ACK_SEND_ERROR",
+                message=f"ModuleEndpoint {self.cfg.module_id} outbound ACK send error: {e!r}",
+                payload={
+                    "channels": list(self.cfg.channels.keys())
+                }
+            )
+
+    # --------------------------
+    # Chunked transfers
+    # --------------------------
+
+    def _should_chunk(self, item: tuple) -> bool:
+        """Large plain sends go out as chunks (not tensor sends or group targets)."""
+        ch_name, dest, payload, aux, _, _ = item
+        threshold = self.cfg.chunk_threshold_bytes
+        return (
+            threshold is not None
+            and len(payload) > threshold
+            and not aux
+            and self.cfg.channels[ch_name].ack_port is not None    # Window ACKs need the ACK path
+            and not is_group_address(dest.decode("utf-8"))
+        )
+
+    def _start_stream(self, ch_name: str, dest: bytes, message: dict, mode: str, data: Any, completion=None) -> None:
+        message_id = message["message_id"]
+        try:
+            policy = self._send_policy(ch_name, message.get("msg_type"), message.get("delivery"))
+        except ValueError as e:
+            self._m_invalid.inc()
+            self.logger.warning(
+                event_type="ENDPOINT_SEND_DROPPED",
+                message=f"ModuleEndpoint {self.cfg.module_id} dropped {mode} transfer message_id={message_id} on {ch_name}: {e}",
+                payload={
+                    "channel": ch_name,
+                    "reason": str(e)
+                }
+            )
+            return
+        header = message if mode == MODE_STREAM else envelope_fields(message)
+        seq = None
+        if self.cfg.channels[ch_name].ordered:
+            # Numbered now, so the transfer keeps its place among the sends
+            # around it however long its chunks take
+            seq_key = (ch_name, dest)
+            seq = seq_frame(self._seq_epoch, self._next_seq.get(seq_key, 0), dest)
+            self._next_seq[seq_key] = self._next_seq.get(seq_key, 0) + 1
+        self._out_streams[message_id] = OutboundStream(
+            channel=ch_name,
+            message=header,
+            mode=mode,
+            data=data,
+            chunk_size=self.cfg.chunk_size_bytes,
+            window=self.cfg.chunk_window,
+            seq=seq,
+        )
+        if policy.router_ack and self._tx_registry.get(message_id) is None:
+            self._tx_registry.create(
+                message_id=message_id,
+                channel=ch_name,
+                source=self.cfg.module_id,
+                target=message["targets"][0],
+                payload=data if mode == MODE_MESSAGE else json.dumps(message).encode("utf-8"),
+                completion=completion,
+                delivery=policy,
+                **self._result_policy(message_id),
+            )
+
+        self.logger.info(
+            event_type="ENDPOINT_STREAM_STARTED",
+            message=f"ModuleEndpoint {self.cfg.module_id} started {mode} transfer message_id={message_id} on {ch_name}",
+            payload={
+                "channel": ch_name,
+                "mode": mode
+            }
+        )
+
+    def _start_queued_streams(self) -> None:
+        while True:
             try:
-                ack = AckMessage.create(
-                    msg_type="ACK",
-                    ack_type="MESSAGE_DELIVERED_ACK",
-                    status="SUCCESS",
-                    source=self.cfg.module_id,
-                    targets=[msg_obj.source],
-                    correlation_id=msg_obj.message_id,
-                    payload={ 
-                        "status": "published",
-                        "message_id": msg_obj.message_id
-                    }
-                )
+                ch_name, target_id, message, data = self._stream_q.get_nowait()
+            except queue.Empty:
+                return
+            if self._ensure_outbound(ch_name) is None:
+                continue
+            self._start_stream(ch_name, target_id.encode("utf-8"), message, MODE_STREAM, data)
 
-                self.send("CC", msg_obj.source, ack.to_bytes())
+    def _streams_sendable(self) -> bool:
+        return any(
+            stream.can_send() and self._readiness.is_ready(("out", stream.channel))
+            for stream in self._out_streams.values()
+        )
 
-                self.logger.info(
-                    event_type="ENDPOINT_SENT_ACK",
-                    message=f"ModuleEndpoint {self.cfg.module_id} sent ACK to {msg_obj.source}",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
-                )
+    def _pump_streams(self, max_chunks: int, now: float) -> None:
+        """
+        Send up to max_chunks chunks, round-robin across active transfers so
+        one large message cannot hold a channel. Transfers whose window stays
+        closed for chunk_stall_timeout_s are dropped.
+        """
+        sent = 0
+        progress = True
+        while progress and sent < max_chunks:
+            progress = False
+            for message_id, stream in list(self._out_streams.items()):
+                if stream.error is not None:
+                    self._abort_stream(message_id, f"stream source failed: {stream.error}")
+                    continue
+                if not stream.can_send():
+                    if not stream.done and now - stream.last_progress > self.cfg.chunk_stall_timeout_s:
+                        self._abort_stream(message_id, "window ACK timeout")
+                    continue
+                out_sock = self._out_socks.get(stream.channel)
+                if out_sock is None or not self._readiness.is_ready(("out", stream.channel)):
+                    continue
+                try:
+                    out_sock.send_multipart(stream.next_frames(), flags=zmq.NOBLOCK, copy=False)
+                except zmq.Again:
+                    continue
+                stream.commit()
+                sent += 1
+                progress = True
+                self._out_last_used[stream.channel] = now
+                self._m_chunks_sent.inc()
+                if stream.done:
+                    del self._out_streams[message_id]
+                    self._m_sent.inc()
+                if sent >= max_chunks:
+                    return
+
+    def _abort_stream(self, message_id: str, reason: str) -> None:
+        stream = self._out_streams.pop(message_id, None)
+        if stream is None:
+            return
+        self._m_chunk_aborts.inc()
 
-            except Exception as e:
-                self.logger.info(
-                    event_type="ENDPOINT_ACK_SEND_ERROR",
-                    message=f"ModuleEndpoint {self.cfg.module_id} outbound ACK send error: {e!r}",
-                    payload={
-                        "channels": list(self.cfg.channels.keys())
-                    }
-                )
+        # Let the receiver release what it buffered (and, on ordered
+        # channels, the transfer's sequence number); if this notice is lost
+        # the receiver's idle or gap timeout does the same
+        out_sock = self._out_socks.get(stream.channel)
+        if out_sock is not None and (stream.next_seq > 0 or stream.seq is not None):
+            try:
+                out_sock.send_multipart(stream.abort_frames(reason), flags=zmq.NOBLOCK)
+            except zmq.ZMQError:
+                pass
+        self.logger.warning(
+            event_type="ENDPOINT_STREAM_ABORTED",
+            message=f"ModuleEndpoint {self.cfg.module_id} dropped transfer message_id={message_id}: {reason}",
+            payload={
+                "channel": stream.channel,
+                "sent": stream.next_seq,
+                "acked": stream.acked
+            }
+        )
 
-            
+    def _handle_chunk(
+        self,
+        msg_obj: CognitiveMessage,
+        aux: list,
+        ch_name: Optional[str],
+        seq: Optional[tuple] = None,
+    ) -> None:
+        transfer = (msg_obj.source, msg_obj.message_id)
+        if seq is not None:
+            # Ordered channel: the transfer's place in its stream, from
+            # its first chunk (or an abort notice)
+            epoch, seqno, target = seq
+            key = (msg_obj.source, ch_name, target)
+            self._transfer_seqs[transfer] = (key, epoch, seqno)
+        chunk = aux[0].buffer if aux else memoryview(b"")
+        event, value = self._reassembler.on_chunk(transfer, ch_name, msg_obj.payload, chunk)
+        if event == "message":
+            self._deliver_transfer(transfer, (CognitiveMessage.from_bytes(value), value, ch_name, False))
+        elif event == "stream":
+            header, stream = value
+            message = CognitiveMessage.from_dict(header)
+            message.stream = stream
+            self._deliver_transfer(transfer, (message, json.dumps(header).encode("utf-8"), ch_name, True))
+        elif event == "aborted":
+            self._deliver_transfer(transfer, None)
+            self._reassembly_aborted(transfer, ch_name, value)
+        elif seq is not None:
+            for item in self._reorder.reserve(key, epoch, seqno, time.monotonic()):
+                if item is not None:
+                    self._deliver(*item)
+
+    def _deliver_transfer(self, transfer: tuple, entry: Optional[tuple]) -> None:
+        """Deliver a finished transfer (None: aborted), in sequence if it has a number."""
+        sequenced = self._transfer_seqs.pop(transfer, None)
+        if sequenced is not None:
+            self._deliver_sequenced(*sequenced, entry)
+        elif entry is not None:
+            self._deliver(*entry)
+
+    def _reassembly_aborted(self, key: tuple, ch_name: Optional[str], reason: str) -> None:
+        source, message_id = key
+        self._m_chunk_aborts.inc()
+        self.logger.warning(
+            event_type="ENDPOINT_REASSEMBLY_ABORTED",
+            message=f"ModuleEndpoint {self.cfg.module_id} dropped inbound transfer message_id={message_id}: {reason}",
+            payload={
+                "channel": ch_name,
+                "source": source
+            }
+        )
 
+    def _send_window_ack(self, key: tuple, ch_name: str, received: int) -> None:
+        # Reassembler callback: endpoint thread (message mode) or the
+        # consuming module thread (stream mode); send() is thread-safe.
+        source, message_id = key
+        ack = AckMessage.create(
+            msg_type="ACK",
+            ack_type=WINDOW_ACK_TYPE,
+            status="SUCCESS",
+            source=self.cfg.module_id,
+            targets=[source],
+            correlation_id=message_id,
+            payload={"received": received},
+        )
+        self.send(ch_name, source, ack.to_bytes())
+
+    # --------------------------
+    # Progress / partial results
+    # --------------------------
+
+    def _result_policy(self, message_id: str) -> dict:
+        """Transaction options for send_request() messages."""
+        stream = self._result_streams.get(message_id)
+        if stream is None:
+            return {}
+        return {"await_result": True, "exec_timeout_s": stream.timeout_s}
+
+    def _route_result(self, ack: AckMessage, event) -> bool:
+        """Feed an ACK for a send_request() into its ResultStream; True if consumed."""
+        stream = self._result_streams.get(ack.correlation_id)
+        if stream is None:
+            return False
+        if ack.ack_type == PROGRESS_ACK_TYPE:
+            payload = ack.payload or {}
+            if payload.get("partial") is not None:
+                stream._put(payload["partial"])
+            if payload.get("final"):
+                self._end_result(ack.correlation_id)
+            return True
+        if isinstance(event, str):
+            # apply_ack raised a TransportError: the request cannot complete
+            self._end_result(ack.correlation_id, event)
+        elif event.new_state == AckState.ERROR.name:
+            details = event.details if isinstance(event.details, dict) else {}
+            error = f"{event.reason}: {details['error']}" if details.get("error") else event.reason
+            self._end_result(ack.correlation_id, error)
+        return False
+
+    def _check_result_deadlines(self) -> None:
+        if not self._result_streams:
+            return
+        for event in self._tx_registry.tick(list(self._result_streams)):
+            if event.new_state in (AckState.TIMEOUT.name, AckState.ERROR.name):
+                self._end_result(event.message_id, event.reason)
+
+    def _end_result(self, message_id: str, error: Optional[str] = None) -> None:
+        stream = self._result_streams.pop(message_id, None)
+        if stream is None:
+            return
+        stream._end(error)
+        if error:
+            self.logger.warning(
+                event_type="ENDPOINT_REQUEST_FAILED",
+                message=f"ModuleEndpoint {self.cfg.module_id} request message_id={message_id} failed: {error}",
+                payload={
+                    "reason": error
+                }
+            )
+
+    # --------------------------
+    # Payload schema validation
+    # --------------------------
+
+    def _valid_payload(self, msg_obj: CognitiveMessage, ch_name: Optional[str], router_checked: bool) -> bool:
+        """
+        Validate on channels checking at the receiver, and on router-checked
+        channels for payloads the router could not see (compressed or
+        chunked). Invalid messages are logged and dropped unacknowledged.
+        """
+        validator = self._validators.get(ch_name, False)
+        if validator is False:
+            ch_cfg = self.cfg.channels.get(ch_name)
+            settings = ch_cfg.validation if ch_cfg is not None else None
+            validator = self._validators[ch_name] = (
+                PayloadValidator(settings, module=self.cfg.module_id) if settings is not None else None
+            )
+        if validator is None:
+            return True
+        if validator.settings.at is ValidationPoint.ROUTER and router_checked:
+            return True
+
+        error = validator.check(msg_obj.msg_type, msg_obj.msg_version, msg_obj.payload)
+        if error is None:
+            return True
+        self.logger.warning(
+            event_type="ENDPOINT_SCHEMA_INVALID",
+            message=f"ModuleEndpoint {self.cfg.module_id} dropped {msg_obj.msg_type} message_id={msg_obj.message_id} from {msg_obj.source}: {error}",
+            payload={
+                "channel": ch_name,
+                "msg_type": msg_obj.msg_type,
+                "error": error
+            }
+        )
+        return False
+
+    # --------------------------
+    # Payload compression
+    # --------------------------
+
+    def _compress(self, ch_name: str, payload: bytes) -> Optional[tuple[bytes, bytes]]:
+        """(envelope, compressed frame) if the channel compresses this payload."""
+        ch_cfg = self.cfg.channels.get(ch_name)
+        settings = ch_cfg.compression if ch_cfg is not None else None
+        if settings is None or len(payload) < settings.threshold_bytes:
+            return None
+
+        compressor = self._compressors.get(ch_name)
+        if compressor is None:
+            compressor = self._compressors[ch_name] = ChannelCompressor(
+                settings,
+                on_disable=lambda stats, ch=ch_name: self._on_compression_disabled(ch, stats),
+            )
+        now = time.monotonic()
+        if not compressor.active(now):
+            return None
+
+        result = compressor.compress(json.loads(payload), now)
+        if result is not None:
+            self._m_compressed_saved.inc(max(0, len(payload) - len(result[0]) - len(result[1])))
+        return result
+
+    def _decompress(self, envelope: bytes, frame) -> Optional[CognitiveMessage]:
+        try:
+            return CognitiveMessage(**decode_message(json.loads(envelope), frame))
+        except Exception as e:
+            # Unknown codec / dictionary or a corrupt frame: drop, keep running
+            self.logger.warning(
+                event_type="ENDPOINT_DECOMPRESS_FAILED",
+                message=f"ModuleEndpoint {self.cfg.module_id} dropped undecodable compressed message: {e}",
+                payload={
+                    "error": str(e)
+                }
+            )
+            return None
+
+    def _on_compression_disabled(self, ch_name: str, stats: dict) -> None:
+        self._m_compression_disabled.inc()
+        self.logger.info(
+            event_type="ENDPOINT_COMPRESSION_DISABLED",
+            message=f"ModuleEndpoint {self.cfg.module_id} paused compression on {ch_name}: CPU cost exceeds bandwidth saved",
+            payload={
+                "channel": ch_name,
+                **stats
+            }
+        )
+
+    # --------------------------
+    # Ordered channels
+    # --------------------------
+
+    def _deliver_sequenced(self, key: tuple, epoch: int, seq: int, entry: Optional[tuple]) -> None:
+        """Deliver whatever is now in sequence (None entries hold an aborted transfer's place)."""
+        for item in self._reorder.push(key, epoch, seq, entry, time.monotonic()):
+            if item is not None:
+                self._deliver(*item)
+
+    def _on_sequence_gap(self, key: tuple, missing: int) -> None:
+        source, ch_name, target = key
+        self._m_seq_gaps.inc(missing)
+        self.logger.warning(
+            event_type="ENDPOINT_SEQUENCE_GAP",
+            message=f"ModuleEndpoint {self.cfg.module_id} skipped {missing} missing message(s) from {source} on {ch_name}",
+            payload={
+                "source": source,
+                "channel": ch_name,
+                "target": target,
+                "missing": missing
+            }
+        )
@@ -0,0 +1,90 @@
+"""
+Module: progress.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Progress / partial-result protocol for long-running handlers.
+
+A handler that takes a while (LLM call, plan generation) answers the
+request with a sequence of PROGRESS_ACKs on the ACK path instead of one
+final message:
+
+    {"seq": n, "partial": <json>, "final": bool}
+
+correlated to the request's message_id. Each progress ACK moves the
+sender's transaction to EXECUTING and extends its execution deadline; the
+final one completes it. Senders that use ModuleEndpoint.send_request()
+consume the partial results as a ResultStream, so they can act on the
+first plan steps while the rest is still being produced.
+"""
+
+from __future__ import annotations
+
+import queue
+from typing import Any, Optional
+
+from src.core.messages.ack_message import AckMessage
+
+
+PROGRESS_ACK_TYPE = "PROGRESS_ACK"
+
+
+def progress_ack(source: str, request_source: str, request_id: str, seq: int, partial: Any, final: bool) -> AckMessage:
+    return AckMessage.create(
+        msg_type="ACK",
+        ack_type=PROGRESS_ACK_TYPE,
+        status="SUCCESS",
+        source=source,
+        targets=[request_source],
+        correlation_id=request_id,
+        payload={"seq": seq, "partial": partial, "final": final},
+    )
+
+
+class ResultAborted(Exception):
+    """The request failed or timed out before its final result."""
+
+
+_END = object()
+
+
+class ResultStream:
+    """
+    Iterator over the partial results of one request (send_request()).
+
+    Iteration blocks until the next partial result and stops after the
+    final one. A request that fails (execution deadline passed without
+    progress, transport error) raises ResultAborted.
+    """
+
+    def __init__(self, message_id: str, timeout_s: float):
+        self.message_id = message_id
+        self.timeout_s = timeout_s          # Execution deadline, extended by each progress ACK
+        self._q: "queue.Queue[object]" = queue.Queue()
+        self._finished = False
+
+    # Endpoint thread
+    def _put(self, partial: Any) -> None:
+        self._q.put(partial)
+
+    def _end(self, error: Optional[str] = None) -> None:
+        self._q.put(ResultAborted(error) if error else _END)
+
+    # Module thread
+    def __iter__(self) -> "ResultStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+        item = self._q.get()
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, ResultAborted):
+            self._finished = True
+            raise item
+        return item
+
+    def collect(self) -> list:
+        return list(self)
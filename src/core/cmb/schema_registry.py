@@ -0,0 +1,337 @@
+"""
+Module: schema_registry.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Payload schema validation compiled per (msg_type, msg_version).
+
+Schemas use a small JSON-schema subset:
+
+    {"type": "object", "required": [...], "properties": {name: schema}}
+    {"type": "array", "items": schema}
+    {"type": "string" | "number" | "integer" | "boolean" | "null" | [types...]}
+    {"enum": [...]}, {"minimum": x, "maximum": y}
+
+Each schema is compiled once into a generated Python function (straight-line
+isinstance / membership checks, no interpretation of the schema at runtime)
+returning None or the first error, e.g. "$.plan.steps[2].step_id: required".
+Properties not listed in a schema are allowed.
+
+The process-wide registry (schema_registry()) is preloaded with the bus's
+built-in payload schemas. Channels opt in with SchemaValidation (validate at
+router ingress or at the receiving endpoint, optionally for a sample of
+messages); PayloadValidator applies it and records per-type validation time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.core.monitoring.metrics import metrics_registry
+
+
+Validator = Callable[[Any], Optional[str]]
+
+ANY_VERSION = "*"
+
+
+class SchemaValidationError(ValueError):
+    pass
+
+
+# ----------------------------
+# Compiler
+# ----------------------------
+
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+
+class _Compiler:
+    def __init__(self):
+        self.lines: list[str] = []
+        self.consts: Dict[str, Any] = {}
+        self._n = 0
+
+    def _name(self, prefix: str) -> str:
+        self._n += 1
+        return f"{prefix}{self._n}"
+
+    def const(self, value: Any) -> str:
+        name = self._name("_c")
+        self.consts[name] = value
+        return name
+
+    def emit(self, schema: dict, var: str, path: str, indent: int) -> None:
+        """
+        Append checks of `var` against `schema`; `path` is a Python
+        expression for the JSON path, only evaluated when a check fails.
+        """
+        pad = "    " * indent
+        out = self.lines.append
+
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else list(types)
+            check = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+            out(f"{pad}if not ({check}): return {path} + {': expected ' + '/'.join(types)!r}")
+
+        if "enum" in schema:
+            values = self.const(frozenset(schema["enum"]))
+            # Unhashable values (lists, dicts) cannot be members
+            out(f"{pad}if {var}.__hash__ is None or {var} not in {values}: return {path} + ': not one of the allowed values'")
+        for key, op in (("minimum", "<"), ("maximum", ">")):
+            if key in schema:
+                bound = schema[key]
+                out(f"{pad}if {var} {op} {bound!r}: return {path} + {f': {key} is {bound}'!r}")
+
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", ()))
+        for key, sub in properties.items():
+            child = self._name("_v")
+            sub_path = f"{path} + {'.' + key!r}"
+            out(f"{pad}{child} = {var}.get({key!r}, _MISSING)")
+            if key in required:
+                out(f"{pad}if {child} is _MISSING: return {sub_path} + ': required'")
+                self.emit(sub, child, sub_path, indent)
+            else:
+                out(f"{pad}if {child} is not _MISSING:")
+                self._emit_block(sub, child, sub_path, indent + 1)
+        for key in sorted(required - set(properties)):
+            out(f"{pad}if {key!r} not in {var}: return {path} + {'.' + key + ': required'!r}")
+
+        if "items" in schema:
+            index, item = self._name("_i"), self._name("_v")
+            out(f"{pad}for {index}, {item} in enumerate({var}):")
+            self._emit_block(schema["items"], item, f"{path} + '[' + str({index}) + ']'", indent + 1)
+
+    def _emit_block(self, schema: dict, var: str, path: str, indent: int) -> None:
+        start = len(self.lines)
+        self.emit(schema, var, path, indent)
+        if len(self.lines) == start:
+            self.lines.append("    " * indent + "pass")
+
+
+def compile_schema(schema: dict, name: str = "payload") -> Validator:
+    """Generate a validator function for `schema`: payload -> None | error."""
+    compiler = _Compiler()
+    compiler.emit(schema, "value", "'$'", 1)
+    source = "\n".join([f"def _validate_{_identifier(name)}(value):", *compiler.lines, "    return None"])
+
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING, **compiler.consts}
+    exec(compile(source, f"<schema {name}>", "exec"), namespace)
+    fn = namespace[f"_validate_{_identifier(name)}"]
+    fn.source = source
+    return fn
+
+
+def _identifier(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+# ----------------------------
+# Registry
+# ----------------------------
+
+class SchemaRegistry:
+    """
+    Payload schemas by (msg_type, msg_version); msg_version ANY_VERSION
+    matches every version without a schema of its own. Validators are
+    compiled on registration and looked up lock-free.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._validators: Dict[Tuple[str, str], Validator] = {}
+
+    def register(self, msg_type: str, msg_version: str, schema: dict) -> Validator:
+        fn = compile_schema(schema, f"{msg_type}_{msg_version}")
+        with self._lock:
+            validators = dict(self._validators)
+            validators[(msg_type, msg_version)] = fn
+            self._validators = validators
+        return fn
+
+    def validator(self, msg_type: str, msg_version: str) -> Optional[Validator]:
+        validators = self._validators
+        fn = validators.get((msg_type, msg_version))
+        return fn if fn is not None else validators.get((msg_type, ANY_VERSION))
+
+    def validate(self, msg_type: str, msg_version: str, payload: Any) -> None:
+        """Raise SchemaValidationError if a registered schema rejects payload."""
+        fn = self.validator(msg_type, msg_version)
+        error = fn(payload) if fn is not None else None
+        if error is not None:
+            raise SchemaValidationError(f"{msg_type} {msg_version}: {error}")
+
+
+# Built-in payload schemas of the bus's control-plane messages
+BUILTIN_SCHEMAS: Dict[Tuple[str, str], dict] = {
+    ("DIRECTIVE_SUBMIT", ANY_VERSION): {
+        "type": "object",
+        "required": ["directive_text"],
+        "properties": {
+            "directive_text": {"type": "string"},
+            "context": {"type": ["object", "null"]},
+        },
+    },
+    ("INTENT_RESULT", ANY_VERSION): {
+        "type": "object",
+        "required": ["intent_id", "intent"],
+        "properties": {
+            "intent_id": {"type": "string"},
+            "directive_text": {"type": ["string", "null"]},
+            "intent": {
+                "type": "object",
+                "required": ["intent_label", "confidence_score"],
+                "properties": {
+                    "intent_label": {"type": "string"},
+                    "confidence_score": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                },
+            },
+        },
+    },
+    ("PLAN_READY", ANY_VERSION): {
+        "type": "object",
+        "properties": {
+            "plan": {
+                "type": "object",
+                "required": ["plan_id", "steps"],
+                "properties": {
+                    "plan_id": {"type": "string"},
+                    "steps": {
+                        "type": "array",
+                        "items": {"type": "object", "required": ["step_id"]},
+                    },
+                },
+            },
+        },
+    },
+    ("TASK_QUEUE_READY", ANY_VERSION): {
+        "type": "object",
+        "required": ["task_queue"],
+        "properties": {
+            "task_queue": {
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "items": {"type": "object", "required": ["task_id"]},
+                    },
+                },
+            },
+        },
+    },
+}
+
+
+_REGISTRY = SchemaRegistry()
+for (_type, _version), _schema in BUILTIN_SCHEMAS.items():
+    _REGISTRY.register(_type, _version, _schema)
+
+
+def schema_registry() -> SchemaRegistry:
+    """Process-wide payload schema registry."""
+    return _REGISTRY
+
+
+# ----------------------------
+# Per-channel validation
+# ----------------------------
+
+class ValidationPoint(Enum):
+    ROUTER = "router"        # Router ingress: invalid messages never reach a module
+    RECEIVER = "receiver"    # Receiving endpoint, before the module sees the message
+
+
+@dataclass(frozen=True)
+class SchemaValidation:
+    at: ValidationPoint = ValidationPoint.RECEIVER
+    sample_rate: float = 1.0        # Fraction of messages validated (per msg_type)
+
+
+class PayloadValidator:
+    """
+    Applies a channel's SchemaValidation for one router or endpoint (single
+    thread). check() returns None or the validation error; unsampled
+    messages and message types without a schema pass.
+    """
+
+    def __init__(
+        self,
+        settings: SchemaValidation,
+        *,
+        registry: Optional[SchemaRegistry] = None,
+        **labels: Any,
+    ):
+        self.settings = settings
+        self._registry = registry or schema_registry()
+        self._labels = labels
+        self._every = max(1, round(1.0 / settings.sample_rate)) if settings.sample_rate > 0 else 0
+        self._seen: Dict[str, int] = {}
+        self._timers: Dict[str, Any] = {}
+        self._invalid: Dict[str, Any] = {}
+
+    def check(self, msg_type: str, msg_version: str, payload: Any) -> Optional[str]:
+        if not self._every:
+            return None
+        fn = self._registry.validator(msg_type, msg_version)
+        if fn is None:
+            return None
+        if self._every > 1:
+            n = self._seen.get(msg_type, 0)
+            self._seen[msg_type] = n + 1
+            if n % self._every:
+                return None
+
+        started = time.perf_counter_ns()
+        error = fn(payload)
+        self._timer(msg_type).observe(time.perf_counter_ns() - started)
+        if error is not None:
+            self._invalid_counter(msg_type).inc()
+        return error
+
+    def _timer(self, msg_type: str):
+        timer = self._timers.get(msg_type)
+        if timer is None:
+            timer = self._timers[msg_type] = metrics_registry().histogram(
+                "cmb_schema_validation_seconds",
+                "Payload schema validation time per message",
+                msg_type=msg_type,
+                at=self.settings.at.value,
+                **self._labels,
+            )
+        return timer
+
+    def _invalid_counter(self, msg_type: str):
+        counter = self._invalid.get(msg_type)
+        if counter is None:
+            counter = self._invalid[msg_type] = metrics_registry().counter(
+                "cmb_schema_invalid_total",
+                "Messages rejected by payload schema validation",
+                msg_type=msg_type,
+                at=self.settings.at.value,
+                **self._labels,
+            )
+        return counter
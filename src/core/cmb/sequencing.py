@@ -0,0 +1,208 @@
+"""
+Module: sequencing.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Per-stream sequence numbers and receiver-side reordering.
+
+On ordered channels the sending endpoint numbers its messages per
+(channel, target) and appends a sequence trailer frame (kind AUX_SEQ,
+before the hop trace, which stays last). Routers forward it untouched like
+any aux frame:
+
+    SEQ_TRAILER_TAG | u32 epoch | u64 seq | target bytes
+
+The epoch is random per endpoint instance, so a restarted sender starts a
+new stream instead of being taken for duplicates. Receivers key streams by
+(source, channel, target) and pass messages through a ReorderBuffer:
+in-order messages are released at once, early ones wait until the gap is
+filled, the gap timeout passes or the window is full (the missing
+sequence numbers are then skipped and counted as a gap). Duplicates are
+dropped.
+
+A stream starts at the first sequence number the receiver sees (a
+receiver that joins late does not wait for numbers sent before it was
+there); anything older than that start is delivered as it arrives. A new
+epoch from the same key replaces the stream: what the old one still held
+is released, and late messages of the old epoch are delivered unordered.
+Streams with nothing pending are forgotten after idle_timeout_s.
+
+A chunked transfer reserves its sequence number when its first chunk
+arrives (reserve()): later messages then wait for the transfer without a
+gap timeout, since the receiver's chunk stall timeout already bounds it.
+An aborted transfer fills its number with None, which the caller skips.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from src.core.cmb.aux_frames import AUX_SEQ
+
+
+SEQ_TRAILER_TAG = b"CMBQ\x01"
+
+_SEQ = struct.Struct("<IQ")
+
+
+def seq_frame(epoch: int, seq: int, target: bytes) -> bytes:
+    return SEQ_TRAILER_TAG + _SEQ.pack(epoch, seq) + target
+
+
+def split_seq(kinds: str, aux: list) -> Tuple[Optional[Tuple[int, int, str]], str, list]:
+    """
+    Detach the trailing sequence frame from aux frames (call after
+    split_hop_trace). Returns ((epoch, seq, target) or None, remaining
+    kinds, remaining aux).
+    """
+    if not kinds.endswith(AUX_SEQ):
+        return None, kinds, aux
+    frame = aux[-1]
+    data = frame if isinstance(frame, (bytes, bytearray)) else frame.bytes
+    offset = len(SEQ_TRAILER_TAG)
+    epoch, seq = _SEQ.unpack_from(data, offset)
+    target = bytes(data[offset + _SEQ.size:]).decode("utf-8")
+    return (epoch, seq, target), kinds[:-1], aux[:-1]
+
+
+class _Stream:
+    __slots__ = ("epoch", "start", "expected", "pending", "reserved", "waiting_since", "last_seen", "retired_epoch")
+
+    def __init__(self, epoch: int, start: int, now: float, retired_epoch: Optional[int] = None):
+        self.epoch = epoch
+        self.start = start                              # First sequence number seen
+        self.expected = start
+        self.pending: Dict[int, Any] = {}
+        self.reserved: Set[int] = set()                 # Numbers of transfers still arriving
+        self.waiting_since: Optional[float] = None      # When the current gap was first seen
+        self.last_seen = now
+        self.retired_epoch = retired_epoch              # The epoch this stream replaced
+
+
+class ReorderBuffer:
+    """
+    Bounded reorder buffer over many sequenced streams. Owned by the
+    endpoint thread.
+
+    push() returns the items that became deliverable, in sequence order;
+    reserve() holds a number for an item still in transit; expire() releases streams whose gap outlived gap_timeout_s and drops
+    streams idle for idle_timeout_s.
+    """
+
+    def __init__(
+        self,
+        window: int = 1024,
+        gap_timeout_s: float = 0.5,
+        idle_timeout_s: float = 60.0,
+        *,
+        on_gap: Optional[Callable[[Hashable, int], None]] = None,
+        on_duplicate: Optional[Callable[[Hashable, int], None]] = None,
+    ):
+        self.window = window
+        self.gap_timeout_s = gap_timeout_s
+        self.idle_timeout_s = idle_timeout_s
+        self._on_gap = on_gap
+        self._on_duplicate = on_duplicate
+        self._streams: Dict[Hashable, _Stream] = {}
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def buffered(self) -> int:
+        return sum(len(s.pending) for s in self._streams.values())
+
+    def push(self, key: Hashable, epoch: int, seq: int, item: Any, now: float) -> List[Any]:
+        out: List[Any] = []
+        stream = self._stream(key, epoch, seq, now, out)
+        if stream is None:
+            # Straggler from the sender's previous instance
+            return [item]
+
+        if seq in stream.reserved:
+            stream.reserved.discard(seq)
+            if seq < stream.expected:
+                # Its slot was skipped while the transfer was still arriving
+                out.append(item)
+                return out
+        elif seq < stream.start:
+            # Sent before this receiver's view of the stream began
+            out.append(item)
+            return out
+        elif seq < stream.expected or seq in stream.pending:
+            if self._on_duplicate is not None:
+                self._on_duplicate(key, seq)
+            return out
+
+        stream.pending[seq] = item
+        if seq == stream.expected:
+            out.extend(self._release(stream, now))
+            return out
+
+        if stream.waiting_since is None and stream.expected not in stream.reserved:
+            stream.waiting_since = now
+        if len(stream.pending) >= self.window:
+            out.extend(self._skip_gap(key, stream, now))
+        return out
+
+    def reserve(self, key: Hashable, epoch: int, seq: int, now: float) -> List[Any]:
+        """Hold seq for an item that push() delivers later; returns what a replaced epoch released."""
+        out: List[Any] = []
+        stream = self._stream(key, epoch, seq, now, out)
+        if stream is not None and seq >= stream.expected and seq not in stream.pending:
+            stream.reserved.add(seq)
+            if seq == stream.expected:
+                stream.waiting_since = None
+        return out
+
+    def expire(self, now: float) -> List[Any]:
+        out: List[Any] = []
+        idle = []
+        for key, stream in self._streams.items():
+            if stream.waiting_since is not None and now - stream.waiting_since >= self.gap_timeout_s:
+                out.extend(self._skip_gap(key, stream, now))
+            elif not stream.pending and not stream.reserved and now - stream.last_seen >= self.idle_timeout_s:
+                idle.append(key)
+        for key in idle:
+            del self._streams[key]
+        return out
+
+    def _stream(self, key: Hashable, epoch: int, seq: int, now: float, out: List[Any]) -> Optional[_Stream]:
+        """The key's stream for epoch (None for its retired epoch); a replaced stream's items go to out."""
+        retired = None
+        stream = self._streams.get(key)
+        if stream is not None and epoch != stream.epoch:
+            if epoch == stream.retired_epoch:
+                stream.last_seen = now
+                return None
+            out.extend(self._flush(key, stream))
+            retired, stream = stream.epoch, None
+        if stream is None:
+            stream = self._streams[key] = _Stream(epoch, seq, now, retired)
+        stream.last_seen = now
+        return stream
+
+    def _release(self, stream: _Stream, now: float) -> List[Any]:
+        out = []
+        while stream.expected in stream.pending:
+            out.append(stream.pending.pop(stream.expected))
+            stream.expected += 1
+        waiting = bool(stream.pending) and stream.expected not in stream.reserved
+        stream.waiting_since = now if waiting else None
+        return out
+
+    def _skip_gap(self, key: Hashable, stream: _Stream, now: float) -> List[Any]:
+        lowest = min(stream.pending)
+        if self._on_gap is not None:
+            self._on_gap(key, lowest - stream.expected)
+        stream.expected = lowest
+        return self._release(stream, now)
+
+    def _flush(self, key: Hashable, stream: _Stream) -> List[Any]:
+        """Everything a replaced stream still holds, in order (gaps counted)."""
+        if not stream.pending:
+            return []
+        seqs = sorted(stream.pending)
+        if self._on_gap is not None:
+            self._on_gap(key, seqs[-1] - stream.expected + 1 - len(seqs))
+        return [stream.pending[seq] for seq in seqs]
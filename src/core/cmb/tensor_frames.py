@@ -0,0 +1,128 @@
+"""
+Module: tensor_frames.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Binary multipart encoding for ndarray attachments on the Cognitive Message Bus (CMB).
+
+Intended for Vector Bus (VB) consumers on another host, where shared memory
+is not available. Arrays travel as raw ZMQ frames after the JSON envelope
+instead of being pushed through json.dumps:
+
+    [payload][layout][tensor header][buffer 0][buffer 1]...
+
+The layout frame marks them as AUX_TENSOR_HEADER / AUX_TENSOR_BUFFER
+(see aux_frames).
+
+The header is a small tagged JSON document describing name, dtype and shape
+for each buffer. Routers forward the trailing frames untouched; the
+receiving ModuleEndpoint rebuilds ndarrays directly over the frame buffers.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy is imported inside the codec functions: only endpoints that actually
+# carry tensors pay for it at startup.
+
+
+# Leading bytes of the header frame (tag + format version)
+TENSOR_HEADER_TAG = b"CMBT\x01"
+
+
+class TensorFrameError(ValueError):
+    """Raised when tensor frames cannot be encoded or decoded."""
+
+
+def _frame_bytes(frame: Any) -> bytes:
+    """Return the bytes of a zmq.Frame or bytes-like object."""
+    if isinstance(frame, (bytes, bytearray)):
+        return bytes(frame)
+    return frame.bytes
+
+
+def _frame_buffer(frame: Any) -> Any:
+    """Return a zero-copy buffer view over a zmq.Frame or bytes-like object."""
+    if isinstance(frame, (bytes, bytearray, memoryview)):
+        return frame
+    return frame.buffer
+
+
+def encode_tensor_frames(tensors: Mapping[str, np.ndarray]) -> list[Any]:
+    """
+    Encode named arrays into [header, buffer...] frames.
+
+    Buffers are returned as contiguous ndarrays so they can be handed to
+    send_multipart(copy=False) without an intermediate bytes copy.
+    """
+    import numpy as np
+
+    specs = []
+    buffers = []
+
+    for name, arr in tensors.items():
+        arr = np.ascontiguousarray(arr)
+        if arr.dtype.hasobject:
+            raise TensorFrameError(
+                f"Tensor '{name}' has object dtype and cannot be sent as raw frames"
+            )
+        specs.append(
+            {
+                "name": name,
+                "dtype": arr.dtype.str,
+                "shape": list(arr.shape),
+            }
+        )
+        buffers.append(arr)
+
+    header = TENSOR_HEADER_TAG + json.dumps({"tensors": specs}).encode("utf-8")
+    return [header, *buffers]
+
+
+def is_tensor_header(frame: Any) -> bool:
+    """True if the frame is a tensor header produced by encode_tensor_frames."""
+    return _frame_bytes(frame)[: len(TENSOR_HEADER_TAG)] == TENSOR_HEADER_TAG
+
+
+def decode_tensor_frames(frames: Sequence[Any]) -> dict[str, np.ndarray]:
+    """
+    Rebuild named arrays from [header, buffer...] frames.
+
+    Arrays are views over the received frame buffers (no copy) and are
+    therefore read-only.
+    """
+    if not frames or not is_tensor_header(frames[0]):
+        raise TensorFrameError("Missing tensor header frame")
+
+    try:
+        header = json.loads(_frame_bytes(frames[0])[len(TENSOR_HEADER_TAG):])
+        specs = header["tensors"]
+    except Exception as e:
+        raise TensorFrameError(f"Invalid tensor header: {e}") from e
+
+    buffers = frames[1:]
+    if len(buffers) != len(specs):
+        raise TensorFrameError(
+            f"Tensor header lists {len(specs)} buffers, got {len(buffers)}"
+        )
+
+    import numpy as np
+
+    tensors: dict[str, np.ndarray] = {}
+    for spec, frame in zip(specs, buffers):
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        try:
+            arr = np.frombuffer(_frame_buffer(frame), dtype=dtype)
+            tensors[spec["name"]] = arr.reshape(shape)
+        except ValueError as e:
+            raise TensorFrameError(
+                f"Tensor '{spec['name']}' buffer does not match {dtype}{list(shape)}: {e}"
+            ) from e
+
+    return tensors
@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 import time
 
+from src.core.cmb.delivery_groups import GroupCompletion
+from src.core.cmb.delivery_policy import DeliveryPolicy
 from src.core.cmb.transport_state_machine import AckStateMachine, AckTransitionEvent
 
 
@@ -52,11 +54,40 @@ class TransactionRecord:
     final_state: Optional[str] = None
     failure_reason: Optional[str] = None
 
+    # -------------------------------------------------
+    # Group delivery (target is "@group")
+    # -------------------------------------------------
+    completion: Optional[GroupCompletion] = None
+    expected_targets: Optional[List[str]] = None      # From the router's ROUTER_ACK
+    delivered_from: List[str] = field(default_factory=list)
+
+    # -------------------------------------------------
+    # Progress / partial results (send_request)
+    # -------------------------------------------------
+    await_result: bool = False
+    exec_timeout_s: Optional[float] = None
+
+    # ROUTER_ONLY transactions complete on the ROUTER_ACK
+    delivery: DeliveryPolicy = DeliveryPolicy.END_TO_END
+
     # -------------------------------------------------
     # Initialization
     # -------------------------------------------------
     def __post_init__(self):
-        self.ack_sm = AckStateMachine(message_id=self.message_id)
+        if self.await_result:
+            # Long-running request: no retry (handlers are not idempotent), the
+            # execution deadline is extended by every progress ACK
+            self.ack_sm = AckStateMachine(
+                message_id=self.message_id,
+                await_result=True,
+                exec_timeout_s=self.exec_timeout_s or 5.0,
+                max_retries=0,
+            )
+        else:
+            self.ack_sm = AckStateMachine(
+                message_id=self.message_id,
+                require_exec_ack=self.delivery.delivered_ack,
+            )
 
     # -------------------------------------------------
     # State transition handling
@@ -85,6 +116,20 @@ class TransactionRecord:
     def is_complete(self) -> bool:
         return self.ack_sm.is_terminal()
 
+    def is_group(self) -> bool:
+        return self.completion is not None
+
+    def record_delivery(self, member: str) -> None:
+        if member not in self.delivered_from:
+            self.delivered_from.append(member)
+
+    def group_delivered(self) -> List[str]:
+        """Delivered members that the router actually addressed."""
+        if self.expected_targets is None:
+            return []
+        expected = set(self.expected_targets)
+        return [m for m in self.delivered_from if m in expected]
+
     def duration(self) -> Optional[float]:
         if self.completed_at is None:
             return None
@@ -109,4 +154,8 @@ class TransactionRecord:
             "duration": self.duration(),
             "final_state": self.final_state,
             "failure_reason": self.failure_reason,
+            "delivery": self.delivery.value,
+            "completion": self.completion.mode if self.completion else None,
+            "expected_targets": self.expected_targets,
+            "delivered_from": list(self.delivered_from),
         }
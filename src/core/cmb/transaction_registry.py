@@ -3,8 +3,11 @@ import time
 from typing import Dict, Optional, Iterable
 
 from src.core.cmb.cmb_exceptions import TransportError
+from src.core.cmb.delivery_groups import GroupCompletion
+from src.core.cmb.delivery_policy import DeliveryPolicy
+from src.core.cmb.progress import PROGRESS_ACK_TYPE
 from src.core.cmb.transaction_record import TransactionRecord
-from src.core.cmb.transport_state_machine import AckTransitionEvent
+from src.core.cmb.transport_state_machine import AckState, AckTransitionEvent
 from src.core.messages.ack_message import AckMessage
 from src.core.messages.cognitive_message import CognitiveMessage
 
@@ -35,10 +38,24 @@ class TransactionRegistry:
         source: str,
         target: str,
         payload: bytes,
-    ) -> TransactionRecord:
+        completion: Optional[GroupCompletion] = None,
+        await_result: bool = False,
+        exec_timeout_s: Optional[float] = None,
+        delivery: DeliveryPolicy = DeliveryPolicy.END_TO_END,
+    ) -> Optional[TransactionRecord]:
         """
         Create and register a new transaction.
+
+        completion is set for group sends: member deliveries are then
+        aggregated into a single completion (see _settle_group).
+        await_result keeps the transaction EXECUTING after delivery until
+        the final PROGRESS_ACK (see progress.py).
+        Fire-and-forget (DeliveryPolicy.NONE) sends are not tracked: nothing
+        is registered and None is returned.
         """
+        if delivery is DeliveryPolicy.NONE:
+            return None
+
         with self._lock:
             if message_id in self._transactions:
                 raise ValueError(f"Duplicate transaction for message_id={message_id}")
@@ -50,6 +67,10 @@ class TransactionRegistry:
                 source=source,
                 target=target,
                 payload=payload,
+                completion=completion,
+                await_result=await_result,
+                exec_timeout_s=exec_timeout_s,
+                delivery=delivery,
             )
 
             # Register a transaction for this message_id
@@ -78,13 +99,28 @@ class TransactionRegistry:
             tx = self._transactions.get(ack.correlation_id)
             if tx is None:
                 # Unknown or already cleaned-up transaction
-                raise TransportError("ERROR 1")
+                raise TransportError(ack.correlation_id, "ERROR 1")
+
+            if ack.ack_type == "ROUTER_ACK" and ack.status == "ERROR":
+                # Router refused the message (e.g. schema validation)
+                event = tx.ack_sm.on_error("ROUTER_REJECTED", details=ack.payload)
+                tx.record_transition(event)
+                return event
+
+            if tx.is_group():
+                return self._apply_group_ack(tx, ack)
 
             if ack.ack_type == "ROUTER_ACK":
                 event = tx.ack_sm.on_router_ack()
 
             elif ack.ack_type == "MESSAGE_DELIVERED_ACK":
                 event = tx.ack_sm.on_msg_delivered_ack()               
+            elif ack.ack_type == PROGRESS_ACK_TYPE:
+                payload = ack.payload or {}
+                event = tx.ack_sm.on_msg_data(
+                    details={"seq": payload.get("seq")},
+                    final=bool(payload.get("final")),
+                )
             else:
                 # Unknown ACK type → ignore safely
                 event = "ERROR 2"
@@ -93,6 +129,55 @@ class TransactionRegistry:
             tx.record_transition(event)
             return event
 
+    def _apply_group_ack(self, tx: TransactionRecord, ack: AckMessage) -> AckTransitionEvent:
+        """
+        ACK for a group send. Member deliveries may arrive before the
+        ROUTER_ACK that lists the members, so both paths try to settle.
+        """
+        if ack.ack_type == "ROUTER_ACK":
+            event = tx.ack_sm.on_router_ack()
+            tx.record_transition(event)
+            tx.expected_targets = list((ack.payload or {}).get("targets") or [])
+            return self._settle_group(tx) or event
+
+        if ack.ack_type == "MESSAGE_DELIVERED_ACK":
+            tx.record_delivery(ack.source)
+            if tx.is_complete():
+                # Member after completion (e.g. policy "any"): not recorded
+                return tx.ack_sm.on_partial_delivery(details={"member": ack.source, "late": True})
+            event = self._settle_group(tx)
+            if event is None:
+                event = tx.ack_sm.on_partial_delivery(details={"member": ack.source})
+                tx.record_transition(event)
+            return event
+
+        return "ERROR 2"
+
+    def _settle_group(self, tx: TransactionRecord) -> Optional[AckTransitionEvent]:
+        """Complete (or fail) a group transaction once its policy is decided."""
+        if tx.ack_sm.state != AckState.AWAIT_MESSAGE_DELIVERED_ACK:
+            return None
+
+        expected = tx.expected_targets
+        required = tx.completion.required(len(expected))
+        details = {
+            "completion": tx.completion.mode,
+            "expected": list(expected),
+            "delivered": tx.group_delivered(),
+        }
+
+        if not expected:
+            event = tx.ack_sm.on_error("GROUP_NO_MEMBERS", details=details)
+        elif required > len(expected):
+            event = tx.ack_sm.on_error("GROUP_QUORUM_UNREACHABLE", details=details)
+        elif len(details["delivered"]) >= required:
+            event = tx.ack_sm.on_msg_delivered_ack(details=details)
+        else:
+            return None
+
+        tx.record_transition(event)
+        return event
+
     def apply_msg_received(self, msg: CognitiveMessage) -> Optional[AckTransitionEvent]:
         """
         Apply a MSG_RECEIVED event to the corresponding transaction.
@@ -111,15 +196,21 @@ class TransactionRegistry:
     # -------------------------------------------------
     # Time-based processing
     # -------------------------------------------------
-    def tick(self) -> Iterable[AckTransitionEvent]:
+    def tick(self, message_ids: Optional[Iterable[str]] = None) -> Iterable[AckTransitionEvent]:
         """
         Drive time-based transitions (timeouts, retries).
         Should be called periodically by ModuleEndpoint.
+
+        message_ids restricts the tick to those transactions.
         """
         events = []
 
         with self._lock:
-            for tx in self._transactions.values():
+            if message_ids is None:
+                txs = list(self._transactions.values())
+            else:
+                txs = [self._transactions[m] for m in message_ids if m in self._transactions]
+            for tx in txs:
                 if tx.is_complete():
                     continue
 
@@ -164,6 +255,17 @@ class TransactionRegistry:
     # -------------------------------------------------
     # Introspection
     # -------------------------------------------------
+    def state_counts(self) -> Dict[str, int]:
+        """
+        Number of transactions per ACK state (for metrics gauges).
+        """
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for tx in self._transactions.values():
+                name = tx.ack_sm.state.name
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
     def snapshot(self) -> Dict[str, dict]:
         """
         Snapshot all current transactions (for GUI / debugging).
@@ -0,0 +1,111 @@
+"""
+Module: transport_qos.py
+Location: src/core/cmb/
+Version: 0.1.0
+
+Per-channel transport QoS profiles.
+
+A TransportQoS is attached to each ChannelConfig and applied by the channel
+router and by module endpoints to every socket they open for the channel:
+
+- send/receive high-water marks and kernel buffer sizes
+- IO-thread pool: each pool is its own zmq.Context, so bulk channels do not
+  share an IO thread with control traffic ("default" is Context.instance())
+- linger on close, ZMQ_IMMEDIATE on connecting sockets
+- conflate: the receiving endpoint keeps only the newest queued message
+  (applied in the endpoint because CMB messages are multipart, which
+  ZMQ_CONFLATE does not support)
+
+ACK sockets always stay on the default pool, since the ACK hub may be
+reached over inproc, which only works within one context.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import zmq
+
+
+DEFAULT_IO_POOL = "default"
+
+# Pool name -> IO threads of its context
+IO_POOL_THREADS: Dict[str, int] = {
+    DEFAULT_IO_POOL: 1,
+    "control": 1,
+    "bulk": 2,
+}
+
+
+@dataclass(frozen=True)
+class TransportQoS:
+    sndhwm: int = 1000              # Messages queued per peer before EAGAIN / drop
+    rcvhwm: int = 1000
+    sndbuf: int = -1                # Kernel buffer bytes (-1 = OS default)
+    rcvbuf: int = -1
+    io_pool: str = DEFAULT_IO_POOL
+    linger_ms: int = 0              # Pending messages kept on close
+    immediate: bool = False         # Queue only to completed connections
+    conflate: bool = False          # Receiver keeps only the newest message
+
+    def apply(self, sock: zmq.Socket) -> None:
+        """Set socket options; call before bind/connect."""
+        sock.setsockopt(zmq.SNDHWM, self.sndhwm)
+        sock.setsockopt(zmq.RCVHWM, self.rcvhwm)
+        sock.setsockopt(zmq.SNDBUF, self.sndbuf)
+        sock.setsockopt(zmq.RCVBUF, self.rcvbuf)
+        sock.setsockopt(zmq.LINGER, self.linger_ms)
+        sock.setsockopt(zmq.IMMEDIATE, int(self.immediate))
+
+
+# ----------------------------
+# Profiles
+# ----------------------------
+
+DEFAULT_QOS = TransportQoS()
+
+# Own IO thread: control latency is not affected by bulk transfers
+CONTROL_QOS = TransportQoS(io_pool="control")
+
+# Deep queues and large kernel buffers for vectors / memory payloads
+BULK_QOS = TransportQoS(
+    sndhwm=10_000,
+    rcvhwm=10_000,
+    sndbuf=4 * 1024 * 1024,
+    rcvbuf=4 * 1024 * 1024,
+    io_pool="bulk",
+)
+
+# Latest-only streams (e.g. perception): old samples are worthless
+STREAM_QOS = TransportQoS(
+    sndhwm=16,
+    rcvhwm=16,
+    io_pool="bulk",
+    conflate=True,
+)
+
+
+# ----------------------------
+# IO-thread pools
+# ----------------------------
+
+_pool_lock = threading.Lock()
+_pool_contexts: Dict[str, Tuple[int, zmq.Context]] = {}
+
+
+def io_context(pool: str = DEFAULT_IO_POOL) -> zmq.Context:
+    """Process-wide context for an IO pool (never terminated, like Context.instance())."""
+    if pool == DEFAULT_IO_POOL:
+        return zmq.Context.instance()
+
+    pid = os.getpid()
+    with _pool_lock:
+        entry = _pool_contexts.get(pool)
+        if entry is None or entry[0] != pid:
+            ctx = zmq.Context(io_threads=IO_POOL_THREADS.get(pool, 1))
+            _pool_contexts[pool] = (pid, ctx)
+            return ctx
+        return entry[1]
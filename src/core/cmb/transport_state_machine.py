@@ -3,12 +3,13 @@ from dataclasses import dataclass
 from typing import Optional, Any
 import time
 
-from core.messages.ack_message import AckMessage
+from src.core.messages.ack_message import AckMessage
 
 class AckState(Enum):
     SEND_PENDING = auto()
     AWAIT_ROUTER_ACK = auto()
     AWAIT_MESSAGE_DELIVERED_ACK = auto()
+    EXECUTING = auto()              # Receiver is producing progress / partial results
     COMPLETED = auto()
     TIMEOUT = auto()
     ERROR = auto()
@@ -46,6 +47,7 @@ class AckStateMachine:
         *,
         require_exec_ack: bool = True,
         allow_progress_ack: bool = True,
+        await_result: bool = False,
         router_timeout_s: float = 1.0,
         exec_timeout_s: float = 5.0,
         max_retries: int = 3,
@@ -55,6 +57,7 @@ class AckStateMachine:
         # Policy
         self.require_exec_ack = require_exec_ack
         self.allow_progress_ack = allow_progress_ack
+        self.await_result = await_result        # Delivery ACK -> EXECUTING until the final progress ACK
         self.router_timeout_s = router_timeout_s
         self.exec_timeout_s = exec_timeout_s
         self.max_retries = max_retries
@@ -104,6 +107,9 @@ class AckStateMachine:
 
     def on_router_ack(self) -> AckTransitionEvent:
         self.router_deadline = None
+        if self.state == AckState.EXECUTING:
+            # Progress overtook the ROUTER_ACK
+            return self._transition(self.state, reason="ROUTER_ACK_LATE")
         if self.require_exec_ack:
             self.exec_deadline = time.monotonic() + self.exec_timeout_s
             return self._transition(
@@ -117,13 +123,17 @@ class AckStateMachine:
         )
 
 
-    def on_msg_delivered_ack(self) -> AckTransitionEvent:
+    def on_msg_delivered_ack(self, details: Optional[Any] = None) -> AckTransitionEvent:
         """
         Handle EXEC ACK from the destination module.
 
         Valid only when waiting for execution completion.
         """
 
+        if self.state == AckState.EXECUTING:
+            # Progress overtook the delivery ACK
+            return self._transition(self.state, reason="MSG_DELIVERED_ACK", details=details)
+
         # --- Illegal state guard ---
         if self.state != AckState.AWAIT_MESSAGE_DELIVERED_ACK:
             return self._transition(
@@ -132,21 +142,68 @@ class AckStateMachine:
             )
 
         # --- Normal success / failure handling ---
+        elif self.await_result:
+            self.exec_deadline = time.monotonic() + self.exec_timeout_s
+            return self._transition(
+                AckState.EXECUTING,
+                reason="MSG_DELIVERED_ACK_AWAIT_RESULT",
+                details=details,
+            )
         else: 
             return self._transition(
             AckState.COMPLETED,
             reason="MSG_DELIVERED_ACK_SUCCESS",
+            details=details,
+        )
+
+    def on_partial_delivery(self, details: Optional[Any] = None) -> AckTransitionEvent:
+        """One group member delivered; the group policy is not yet met."""
+        return self._transition(
+            self.state,
+            reason="MSG_DELIVERED_ACK_PARTIAL",
+            details=details,
+        )
+
+    def on_error(self, reason: str, details: Optional[Any] = None) -> AckTransitionEvent:
+        self.router_deadline = None
+        self.exec_deadline = None
+        return self._transition(
+            AckState.ERROR,
+            reason=reason,
+            details=details,
         )
         
 
     
-    def on_msg_data(self, details: Optional[Any] = None) -> AckTransitionEvent:
+    def on_msg_data(self, details: Optional[Any] = None, *, final: bool = False) -> AckTransitionEvent:
+        """
+        Handle a PROGRESS ACK (partial result) from the destination module.
+
+        Moves to (or stays in) EXECUTING and extends the execution
+        deadline; the final progress ACK completes the transaction.
+        """
         if not self.allow_progress_ack:
             return self._transition(
                 self.state,
                 reason="PROGRESS_ACK_IGNORED",
             )
 
+        if self.is_terminal():
+            return self._transition(
+                self.state,
+                reason="LATE_PROGRESS_ACK",
+                details=details,
+            )
+
+        self.router_deadline = None
+        if final:
+            self.exec_deadline = None
+            return self._transition(
+                AckState.COMPLETED,
+                reason="RESULT_ACK",
+                details=details,
+            )
+
         # Stay in EXECUTING, refresh timeout
         self.exec_deadline = time.monotonic() + self.exec_timeout_s
         return self._transition(
@@ -163,7 +220,7 @@ class AckStateMachine:
             if self.router_deadline and now >= self.router_deadline:
                 return self._handle_timeout("ROUTER_TIMEOUT")
 
-        if self.state in (AckState.AWAIT_EXEC_ACK, AckState.EXECUTING):
+        if self.state in (AckState.AWAIT_MESSAGE_DELIVERED_ACK, AckState.EXECUTING):
             if self.exec_deadline and now >= self.exec_deadline:
                 return self._handle_timeout("EXEC_TIMEOUT")
 
@@ -185,13 +242,14 @@ class AckStateMachine:
             reason=f"{reason}_FAIL",
         )
 
-    def cancel(self) -> AckTransitionEvent:
+    def cancel(self, reason: str = "CANCEL") -> AckTransitionEvent:
         self.router_deadline = None
         self.exec_deadline = None
         return self._transition(
             AckState.CANCELLED,
-            reason="CANCEL",
+            reason=reason,
         )
+
     def is_terminal(self) -> bool:
         return self.state in (
             AckState.COMPLETED,
@@ -1,5 +1,7 @@
 import json
 
+from src.core.cmb.delivery_policy import DeliveryPolicy
+
 
 def extract_message_id(payload: bytes) -> str:
     """
@@ -17,3 +19,40 @@ def extract_message_id(payload: bytes) -> str:
         raise ValueError("Payload missing 'message_id'")
 
     return message_id
+
+
+def extract_routing(payload: bytes) -> tuple:
+    """
+    (message_id, msg_type, delivery) of a serialized CognitiveMessage or
+    AckMessage; delivery is None when the message has no policy override.
+
+    Raises ValueError like extract_message_id, or for an unknown delivery
+    policy.
+    """
+    try:
+        data = json.loads(payload.decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"Invalid message payload (not JSON): {e}")
+
+    message_id = data.get("message_id")
+    if not message_id:
+        raise ValueError("Payload missing 'message_id'")
+
+    delivery = data.get("delivery")
+    if delivery is not None:
+        DeliveryPolicy.resolve(delivery, DeliveryPolicy.END_TO_END)
+    return message_id, data.get("msg_type"), delivery
+
+
+def split_inbound_frames(frames: list) -> tuple:
+    """
+    Split ROUTER -> DEALER frames into (payload, aux_frames).
+
+    Tolerates an optional leading empty delimiter:
+      [empty?][payload][aux...]
+    Aux frames (e.g. tensor buffers) are returned untouched.
+    """
+    if len(frames) > 1 and len(frames[0]) == 0:
+        frames = frames[1:]
+    return frames[0], list(frames[1:])
+
@@ -21,6 +21,7 @@ import queue
 
 from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
 from src.core.cmb.module_endpoint import ModuleEndpoint
+from src.core.logging.log_segments import tail_lines
 from src.core.messages.cognitive_message import CognitiveMessage
 
 
@@ -96,7 +97,7 @@ class DirectiveGUI:
         self.log_text = scrolledtext.ScrolledText(self.root, height=10)
         self.log_text.pack(fill="both", expand=False, padx=6, pady=4)
 
-        self._last_log_size = 0
+        self._last_log_marker = None
     
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
@@ -177,23 +178,25 @@ class DirectiveGUI:
             return
 
         try:
-            if not os.path.exists(self.logfile):
+            try:
+                st = os.stat(self.logfile)
+            except OSError:
                 self.root.after(500, self.poll_log)
                 return
 
-            size = os.path.getsize(self.logfile)
-            if size == self._last_log_size:
+            # (inode, size) also changes when the file is rotated
+            marker = (st.st_ino, st.st_size)
+            if marker == self._last_log_marker:
                 self.root.after(500, self.poll_log)
                 return
 
-            # Read new content (simple approach for demo)
-            with open(self.logfile, "r", encoding="utf-8") as f:
-                lines = f.readlines()[-50:]  # tail 50
+            # Seeks to the end (and into the newest segment if needed)
+            lines = tail_lines(self.logfile, 50)
 
             self.log_text.delete("1.0", "end")
             self.log_text.insert("end", "".join(lines))
             self.log_text.see("end")
-            self._last_log_size = size
+            self._last_log_marker = marker
 
         finally:
             self.root.after(1500, self.poll_log)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from src.core.intent.interfaces import IntentExtractionInterface
-from src.core.intent.llm_adapter_openai_intent import OpenAIIntentAdapter
 from src.core.intent.schema import from_dict, IntentValidationError
 from src.core.intent.models import IntentObject
 from src.core.intent.models import DirectiveSource
 
+if TYPE_CHECKING:
+    from src.core.intent.llm_adapter_openai_intent import OpenAIIntentAdapter
+
 
 @dataclass
 class IntentExtractor(IntentExtractionInterface):
@@ -14,10 +14,11 @@ OpenAI-backed intent classification adapter (Phase 1)
 from __future__ import annotations
 
 import json
+import time
 from typing import Dict, Any, List
-from openai import OpenAI
 
 from src.core.policy.model_selection.policy import ModelSelectionPolicy
+from src.core.monitoring.metrics import metrics_registry
 #from src.core.policy.model_selection.enums import TaskType, ReasoningDepth
 
 
@@ -35,12 +36,21 @@ class OpenAIIntentAdapter:
         :param escalation_models: ordered escalation list
         :param max_attempts: hard cap on total attempts (prevents loops)
         """
-        self.client = OpenAI()
+        self._client = None
         self.policy = policy
         self.primary_model = primary_model
         self.escalation_models = escalation_models or ["gpt-5", "gpt-5.2"]
         self.max_attempts = max_attempts
 
+    @property
+    def client(self):
+        """OpenAI client, imported and constructed on first call (keeps module startup fast)."""
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI()
+        return self._client
+
     # ------------------------------------------------------------------
     # Public API expected by IntentExtractor
     # ------------------------------------------------------------------
@@ -187,10 +197,19 @@ CRITICAL RULES
 
 If you violate any rule, your output will be rejected.
 """
-        response = self.client.responses.create(
-            model=model_name,
-            input=prompt,
-        )
+        started = time.perf_counter_ns()
+        try:
+            response = self.client.responses.create(
+                model=model_name,
+                input=prompt,
+            )
+        finally:
+            metrics_registry().histogram(
+                "llm_call_latency_seconds",
+                "Wall time of LLM API calls",
+                adapter="openai_intent",
+                model=model_name,
+            ).observe(time.perf_counter_ns() - started)
 
         raw_text = response.output_text or ""
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any
+from src.core.cmb.schema_registry import compile_schema
 from src.core.intent.models import (
     IntentObject,
     DirectiveSource,
@@ -15,6 +16,36 @@ class IntentValidationError(ValueError):
     pass
 
 
+def _enum_values(enum_cls) -> list[str]:
+    return [member.value for member in enum_cls]
+
+
+INTENT_SCHEMA = {
+    "type": "object",
+    "required": [
+        "intent_label",
+        "planning_required",
+        "urgency_level",
+        "risk_level",
+        "expected_response_type",
+        "confidence_score",
+    ],
+    "properties": {
+        "intent_label": {"type": "string"},
+        "directive_source": {"enum": _enum_values(DirectiveSource)},
+        "directive_type": {"enum": _enum_values(DirectiveType)},
+        "urgency_level": {"enum": _enum_values(UrgencyLevel)},
+        "risk_level": {"enum": _enum_values(RiskLevel)},
+        "expected_response_type": {"enum": _enum_values(ExpectedResponseType)},
+        "suggested_modules": {"type": ["array", "null"]},
+        "execution_constraints": {"type": ["object", "null"]},
+    },
+}
+
+# Compiled once at import; from_dict runs on every LLM classification
+_validate_intent = compile_schema(INTENT_SCHEMA, "intent")
+
+
 def validate_confidence(score: float) -> None:
     if not isinstance(score, (float, int)):
         raise IntentValidationError("confidence_score must be a number.")
@@ -27,18 +58,9 @@ def from_dict(data: dict[str, Any]) -> IntentObject:
     Convert a dict (typically LLM JSON output) into an IntentObject,
     enforcing enum validity and basic constraints.
     """
-    print(f"Debug: Raw LLM output for intent classification: {data}")
-    required = [
-        "intent_label",
-        "planning_required",
-        "urgency_level",
-        "risk_level",
-        "expected_response_type",
-        "confidence_score",
-    ]
-    missing = [k for k in required if k not in data]
-    if missing:
-        raise IntentValidationError(f"Missing required fields: {missing}")
+    error = _validate_intent(data)
+    if error is not None:
+        raise IntentValidationError(f"Invalid intent: {error}")
 
     validate_confidence(float(data["confidence_score"]))
 
@@ -0,0 +1,326 @@
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.core.logging.file_log_sink import entry_to_json
+from src.core.logging.log_entry import LogEntry
+from src.core.logging.log_segments import (
+    SegmentCompressor,
+    SegmentRotation,
+    first_timestamp,
+    new_segment_path,
+    rotation_lock,
+)
+from src.core.logging.log_severity import LogSeverity
+
+
+_BARRIER_POLL_S = 0.1      # flush() re-checks for a finished close() this often
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+# Posix renames a file other processes hold open; Windows refuses, so there
+# only the file's single writer (exclusive=True) rotates it
+_SHARED_ROTATION = os.name == "posix"
+
+
+class AsyncBatchLogSink:
+    """
+    Base for log sinks that hand entries to a background writer thread.
+
+    emit() only appends the entry to a bounded in-memory buffer (a deque;
+    append/popleft are atomic, so the caller takes no lock). The writer
+    serializes entries in batches and passes each batch to _write() at once
+    (group commit) when batch_size entries are waiting or flush_interval_s
+    has passed. Subclasses implement _write(), _sync() and _close_output().
+
+    Overflow: once `capacity` entries are buffered, TRACE/DEBUG/INFO entries
+    are dropped (and counted); WARNING and above may still use `reserve`
+    further slots before they are dropped too.
+
+    flush() is the durability barrier: it queues a marker behind every entry
+    emitted so far and returns once the writer has written (and synced) up
+    to that marker. A barrier is released even if the write fails, and
+    flush() returns at once on a closed sink.
+
+    Entries are serialized later on the writer thread, so callers must not
+    mutate an entry or its payload after emitting it.
+
+    on_tick, if given, is called from the writer thread on every wakeup
+    (at least every flush_interval_s), e.g. to emit periodic entries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        capacity: int = 65_536,
+        reserve: int = 4_096,
+        batch_size: int = 512,
+        flush_interval_s: float = 0.05,
+        on_tick: Optional[Callable[[], None]] = None,
+    ):
+        self._capacity = capacity
+        self._limit = capacity + reserve
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._on_tick = on_tick
+
+        self._buffer: deque = deque()
+        self._dropped = 0
+
+        self._wake = threading.Event()
+        self._closed = False
+        self._drained = threading.Event()      # Set once close() wrote the last batch
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """Entries dropped because the buffer was full."""
+        return self._dropped
+
+    def emit(self, entry: LogEntry) -> None:
+        """
+        Queue a log entry for the writer. Never blocks, never raises.
+        """
+        buffered = len(self._buffer)
+        if buffered >= self._capacity and (
+            entry.severity.value < LogSeverity.WARNING.value or buffered >= self._limit
+        ):
+            self._dropped += 1
+            return
+        self._buffer.append(entry)
+        if buffered + 1 >= self._batch_size:
+            self._wake.set()
+
+    def emit_line(self, line: str) -> None:
+        """
+        Queue an already serialized JSONL record (e.g. received from another
+        process). Only dropped once the reserve is exhausted too.
+        """
+        buffered = len(self._buffer)
+        if buffered >= self._limit:
+            self._dropped += 1
+            return
+        self._buffer.append(line)
+        if buffered + 1 >= self._batch_size:
+            self._wake.set()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Durability barrier: wait until all entries emitted so far are
+        written. Returns False on timeout.
+        """
+        if self._closed:
+            return True
+        barrier = threading.Event()
+        self._buffer.append(barrier)
+        self._wake.set()
+
+        # A barrier queued while close() drains may never be reached
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not barrier.wait(_BARRIER_POLL_S if deadline is None else
+                               max(0.0, min(_BARRIER_POLL_S, deadline - time.monotonic()))):
+            if self._drained.is_set():
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return True
+
+    def close(self) -> None:
+        """
+        Write everything still buffered and close the output.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout=5.0)
+        try:
+            while self._buffer:
+                self._write_batch(self._batch_size)
+            self._close_output()
+        except Exception:
+            pass
+        # Release flush() callers whose barrier was never reached (write error)
+        while self._buffer:
+            item = self._buffer.popleft()
+            if isinstance(item, threading.Event):
+                item.set()
+        self._drained.set()
+
+    # ----------------------------
+    # Output (writer thread)
+    # ----------------------------
+
+    def _write(self, data: str) -> None:
+        raise NotImplementedError
+
+    def _sync(self) -> None:
+        """Called before a flush() barrier is released."""
+
+    def _close_output(self) -> None:
+        """Called once by close() after the last batch."""
+
+    # ----------------------------
+    # Writer thread
+    # ----------------------------
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self._flush_interval_s)
+            self._wake.clear()
+            try:
+                if self._on_tick is not None:
+                    self._on_tick()
+                while self._buffer and not self._closed:
+                    self._write_batch(self._batch_size)
+            except Exception:
+                # Never allow logging to break the system
+                time.sleep(self._flush_interval_s)
+
+    def _write_batch(self, max_entries: int) -> None:
+        popleft = self._buffer.popleft
+        lines = []
+        barrier = None
+        for _ in range(max_entries):
+            try:
+                item = popleft()
+            except IndexError:
+                break
+            if isinstance(item, threading.Event):
+                barrier = item
+                break
+            try:
+                lines.append((item if isinstance(item, str) else entry_to_json(item)) + "\n")
+            except Exception:
+                pass
+
+        try:
+            if lines:
+                self._write("".join(lines))
+            if barrier is not None:
+                self._sync()
+        finally:
+            # A failed write must not leave flush() waiting forever
+            if barrier is not None:
+                barrier.set()
+
+
+class AsyncFileLogSink(AsyncBatchLogSink):
+    """
+    Log sink that appends log entries to a JSONL file from a background
+    writer thread: one os.write() per batch on an O_APPEND descriptor, fsync
+    on flush() barriers with fsync=True. See AsyncBatchLogSink for buffering
+    and overflow.
+
+    Each batch lands at the end of the file as a unit, so processes that
+    append to the same file without a LogCollector never interleave their
+    lines (a buffered file object would split large batches into several
+    writes).
+
+    With a SegmentRotation the file is closed into a segment once it is
+    too large or too old, and segments are compressed and indexed in the
+    background (see log_segments). Rotation is coordinated between
+    processes appending to the same file: a writer whose file was rotated
+    by another process reopens the new one on its next batch. On hosts that
+    cannot rename an open file (Windows) only an `exclusive` sink - the
+    file's single writer, e.g. the LogCollector's - rotates.
+    """
+
+    def __init__(
+        self,
+        logfile_path: str,
+        *,
+        fsync: bool = False,
+        rotation: Optional[SegmentRotation] = None,
+        exclusive: bool = False,
+        **kwargs,
+    ):
+        self._path = Path(logfile_path)
+        self._fsync = fsync
+        self._rotation = rotation
+        self.exclusive = exclusive
+        self._compressor: Optional[SegmentCompressor] = None
+
+        # Ensure parent directory exists
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._open()
+        if rotation is not None:
+            self._compressor = SegmentCompressor(self._path, rotation)
+
+        super().__init__(f"AsyncFileLogSink[{self._path.name}]", **kwargs)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _open(self) -> None:
+        self._fd = os.open(self._path, _APPEND_FLAGS, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+        self._segment_started = first_timestamp(self._path) or time.time()
+
+    def _write(self, data: str) -> None:
+        if self._rotation is not None:
+            self._follow_rotation()
+        view = memoryview(data.encode("utf-8"))
+        while view:
+            # Regular files take the whole batch; loop for the rare short write
+            view = view[os.write(self._fd, view):]
+        if self._rotation is not None and self._rotation_due():
+            self._rotate()
+
+    def _sync(self) -> None:
+        if self._fsync:
+            os.fsync(self._fd)
+
+    def _close_output(self) -> None:
+        os.close(self._fd)
+        if self._compressor is not None:
+            self._compressor.close()
+
+    # ----------------------------
+    # Rotation (writer thread)
+    # ----------------------------
+
+    def _rotation_due(self) -> bool:
+        if not (_SHARED_ROTATION or self.exclusive):
+            return False
+        rotation = self._rotation
+        if rotation.max_bytes is not None and os.fstat(self._fd).st_size >= rotation.max_bytes:
+            return True
+        return rotation.max_age_s is not None and time.time() - self._segment_started >= rotation.max_age_s
+
+    def _follow_rotation(self) -> None:
+        """Reopen if another process rotated the file since our last batch."""
+        try:
+            rotated = os.stat(self._path).st_ino != self._inode
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            os.close(self._fd)
+            self._open()
+
+    def _rotate(self) -> None:
+        try:
+            with rotation_lock(self._path):
+                self._follow_rotation()
+                if not self._rotation_due():
+                    return  # another process rotated first
+                segment = new_segment_path(self._path)
+                # Our own handle must not pin the file (Windows)
+                os.close(self._fd)
+                try:
+                    os.replace(self._path, segment)
+                finally:
+                    self._open()
+        except OSError:
+            # Lock wait timed out or the file is held open elsewhere; retry next batch
+            return
+        self._compressor.submit(segment)
@@ -26,3 +26,7 @@ class ExecutionContext:
     parent_event_id: Optional[str] = None
     # Links this event to the event that caused it, enabling
     # causal graphs and replay trees.
+
+    traced: bool = False
+    # Set for work being traced end to end (e.g. sampled hop-traced
+    # messages); its entries bypass log sampling and rate limits.
@@ -6,6 +6,25 @@ import threading
 from src.core.logging.log_entry import LogEntry
 
 
+def entry_to_json(entry: LogEntry) -> str:
+    """Serialize a log entry as one JSONL record (without newline)."""
+    record = {
+        "log_id": entry.log_id,
+        "timestamp": entry.timestamp,
+        "severity": entry.severity.name,
+        "source_module": entry.source_module,
+        "event_type": entry.event_type,
+        "message": entry.message,
+        "payload": entry.payload,
+        "context": (
+            vars(entry.context)
+            if entry.context is not None
+            else None
+        ),
+    }
+    return json.dumps(record)
+
+
 class FileLogSink:
     """
     Log sink that persists log entries to an append-only JSONL file.
@@ -31,22 +50,9 @@ class FileLogSink:
         This method must not raise exceptions outward.
         """
         try:
-            record = {
-                "log_id": entry.log_id,
-                "timestamp": entry.timestamp,
-                "severity": entry.severity.name,
-                "source_module": entry.source_module,
-                "event_type": entry.event_type,
-                "message": entry.message,
-                "payload": entry.payload,
-                "context": (
-                    vars(entry.context)
-                    if entry.context is not None
-                    else None
-                ),
-            }
+            line = entry_to_json(entry)
             with self._lock:
-                self._file.write(json.dumps(record) + "\n")
+                self._file.write(line + "\n")
                 self._file.flush()
 
         except Exception:
@@ -0,0 +1,118 @@
+"""
+Module: log_collector.py
+Location: src/core/logging/
+Version: 0.1.0
+
+Single writer for a log file shared by several processes.
+
+Processes started with AGI_LOG_COLLECTOR=<address> ship their log batches
+to the collector (CollectorLogSink, ZMQ PUSH) instead of appending to the
+file themselves; the collector PULLs them and appends through its own
+process's log hub. The file then has exactly one writer: no interleaved
+partial lines, no lock contention between processes, and rotation also
+works where an open file cannot be renamed (Windows rotates only in the
+collector).
+
+Run standalone:
+    python -m src.core.logging.log_collector [--address ipc:///tmp/agi-log-collector.sock] [--path logs/system.jsonl]
+
+or let the Supervisor host it (Supervisor(log_collector=...)).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import threading
+from typing import Optional
+
+import zmq
+
+from src.core.logging.async_file_log_sink import AsyncFileLogSink
+from src.core.logging.log_hub import DEFAULT_LOG_PATH, LOG_COLLECTOR_ENV, log_hub
+
+
+DEFAULT_LOG_COLLECTOR = (
+    "ipc:///tmp/agi-log-collector.sock" if os.name == "posix" else "tcp://127.0.0.1:6190"
+)
+
+
+class LogCollector:
+    """
+    PULL socket feeding shipped log batches into this process's hub for
+    `path`. Runs on its own thread; batches are already serialized JSONL.
+    """
+
+    def __init__(self, address: str = DEFAULT_LOG_COLLECTOR, path: str = DEFAULT_LOG_PATH):
+        self.address = address
+        self.path = path
+        self.received = 0
+        self._stop_evt = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_evt.clear()
+        self._thread = threading.Thread(target=self._run, name="LogCollector", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=2.0)
+
+    def stop(self) -> None:
+        self._stop_evt.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        log_hub(self.path).flush(timeout=2.0)
+
+    def _run(self) -> None:
+        sink = log_hub(self.path).system_sink
+        if isinstance(sink, AsyncFileLogSink):
+            sink.exclusive = True
+        sock = zmq.Context.instance().socket(zmq.PULL)
+        sock.setsockopt(zmq.LINGER, 0)
+        sock.bind(self.address)
+        self._ready.set()
+
+        poller = zmq.Poller()
+        poller.register(sock, zmq.POLLIN)
+        try:
+            while not self._stop_evt.is_set():
+                if not poller.poll(100):
+                    continue
+                # Drain what is queued; the hub's sink group-commits it
+                while True:
+                    try:
+                        batch = sock.recv(flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    self.received += 1
+                    sink.emit_line(batch.decode("utf-8").rstrip("\n"))
+        finally:
+            sock.close()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Collect log batches from several processes into one file")
+    parser.add_argument("--address", default=DEFAULT_LOG_COLLECTOR)
+    parser.add_argument("--path", default=DEFAULT_LOG_PATH)
+    args = parser.parse_args(argv)
+
+    # The collector writes the file itself, never ships to a collector
+    os.environ.pop(LOG_COLLECTOR_ENV, None)
+    collector = LogCollector(args.address, args.path)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    collector.start()
+    try:
+        while not stop.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        collector.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 import time
-import uuid
 
 from src.core.logging.log_severity import LogSeverity
+from src.core.messages.message_id import new_id
 from src.core.logging.execution_context import ExecutionContext
 
 
@@ -20,8 +20,8 @@ class LogEntry:
     - threat and error analysis
     """
 
-    log_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    # Unique identifier for this log entry.
+    log_id: str = field(default_factory=new_id)
+    # Unique, time-ordered identifier for this log entry.
     # Used for indexing, correlation, and replay.
 
     timestamp: float = field(default_factory=time.time)
@@ -0,0 +1,149 @@
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import zmq
+
+from src.core.logging.async_file_log_sink import AsyncBatchLogSink, AsyncFileLogSink
+from src.core.logging.log_manager import LogManager
+from src.core.logging.log_rate_limit import EventLogLimit, LogRateLimiter
+from src.core.logging.log_segments import SegmentRotation
+from src.core.logging.log_severity import LogSeverity
+
+
+DEFAULT_LOG_PATH = "logs/system.jsonl"
+
+# Set (by the Supervisor) to a log collector address to ship this process's
+# logs there instead of appending to the log file directly
+LOG_COLLECTOR_ENV = "AGI_LOG_COLLECTOR"
+
+# Initial levels for the hub, e.g. "WARNING,CC=DEBUG,ACK_HUB=INFO": a bare
+# level sets the default, MODULE=LEVEL overrides one module. Levels can be
+# changed later at runtime with LogManager.set_level().
+LOG_LEVELS_ENV = "AGI_LOG_LEVELS"
+
+# Segment rotation of the log file, e.g. "size=64M,age=1h,keep=20" or "off"
+# (see SegmentRotation.parse). Default: DEFAULT_ROTATION.
+LOG_ROTATION_ENV = "AGI_LOG_ROTATION"
+DEFAULT_ROTATION = SegmentRotation()
+
+
+class CollectorLogSink(AsyncBatchLogSink):
+    """
+    Log sink that ships batches of serialized entries to a LogCollector
+    over a ZMQ PUSH socket (ipc:// or tcp://). One message per batch.
+
+    Never blocks: batches the collector cannot take (not running, HWM
+    reached) are dropped and counted. flush() returns once the batch is
+    handed to ZMQ; the collector owns durability.
+    """
+
+    def __init__(self, address: str, **kwargs):
+        self._address = address
+        self._sock: Optional[zmq.Socket] = None
+        super().__init__(f"CollectorLogSink[{address}]", **kwargs)
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    def _write(self, data: str) -> None:
+        if self._sock is None:
+            # Created on the writer thread, its only user
+            self._sock = zmq.Context.instance().socket(zmq.PUSH)
+            self._sock.setsockopt(zmq.SNDHWM, 1000)
+            self._sock.setsockopt(zmq.LINGER, 1000)
+            self._sock.connect(self._address)
+        try:
+            self._sock.send(data.encode("utf-8"), flags=zmq.NOBLOCK)
+        except zmq.Again:
+            self._dropped += data.count("\n")
+
+    def _close_output(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+
+
+class LogHub(LogManager):
+    """
+    Process-wide LogManager: every Logger in the process binds to the hub
+    of its log file, so the file has one handle and one writer thread per
+    process instead of one per component.
+
+    The hub's system sink appends to the file (AsyncFileLogSink) or, with a
+    collector address, ships to the LogCollector process that owns the file
+    (CollectorLogSink). Extra sinks (GUI, console) can still be registered.
+
+    The file is rotated into compressed, indexed segments per `rotation`
+    (read them back with log_segments.tail_lines / read_range).
+
+    High-frequency event types are sampled / rate-limited per
+    DEFAULT_EVENT_LIMITS unless `rate_limits` is given ({} disables);
+    hub.rate_limiter.set_limit() changes them at runtime. Suppressed-count
+    summaries that fall due are emitted from the system sink's writer tick.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_LOG_PATH,
+        *,
+        collector: Optional[str] = None,
+        min_severity: LogSeverity = LogSeverity.INFO,
+        rate_limits: Optional[Dict[str, EventLogLimit]] = None,
+        rotation: Optional[SegmentRotation] = DEFAULT_ROTATION,
+    ):
+        super().__init__(min_severity=min_severity, rate_limiter=LogRateLimiter(rate_limits))
+        self.path = Path(path)
+        self.system_sink: AsyncBatchLogSink = (
+            CollectorLogSink(collector, on_tick=self.emit_due_summaries) if collector
+            else AsyncFileLogSink(str(self.path), rotation=rotation, on_tick=self.emit_due_summaries)
+        )
+        self.register_sink(self.system_sink)
+
+    def configure_levels(self, spec: str) -> None:
+        """
+        Apply a level spec in the LOG_LEVELS_ENV format. Raises ValueError
+        for unknown level names.
+        """
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            module_id, _, name = item.rpartition("=")
+            try:
+                level = LogSeverity[name.strip().upper()]
+            except KeyError:
+                raise ValueError(f"Unknown log level {name!r} in {spec!r}") from None
+            self.set_level(level, module_id.strip() or None)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Durability barrier for everything logged through the hub so far,
+        including pending suppressed-count summaries.
+        """
+        self.emit_summaries()
+        return self.system_sink.flush(timeout)
+
+
+_hubs_lock = threading.Lock()
+_hubs: Dict[Path, LogHub] = {}
+
+
+def log_hub(path: str = DEFAULT_LOG_PATH) -> LogHub:
+    """
+    Process-wide hub for a log file (relative paths resolve against the
+    current directory on first use).
+    """
+    key = Path(path).resolve()
+    hub = _hubs.get(key)
+    if hub is None:
+        with _hubs_lock:
+            hub = _hubs.get(key)
+            if hub is None:
+                rotation = os.environ.get(LOG_ROTATION_ENV)
+                hub = LogHub(
+                    str(key),
+                    collector=os.environ.get(LOG_COLLECTOR_ENV) or None,
+                    rotation=SegmentRotation.parse(rotation) if rotation else DEFAULT_ROTATION,
+                )
+                hub.configure_levels(os.environ.get(LOG_LEVELS_ENV, ""))
+                _hubs[key] = hub
+    return hub
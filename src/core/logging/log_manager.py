@@ -1,6 +1,7 @@
-from typing import  Protocol
+from typing import Any, Callable, Dict, Optional, Protocol, Union
 
 from src.core.logging.log_entry import LogEntry
+from src.core.logging.log_rate_limit import LogRateLimiter
 from src.core.logging.log_severity import LogSeverity
 
 class LogSink(Protocol):
@@ -25,11 +26,25 @@ class LogManager:
 
     LogManager is responsible for accepting log entries
     and distributing them to registered sinks.
+
+    The minimum severity can be overridden per module at runtime
+    (set_level); Loggers pick the change up on their next call. An
+    optional LogRateLimiter samples / rate-limits high-frequency event
+    types and has its suppressed-count summaries emitted here.
     """
 
-    def __init__(self, *, min_severity: LogSeverity = LogSeverity.INFO):
+    def __init__(
+        self,
+        *,
+        min_severity: LogSeverity = LogSeverity.INFO,
+        rate_limiter: Optional[LogRateLimiter] = None,
+    ):
         self._min_severity = min_severity
         self._sinks: list[LogSink] = []
+        self.rate_limiter = rate_limiter
+        self._module_levels: Dict[str, LogSeverity] = {}
+        # Bumped on every level change; Loggers cache their threshold per generation
+        self._generation = 0
 
     def register_sink(self, sink: LogSink) -> None:
         """
@@ -40,6 +55,61 @@ class LogManager:
         """
         self._sinks.append(sink)
 
+    def set_level(self, level: LogSeverity, module_id: Optional[str] = None) -> None:
+        """
+        Set the minimum severity for one module, or the default for all
+        modules without an override when module_id is None.
+        """
+        if module_id is None:
+            self._min_severity = level
+        else:
+            self._module_levels[module_id] = level
+        self._generation += 1
+
+    def clear_level(self, module_id: str) -> None:
+        """
+        Drop a module's override; it falls back to the default level.
+        """
+        if self._module_levels.pop(module_id, None) is not None:
+            self._generation += 1
+
+    def level_for(self, module_id: str) -> LogSeverity:
+        """
+        Effective minimum severity for a module.
+        """
+        return self._module_levels.get(module_id, self._min_severity)
+
+    def admit(self, module_id: str, event_type: str, severity: LogSeverity, context=None) -> bool:
+        """
+        Rate-limiter decision for an entry about to be built (True without
+        a limiter). Emits suppressed-count summaries when they are due.
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            return True
+        admitted = limiter.admit(module_id, event_type, severity, context)
+        if limiter.summary_due:
+            self.emit_summaries()
+        return admitted
+
+    def emit_due_summaries(self) -> None:
+        """
+        Emit suppressed-count summaries if their interval has passed. Meant
+        for a periodic caller (a sink's writer tick), so summaries go out
+        even after the limited events stop.
+        """
+        limiter = self.rate_limiter
+        if limiter is not None and limiter.summaries_due():
+            self.emit_summaries()
+
+    def emit_summaries(self) -> None:
+        """
+        Emit the rate limiter's pending suppressed-count summaries now.
+        """
+        if self.rate_limiter is not None:
+            for summary in self.rate_limiter.drain_summaries():
+                self._emit(summary)
+
     def log(self, entry: LogEntry) -> None:
         """
         Submit a log entry to the logging subsystem.
@@ -48,9 +118,13 @@ class LogManager:
         It must be fast and non-blocking.
         """
 
-        if entry.severity.value < self._min_severity.value:
+        if entry.severity.value < self.level_for(entry.source_module).value:
+            return
+        if not self.admit(entry.source_module, entry.event_type, entry.severity, entry.context):
             return
+        self._emit(entry)
 
+    def _emit(self, entry: LogEntry) -> None:
         for sink in self._sinks:
             try:
                 sink.emit(entry)
@@ -59,19 +133,79 @@ class LogManager:
                 # Failures here are intentionally swallowed.
                 pass
 
+Message = Union[str, Callable[[], str]]
+Payload = Union[Dict[str, Any], Callable[[], Dict[str, Any]], None]
+
 class Logger:
     """
     Convenience façade bound to a specific module.
+
+    One method per severity (trace ... critical). Disabled levels, and
+    entries the manager's rate limiter suppresses, return before anything
+    is built: no LogEntry, id or timestamp. To keep the arguments cheap
+    too, pass the message as a template with `args` (formatted with %
+    only when the entry is logged) or as a callable, and the payload as a
+    callable returning the dict:
+
+        logger.debug(
+            event_type="ENDPOINT_SENT_MESSAGE",
+            message="sent on %s to %r",
+            args=(ch_name, dest),
+            payload=lambda: {"channels": list(channels)},
+        )
+
+    Guard anything more expensive with enabled_for().
     """
 
     def __init__(self, module_id: str, manager: LogManager):
         self._module_id = module_id
         self._manager = manager
+        self._generation = -1
+        self._threshold = 0
+
+    @property
+    def module_id(self) -> str:
+        return self._module_id
 
-    def info(self, *, event_type: str, message: str, context=None, payload=None):
-        self._manager.log(
+    def enabled_for(self, level: LogSeverity) -> bool:
+        """
+        True if an entry at `level` from this module would be logged.
+        """
+        manager = self._manager
+        if self._generation != manager._generation:
+            self._generation = manager._generation
+            self._threshold = manager.level_for(self._module_id).value
+        return level.value >= self._threshold
+
+    def log(
+        self,
+        level: LogSeverity,
+        *,
+        event_type: str,
+        message: Message,
+        args: tuple = (),
+        context=None,
+        payload: Payload = None,
+    ) -> None:
+        if not self.enabled_for(level):
+            return
+        manager = self._manager
+        if manager.rate_limiter is not None and not manager.admit(self._module_id, event_type, level, context):
+            return
+        try:
+            if callable(message):
+                message = message()
+            elif args:
+                message = message % args
+            if callable(payload):
+                payload = payload()
+        except Exception as e:
+            # A broken log call must not break the caller
+            message = f"log formatting failed for {event_type}: {e!r}"
+            payload = None
+        manager._emit(
             LogEntry(
-                severity=LogSeverity.INFO,
+                severity=level,
                 source_module=self._module_id,
                 event_type=event_type,
                 message=message,
@@ -79,3 +213,21 @@ class Logger:
                 payload=payload or {},
             )
         )
+
+    def trace(self, *, event_type: str, message: Message, args: tuple = (), context=None, payload: Payload = None):
+        self.log(LogSeverity.TRACE, event_type=event_type, message=message, args=args, context=context, payload=payload)
+
+    def debug(self, *, event_type: str, message: Message, args: tuple = (), context=None, payload: Payload = None):
+        self.log(LogSeverity.DEBUG, event_type=event_type, message=message, args=args, context=context, payload=payload)
+
+    def info(self, *, event_type: str, message: Message, args: tuple = (), context=None, payload: Payload = None):
+        self.log(LogSeverity.INFO, event_type=event_type, message=message, args=args, context=context, payload=payload)
+
+    def warning(self, *, event_type: str, message: Message, args: tuple = (), context=None, payload: Payload = None):
+        self.log(LogSeverity.WARNING, event_type=event_type, message=message, args=args, context=context, payload=payload)
+
+    def error(self, *, event_type: str, message: Message, args: tuple = (), context=None, payload: Payload = None):
+        self.log(LogSeverity.ERROR, event_type=event_type, message=message, args=args, context=context, payload=payload)
+
+    def critical(self, *, event_type: str, message: Message, args: tuple = (), context=None, payload: Payload = None):
+        self.log(LogSeverity.CRITICAL, event_type=event_type, message=message, args=args, context=context, payload=payload)
@@ -0,0 +1,174 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.core.logging.log_entry import LogEntry
+from src.core.logging.log_severity import LogSeverity
+
+
+@dataclass(frozen=True)
+class EventLogLimit:
+    """
+    Volume limit for one event_type, applied per source module.
+
+    sample_rate keeps every round(1 / sample_rate)-th entry (1.0 keeps
+    all); entries that survive sampling then take a token from a bucket
+    refilled at rate_per_s up to burst (None: no bucket).
+    """
+
+    sample_rate: float = 1.0
+    rate_per_s: Optional[float] = None
+    burst: Optional[int] = None
+
+
+# Central limits for the per-message event types. Everything else is
+# unlimited; ERROR and above and traced entries are never limited.
+DEFAULT_EVENT_LIMITS: Dict[str, EventLogLimit] = {
+    "ENDPOINT_TRANSACTION_CREATED": EventLogLimit(sample_rate=0.1, rate_per_s=20, burst=100),
+    "ENDPOINT_SENT_MESSAGE": EventLogLimit(sample_rate=0.1, rate_per_s=20, burst=100),
+    "ENDPOINT_RECEIVED_ACK": EventLogLimit(sample_rate=0.1, rate_per_s=20, burst=100),
+    "ENDPOINT_CREATED_TRANSACTION": EventLogLimit(sample_rate=0.1, rate_per_s=20, burst=100),
+    "ENDPOINT_SENT_ACK": EventLogLimit(sample_rate=0.1, rate_per_s=20, burst=100),
+    "MODULE_MESSAGE_RECV": EventLogLimit(rate_per_s=50, burst=200),
+}
+
+SUPPRESSED_EVENT_TYPE = "LOG_SUPPRESSED"
+
+
+class _EventState:
+    __slots__ = ("every", "seen", "rate", "burst", "tokens", "refilled", "sampled_out", "rate_limited")
+
+    def __init__(self, limit: EventLogLimit, now: float):
+        self.every = max(1, round(1.0 / limit.sample_rate)) if limit.sample_rate > 0 else 0
+        self.seen = 0
+        self.rate = limit.rate_per_s
+        self.burst = float(limit.burst if limit.burst is not None else max(1.0, limit.rate_per_s or 1.0))
+        self.tokens = self.burst
+        self.refilled = now
+        self.sampled_out = 0
+        self.rate_limited = 0
+
+
+class LogRateLimiter:
+    """
+    Per-(source_module, event_type) sampling and token buckets for a
+    LogManager, so log volume under load is bounded by the configured
+    rates rather than by message throughput.
+
+    Suppressed entries are counted; every summary_interval_s the counts
+    are due as one LOG_SUPPRESSED entry per limited key (drain_summaries),
+    which the LogManager emits on its next call, from its sink's writer
+    tick (see summaries_due) or on flush.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, EventLogLimit]] = None,
+        *,
+        summary_interval_s: float = 10.0,
+    ):
+        self._limits: Dict[str, EventLogLimit] = dict(DEFAULT_EVENT_LIMITS if limits is None else limits)
+        self._summary_interval_s = summary_interval_s
+        self._lock = threading.Lock()
+        self._state: Dict[Tuple[str, str], _EventState] = {}
+        self._window_start = time.monotonic()
+        self._next_summary = self._window_start + summary_interval_s
+        self.summary_due = False
+
+    def summaries_due(self, now: Optional[float] = None) -> bool:
+        """
+        True once the summary interval has passed, also when no limited
+        event type has been logged since (admit() only notices on a call).
+        """
+        return self.summary_due or (time.monotonic() if now is None else now) >= self._next_summary
+
+    def set_limit(self, event_type: str, limit: Optional[EventLogLimit]) -> None:
+        """
+        Change (or with None remove) an event type's limit at runtime.
+        """
+        with self._lock:
+            if limit is None:
+                self._limits.pop(event_type, None)
+            else:
+                self._limits[event_type] = limit
+            for key in [k for k in self._state if k[1] == event_type]:
+                del self._state[key]
+
+    def admit(
+        self,
+        source_module: str,
+        event_type: str,
+        severity: LogSeverity,
+        context=None,
+    ) -> bool:
+        """
+        True if the entry should be logged. Never limits ERROR/CRITICAL
+        entries or entries whose ExecutionContext is traced.
+        """
+        limit = self._limits.get(event_type)
+        if limit is None:
+            return True
+        if severity.value >= LogSeverity.ERROR.value or getattr(context, "traced", False):
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_summary:
+                self.summary_due = True
+
+            key = (source_module, event_type)
+            state = self._state.get(key)
+            if state is None:
+                state = self._state[key] = _EventState(limit, now)
+
+            if state.every != 1:
+                n = state.seen
+                state.seen = n + 1
+                if not state.every or n % state.every:
+                    state.sampled_out += 1
+                    return False
+
+            if state.rate is not None:
+                state.tokens = min(state.burst, state.tokens + (now - state.refilled) * state.rate)
+                state.refilled = now
+                if state.tokens < 1.0:
+                    state.rate_limited += 1
+                    return False
+                state.tokens -= 1.0
+            return True
+
+    def drain_summaries(self) -> List[LogEntry]:
+        """
+        LOG_SUPPRESSED entries for every key that dropped entries since the
+        last drain; resets the counts.
+        """
+        now = time.monotonic()
+        with self._lock:
+            window_s = round(now - self._window_start, 3)
+            self._window_start = now
+            self._next_summary = now + self._summary_interval_s
+            self.summary_due = False
+
+            summaries = []
+            for (source_module, event_type), state in self._state.items():
+                suppressed = state.sampled_out + state.rate_limited
+                if not suppressed:
+                    continue
+                summaries.append(
+                    LogEntry(
+                        severity=LogSeverity.INFO,
+                        source_module=source_module,
+                        event_type=SUPPRESSED_EVENT_TYPE,
+                        message=f"{suppressed} {event_type} entries suppressed in the last {window_s}s",
+                        payload={
+                            "event_type": event_type,
+                            "suppressed": suppressed,
+                            "sampled_out": state.sampled_out,
+                            "rate_limited": state.rate_limited,
+                            "window_s": window_s,
+                        },
+                    )
+                )
+                state.sampled_out = state.rate_limited = 0
+        return summaries
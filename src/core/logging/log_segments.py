@@ -0,0 +1,549 @@
+"""
+Module: log_segments.py
+Location: src/core/logging/
+Version: 0.1.0
+
+Rotating, compressed, indexed JSONL log segments.
+
+With a SegmentRotation, AsyncFileLogSink keeps appending to the active file
+(e.g. logs/system.jsonl) and, once it reaches max_bytes or max_age_s,
+renames it to a closed segment next to it:
+
+    logs/system.20261019-120000-000.jsonl[.gz]    closed segment
+    logs/system.20261019-120000-000.idx.json      its sidecar index
+
+A background SegmentCompressor then rewrites each closed segment as a
+series of gzip members of `index_every` lines (a valid .gz file for any
+gzip reader) and writes the sidecar index: time range, entry count, bloom
+filters of source_module and event_type, and per block its byte offset,
+length and time range. Readers use the index to skip whole segments and
+to seek straight to the blocks they need:
+
+    tail_lines(path, 50)                       last lines, newest segments only
+    read_range(path, start_ts, end_ts, event_type="PLAN_READY")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # non-posix
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # posix
+    msvcrt = None
+
+
+_SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30}
+_AGE_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# A compression temp file untouched this long belongs to a dead process
+_STALE_TMP_S = 300.0
+
+
+@dataclass(frozen=True)
+class SegmentRotation:
+    """
+    When to close the active log file and what to do with closed segments.
+
+    max_bytes / max_age_s: rotate once either is reached (None: never).
+    compress: gzip closed segments (in blocks of index_every lines).
+    max_segments: delete the oldest closed segments beyond this many.
+    settle_s: delay before a closed segment is compressed, so writers in
+    other processes notice the rotation before their last batch lands.
+    """
+
+    max_bytes: Optional[int] = 64 << 20
+    max_age_s: Optional[float] = None
+    compress: bool = True
+    index_every: int = 256
+    max_segments: Optional[int] = None
+    settle_s: float = 1.0
+
+    @classmethod
+    def parse(cls, spec: str) -> Optional["SegmentRotation"]:
+        """
+        Parse "size=64M,age=1h,keep=20,compress=1" (any subset; "off"
+        disables rotation). Raises ValueError for malformed specs.
+        """
+        spec = spec.strip()
+        if spec.lower() in ("off", "0", "none"):
+            return None
+        values: Dict[str, Any] = {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            key, _, value = item.partition("=")
+            key, value = key.strip().lower(), value.strip().lower()
+            match = re.fullmatch(r"(\d+(?:\.\d+)?)([a-z]?)b?", value)
+            if key == "size" and match and match.group(2) in _SIZE_UNITS:
+                values["max_bytes"] = int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+            elif key == "age" and match and match.group(2) in _AGE_UNITS:
+                values["max_age_s"] = float(match.group(1)) * _AGE_UNITS[match.group(2)]
+            elif key == "keep" and value.isdigit():
+                values["max_segments"] = int(value)
+            elif key == "compress" and value in ("0", "1"):
+                values["compress"] = value == "1"
+            else:
+                raise ValueError(f"Invalid log rotation setting {item!r} in {spec!r}")
+        return cls(**values)
+
+
+# ----------------------------
+# Bloom filter
+# ----------------------------
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter over strings (no false negatives).
+    """
+
+    def __init__(self, bits: int = 2048, hashes: int = 4, data: Optional[bytes] = None):
+        self.bits = bits
+        self.hashes = hashes
+        self._data = bytearray(data) if data is not None else bytearray((bits + 7) // 8)
+
+    def _positions(self, value: str) -> Iterator[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=4 * self.hashes).digest()
+        for i in range(self.hashes):
+            yield int.from_bytes(digest[4 * i: 4 * i + 4], "little") % self.bits
+
+    def add(self, value: str) -> None:
+        for pos in self._positions(value):
+            self._data[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._data[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    def to_dict(self) -> dict:
+        return {"bits": self.bits, "hashes": self.hashes, "data": self._data.hex()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BloomFilter":
+        return cls(data["bits"], data["hashes"], bytes.fromhex(data["data"]))
+
+
+# ----------------------------
+# Segment index
+# ----------------------------
+
+@dataclass
+class SegmentIndex:
+    """
+    Sidecar index of one closed segment. blocks are
+    [offset, length, entries, min_ts, max_ts]; offsets are into the
+    segment file as stored (gzip member boundaries when compressed).
+    """
+
+    segment: str
+    compressed: bool
+    entries: int = 0
+    min_ts: Optional[float] = None
+    max_ts: Optional[float] = None
+    blocks: List[list] = field(default_factory=list)
+    source_modules: BloomFilter = field(default_factory=BloomFilter)
+    event_types: BloomFilter = field(default_factory=BloomFilter)
+
+    def overlaps(self, start_ts: Optional[float], end_ts: Optional[float]) -> bool:
+        if self.min_ts is None:
+            return False
+        return (start_ts is None or self.max_ts >= start_ts) and (end_ts is None or self.min_ts <= end_ts)
+
+    def may_contain(self, *, source_module: Optional[str] = None, event_type: Optional[str] = None) -> bool:
+        if source_module is not None and source_module not in self.source_modules:
+            return False
+        return event_type is None or event_type in self.event_types
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "segment": self.segment,
+            "compressed": self.compressed,
+            "entries": self.entries,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "blocks": self.blocks,
+            "source_modules": self.source_modules.to_dict(),
+            "event_types": self.event_types.to_dict(),
+        })
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SegmentIndex"]:
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            return cls(
+                segment=data["segment"],
+                compressed=data["compressed"],
+                entries=data["entries"],
+                min_ts=data["min_ts"],
+                max_ts=data["max_ts"],
+                blocks=data["blocks"],
+                source_modules=BloomFilter.from_dict(data["source_modules"]),
+                event_types=BloomFilter.from_dict(data["event_types"]),
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def _base_name(segment: Path) -> str:
+    name = segment.name
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return name[: -len(".jsonl")] if name.endswith(".jsonl") else name
+
+
+def index_path(segment: Path) -> Path:
+    return segment.with_name(_base_name(segment) + ".idx.json")
+
+
+def _segment_pattern(active: Path) -> "re.Pattern[str]":
+    return re.compile(re.escape(active.stem) + r"\.\d{8}-\d{6}-\d{3}(?:-\d+)?\.jsonl(?:\.gz)?$")
+
+
+def new_segment_path(active: Path, now: Optional[float] = None) -> Path:
+    """Name for the active file once closed (sorts chronologically)."""
+    now = time.time() if now is None else now
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
+    candidate = active.with_name(f"{active.stem}.{stamp}.jsonl")
+    n = 1
+    while candidate.exists() or candidate.with_name(candidate.name + ".gz").exists():
+        candidate = active.with_name(f"{active.stem}.{stamp}-{n}.jsonl")
+        n += 1
+    return candidate
+
+
+def closed_segments(active: Path) -> List[Path]:
+    """
+    Closed segments of an active log file, oldest first. While a segment
+    is being compressed both forms exist; the plain one is listed until
+    the compressed one is indexed.
+    """
+    active = Path(active)
+    pattern = _segment_pattern(active)
+    try:
+        names = [p for p in active.parent.iterdir() if pattern.match(p.name)]
+    except OSError:
+        return []
+
+    by_base: Dict[str, Path] = {}
+    for path in names:
+        base = _base_name(path)
+        current = by_base.get(base)
+        if current is None:
+            by_base[base] = path
+        elif path.suffix == ".gz" and index_path(path).exists():
+            by_base[base] = path
+        elif current.suffix == ".gz" and not index_path(current).exists():
+            by_base[base] = path
+    return [by_base[base] for base in sorted(by_base)]
+
+
+# ----------------------------
+# Building segments (background)
+# ----------------------------
+
+def build_segment(plain: Path, rotation: SegmentRotation) -> Path:
+    """
+    Index a closed plain segment, gzip-compressing it block by block if
+    rotation.compress. Returns the final segment path. Crash-safe: the
+    plain file is only removed once the compressed file and index exist.
+    Raises FileExistsError if the segment is being built elsewhere.
+    """
+    plain = Path(plain)
+    final = plain.with_name(plain.name + ".gz") if rotation.compress else plain
+    index = SegmentIndex(segment=final.name, compressed=rotation.compress)
+
+    out = None
+    if rotation.compress:
+        # Exclusive create: another process's compressor may be on it already
+        tmp = final.with_name(final.name + ".tmp")
+        with contextlib.suppress(OSError):
+            if time.time() - tmp.stat().st_mtime > _STALE_TMP_S:
+                tmp.unlink()  # left behind by a crashed run
+        out = open(tmp, "xb")
+    try:
+        with open(plain, "rb") as f:
+            offset = 0
+            while True:
+                lines = [line for line in (f.readline() for _ in range(rotation.index_every)) if line]
+                if not lines:
+                    break
+                data = b"".join(lines)
+                min_ts = max_ts = None
+                for line in lines:
+                    try:
+                        record = json.loads(line)
+                        ts = float(record["timestamp"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    min_ts = ts if min_ts is None else min(min_ts, ts)
+                    max_ts = ts if max_ts is None else max(max_ts, ts)
+                    index.source_modules.add(str(record.get("source_module", "")))
+                    index.event_types.add(str(record.get("event_type", "")))
+
+                stored = gzip.compress(data, mtime=0) if out is not None else data
+                if out is not None:
+                    out.write(stored)
+                index.blocks.append([offset, len(stored), len(lines), min_ts, max_ts])
+                offset += len(stored)
+                index.entries += len(lines)
+                if min_ts is not None:
+                    index.min_ts = min_ts if index.min_ts is None else min(index.min_ts, min_ts)
+                    index.max_ts = max_ts if index.max_ts is None else max(index.max_ts, max_ts)
+    finally:
+        if out is not None:
+            out.close()
+
+    idx = index_path(final)
+    idx.with_name(idx.name + ".tmp").write_text(index.to_json(), encoding="utf-8")
+    if out is not None:
+        os.replace(out.name, final)
+    os.replace(idx.with_name(idx.name + ".tmp"), idx)
+    if final != plain:
+        plain.unlink()
+    return final
+
+
+def enforce_retention(active: Path, max_segments: Optional[int]) -> None:
+    if max_segments is None:
+        return
+    segments = closed_segments(active)
+    for segment in segments[: max(0, len(segments) - max_segments)]:
+        for path in (segment, index_path(segment)):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+class SegmentCompressor:
+    """
+    Background thread compressing and indexing closed segments of one
+    active log file (see build_segment), then applying retention.
+    Segments left unindexed by an earlier run are picked up on start.
+    """
+
+    def __init__(self, active: Path, rotation: SegmentRotation):
+        self._active = Path(active)
+        self._rotation = rotation
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name=f"SegmentCompressor[{self._active.name}]", daemon=True
+        )
+        for segment in closed_segments(self._active):
+            if not index_path(segment).exists():
+                self._queue.put((segment, 0.0))
+        self._thread.start()
+
+    def submit(self, segment: Path) -> None:
+        self._queue.put((segment, time.monotonic() + self._rotation.settle_s))
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            segment, not_before = item
+            delay = not_before - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                if segment.exists() and not segment.name.endswith(".gz"):
+                    build_segment(segment, self._rotation)
+                enforce_retention(self._active, self._rotation.max_segments)
+            except Exception:
+                # Leave the plain segment in place; it stays readable
+                pass
+
+
+@contextlib.contextmanager
+def rotation_lock(active: Path):
+    """
+    Serialize rotation of one log file between processes (flock on posix,
+    msvcrt.locking on Windows, which raises OSError after ~10 s of waiting).
+    """
+    lock_path = Path(active).with_name(Path(active).name + ".lock")
+    if fcntl is not None:
+        with open(lock_path, "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        with open(lock_path, "a+") as lock:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        yield
+
+
+def first_timestamp(path: Path) -> Optional[float]:
+    """Timestamp of a log file's first entry, if readable."""
+    try:
+        with open(path, "rb") as f:
+            return float(json.loads(f.readline())["timestamp"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+# ----------------------------
+# Reading
+# ----------------------------
+
+def _tail_plain(path: Path, n: int, *, chunk_size: int = 65_536) -> List[str]:
+    """Last n complete lines of a plain file, reading backwards."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return []
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        data = b""
+        pos = end
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    # Drop a partially written last line
+    if not data.endswith(b"\n"):
+        data = data[: data.rfind(b"\n") + 1]
+    lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut
+    return lines[-n:] if n else []
+
+
+def _read_block(f, block: list, compressed: bool) -> List[str]:
+    f.seek(block[0])
+    data = f.read(block[1])
+    if compressed:
+        data = gzip.decompress(data)
+    return data.decode("utf-8", errors="replace").splitlines(keepends=True)
+
+
+def _segment_blocks(segment: Path, index: Optional[SegmentIndex], blocks: Optional[List[list]] = None) -> Iterator[List[str]]:
+    """Lines of a closed segment per block (whole file if unindexed)."""
+    if index is None:
+        opener = gzip.open if segment.name.endswith(".gz") else open
+        with opener(segment, "rt", encoding="utf-8", errors="replace") as f:
+            yield f.readlines()
+        return
+    with open(segment, "rb") as f:
+        for block in index.blocks if blocks is None else blocks:
+            yield _read_block(f, block, index.compressed)
+
+
+def tail_lines(active: str, n: int = 50) -> List[str]:
+    """
+    Last n lines of a log, across the active file and as many of the
+    newest closed segments as needed (each read from its last blocks).
+    """
+    active = Path(active)
+    lines = _tail_plain(active, n)
+    for segment in reversed(closed_segments(active)):
+        if len(lines) >= n:
+            break
+        need = n - len(lines)
+        index = SegmentIndex.load(index_path(segment))
+        if index is None and not segment.name.endswith(".gz"):
+            lines = _tail_plain(segment, need) + lines
+            continue
+
+        older: List[str] = []
+        if index is None:
+            older = next(_segment_blocks(segment, None))[-need:]
+        else:
+            for block in reversed(index.blocks):
+                older = next(_segment_blocks(segment, index, [block])) + older
+                if len(older) >= need:
+                    break
+        lines = older[-need:] + lines
+    return lines
+
+
+def _matching(
+    lines: List[str],
+    start_ts: Optional[float],
+    end_ts: Optional[float],
+    source_module: Optional[str],
+    event_type: Optional[str],
+) -> Iterator[dict]:
+    for line in lines:
+        if event_type is not None and event_type not in line:
+            continue
+        try:
+            record = json.loads(line)
+            ts = float(record["timestamp"])
+        except (ValueError, KeyError, TypeError):
+            continue
+        if (start_ts is not None and ts < start_ts) or (end_ts is not None and ts > end_ts):
+            continue
+        if source_module is not None and record.get("source_module") != source_module:
+            continue
+        if event_type is not None and record.get("event_type") != event_type:
+            continue
+        yield record
+
+
+def read_range(
+    active: str,
+    start_ts: Optional[float] = None,
+    end_ts: Optional[float] = None,
+    *,
+    source_module: Optional[str] = None,
+    event_type: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    Log records with start_ts <= timestamp <= end_ts (and the given
+    source_module / event_type), oldest segment first. Indexed segments
+    outside the range or whose blooms exclude the filters are skipped
+    unopened; of the others only overlapping blocks are read.
+    """
+    active = Path(active)
+    for segment in closed_segments(active):
+        index = SegmentIndex.load(index_path(segment))
+        blocks = None
+        if index is not None:
+            if not index.overlaps(start_ts, end_ts):
+                continue
+            if not index.may_contain(source_module=source_module, event_type=event_type):
+                continue
+            blocks = [
+                b for b in index.blocks
+                if b[3] is not None
+                and (start_ts is None or b[4] >= start_ts)
+                and (end_ts is None or b[3] <= end_ts)
+            ]
+        for lines in _segment_blocks(segment, index, blocks):
+            yield from _matching(lines, start_ts, end_ts, source_module, event_type)
+
+    try:
+        with open(active, "r", encoding="utf-8", errors="replace") as f:
+            while True:
+                lines = f.readlines(1 << 20)
+                if not lines:
+                    break
+                yield from _matching(lines, start_ts, end_ts, source_module, event_type)
+    except OSError:
+        return
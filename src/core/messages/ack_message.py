@@ -7,11 +7,12 @@ Defines the standard ack message structure used throughout the AGI system's Cogn
 This module should be treated as canonical and never duplicated or modified outside of version-controlled updates.
 """
 
-import uuid
 import time
 import json
 from dataclasses import dataclass, asdict
 
+from src.core.messages.message_id import new_id
+
 
 
 @dataclass
@@ -39,7 +40,7 @@ class AckMessage:
 
     ) -> "AckMessage":
         return AckMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=new_id(),
             msg_type = msg_type,
             ack_type = ack_type,
             status = status,
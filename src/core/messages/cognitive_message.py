@@ -7,11 +7,11 @@ Defines the standard message structure used throughout the AGI system's Cognitiv
 This module should be treated as canonical and never duplicated or modified outside of version-controlled updates.
 """
 
-import uuid
 import time
 import json
 from dataclasses import dataclass, asdict
 from src.core.messages.ack_message import AckMessage
+from src.core.messages.message_id import new_id
 
 
 
@@ -30,6 +30,12 @@ class CognitiveMessage:
     timestamp: float             # Epoch seconds
     ttl: float                   # Time-to-live (seconds)
     signature: str | None        # Optional integrity/auth
+    delivery: str | None = None  # DeliveryPolicy override (None = channel default)
+
+    # Transport-side attachments (not dataclass fields, never serialized)
+    tensors = None               # dict[str, ndarray] rebuilt from binary frames
+    trace = None                 # HopTrace when the message was sampled for hop tracing
+    stream = None                # ChunkStream for messages sent with send_stream()
 
 
     
@@ -45,9 +51,10 @@ class CognitiveMessage:
        payload: dict,
        priority: int = 50,
        ttl: float = 10.0,
-       signature: str = ""
+       signature: str = "",
+       delivery: str | None = None,
     ) -> "CognitiveMessage":
-        message_id = str(uuid.uuid4())
+        message_id = new_id()
         correlation_id = message_id if correlation_id is None else correlation_id
         return CognitiveMessage(
             message_id=message_id,
@@ -62,13 +69,14 @@ class CognitiveMessage:
             priority=priority,
             timestamp=time.time(),
             ttl=ttl,
-            signature=signature
+            signature=signature,
+            delivery=delivery,
         )
     
     @staticmethod
     def system_ack(payload: dict) -> "AckMessage":
         return AckMessage(
-           message_id=str(uuid.uuid4()),
+           message_id=new_id(),
            source="CMB_ROUTER",
            targets=[],
            payload=payload,
@@ -117,6 +125,7 @@ class CognitiveMessage:
                 ttl=data.get("ttl", 0),
                 timestamp=data.get("timestamp"),
                 signature=data.get("signature"),
+                delivery=data.get("delivery"),
             )
         except KeyError as e:
             raise ValueError(f"Missing required CognitiveMessage field: {e}")
@@ -0,0 +1,210 @@
+"""
+Module: message_id.py
+Location: src/core/messages/
+Version: 0.1.0
+
+Time-ordered compact identifiers for messages, ACKs and log entries.
+
+The default generator packs a 64-bit id as:
+
+    | 42 bits: ms since ID_EPOCH_MS | 10 bits: node | 12 bits: sequence |
+
+- ids from one generator are strictly increasing (the clock is never allowed
+  to run backwards and a full sequence borrows the next millisecond)
+- the node field keeps processes apart; it comes from AGI_NODE_ID (the
+  Supervisor assigns a distinct value to every process it spawns) and falls
+  back to a host + pid hash, which can collide once more than a handful of
+  processes share a deployment. Federated deployments (routers linked
+  across hosts) therefore require AGI_NODE_ID: federated routers and
+  Supervisors of federated topologies refuse to start without it
+  (require_node_id)
+- the string form is 16 lowercase hex digits, so string order == numeric
+  order == creation order; that is what goes into JSON payloads and logs
+- id_to_bytes / id_from_bytes give the 8-byte big-endian form for binary
+  frames
+
+The generator is pluggable (set_id_generator) so tests or deployments that
+need globally random ids can install UuidIdGenerator.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+import uuid
+import zlib
+from typing import Optional, Protocol
+
+
+ID_EPOCH_MS = 1_704_067_200_000      # 2024-01-01T00:00:00Z
+
+NODE_BITS = 10
+SEQUENCE_BITS = 12
+MAX_NODE = (1 << NODE_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+TIMESTAMP_SHIFT = NODE_BITS + SEQUENCE_BITS
+
+NODE_ID_ENV = "AGI_NODE_ID"
+
+
+class IdGenerator(Protocol):
+    def next_id(self) -> str: ...
+
+
+# ----------------------------
+# Generators
+# ----------------------------
+
+def configured_node_id() -> Optional[int]:
+    """Node field from AGI_NODE_ID (None when unset)."""
+    configured = os.environ.get(NODE_ID_ENV)
+    if not configured:
+        return None
+    node_id = int(configured)
+    if not 0 <= node_id <= MAX_NODE:
+        raise ValueError(f"{NODE_ID_ENV} must be in 0..{MAX_NODE}, got {node_id}")
+    return node_id
+
+
+def fallback_node_id(host: str, pid: int) -> int:
+    """Host + pid hash used without AGI_NODE_ID (not unique across hosts)."""
+    return zlib.crc32(f"{host}:{pid}".encode("utf-8")) & MAX_NODE
+
+
+def default_node_id() -> int:
+    """Node field from AGI_NODE_ID, else derived from host name and pid."""
+    node_id = configured_node_id()
+    if node_id is not None:
+        return node_id
+    return fallback_node_id(socket.gethostname(), os.getpid())
+
+
+def require_node_id(reason: str) -> int:
+    """
+    Node field from AGI_NODE_ID; raises ValueError when unset, for setups
+    where the host + pid fallback would collide (e.g. federation).
+    """
+    node_id = configured_node_id()
+    if node_id is None:
+        raise ValueError(
+            f"{NODE_ID_ENV} must be set {reason}; the host/pid fallback is not unique across hosts"
+        )
+    return node_id
+
+
+class MonotonicIdGenerator:
+    """64-bit time-ordered ids (timestamp | node | sequence). Thread-safe."""
+
+    def __init__(self, node_id: Optional[int] = None, *, clock_ms=None):
+        node_id = default_node_id() if node_id is None else node_id
+        if not 0 <= node_id <= MAX_NODE:
+            raise ValueError(f"node_id must be in 0..{MAX_NODE}")
+        self.node_id = node_id
+        self._clock_ms = clock_ms or (lambda: time.time_ns() // 1_000_000)
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+
+    def next_int(self) -> int:
+        with self._lock:
+            now_ms = self._clock_ms() - ID_EPOCH_MS
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                # Same millisecond or clock stepped back: stay on _last_ms
+                self._sequence += 1
+                if self._sequence > MAX_SEQUENCE:
+                    self._last_ms += 1
+                    self._sequence = 0
+            return (self._last_ms << TIMESTAMP_SHIFT) | (self.node_id << SEQUENCE_BITS) | self._sequence
+
+    def next_id(self) -> str:
+        return format_id(self.next_int())
+
+
+class UuidIdGenerator:
+    """Random uuid4 strings (previous behaviour; no ordering)."""
+
+    def next_id(self) -> str:
+        return str(uuid.uuid4())
+
+
+# ----------------------------
+# Encoding
+# ----------------------------
+
+def format_id(value: int) -> str:
+    return f"{value:016x}"
+
+
+def parse_id(text: str) -> int:
+    if len(text) != 16:
+        raise ValueError(f"Not a compact id: {text!r}")
+    return int(text, 16)
+
+
+def id_to_bytes(text: str) -> bytes:
+    return parse_id(text).to_bytes(8, "big")
+
+
+def id_from_bytes(data: bytes) -> str:
+    if len(data) != 8:
+        raise ValueError(f"Compact id must be 8 bytes, got {len(data)}")
+    return format_id(int.from_bytes(data, "big"))
+
+
+def id_timestamp(text: str) -> float:
+    """Creation time (epoch seconds, ms resolution) encoded in a compact id."""
+    return ((parse_id(text) >> TIMESTAMP_SHIFT) + ID_EPOCH_MS) / 1000.0
+
+
+def id_lower_bound(epoch_s: float) -> str:
+    """Smallest id created at or after epoch_s (for range queries on id order)."""
+    ms = max(0, int(epoch_s * 1000) - ID_EPOCH_MS)
+    return format_id(ms << TIMESTAMP_SHIFT)
+
+
+# ----------------------------
+# Process-wide generator
+# ----------------------------
+
+_generator: Optional[IdGenerator] = None
+_generator_lock = threading.Lock()
+
+
+def set_id_generator(generator: Optional[IdGenerator]) -> None:
+    """Install the process-wide generator (None restores the default)."""
+    global _generator
+    with _generator_lock:
+        _generator = generator
+
+
+def id_generator() -> IdGenerator:
+    global _generator
+    gen = _generator
+    if gen is None:
+        with _generator_lock:
+            if _generator is None:
+                _generator = MonotonicIdGenerator()
+            gen = _generator
+    return gen
+
+
+def new_id() -> str:
+    return id_generator().next_id()
+
+
+def _reset_after_fork() -> None:
+    # A forked child must not share the parent's node id / sequence. The lock
+    # may have been held by another parent thread, so it is replaced too.
+    global _generator, _generator_lock
+    _generator_lock = threading.Lock()
+    if isinstance(_generator, MonotonicIdGenerator):
+        _generator = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
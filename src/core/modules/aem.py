@@ -11,6 +11,7 @@ Phase 1 Cognitive Executive (AEM)
 
 from __future__ import annotations
 
+import threading
 import uuid
 import time
 from typing import Dict, Any
@@ -20,16 +21,10 @@ from src.core.cmb.module_endpoint import ModuleEndpoint
 from src.core.messages.cognitive_message import CognitiveMessage
 from src.core.messages.message_module import MessageType
 
-from src.core.intent.intent_extractor import IntentExtractor
 from src.core.intent.router import DirectiveRouter
-from src.core.intent.llm_adapter_mock import MockLLMAdapter  # Phase 1 baseline
 
-from src.core.logging.log_manager import LogManager, Logger
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
-
-from src.core.intent.llm_adapter_openai_intent import OpenAIIntentAdapter
-from src.core.policy.model_selection.policy import ModelSelectionPolicy
+from src.core.logging.log_manager import Logger
+from src.core.logging.log_hub import log_hub
 
 
 MODULE_ID = "AEM"  # keep stable for launcher + GUI compatibility
@@ -51,8 +46,7 @@ class AEM:
         # -----------------------------
         # Logging (single canonical system)
         # -----------------------------
-        log_manager = LogManager(min_severity=LogSeverity.INFO)
-        log_manager.register_sink(FileLogSink("logs/system.jsonl"))
+        log_manager = log_hub()
         self.logger = Logger("AEM", log_manager)
 
         self.logger.info(
@@ -63,17 +57,9 @@ class AEM:
         # -----------------------------
         # Intent infrastructure (Phase 1)
         # -----------------------------
-        policy = ModelSelectionPolicy(
-            max_tokens_per_cycle=20_000,
-            max_cost_per_cycle=0.05,
-        )
-
-        adapter = OpenAIIntentAdapter(policy)
-
-        self.intent_extractor = IntentExtractor(
-            llm_adapter=adapter,
-            min_confidence=0.60,
-        )
+        # The LLM-backed extractor is built on first use (see intent_extractor)
+        self._intent_extractor = None
+        self._intent_extractor_lock = threading.Lock()
 
         self.intent_router = DirectiveRouter()
 
@@ -102,6 +88,32 @@ class AEM:
             message="AEM endpoint started",
         )
 
+    @property
+    def intent_extractor(self):
+        """
+        LLM-backed intent extractor, imported and constructed on first use
+        so AEM reaches AEM_READY without loading the OpenAI SDK.
+        """
+        extractor = self._intent_extractor
+        if extractor is not None:
+            return extractor
+
+        with self._intent_extractor_lock:
+            if self._intent_extractor is None:
+                from src.core.intent.intent_extractor import IntentExtractor
+                from src.core.intent.llm_adapter_openai_intent import OpenAIIntentAdapter
+                from src.core.policy.model_selection.policy import ModelSelectionPolicy
+
+                policy = ModelSelectionPolicy(
+                    max_tokens_per_cycle=20_000,
+                    max_cost_per_cycle=0.05,
+                )
+                self._intent_extractor = IntentExtractor(
+                    llm_adapter=OpenAIIntentAdapter(policy),
+                    min_confidence=0.60,
+                )
+            return self._intent_extractor
+
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
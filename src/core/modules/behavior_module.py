@@ -11,9 +11,8 @@ import time
 
 from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
 from src.core.cmb.module_endpoint import ModuleEndpoint
-from src.core.logging.log_manager import LogManager, Logger
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
+from src.core.logging.log_manager import Logger
+from src.core.logging.log_hub import log_hub
 from src.core.modules.common_module_loop import CommonModuleLoop
 
 
@@ -24,8 +23,7 @@ def main():
     # -----------------------------
     # Logging setup
     # -----------------------------
-    log_manager = LogManager(min_severity=LogSeverity.INFO)
-    log_manager.register_sink(FileLogSink("logs/system.jsonl"))
+    log_manager = log_hub()
     logger = Logger(MODULE_ID, log_manager)
 
     logger.info(
@@ -46,6 +44,7 @@ def main():
         channel_names=channels,
         host="localhost",
         poll_timeout_ms=50,
+        subscribe=["CC"],  # Inbound traffic arrives on CC; other channels connect on first send
     )
 
     endpoint = ModuleEndpoint(
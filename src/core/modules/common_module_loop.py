@@ -1,9 +1,24 @@
 import time
 import threading
-from typing import Optional, Callable
+import weakref
+from typing import Optional, Callable, Dict
 
 from src.core.cmb.module_endpoint import ModuleEndpoint
+from src.core.cmb.hop_trace import Hop, hop_latency_stats
+from src.core.monitoring.metrics import MetricsHttpServer, MetricsPublisher, metrics_registry
+from src.core.modules.message_dispatcher import ConcurrentDispatcher
+from src.core.logging.execution_context import ExecutionContext
 from src.core.logging.log_manager import Logger
+from src.core.utils.component_env import getenv
+
+
+# Defaults for options a module's main() does not set, so the Supervisor
+# topology can enable them per component through "env". Replicas serve
+# /metrics on consecutive ports from AGI_METRICS_PORT (+AGI_REPLICA_INDEX).
+METRICS_PORT_ENV = "AGI_METRICS_PORT"
+METRICS_PUBLISH_INTERVAL_ENV = "AGI_METRICS_PUBLISH_INTERVAL"
+CONCURRENT_ENV = "AGI_LOOP_CONCURRENT"          # "1" / "true" = dispatcher mode
+MAX_WORKERS_ENV = "AGI_LOOP_MAX_WORKERS"
 
 
 class CommonModuleLoop:
@@ -11,8 +26,23 @@ class CommonModuleLoop:
     Generic execution loop for all CMB-connected modules.
 
     This loop mediates between ModuleEndPoint and module-specific logic.
+
+    By default each iteration handles one message inline. With
+    concurrent=True (default from AGI_LOOP_CONCURRENT), messages are drained in batches and run on a bounded
+    worker pool; order is preserved per context_tag / correlation_id and
+    handler_limits caps concurrency per msg_type.
     """
 
+    # Running loops by thread ident, so a supervisor running modules as
+    # threads (all-in-one mode) can drain them.
+    _running: "weakref.WeakValueDictionary[int, CommonModuleLoop]" = weakref.WeakValueDictionary()
+
+    @classmethod
+    def for_thread(cls, ident: Optional[int]) -> Optional["CommonModuleLoop"]:
+        if ident is None:
+            return None
+        return cls._running.get(ident)
+
     def __init__(
         self,
         *,
@@ -24,6 +54,13 @@ class CommonModuleLoop:
         on_tick: Optional[Callable] = None,
         on_shutdown: Optional[Callable] = None,
         poll_interval: float = 0.1,
+        metrics_port: Optional[int] = None,
+        metrics_publish_interval: Optional[float] = None,
+        concurrent: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        batch_size: int = 32,
+        max_pending: int = 256,
+        handler_limits: Optional[Dict[str, int]] = None,
     ):
         self.module_id = module_id
         self.endpoint = endpoint
@@ -37,12 +74,48 @@ class CommonModuleLoop:
         self.poll_interval = poll_interval
         self._stop_evt = threading.Event()
 
+        if metrics_port is None and getenv(METRICS_PORT_ENV):
+            metrics_port = int(getenv(METRICS_PORT_ENV)) + int(getenv("AGI_REPLICA_INDEX") or 0)
+        if metrics_publish_interval is None and getenv(METRICS_PUBLISH_INTERVAL_ENV):
+            metrics_publish_interval = float(getenv(METRICS_PUBLISH_INTERVAL_ENV))
+        if concurrent is None:
+            concurrent = (getenv(CONCURRENT_ENV) or "").strip().lower() in ("1", "true", "yes", "on")
+        if max_workers is None:
+            max_workers = int(getenv(MAX_WORKERS_ENV) or 4)
+
+        # Metrics: optional local /metrics endpoint and periodic DAC publication
+        self._metrics_http = (
+            MetricsHttpServer(port=metrics_port) if metrics_port is not None else None
+        )
+        self._metrics_publisher = (
+            MetricsPublisher(endpoint, module_id=module_id, interval_s=metrics_publish_interval)
+            if metrics_publish_interval
+            else None
+        )
+        self._handler_hist: dict = {}
+
+        # Dispatcher mode: batched drain + bounded worker pool, ordered per
+        # context_tag / correlation_id. Inline (one message per iteration) otherwise.
+        self.batch_size = batch_size
+        self._dispatcher = (
+            ConcurrentDispatcher(
+                module_id=module_id,
+                handle=self._handle_message,
+                max_workers=max_workers,
+                max_pending=max_pending,
+                handler_limits=handler_limits,
+            )
+            if concurrent
+            else None
+        )
+
     def start(self):
         self.logger.info(
             event_type="MODULE_LOOP_START",
             message="Module loop starting",
             payload={"module_id": self.module_id},
         )
+        CommonModuleLoop._running[threading.get_ident()] = self
 
         if self.on_start:
             try:
@@ -53,6 +126,17 @@ class CommonModuleLoop:
                     message=str(e),
                 )
 
+        try:
+            if self._metrics_http:
+                self._metrics_http.start()
+            if self._metrics_publisher:
+                self._metrics_publisher.start()
+        except Exception as e:
+            self.logger.info(
+                event_type="MODULE_METRICS_START_ERROR",
+                message=str(e),
+            )
+
         self.run()
 
     def stop(self):
@@ -65,31 +149,13 @@ class CommonModuleLoop:
     def run(self):
         try:
             while not self._stop_evt.is_set():
-                # Receive message (non-blocking or short timeout)
-                msg = self.endpoint.recv(timeout=self.poll_interval)
-
-                if msg is not None:
-                    self.logger.info(
-                        event_type="MODULE_MESSAGE_RECV",
-                        message="Message received",
-                        payload={
-                            "msg_type": msg.msg_type,
-                            "source": msg.source,
-                            "message_id": msg.message_id,
-                        },
-                    )
-
-                    try:
-                        self.on_message(msg)
-                    except Exception as e:
-                        self.logger.info(
-                            event_type="MODULE_MESSAGE_HANDLER_ERROR",
-                            message="Exception in module message handler",
-                            payload={
-                                "exception_type": type(e).__name__,
-                                "exception": str(e),
-                            },
-                        )   
+                if self._dispatcher is None:
+                    # Inline mode: receive one message (short timeout) and handle it
+                    msg = self.endpoint.recv(timeout=self.poll_interval)
+                    if msg is not None:
+                        self._handle_message(msg)
+                else:
+                    self._dispatch_batch()
 
                 # Optional periodic work
                 if self.on_tick:
@@ -102,6 +168,11 @@ class CommonModuleLoop:
                         )
 
         finally:
+            if self._metrics_publisher:
+                self._metrics_publisher.stop()
+            if self._metrics_http:
+                self._metrics_http.stop()
+
             if self.on_shutdown:
                 try:
                     self.on_shutdown()
@@ -111,9 +182,91 @@ class CommonModuleLoop:
                         message=str(e),
                     )
 
+            if self._dispatcher is not None:
+                self._dispatcher.shutdown()
+
             self.endpoint.stop()
 
             self.logger.info(
                 event_type="MODULE_LOOP_EXIT",
                 message="Module loop exited",
             )
+
+    def _dispatch_batch(self) -> None:
+        """
+        Concurrent mode: drain up to batch_size messages (bounded by free
+        dispatcher capacity) and hand them to the worker pool.
+        """
+        capacity = self._dispatcher.capacity()
+        if capacity == 0:
+            # Pool saturated; leave messages in the endpoint queue
+            time.sleep(self.poll_interval / 10)
+            return
+
+        batch = self.endpoint.drain_incoming(max_items=min(self.batch_size, capacity))
+        if not batch:
+            msg = self.endpoint.recv(timeout=self.poll_interval)
+            if msg is None:
+                return
+            batch = [msg]
+
+        for msg in batch:
+            self._dispatcher.submit(msg)
+
+    def _handle_message(self, msg) -> None:
+        """Log, time and run on_message for one message (any thread)."""
+        # Sampled messages carry a hop trace; close it around the handler.
+        # Their log entries are traced, so they bypass log rate limits.
+        trace = getattr(msg, "trace", None)
+        self.logger.info(
+            event_type="MODULE_MESSAGE_RECV",
+            message="Message received",
+            context=self._traced_context(msg) if trace is not None else None,
+            payload=lambda: {
+                "msg_type": msg.msg_type,
+                "source": msg.source,
+                "message_id": msg.message_id,
+            },
+        )
+
+        if trace is not None:
+            trace.stamp(Hop.HANDLER_START)
+        started = time.perf_counter_ns()
+
+        try:
+            self.on_message(msg)
+        except Exception as e:
+            self.logger.error(
+                event_type="MODULE_MESSAGE_HANDLER_ERROR",
+                message="Exception in module message handler",
+                payload={
+                    "exception_type": type(e).__name__,
+                    "exception": str(e),
+                },
+            )
+        finally:
+            self._handler_histogram(msg.msg_type).observe(
+                time.perf_counter_ns() - started
+            )
+            if trace is not None:
+                trace.stamp(Hop.HANDLER_END)
+                hop_latency_stats().record(trace)
+
+    @staticmethod
+    def _traced_context(msg) -> ExecutionContext:
+        return ExecutionContext(
+            work_id=msg.correlation_id or msg.message_id,
+            event_id=msg.message_id,
+            traced=True,
+        )
+
+    def _handler_histogram(self, msg_type: str):
+        hist = self._handler_hist.get(msg_type)
+        if hist is None:
+            hist = self._handler_hist[msg_type] = metrics_registry().histogram(
+                "module_handler_duration_seconds",
+                "on_message handler wall time",
+                module=self.module_id,
+                msg_type=msg_type,
+            )
+        return hist
@@ -17,9 +17,8 @@ from typing import Any, Dict, List
 from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
 from src.core.cmb.module_endpoint import ModuleEndpoint
 
-from src.core.logging.log_manager import LogManager, Logger
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
+from src.core.logging.log_manager import Logger
+from src.core.logging.log_hub import log_hub
 
 from src.core.modules.common_module_loop import CommonModuleLoop
 from src.core.messages.cognitive_message import CognitiveMessage
@@ -110,8 +109,7 @@ def main():
     # -----------------------------
     # Logging
     # -----------------------------
-    log_manager = LogManager(min_severity=LogSeverity.INFO)
-    log_manager.register_sink(FileLogSink("logs/system.jsonl"))
+    log_manager = log_hub()
     logger = Logger(MODULE_ID, log_manager)
 
     logger.info(event_type="EXEC_INIT", message="Executive module initializing")
@@ -126,6 +124,7 @@ def main():
         channel_names=channels,
         host="localhost",
         poll_timeout_ms=50,
+        subscribe=["CC"],  # Inbound traffic arrives on CC; other channels connect on first send
     )
 
     endpoint = ModuleEndpoint(
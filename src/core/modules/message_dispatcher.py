@@ -0,0 +1,191 @@
+"""
+Module: message_dispatcher.py
+Location: src/core/modules/
+
+Concurrent, order-preserving message dispatch for CommonModuleLoop.
+
+Messages are grouped into lanes by ordering key (context_tag, else
+correlation_id). Each lane runs strictly in arrival order on a bounded
+worker pool, so messages of one episode never overtake each other while
+unrelated episodes proceed concurrently. A slow LLM-bound handler therefore
+stalls only its own lane.
+
+Per-msg_type concurrency limits cap how many handlers of one kind run at
+once (e.g. at most 2 concurrent INTENT extractions). A lane waiting on a
+limit is parked without holding a worker, so it cannot starve other lanes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+from src.core.monitoring.metrics import metrics_registry
+
+
+def default_ordering_key(msg: Any) -> str:
+    """Order by episode context when present, otherwise by request chain."""
+    return msg.context_tag or msg.correlation_id or msg.message_id
+
+
+class ConcurrentDispatcher:
+    """
+    Bounded worker pool with per-key FIFO lanes.
+
+    submit() never blocks; callers check capacity() first and leave excess
+    messages in the endpoint queue (natural backpressure).
+    """
+
+    def __init__(
+        self,
+        *,
+        module_id: str,
+        handle: Callable[[Any], None],
+        max_workers: int = 4,
+        max_pending: int = 256,
+        handler_limits: Optional[Dict[str, int]] = None,
+        key_fn: Callable[[Any], str] = default_ordering_key,
+    ):
+        self.module_id = module_id
+        self._handle = handle
+        self._key_fn = key_fn
+        self.max_pending = max_pending
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"Dispatch[{module_id}]",
+        )
+
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._lanes: Dict[str, Deque[tuple[Any, int]]] = {}
+        self._pending = 0
+
+        # Per-msg_type limits are enforced before a lane is handed to the
+        # pool: a lane whose next message is at its limit is parked (holding
+        # no worker) and rescheduled when a handler of that type finishes.
+        self._limits: Dict[str, int] = dict(handler_limits or {})
+        self._running: Dict[str, int] = {}
+        self._parked: Dict[str, Deque[str]] = {}
+
+        self._queue_hist: Dict[str, Any] = {}
+
+    # -------------------------------------------------
+    # Submission
+    # -------------------------------------------------
+    def capacity(self) -> int:
+        with self._lock:
+            return max(0, self.max_pending - self._pending)
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def submit(self, msg: Any) -> None:
+        key = self._key_fn(msg)
+        item = (msg, time.perf_counter_ns())
+
+        with self._lock:
+            self._pending += 1
+            lane = self._lanes.get(key)
+            if lane is not None:
+                # Lane already running; it will pick this up in order
+                lane.append(item)
+                return
+            self._lanes[key] = deque([item])
+            if not self._admit_head(key):
+                return
+
+        self._pool.submit(self._run_lane, key)
+
+    # -------------------------------------------------
+    # Workers
+    # -------------------------------------------------
+    def _admit_head(self, key: str) -> bool:
+        """
+        Reserve a handler slot for the lane's next message (lock held).
+
+        Returns False and parks the lane if its msg_type is at its limit.
+        """
+        msg_type = self._lanes[key][0][0].msg_type
+        limit = self._limits.get(msg_type)
+        if limit is None:
+            return True
+        if self._running.get(msg_type, 0) >= limit:
+            self._parked.setdefault(msg_type, deque()).append(key)
+            return False
+        self._running[msg_type] = self._running.get(msg_type, 0) + 1
+        return True
+
+    def _release(self, msg_type: str) -> Optional[str]:
+        """
+        Free a handler slot (lock held) and hand it straight to a parked
+        lane, if any. Returns the key of the lane to reschedule.
+        """
+        if msg_type not in self._limits:
+            return None
+        parked = self._parked.get(msg_type)
+        if parked:
+            # Slot passes to the parked lane; the running count is unchanged
+            return parked.popleft()
+        self._running[msg_type] -= 1
+        return None
+
+    def _run_lane(self, key: str) -> None:
+        while True:
+            with self._lock:
+                lane = self._lanes[key]
+                msg, enqueued_ns = lane[0]
+
+            # Measured after the handler slot was reserved, so time spent
+            # parked at a msg_type limit counts as queue time
+            self._queue_histogram(msg.msg_type).observe(time.perf_counter_ns() - enqueued_ns)
+
+            try:
+                self._handle(msg)
+            except Exception:
+                # handle() logs its own failures; a lane must never stall
+                pass
+
+            with self._lock:
+                resume = self._release(msg.msg_type)
+                lane.popleft()
+                self._pending -= 1
+                if not lane:
+                    del self._lanes[key]
+                    if self._pending == 0:
+                        self._idle.notify_all()
+                    proceed = False
+                else:
+                    proceed = self._admit_head(key)
+
+            if resume is not None:
+                self._pool.submit(self._run_lane, resume)
+            if not proceed:
+                return
+
+    def _queue_histogram(self, msg_type: str):
+        hist = self._queue_hist.get(msg_type)
+        if hist is None:
+            hist = self._queue_hist[msg_type] = metrics_registry().histogram(
+                "module_queue_time_seconds",
+                "Time from dispatch to handler start",
+                module=self.module_id,
+                msg_type=msg_type,
+            )
+        return hist
+
+    # -------------------------------------------------
+    # Shutdown
+    # -------------------------------------------------
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all submitted messages are handled."""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def shutdown(self, *, timeout: Optional[float] = 5.0) -> None:
+        self.drain(timeout=timeout)
+        self._pool.shutdown(wait=False, cancel_futures=True)
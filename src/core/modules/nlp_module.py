@@ -7,17 +7,13 @@ and forwards structured directives to the Planner.
 
 from __future__ import annotations
 
+import threading
 import time
 
-from src.core.intent.intent_extractor import IntentExtractor
-from src.core.intent.llm_adapter_openai_intent import OpenAIIntentAdapter
-from src.core.policy.model_selection.policy import ModelSelectionPolicy
-
 from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
 from src.core.cmb.module_endpoint import ModuleEndpoint
-from src.core.logging.log_manager import LogManager, Logger
-from src.core.logging.log_severity import LogSeverity
-from src.core.logging.file_log_sink import FileLogSink
+from src.core.logging.log_manager import Logger
+from src.core.logging.log_hub import log_hub
 from src.core.modules.common_module_loop import CommonModuleLoop
 from src.core.messages.cognitive_message import CognitiveMessage
 
@@ -25,12 +21,27 @@ from src.core.messages.cognitive_message import CognitiveMessage
 MODULE_ID = "NLP"
 
 
+def _build_intent_extractor():
+    """
+    Build the LLM-backed intent extractor.
+
+    Imported and constructed on the first directive rather than at module
+    load, so the module reaches NLP_START without paying for the OpenAI SDK.
+    """
+    from src.core.intent.intent_extractor import IntentExtractor
+    from src.core.intent.llm_adapter_openai_intent import OpenAIIntentAdapter
+    from src.core.policy.model_selection.policy import ModelSelectionPolicy
+
+    policy = ModelSelectionPolicy(20_000, 0.05)
+    adapter = OpenAIIntentAdapter(policy)
+    return IntentExtractor(adapter, min_confidence=0.60)
+
+
 def main():
     # -----------------------------
     # Logging setup
     # -----------------------------
-    log_manager = LogManager(min_severity=LogSeverity.INFO)
-    log_manager.register_sink(FileLogSink("logs/system.jsonl"))
+    log_manager = log_hub()
     logger = Logger(MODULE_ID, log_manager)
 
     logger.info(
@@ -51,6 +62,7 @@ def main():
         channel_names=channels,
         host="localhost",
         poll_timeout_ms=50,
+        subscribe=["CC"],  # Inbound traffic arrives on CC; other channels connect on first send
     )
 
     endpoint = ModuleEndpoint(
@@ -63,6 +75,9 @@ def main():
     # -----------------------------
     # Message handler
     # -----------------------------
+    state: dict = {}  # Lazily built intent extractor, reused across directives
+    state_lock = threading.Lock()  # Concurrent handlers must build it only once
+
     def handle_message(msg):
         if msg.msg_type != "DIRECTIVE_SUBMIT":
             return
@@ -81,9 +96,12 @@ def main():
             },
         )
 
-        policy = ModelSelectionPolicy(20_000, 0.05)
-        adapter = OpenAIIntentAdapter(policy)
-        extractor = IntentExtractor(adapter, min_confidence=0.60)
+        extractor = state.get("extractor")
+        if extractor is None:
+            with state_lock:
+                extractor = state.get("extractor")
+                if extractor is None:
+                    extractor = state["extractor"] = _build_intent_extractor()
 
         intent = extractor.extract_intent(directive_text, directive_source)
 
@@ -105,7 +123,6 @@ def main():
             correlation_id=msg.message_id,
             payload=intent_payload,
         )
-        print(f"out_msg: {out_msg.to_dict()}")
         
         endpoint.send("CC", "AEM", out_msg.to_bytes())
 
@@ -0,0 +1,140 @@
+"""
+Module: histogram.py
+Location: src/core/monitoring/
+Version: 0.1.0
+
+Log-linear (HDR-style) histogram for latency and size distributions.
+
+Values are non-negative integers (typically nanoseconds). Each power-of-two
+range is split into a fixed number of linear sub-buckets, so percentiles
+carry a bounded relative error (~3% with the default 6 sub-bucket bits)
+while memory stays proportional to the number of distinct magnitudes seen.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """
+    Sparse log-linear histogram.
+
+    record() is a few integer operations plus one dict update and is safe to
+    call from a single writer thread without locking. Callers that share one
+    histogram across threads should pass lock=True.
+    """
+
+    def __init__(self, *, sub_bucket_bits: int = 6, lock: bool = False):
+        self._sub_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count >> 1
+
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+        self._lock = threading.Lock() if lock else None
+
+    # -------------------------------------------------
+    # Bucket mapping
+    # -------------------------------------------------
+    def _bucket(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        top = value >> shift
+        return self._sub_count + (shift - 1) * self._half + (top - self._half)
+
+    def _bucket_bounds(self, bucket: int) -> tuple[int, int]:
+        if bucket < self._sub_count:
+            return bucket, bucket
+        offset = bucket - self._sub_count
+        shift = offset // self._half + 1
+        top = offset % self._half + self._half
+        return top << shift, ((top + 1) << shift) - 1
+
+    # -------------------------------------------------
+    # Recording
+    # -------------------------------------------------
+    def record(self, value: int) -> None:
+        value = int(value)
+        if value < 0:
+            value = 0
+
+        if self._lock is not None:
+            with self._lock:
+                self._record(value)
+        else:
+            self._record(value)
+
+    def _record(self, value: int) -> None:
+        b = self._bucket(value)
+        self._counts[b] = self._counts.get(b, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Fold another histogram (same sub_bucket_bits) into this one."""
+        if other._sub_bits != self._sub_bits:
+            raise ValueError("Cannot merge histograms with different resolution")
+        for b, c in list(other._counts.items()):
+            self._counts[b] = self._counts.get(b, 0) + c
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    # -------------------------------------------------
+    # Queries
+    # -------------------------------------------------
+    def percentile(self, q: float) -> int:
+        """Value at percentile q (0-100), reported as the bucket midpoint."""
+        if self.count == 0:
+            return 0
+        target = max(1, int(q / 100.0 * self.count + 0.999999))
+        seen = 0
+        for b in sorted(self._counts):
+            seen += self._counts[b]
+            if seen >= target:
+                low, high = self._bucket_bounds(b)
+                value = (low + high) // 2
+                return min(max(value, self.min or 0), self.max or value)
+        return self.max or 0
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """Sorted (upper_bound, count) pairs, for exposition formats."""
+        return [
+            (self._bucket_bounds(b)[1], self._counts[b])
+            for b in sorted(self._counts)
+        ]
+
+    def snapshot(self, *, scale: float = 1.0) -> dict:
+        """
+        Serializable summary. `scale` converts units
+        (e.g. 1e-3 to report nanosecond samples in microseconds).
+        """
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.mean() * scale, 3),
+            "min": round((self.min or 0) * scale, 3),
+            "p50": round(self.percentile(50) * scale, 3),
+            "p95": round(self.percentile(95) * scale, 3),
+            "p99": round(self.percentile(99) * scale, 3),
+            "p99.9": round(self.percentile(99.9) * scale, 3),
+            "max": round((self.max or 0) * scale, 3),
+        }
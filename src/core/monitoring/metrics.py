@@ -0,0 +1,445 @@
+"""
+Module: metrics.py
+Location: src/core/monitoring/
+Version: 0.1.0
+
+In-process metrics registry for CMB and module runtimes.
+
+- Counter:   monotonically increasing, per-thread cells (lock-free inc)
+- Gauge:     last value set, or a callback evaluated at collection time
+- Histogram: per-thread log-linear LatencyHistogram, merged on collection
+
+Hot-path updates never take a lock: each thread writes its own cell and
+collectors sum/merge the cells when scraped. Series are looked up once by
+(name, labels) and should be cached by the caller.
+
+Exposition:
+- render_prometheus()  -> Prometheus text format (served by MetricsHttpServer)
+- MetricsPublisher     -> periodic MetricSample messages on the DAC channel
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+
+from src.core.monitoring.histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+# Exported histogram boundaries in seconds (samples are recorded in ns)
+DEFAULT_SECONDS_BUCKETS = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0,
+    10.0, 30.0, 60.0,
+)
+
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: Optional[tuple[str, str]] = None) -> str:
+    items = list(key)
+    if extra is not None:
+        items.append(extra)
+    if not items:
+        return ""
+    body = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in items)
+    return "{" + body + "}"
+
+
+# ----------------------------
+# Series
+# ----------------------------
+
+class Counter:
+    """Monotonic counter with one cell per writing thread."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._cells: list[list[float]] = []
+        self._lock = threading.Lock()
+
+    def _new_cell(self) -> list[float]:
+        cell = [0]
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+    def inc(self, amount: float = 1) -> None:
+        try:
+            self._local.cell[0] += amount
+        except AttributeError:
+            self._new_cell()[0] += amount
+
+    def value(self) -> float:
+        return sum(cell[0] for cell in list(self._cells))
+
+
+class Gauge:
+    """Point-in-time value, either set directly or sampled from a callback."""
+
+    def __init__(self, fn: Optional[Callable[[], float]] = None):
+        self._value: float = 0
+        self._fn = fn
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self._value -= amount
+
+    def value(self) -> float:
+        if self._fn is not None:
+            try:
+                return float(self._fn())
+            except Exception:
+                return float("nan")
+        return self._value
+
+
+class Histogram:
+    """
+    Latency histogram with one LatencyHistogram per writing thread.
+
+    Samples are integers in the recording unit (nanoseconds by convention);
+    `scale` converts them to the exported unit (seconds by default).
+    """
+
+    def __init__(self, *, scale: float = 1e-9, buckets: Iterable[float] = DEFAULT_SECONDS_BUCKETS):
+        self.scale = scale
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._parts: list[LatencyHistogram] = []
+        self._lock = threading.Lock()
+
+    def _new_part(self) -> LatencyHistogram:
+        part = LatencyHistogram()
+        with self._lock:
+            self._parts.append(part)
+        self._local.part = part
+        return part
+
+    def observe(self, value: int) -> None:
+        try:
+            self._local.part.record(value)
+        except AttributeError:
+            self._new_part().record(value)
+
+    def merged(self) -> LatencyHistogram:
+        out = LatencyHistogram()
+        for part in list(self._parts):
+            out.merge(part)
+        return out
+
+
+# ----------------------------
+# Registry
+# ----------------------------
+
+class _Family:
+    def __init__(self, name: str, kind: str, help_text: str, unit: str):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.unit = unit
+        self.series: Dict[LabelKey, Any] = {}
+
+
+class MetricsRegistry:
+    """
+    Process-wide collection of metric families.
+
+    counter()/gauge()/histogram() return the series for a given label set,
+    creating it on first use. Registration takes a lock; updates do not.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: Dict[str, _Family] = {}
+
+    def _series(self, kind: str, name: str, help_text: str, unit: str, labels: Dict[str, Any], factory):
+        key = _label_key(labels)
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = _Family(name, kind, help_text, unit)
+            elif family.kind != kind:
+                raise ValueError(f"Metric {name} already registered as {family.kind}")
+
+            series = family.series.get(key)
+            if series is None:
+                series = family.series[key] = factory()
+            return series
+
+    def counter(self, name: str, help_text: str = "", *, unit: str = "count", **labels: Any) -> Counter:
+        return self._series("counter", name, help_text, unit, labels, Counter)
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str = "",
+        *,
+        fn: Optional[Callable[[], float]] = None,
+        unit: str = "",
+        **labels: Any,
+    ) -> Gauge:
+        """Gauge series; pass fn to sample a value (e.g. queue depth) at scrape time."""
+        gauge = self._series("gauge", name, help_text, unit, labels, lambda: Gauge(fn))
+        if fn is not None:
+            gauge._fn = fn
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        *,
+        scale: float = 1e-9,
+        unit: str = "s",
+        **labels: Any,
+    ) -> Histogram:
+        return self._series("histogram", name, help_text, unit, labels, lambda: Histogram(scale=scale))
+
+    def unregister(self, name: str, **labels: Any) -> None:
+        """Drop one series (e.g. a callback gauge whose owner has stopped)."""
+        with self._lock:
+            family = self._families.get(name)
+            if family is not None:
+                family.series.pop(_label_key(labels), None)
+
+    def families(self) -> list[_Family]:
+        with self._lock:
+            return sorted(self._families.values(), key=lambda f: f.name)
+
+    # -------------------------------------------------
+    # Collection
+    # -------------------------------------------------
+    def collect(self) -> list[dict]:
+        """
+        Flatten all series into samples:
+        {"name", "labels", "value", "unit"} (histograms expand to summary samples).
+        """
+        samples: list[dict] = []
+        for family in self.families():
+            for key, series in list(family.series.items()):
+                labels = dict(key)
+                if family.kind == "histogram":
+                    hist = series.merged()
+                    scale = series.scale
+                    samples.append({"name": f"{family.name}_count", "labels": labels, "value": hist.count, "unit": "count"})
+                    samples.append({"name": f"{family.name}_sum", "labels": labels, "value": hist.total * scale, "unit": family.unit})
+                    for q in (50, 95, 99):
+                        samples.append(
+                            {
+                                "name": f"{family.name}_p{q}",
+                                "labels": labels,
+                                "value": hist.percentile(q) * scale,
+                                "unit": family.unit,
+                            }
+                        )
+                else:
+                    samples.append({"name": family.name, "labels": labels, "value": series.value(), "unit": family.unit})
+        return samples
+
+    def render_prometheus(self) -> str:
+        """Render all families in Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        for family in self.families():
+            if family.help:
+                lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+
+            for key, series in list(family.series.items()):
+                if family.kind != "histogram":
+                    lines.append(f"{family.name}{_format_labels(key)} {series.value()}")
+                    continue
+
+                hist = series.merged()
+                buckets = hist.buckets()
+                idx = 0
+                cumulative = 0
+                for bound in series.buckets:
+                    limit = bound / series.scale
+                    while idx < len(buckets) and buckets[idx][0] <= limit:
+                        cumulative += buckets[idx][1]
+                        idx += 1
+                    lines.append(f"{family.name}_bucket{_format_labels(key, ('le', repr(bound)))} {cumulative}")
+                lines.append(f"{family.name}_bucket{_format_labels(key, ('le', '+Inf'))} {hist.count}")
+                lines.append(f"{family.name}_sum{_format_labels(key)} {hist.total * series.scale}")
+                lines.append(f"{family.name}_count{_format_labels(key)} {hist.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def metrics_registry() -> MetricsRegistry:
+    """Process-wide metrics registry."""
+    return _REGISTRY
+
+
+# ----------------------------
+# HTTP exposition
+# ----------------------------
+
+class MetricsHttpServer:
+    """
+    Local HTTP endpoint serving GET /metrics in Prometheus text format.
+
+    Binds to 127.0.0.1 by default; runs in a daemon thread.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, *, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry or metrics_registry()
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+
+        # Imported here: most modules never serve /metrics
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Scrapes are not system events; keep them out of stderr
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name=f"MetricsHttp[{self.port}]",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+
+# ----------------------------
+# DAC publication
+# ----------------------------
+
+class MetricsPublisher:
+    """
+    Periodically publishes the registry as MetricSample records on the
+    DAC (Diagnostic and Awareness) channel.
+
+    One METRIC_SAMPLES CognitiveMessage is sent per interval; its payload
+    holds a list of serialized MetricSample objects. Labels are folded into
+    the sample name as name{k="v"} since MetricSample has no label field.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        *,
+        module_id: str,
+        registry: Optional[MetricsRegistry] = None,
+        interval_s: float = 10.0,
+        channel: str = "DAC",
+        target: str = "diagnostics",
+    ):
+        self.endpoint = endpoint
+        self.module_id = module_id
+        self.registry = registry or metrics_registry()
+        self.interval_s = interval_s
+        self.channel = channel
+        self.target = target
+
+        self._stop_evt = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def build_samples(self) -> list[dict]:
+        from src.core.architecture.agi_system_dataclasses import MetricSample
+
+        out = []
+        for s in self.registry.collect():
+            name = s["name"] + _format_labels(_label_key(s["labels"]))
+            out.append(asdict(MetricSample(name=name, value=float(s["value"]), unit=s["unit"])))
+        return out
+
+    def publish_once(self) -> None:
+        from src.core.messages.cognitive_message import CognitiveMessage
+
+        msg = CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="METRIC_SAMPLES",
+            msg_version="0.1.0",
+            source=self.module_id,
+            targets=[self.target],
+            context_tag=None,
+            correlation_id=None,
+            payload={"samples": self.build_samples()},
+            priority=10,
+            ttl=self.interval_s * 2,
+        )
+        self.endpoint.send(self.channel, self.target, msg.to_bytes())
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_evt.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"MetricsPublisher[{self.module_id}]",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_evt.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        while not self._stop_evt.wait(self.interval_s):
+            try:
+                self.publish_once()
+            except Exception:
+                # Metrics must never destabilize the module
+                pass
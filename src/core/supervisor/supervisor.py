@@ -0,0 +1,639 @@
+"""
+Module: supervisor.py
+Location: src/core/supervisor/
+Version: 0.1.0
+
+Process supervisor for CMB routers and modules.
+
+- Dependency-ordered startup with readiness probes (delay / tcp / log_event)
+- Restart on exit with exponential backoff (always | on-failure | never)
+- Graceful drain on shutdown: reverse startup order, SIGINT, then
+  terminate/kill after each component's drain timeout
+- CPU affinity per component (Linux), inherited by the process from its
+  first instruction; not applied to in-thread components
+- A distinct message-id node (AGI_NODE_ID) per spawned process, counted
+  up from the supervisor's own node
+- Optional all-in-one mode: components run as threads in this interpreter
+  (ACK hub and routers as in-process services linked over inproc, modules
+  via their main()) to avoid per-process overhead on small nodes. Components with isolation="process"
+  (e.g. Tk GUIs that need their own main thread) always get a process.
+  An in-thread module can only be drained or restarted through its
+  CommonModuleLoop; modules without one are reported at readiness and
+  should use isolation="process".
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+from src.core.supervisor.topology import ComponentSpec, ReadinessProbe, Topology
+from src.core.logging.log_manager import Logger
+from src.core.logging.log_collector import LogCollector
+from src.core.logging.log_hub import DEFAULT_LOG_PATH, LOG_COLLECTOR_ENV, log_hub
+from src.core.messages.message_id import (
+    MAX_NODE,
+    NODE_ID_ENV,
+    MonotonicIdGenerator,
+    require_node_id,
+    set_id_generator,
+)
+from src.core.utils.component_env import component_env
+
+
+class SupervisorError(RuntimeError):
+    """Raised when the topology cannot be brought up."""
+
+
+def _is_federated(spec: ComponentSpec) -> bool:
+    return spec.kind == "router" and any(
+        arg.split("=", 1)[0] in ("--federation-port", "--peer") for arg in spec.args
+    )
+
+
+class InstanceState(Enum):
+    PENDING = "PENDING"
+    STARTING = "STARTING"
+    READY = "READY"
+    BACKOFF = "BACKOFF"
+    FAILED = "FAILED"
+    STOPPED = "STOPPED"
+
+
+@dataclass
+class ComponentInstance:
+    """Runtime state of one replica of a component."""
+
+    spec: ComponentSpec
+    replica: int
+
+    state: InstanceState = InstanceState.PENDING
+    process: Optional[subprocess.Popen] = None
+    thread: Optional[threading.Thread] = None
+    service: Any = None                     # ChannelRouter / AckHub in all-in-one mode
+    started_at: float = 0.0
+    restarts: int = 0
+    consecutive_failures: int = 0
+    next_restart_at: Optional[float] = None
+    last_exit_code: Optional[int] = None
+    log_offset: int = 0                     # log_event probe starts reading here
+    node_id: int = 0                        # Message-id node (AGI_NODE_ID) of its processes
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        if self.spec.replicas == 1:
+            return self.spec.name
+        return f"{self.spec.name}#{self.replica}"
+
+    def is_alive(self) -> bool:
+        if self.process is not None:
+            return self.process.poll() is None
+        if self.thread is not None:
+            return self.thread.is_alive()
+        return False
+
+
+class Supervisor:
+    """
+    Brings a Topology up in dependency order and keeps it running.
+
+    Typical use:
+        sup = Supervisor(load_topology("topology.json"))
+        sup.run_forever()     # start, monitor, drain on Ctrl+C / SIGTERM
+    """
+
+    def __init__(
+        self,
+        topology: Topology,
+        *,
+        all_in_one: bool = False,
+        python: str = sys.executable,
+        cwd: Optional[str] = None,
+        monitor_interval_s: float = 0.2,
+        backoff_reset_s: float = 30.0,
+        log_collector: Optional[str] = None,
+    ):
+        self.topology = topology
+        self.all_in_one = all_in_one
+        self.python = python
+        self.cwd = cwd or os.getcwd()
+        self.monitor_interval_s = monitor_interval_s
+        self.backoff_reset_s = backoff_reset_s
+        self.log_collector = log_collector
+
+        self._order = topology.startup_order()
+        self._instances: List[ComponentInstance] = [
+            ComponentInstance(spec=spec, replica=i)
+            for spec in self._order
+            for i in range(spec.replicas)
+        ]
+
+        # Message-id nodes: this process (and in-thread components) keeps
+        # AGI_NODE_ID (default 0), every spawned process gets the next ones.
+        # Supervisors on federated hosts need non-overlapping AGI_NODE_ID bases,
+        # so a federated topology does not start without one.
+        if any(_is_federated(spec) for spec in self._order):
+            try:
+                require_node_id("for a topology with federated routers")
+            except ValueError as e:
+                raise SupervisorError(str(e)) from None
+        self.node_id = int(os.environ.get(NODE_ID_ENV) or 0)
+        if len(self._instances) > MAX_NODE:
+            raise SupervisorError(f"Topology has more than {MAX_NODE} instances; message-id nodes would repeat")
+        for index, inst in enumerate(self._instances, start=1):
+            inst.node_id = (self.node_id + index) % (MAX_NODE + 1)
+        set_id_generator(MonotonicIdGenerator(node_id=self.node_id))
+
+        self._lock = threading.RLock()
+        self._stopping = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+        # Logging. With log_collector set, spawned processes ship their logs
+        # to a LogCollector hosted here, the log file's only writer.
+        self.log_manager = log_hub()
+        self.logger = Logger("SUPERVISOR", self.log_manager)
+        self._collector: Optional[LogCollector] = (
+            LogCollector(log_collector, path=str(Path(self.cwd) / DEFAULT_LOG_PATH))
+            if log_collector else None
+        )
+
+    # --------------------------
+    # Public API
+    # --------------------------
+
+    def start(self) -> None:
+        """Start all components in dependency order, waiting for readiness."""
+        if self._collector:
+            self._collector.start()
+
+        self.logger.info(
+            event_type="SUPERVISOR_START",
+            message=f"Starting topology {self.topology.name}",
+            payload={
+                "order": [c.name for c in self._order],
+                "all_in_one": self.all_in_one,
+            },
+        )
+
+        for spec in self._order:
+            replicas = [inst for inst in self._instances if inst.spec is spec]
+            for inst in replicas:
+                self._spawn(inst)
+            for inst in replicas:
+                if not self._wait_ready(inst):
+                    self.logger.info(
+                        event_type="SUPERVISOR_READINESS_FAILED",
+                        message=f"{inst.label} not ready within {spec.ready.timeout_s}s",
+                        payload={"component": inst.label},
+                    )
+                    self.shutdown()
+                    raise SupervisorError(f"{inst.label} failed readiness probe")
+
+        self._monitor = threading.Thread(target=self._monitor_loop, name="SupervisorMonitor", daemon=True)
+        self._monitor.start()
+
+        self.logger.info(
+            event_type="SUPERVISOR_READY",
+            message=f"Topology {self.topology.name} ready",
+            payload={"instances": [i.label for i in self._instances]},
+        )
+
+    def run_forever(self) -> None:
+        """Start, then block until Ctrl+C / SIGTERM, then drain."""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self._stopping.set())
+
+        self.start()
+        try:
+            while not self._stopping.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Drain components in reverse startup order."""
+        self._stopping.set()
+        if self._monitor and self._monitor is not threading.current_thread():
+            self._monitor.join(timeout=2.0)
+
+        self.logger.info(
+            event_type="SUPERVISOR_SHUTDOWN",
+            message=f"Draining topology {self.topology.name}",
+        )
+
+        for inst in reversed(self._instances):
+            with self._lock:
+                if inst.state in (InstanceState.PENDING, InstanceState.STOPPED):
+                    continue
+                self._stop_instance(inst)
+                if inst.state != InstanceState.FAILED:
+                    inst.state = InstanceState.STOPPED
+
+        self.logger.info(
+            event_type="SUPERVISOR_STOPPED",
+            message=f"Topology {self.topology.name} stopped",
+        )
+        if self._collector:
+            self._collector.stop()
+
+    def status(self) -> list[dict]:
+        with self._lock:
+            return [
+                {
+                    "component": i.label,
+                    "state": i.state.value,
+                    "alive": i.is_alive(),
+                    "pid": i.process.pid if i.process else None,
+                    "restarts": i.restarts,
+                    "last_exit_code": i.last_exit_code,
+                }
+                for i in self._instances
+            ]
+
+    # --------------------------
+    # Spawning
+    # --------------------------
+
+    def _in_thread(self, spec: ComponentSpec) -> bool:
+        return self.all_in_one and spec.isolation != "process"
+
+    def _spawn(self, inst: ComponentInstance) -> None:
+        spec = inst.spec
+        inst.state = InstanceState.STARTING
+        inst.started_at = time.monotonic()
+        inst.next_restart_at = None
+        inst.log_offset = self._log_size(spec.ready)
+        if inst.service is not None:
+            # Restart of an in-thread service: release the old one's sockets
+            inst.service.stop()
+            inst.service = None
+
+        if self._in_thread(spec):
+            self._spawn_thread(inst)
+        else:
+            self._spawn_process(inst)
+
+        self.logger.info(
+            event_type="SUPERVISOR_SPAWN",
+            message=f"Spawned {inst.label}",
+            payload={
+                "component": inst.label,
+                "pid": inst.process.pid if inst.process else None,
+                "mode": "thread" if inst.thread else "process",
+                "restarts": inst.restarts,
+            },
+        )
+
+    def _component_env(self, inst: ComponentInstance) -> dict:
+        """Settings a component reads from its environment (see component_env.py)."""
+        spec = inst.spec
+        return {
+            **spec.env,
+            "AGI_COMPONENT": spec.name,
+            "AGI_REPLICA_INDEX": str(inst.replica),
+            "AGI_REPLICA_COUNT": str(spec.replicas),
+        }
+
+    def _spawn_process(self, inst: ComponentInstance) -> None:
+        spec = inst.spec
+        env = dict(os.environ)
+        env[NODE_ID_ENV] = str(inst.node_id)
+        env.update(self._component_env(inst))
+        if self.log_collector:
+            env[LOG_COLLECTOR_ENV] = self.log_collector
+
+        kwargs: dict = {}
+        if os.name == "posix":
+            # Own session: terminal Ctrl+C reaches only the supervisor,
+            # which then drains children in order.
+            kwargs["start_new_session"] = True
+        else:
+            kwargs["creationflags"] = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+
+        with self._pinned(inst):
+            inst.process = subprocess.Popen(
+                [self.python, "-m", spec.module, *spec.args],
+                cwd=self.cwd,
+                env=env,
+                **kwargs,
+            )
+        inst.thread = None
+
+    @contextmanager
+    def _pinned(self, inst: ComponentInstance) -> Iterator[None]:
+        """
+        Pin the calling thread to the component's CPUs while it spawns, so
+        the child inherits the affinity before it runs any code (setting it
+        on the pid after Popen races the child's own threads).
+        """
+        cpus = inst.spec.cpu_affinity
+        if not cpus:
+            yield
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            self.logger.warning(
+                event_type="SUPERVISOR_AFFINITY_IGNORED",
+                message=f"CPU affinity for {inst.label} is not supported on this platform",
+                payload={"component": inst.label},
+            )
+            yield
+            return
+
+        previous = os.sched_getaffinity(0)
+        try:
+            os.sched_setaffinity(0, set(cpus))
+        except OSError as e:
+            self.logger.warning(
+                event_type="SUPERVISOR_AFFINITY_ERROR",
+                message=f"Could not pin {inst.label} to {cpus}: {e!r}",
+                payload={"component": inst.label},
+            )
+            yield
+            return
+        try:
+            yield
+        finally:
+            os.sched_setaffinity(0, previous)
+
+    def _spawn_thread(self, inst: ComponentInstance) -> None:
+        spec = inst.spec
+        inst.process = None
+
+        if spec.cpu_affinity:
+            self.logger.warning(
+                event_type="SUPERVISOR_AFFINITY_IGNORED",
+                message=f"{inst.label} runs in-thread; cpu_affinity {spec.cpu_affinity} is not applied",
+                payload={"component": inst.label},
+            )
+
+        if spec.kind == "ack_hub":
+            from src.core.cmb.ack_hub import AckHub
+            from src.core.cmb.ack_hub_entry import build_parser
+
+            args = build_parser().parse_args(spec.args)
+            hub = AckHub(host=args.host, shards=args.shards)
+            hub.start()
+            inst.service = hub
+            inst.thread = hub._threads[-1]
+            return
+
+        if spec.kind == "router":
+            from src.core.cmb.cmb_router import ChannelRouter
+            from src.core.cmb.cmb_channel_config import CMB_ACK_HUB_INPROC
+
+            # Same process as the hub: hand ACKs over inproc instead of TCP
+            router = ChannelRouter(channel_name=spec.channels[0], ack_hub_address=CMB_ACK_HUB_INPROC)
+            router.start()
+            inst.service = router
+            inst.thread = router._thread
+            return
+
+        env = self._component_env(inst)
+
+        def target() -> None:
+            module = importlib.import_module(spec.module)
+            with component_env(env):
+                module.main()
+
+        inst.thread = threading.Thread(target=target, name=f"Component[{inst.label}]", daemon=True)
+        inst.thread.start()
+
+    # --------------------------
+    # Readiness
+    # --------------------------
+
+    def _log_size(self, probe: ReadinessProbe) -> int:
+        if probe.type != "log_event":
+            return 0
+        try:
+            return (Path(self.cwd) / probe.log_path).stat().st_size
+        except OSError:
+            return 0
+
+    def _wait_ready(self, inst: ComponentInstance) -> bool:
+        probe = inst.spec.ready
+        deadline = time.monotonic() + probe.timeout_s
+
+        while time.monotonic() < deadline:
+            if not inst.is_alive():
+                return False
+            if self._probe(inst, probe):
+                inst.state = InstanceState.READY
+                self.logger.info(
+                    event_type="SUPERVISOR_COMPONENT_READY",
+                    message=f"{inst.label} ready after {time.monotonic() - inst.started_at:.2f}s",
+                    payload={"component": inst.label, "probe": probe.type},
+                )
+                self._check_stop_hook(inst)
+                return True
+            time.sleep(0.05)
+
+        return False
+
+    def _probe(self, inst: ComponentInstance, probe: ReadinessProbe) -> bool:
+        if probe.type == "delay":
+            return time.monotonic() - inst.started_at >= probe.delay_s
+
+        if probe.type == "tcp":
+            try:
+                with socket.create_connection((probe.host, probe.port), timeout=0.2):
+                    return True
+            except OSError:
+                return False
+
+        if probe.type == "log_event":
+            return self._log_event_seen(inst, probe)
+
+        raise SupervisorError(f"Unknown readiness probe type: {probe.type}")
+
+    def _log_event_seen(self, inst: ComponentInstance, probe: ReadinessProbe) -> bool:
+        path = Path(self.cwd) / probe.log_path
+        try:
+            with open(path, "rb") as f:
+                if f.seek(0, os.SEEK_END) < inst.log_offset:
+                    inst.log_offset = 0  # rotated into a segment; start the new file
+                f.seek(inst.log_offset)
+                chunk = f.read()
+        except OSError:
+            return False
+
+        # Only consume complete lines; partial tails are re-read next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return False
+        inst.log_offset += end + 1
+
+        needle = probe.event_type.encode("utf-8")
+        for line in chunk[: end + 1].splitlines():
+            if needle not in line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("event_type") != probe.event_type:
+                continue
+            if probe.source_module and record.get("source_module") != probe.source_module:
+                continue
+            return True
+        return False
+
+    def _check_stop_hook(self, inst: ComponentInstance) -> None:
+        """Warn about an in-thread module that cannot be drained."""
+        if inst.thread is None or inst.service is not None or self._thread_loop(inst) is not None:
+            return
+        inst.metadata["no_stop_hook"] = True
+        self.logger.warning(
+            event_type="SUPERVISOR_NO_STOP_HOOK",
+            message=(
+                f"{inst.label} runs in-thread without a CommonModuleLoop; it cannot be "
+                f"drained or restarted until it returns. Use isolation=\"process\" for it."
+            ),
+            payload={"component": inst.label},
+        )
+
+    @staticmethod
+    def _thread_loop(inst: ComponentInstance):
+        from src.core.modules.common_module_loop import CommonModuleLoop
+
+        return CommonModuleLoop.for_thread(inst.thread.ident)
+
+    # --------------------------
+    # Monitoring / restart
+    # --------------------------
+
+    def _monitor_loop(self) -> None:
+        while not self._stopping.wait(self.monitor_interval_s):
+            now = time.monotonic()
+            for inst in self._instances:
+                with self._lock:
+                    if self._stopping.is_set():
+                        return
+                    self._check_instance(inst, now)
+
+    def _check_instance(self, inst: ComponentInstance, now: float) -> None:
+        spec = inst.spec
+
+        if inst.state == InstanceState.BACKOFF:
+            if inst.next_restart_at is not None and now >= inst.next_restart_at:
+                inst.restarts += 1
+                self._spawn(inst)
+            return
+
+        if inst.state == InstanceState.STARTING:
+            # Restarted instance: promote once its probe passes
+            if inst.is_alive() and self._probe(inst, spec.ready):
+                inst.state = InstanceState.READY
+                self._check_stop_hook(inst)
+            elif inst.is_alive():
+                return
+
+        if inst.state not in (InstanceState.READY, InstanceState.STARTING) or inst.is_alive():
+            return
+
+        code = inst.process.returncode if inst.process else None
+        inst.last_exit_code = code
+        failed = code != 0
+
+        # A long healthy run resets the backoff
+        if now - inst.started_at >= self.backoff_reset_s:
+            inst.consecutive_failures = 0
+        inst.consecutive_failures += 1
+
+        should_restart = spec.restart == "always" or (spec.restart == "on-failure" and failed)
+        if spec.max_restarts is not None and inst.restarts >= spec.max_restarts:
+            should_restart = False
+
+        if not should_restart:
+            inst.state = InstanceState.FAILED if failed else InstanceState.STOPPED
+            self.logger.info(
+                event_type="SUPERVISOR_COMPONENT_EXITED",
+                message=f"{inst.label} exited with {code}; not restarting",
+                payload={"component": inst.label, "exit_code": code},
+            )
+            return
+
+        delay = min(
+            spec.backoff_initial_s * (2 ** (inst.consecutive_failures - 1)),
+            spec.backoff_max_s,
+        )
+        inst.state = InstanceState.BACKOFF
+        inst.next_restart_at = now + delay
+
+        self.logger.info(
+            event_type="SUPERVISOR_COMPONENT_RESTART_SCHEDULED",
+            message=f"{inst.label} exited with {code}; restarting in {delay:.2f}s",
+            payload={"component": inst.label, "exit_code": code, "delay_s": delay},
+        )
+
+    # --------------------------
+    # Stopping
+    # --------------------------
+
+    def _stop_instance(self, inst: ComponentInstance) -> None:
+        spec = inst.spec
+
+        if inst.service is not None:
+            inst.service.stop()
+            return
+
+        if inst.thread is not None:
+            if not inst.thread.is_alive():
+                return
+            loop = self._thread_loop(inst)
+            if loop is not None:
+                loop.stop()
+                inst.thread.join(timeout=spec.drain_timeout_s)
+            if inst.thread.is_alive():
+                # No stop hook, or it did not drain; the daemon thread ends
+                # with the interpreter.
+                self.logger.warning(
+                    event_type="SUPERVISOR_THREAD_NOT_STOPPED",
+                    message=f"{inst.label} is still running in-thread after shutdown",
+                    payload={"component": inst.label, "stop_hook": loop is not None},
+                )
+            return
+
+        proc = inst.process
+        if proc is None or proc.poll() is not None:
+            return
+
+        try:
+            if os.name == "posix":
+                proc.send_signal(signal.SIGINT)
+            else:
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+            proc.wait(timeout=spec.drain_timeout_s)
+            return
+        except subprocess.TimeoutExpired:
+            pass
+        except OSError:
+            pass
+
+        proc.terminate()
+        try:
+            proc.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait(timeout=2.0)
+
+        self.logger.info(
+            event_type="SUPERVISOR_FORCED_STOP",
+            message=f"{inst.label} did not drain within {spec.drain_timeout_s}s",
+            payload={"component": inst.label},
+        )
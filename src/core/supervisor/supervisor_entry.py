@@ -0,0 +1,49 @@
+"""
+Module: supervisor_entry.py
+Location: src/core/supervisor/
+Version: 0.1.0
+
+Command-line entry point for the Supervisor.
+
+    python -m src.core.supervisor.supervisor_entry path/to/topology.json [--all-in-one] [--log-collector [ADDRESS]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from src.core.logging.log_collector import DEFAULT_LOG_COLLECTOR
+from src.core.supervisor.supervisor import Supervisor
+from src.core.supervisor.topology import load_topology
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a CMB topology under supervision")
+    parser.add_argument("topology", help="Path to topology JSON file")
+    parser.add_argument(
+        "--all-in-one",
+        action="store_true",
+        help="Run components as threads in this process (except isolation=process)",
+    )
+    parser.add_argument(
+        "--log-collector",
+        nargs="?",
+        const=DEFAULT_LOG_COLLECTOR,
+        default=None,
+        metavar="ADDRESS",
+        help=f"Collect spawned processes' logs through one writer (default address {DEFAULT_LOG_COLLECTOR})",
+    )
+    args = parser.parse_args(argv)
+
+    os.makedirs("logs", exist_ok=True)
+    supervisor = Supervisor(
+        load_topology(args.topology),
+        all_in_one=args.all_in_one,
+        log_collector=args.log_collector,
+    )
+    supervisor.run_forever()
+
+
+if __name__ == "__main__":
+    main()
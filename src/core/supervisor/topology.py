@@ -0,0 +1,197 @@
+"""
+Module: topology.py
+Location: src/core/supervisor/
+Version: 0.1.0
+
+Declarative system topology for the Supervisor.
+
+A topology file (JSON) lists the CMB channels to route and the components
+to run. Each channel becomes a router component ("router.<CH>"), and an
+"ack_hub" component is added that all routers depend on; module components
+that declare channels depend on those routers automatically. Top-level
+"router" / "ack_hub" objects override fields of the generated components
+(e.g. "ack_hub": {"args": ["--shards", "4"]}).
+
+A component's "env" sets its runtime options (AGI_TRACE_SAMPLE_RATE, ...);
+in all-in-one mode they apply to the component's thread only.
+
+Example:
+{
+  "name": "directive_demo",
+  "channels": ["CC"],
+  "components": [
+    {
+      "name": "nlp",
+      "module": "src.core.modules.nlp_module",
+      "channels": ["CC"],
+      "replicas": 1,
+      "cpu_affinity": [2],
+      "ready": {"type": "log_event", "event_type": "NLP_START"},
+      "restart": "on-failure",
+      "env": {"AGI_TRACE_SAMPLE_RATE": "0.01"}
+    }
+  ]
+}
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+ROUTER_ENTRY_MODULE = "src.core.cmb.cmb_router_entry"
+ACK_HUB_ENTRY_MODULE = "src.core.cmb.ack_hub_entry"
+ACK_HUB_NAME = "ack_hub"
+
+
+class TopologyError(ValueError):
+    """Raised for invalid or cyclic topology definitions."""
+
+
+@dataclass(frozen=True)
+class ReadinessProbe:
+    """How the supervisor decides a component instance is ready."""
+
+    type: str = "delay"                  # delay | tcp | log_event
+    delay_s: float = 0.5                 # delay: fixed wait
+    host: str = "localhost"              # tcp: host to connect to
+    port: Optional[int] = None           # tcp: port that must accept connections
+    event_type: Optional[str] = None     # log_event: event_type to wait for
+    source_module: Optional[str] = None  # log_event: optional source_module filter
+    log_path: str = "logs/system.jsonl"  # log_event: JSONL log to tail
+    timeout_s: float = 15.0              # Give up (and fail startup) after this long
+
+
+@dataclass(frozen=True)
+class ComponentSpec:
+    """One supervised component (possibly replicated)."""
+
+    name: str
+    module: str                                   # python -m target
+    kind: str = "module"                          # module | router | ack_hub
+    args: List[str] = field(default_factory=list)
+    channels: List[str] = field(default_factory=list)
+    replicas: int = 1
+    cpu_affinity: List[int] = field(default_factory=list)
+    depends_on: List[str] = field(default_factory=list)
+    ready: ReadinessProbe = field(default_factory=ReadinessProbe)
+    restart: str = "on-failure"                   # always | on-failure | never
+    max_restarts: Optional[int] = None            # None = unlimited
+    backoff_initial_s: float = 0.5
+    backoff_max_s: float = 30.0
+    drain_timeout_s: float = 5.0                  # Grace period after SIGINT before terminate
+    isolation: str = "auto"                       # auto | process (process = never run in-thread)
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Topology:
+    name: str
+    components: List[ComponentSpec]
+
+    def get(self, name: str) -> ComponentSpec:
+        for c in self.components:
+            if c.name == name:
+                return c
+        raise KeyError(f"Unknown component: {name}")
+
+    def startup_order(self) -> List[ComponentSpec]:
+        """Dependency-ordered component list (Kahn's algorithm, stable)."""
+        by_name = {c.name: c for c in self.components}
+        for c in self.components:
+            for dep in c.depends_on:
+                if dep not in by_name:
+                    raise TopologyError(f"{c.name} depends on unknown component {dep}")
+
+        ordered: List[ComponentSpec] = []
+        done: set[str] = set()
+        remaining = list(self.components)
+        while remaining:
+            ready = [c for c in remaining if all(d in done for d in c.depends_on)]
+            if not ready:
+                cycle = ", ".join(c.name for c in remaining)
+                raise TopologyError(f"Dependency cycle among: {cycle}")
+            for c in ready:
+                ordered.append(c)
+                done.add(c.name)
+            remaining = [c for c in remaining if c.name not in done]
+        return ordered
+
+
+def _ack_hub_spec(overrides: Dict[str, Any]) -> ComponentSpec:
+    from src.core.cmb.cmb_channel_config import CMB_ACK_HUB_EGRESS_PORT
+
+    probe = ReadinessProbe(type="tcp", port=CMB_ACK_HUB_EGRESS_PORT, timeout_s=10.0)
+    data: Dict[str, Any] = {
+        "name": ACK_HUB_NAME,
+        "module": ACK_HUB_ENTRY_MODULE,
+        "kind": "ack_hub",
+        "ready": probe,
+        "restart": "always",
+    }
+    data.update(overrides)
+    return ComponentSpec(**data)
+
+
+def _router_spec(channel: str, overrides: Dict[str, Any]) -> ComponentSpec:
+    from src.core.cmb.cmb_channel_config import get_channel_ingress_port
+
+    probe = ReadinessProbe(type="tcp", port=get_channel_ingress_port(channel), timeout_s=10.0)
+    data: Dict[str, Any] = {
+        "name": f"router.{channel}",
+        "module": ROUTER_ENTRY_MODULE,
+        "kind": "router",
+        "args": ["--channel", channel],
+        "channels": [channel],
+        "ready": probe,
+        "restart": "always",
+        "depends_on": [ACK_HUB_NAME],
+    }
+    data.update(overrides)
+    return ComponentSpec(**data)
+
+
+def _component_from_dict(data: Dict[str, Any]) -> ComponentSpec:
+    data = dict(data)
+    if "name" not in data or "module" not in data:
+        raise TopologyError(f"Component needs 'name' and 'module': {data}")
+    if "ready" in data and isinstance(data["ready"], dict):
+        data["ready"] = ReadinessProbe(**data["ready"])
+    try:
+        return ComponentSpec(**data)
+    except TypeError as e:
+        raise TopologyError(f"Invalid component {data.get('name')}: {e}") from e
+
+
+def topology_from_dict(data: Dict[str, Any]) -> Topology:
+    """Build a Topology, expanding channels into ACK hub + router components."""
+    router_overrides = data.get("router", {})
+    routers = [_router_spec(ch, router_overrides) for ch in data.get("channels", [])]
+    router_names = {r.channels[0]: r.name for r in routers}
+
+    components = [_ack_hub_spec(data.get("ack_hub", {}))] if routers else []
+    components.extend(routers)
+    for item in data.get("components", []):
+        spec = _component_from_dict(item)
+        implicit = [router_names[ch] for ch in spec.channels if ch in router_names]
+        deps = list(dict.fromkeys(implicit + list(spec.depends_on)))
+        components.append(
+            ComponentSpec(**{**spec.__dict__, "depends_on": deps})
+        )
+
+    names = [c.name for c in components]
+    dupes = {n for n in names if names.count(n) > 1}
+    if dupes:
+        raise TopologyError(f"Duplicate component names: {sorted(dupes)}")
+
+    topo = Topology(name=data.get("name", "topology"), components=components)
+    topo.startup_order()  # validate early
+    return topo
+
+
+def load_topology(path: str | Path) -> Topology:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return topology_from_dict(data)
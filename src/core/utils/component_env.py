@@ -0,0 +1,42 @@
+"""
+Module: component_env.py
+Location: src/core/utils/
+Version: 0.1.0
+
+Environment lookups for per-component settings.
+
+The Supervisor passes a component's settings (topology "env" plus its
+AGI_COMPONENT / AGI_REPLICA_* values) as environment variables of the
+spawned process. In all-in-one mode components share one process, so the
+Supervisor installs the same values as a thread-local overlay around the
+component's main() instead; getenv() checks that overlay before os.environ.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+_local = threading.local()
+
+
+def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Component setting from the thread's overlay, else os.environ."""
+    overlay: Optional[Dict[str, str]] = getattr(_local, "overlay", None)
+    if overlay is not None and name in overlay:
+        return overlay[name]
+    return os.environ.get(name, default)
+
+
+@contextmanager
+def component_env(env: Dict[str, str]) -> Iterator[None]:
+    """Install env as the calling thread's overlay for the duration."""
+    previous = getattr(_local, "overlay", None)
+    _local.overlay = {**(previous or {}), **env}
+    try:
+        yield
+    finally:
+        _local.overlay = previous
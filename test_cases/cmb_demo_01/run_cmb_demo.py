@@ -33,6 +33,7 @@ MODULES = {
 PYTHON = sys.executable
 
 MODULES = {
+    "ack_hub":    [PYTHON, "-m", "src.core.cmb.ack_hub_entry"],
     "router":     [PYTHON, "-m", "src.core.cmb.cmb_router_entry"],
     "behavior":   [PYTHON, "-m", "src.core.modules.behavior_module"],
     "executive":  [PYTHON, "-m", "src.core.executive.executive_stub"],
@@ -73,6 +74,7 @@ def main():
     procs = []
     #for channel in CMB_CHANNEL_PORTS:
      #   procs.append(launch_router(channel))
+    procs.append(launch("ack_hub"))
     procs.append(launch_router("CC"))
     procs.append(launch("behavior"))
 
@@ -0,0 +1,132 @@
+"""
+Shared CMB test harness: an ACK hub, one channel router and any number of
+ModuleEndpoints on free localhost ports, torn down after the test.
+
+    def test_x(cmb, wait_for):
+        net = cmb(ordered=True)                  # ChannelConfig overrides
+        sender, receiver = net.endpoint("a"), net.endpoint("b")
+        net.start()
+        assert receiver.wait_ready(timeout=3.0)
+"""
+
+import socket
+import time
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+from src.core.cmb.ack_hub import AckHub
+from src.core.cmb.channel_registry import ChannelConfig, InboundDelivery
+from src.core.cmb.cmb_router import ChannelRouter
+from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
+from src.core.cmb.module_endpoint import ModuleEndpoint
+
+
+def _free_ports(count: int) -> List[int]:
+    """Ports the OS had free a moment ago (all held open together, so distinct)."""
+    socks = []
+    try:
+        for _ in range(count):
+            s = socket.socket()
+            s.bind(("127.0.0.1", 0))
+            socks.append(s)
+        return [s.getsockname()[1] for s in socks]
+    finally:
+        for s in socks:
+            s.close()
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class CmbNet:
+    """ACK hub + router for one channel, plus the endpoints built on it."""
+
+    def __init__(self, channel_name: str, router_options: dict, channel_options: dict):
+        hub_in, hub_out, router_in, router_out = _free_ports(4)
+        self.channel = ChannelConfig(
+            name=channel_name,
+            router_port=router_in,
+            inbound_delivery=InboundDelivery.DIRECTED,
+            inbound_port=router_out,
+            ack_port=hub_out,
+            **channel_options,
+        )
+        self.hub = AckHub("127.0.0.1", ingress_port=hub_in, egress_port=hub_out, shards=1, inproc_address=None)
+        router_options = {
+            "delivery": self.channel.delivery,
+            "validation": self.channel.validation,
+            **router_options,
+        }
+        self.router = ChannelRouter(
+            channel_name, "127.0.0.1", router_port=router_in, module_egress_port=router_out,
+            ack_hub_address=f"tcp://127.0.0.1:{hub_in}", **router_options,
+        )
+        self.endpoints: Dict[str, ModuleEndpoint] = {}
+        self._router_started = False
+        self._started: List[ModuleEndpoint] = []
+
+    def endpoint(self, module_id: str, **config) -> ModuleEndpoint:
+        """Endpoint on this channel (started by start()/start_endpoints())."""
+        config.setdefault("poll_timeout_ms", 10)
+        ep = ModuleEndpoint(MultiChannelEndpointConfig(
+            module_id=module_id, channels={self.channel.name: self.channel}, host="127.0.0.1", **config,
+        ))
+        self.endpoints[module_id] = ep
+        return ep
+
+    def start_router(self) -> None:
+        self.hub.start()
+        self.router.start()
+        self._router_started = True
+
+    def start_endpoints(self) -> None:
+        for ep in self.endpoints.values():
+            if ep not in self._started:
+                ep.start()
+                self._started.append(ep)
+
+    def start(self) -> None:
+        self.start_router()
+        self.start_endpoints()
+
+    def stop(self) -> None:
+        for ep in self._started:
+            ep.stop()
+        self._started = []
+        if self._router_started:
+            self.router.stop()
+            self.hub.stop()
+            self._router_started = False
+
+
+@pytest.fixture
+def free_ports() -> Callable[[int], List[int]]:
+    return _free_ports
+
+
+@pytest.fixture
+def wait_for() -> Callable[..., bool]:
+    return _wait_for
+
+
+@pytest.fixture
+def cmb(tmp_path, monkeypatch):
+    """Factory for CmbNet harnesses; logs go to tmp_path/logs."""
+    monkeypatch.chdir(tmp_path)
+    nets: List[CmbNet] = []
+
+    def make(channel_name: str = "CC", *, router_options: Optional[dict] = None, **channel_options) -> CmbNet:
+        net = CmbNet(channel_name, router_options or {}, channel_options)
+        nets.append(net)
+        return net
+
+    yield make
+    for net in nets:
+        net.stop()
@@ -0,0 +1,94 @@
+"""
+Stand-in component for supervisor tests (run with python -m, or as a
+thread through main() in all-in-one mode). Behaviour comes from its
+component environment:
+
+    SV_MODE       serve | stubborn | loop | plain
+    SV_STARTS     file that gets one line per start
+    SV_READY_LOG  JSONL file that gets an SV_READY event once started
+    SV_PORT       port to listen on (tcp readiness probe)
+    SV_EXIT_AFTER / SV_EXIT_CODE   exit with the code after this many seconds
+    SV_AFFINITY   file that gets the process's CPU affinity
+"""
+
+import json
+import os
+import signal
+import socket
+import sys
+import time
+
+from src.core.modules.common_module_loop import CommonModuleLoop
+from src.core.utils.component_env import getenv
+
+
+class _IdleEndpoint:
+    def recv(self, timeout=None):
+        time.sleep(timeout or 0.01)
+        return None
+
+    def stop(self):
+        pass
+
+
+class _QuietLogger:
+    def info(self, **kwargs):
+        pass
+
+    warning = error = info
+
+
+def _announce() -> None:
+    if getenv("SV_STARTS"):
+        with open(getenv("SV_STARTS"), "a") as f:
+            f.write(f"{os.getpid()}\n")
+    if getenv("SV_AFFINITY"):
+        with open(getenv("SV_AFFINITY"), "w") as f:
+            f.write(json.dumps(sorted(os.sched_getaffinity(0))))
+    if getenv("SV_READY_LOG"):
+        with open(getenv("SV_READY_LOG"), "a") as f:
+            f.write(json.dumps({"event_type": "SV_READY", "source_module": "SV"}) + "\n")
+
+
+def main() -> None:
+    mode = getenv("SV_MODE", "serve")
+
+    if mode == "loop":
+        loop = CommonModuleLoop(
+            module_id="SV",
+            endpoint=_IdleEndpoint(),
+            logger=_QuietLogger(),
+            on_message=lambda msg: None,
+            on_start=_announce,
+            poll_interval=0.01,
+        )
+        loop.start()
+        return
+
+    if mode == "plain":
+        _announce()
+        time.sleep(float(getenv("SV_EXIT_AFTER") or 2.0))
+        return
+
+    if mode == "stubborn":
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    listener = None
+    if getenv("SV_PORT"):
+        listener = socket.create_server(("127.0.0.1", int(getenv("SV_PORT"))))
+    _announce()
+
+    try:
+        deadline = time.monotonic() + float(getenv("SV_EXIT_AFTER") or 60.0)
+        while time.monotonic() < deadline:
+            time.sleep(0.01)
+    except KeyboardInterrupt:
+        sys.exit(0)
+    finally:
+        if listener is not None:
+            listener.close()
+    sys.exit(int(getenv("SV_EXIT_CODE") or 0))
+
+
+if __name__ == "__main__":
+    main()
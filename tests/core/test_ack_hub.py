@@ -0,0 +1,50 @@
+import time
+
+import zmq
+
+from src.core.cmb.ack_hub import AckHub, ack_egress_port, ack_shard
+
+
+def test_shard_mapping_is_stable_and_single_shard_is_base_port() -> None:
+    assert ack_shard("NLP", 1) == 0
+    assert ack_shard("NLP", 4) == ack_shard(b"NLP", 4)
+    assert {ack_shard(f"m{i}", 4) for i in range(64)} == {0, 1, 2, 3}
+    assert ack_egress_port(6102, "anything", 1) == 6102
+
+
+def test_hub_delivers_each_ack_from_the_targets_shard(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)  # hub logs go to ./logs
+
+    shards = 2
+    hub = AckHub("127.0.0.1", ingress_port=18801, egress_port=18810, shards=shards, inproc_address=None)
+    # One identity per shard
+    ids = {}
+    i = 0
+    while len(ids) < shards:
+        ids.setdefault(ack_shard(f"mod{i}", shards), f"mod{i}")
+        i += 1
+
+    ctx = zmq.Context.instance()
+    hub.start()
+    receivers = {}
+    push = ctx.socket(zmq.PUSH)
+    try:
+        for shard, identity in ids.items():
+            sock = ctx.socket(zmq.DEALER)
+            sock.setsockopt_string(zmq.IDENTITY, identity)
+            sock.connect(f"tcp://127.0.0.1:{ack_egress_port(18810, identity, shards)}")
+            receivers[identity] = sock
+        push.connect("tcp://127.0.0.1:18801")
+        time.sleep(0.3)  # ROUTER drops ACKs for identities not yet connected
+
+        for identity in ids.values():
+            push.send_multipart([identity.encode(), f"ack-for-{identity}".encode()])
+
+        for identity, sock in receivers.items():
+            assert sock.poll(3000), f"no ACK for {identity}"
+            assert sock.recv_multipart() == [b"", f"ack-for-{identity}".encode()]
+    finally:
+        push.close(linger=0)
+        for sock in receivers.values():
+            sock.close(linger=0)
+        hub.stop()
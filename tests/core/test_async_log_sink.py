@@ -0,0 +1,68 @@
+import json
+
+from src.core.logging.async_file_log_sink import AsyncFileLogSink
+from src.core.logging.log_entry import LogEntry
+from src.core.logging.log_severity import LogSeverity
+
+
+def _read(path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_flush_is_a_durability_barrier(tmp_path) -> None:
+    path = tmp_path / "system.jsonl"
+    sink = AsyncFileLogSink(str(path), batch_size=64, flush_interval_s=10.0)
+    try:
+        for n in range(1000):
+            sink.emit(LogEntry(source_module="test", event_type="E", payload={"n": n}))
+        assert sink.flush(timeout=5.0)
+        assert [r["payload"]["n"] for r in _read(path)] == list(range(1000))
+    finally:
+        sink.close()
+
+
+def test_overflow_drops_info_before_warnings(tmp_path) -> None:
+    path = tmp_path / "system.jsonl"
+    sink = AsyncFileLogSink(str(path), capacity=10, reserve=5, batch_size=1000, flush_interval_s=10.0)
+    # Fill the buffer before the writer's first wakeup
+    for _ in range(20):
+        sink.emit(LogEntry(severity=LogSeverity.INFO, event_type="INFO"))
+    for _ in range(10):
+        sink.emit(LogEntry(severity=LogSeverity.ERROR, event_type="ERROR"))
+    sink.close()
+
+    events = [r["event_type"] for r in _read(path)]
+    assert events == ["INFO"] * 10 + ["ERROR"] * 5
+    assert sink.dropped == 15
+
+
+class _FailingSink(AsyncFileLogSink):
+    def _write(self, data: str) -> None:
+        raise OSError("disk full")
+
+
+def test_flush_returns_when_write_fails_or_sink_is_closed(tmp_path) -> None:
+    sink = _FailingSink(str(tmp_path / "system.jsonl"), flush_interval_s=0.01)
+    sink.emit(LogEntry(source_module="test", event_type="E"))
+    assert sink.flush(timeout=5.0)
+
+    sink.close()
+    assert sink.flush()
+
+
+def test_sinks_sharing_a_file_never_interleave_lines(tmp_path) -> None:
+    path = tmp_path / "system.jsonl"
+    sinks = [AsyncFileLogSink(str(path), batch_size=256, flush_interval_s=0.001) for _ in range(2)]
+    blob = "x" * 2048     # Batches far beyond a file object's buffer
+    try:
+        for n in range(2000):
+            for i, sink in enumerate(sinks):
+                sink.emit(LogEntry(source_module=f"s{i}", event_type="E", payload={"n": n, "blob": blob}))
+        assert all(sink.flush(timeout=10.0) for sink in sinks)
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    records = _read(path)
+    for i in range(2):
+        assert [r["payload"]["n"] for r in records if r["source_module"] == f"s{i}"] == list(range(2000))
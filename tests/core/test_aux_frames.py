@@ -0,0 +1,45 @@
+import pytest
+
+from src.core.cmb.aux_frames import pack_aux, unpack_aux
+from src.core.cmb.hop_trace import HopTrace, split_hop_trace
+from src.core.cmb.sequencing import seq_frame, split_seq
+
+
+def test_pack_and_unpack_round_trip() -> None:
+    trailer = HopTrace(stamps=[(1, 10)]).to_frame()
+    frames = pack_aux("TBQH", [b"hdr", b"buf", seq_frame(1, 0, b"EXEC"), trailer])
+
+    assert frames[0] == b"TBQH"
+    kinds, aux = unpack_aux(frames)
+    trace, kinds, aux = split_hop_trace(kinds, aux)
+    seq, kinds, aux = split_seq(kinds, aux)
+    assert trace.stamps == [(1, 10)]
+    assert seq == (1, 0, "EXEC")
+    assert kinds == "TB" and aux == [b"hdr", b"buf"]
+
+
+def test_no_aux_frames_means_no_layout_frame() -> None:
+    assert pack_aux("", []) == []
+    assert unpack_aux([]) == ("", [])
+
+
+def test_data_frames_that_look_like_trailers_keep_their_role() -> None:
+    # A raw buffer whose bytes start like a trace or seq trailer
+    trace_like = HopTrace(stamps=[(1, 10)]).to_frame()
+    seq_like = seq_frame(1, 0, b"EXEC")
+
+    kinds, aux = unpack_aux(pack_aux("TBB", [b"hdr", seq_like, trace_like]))
+    trace, kinds, aux = split_hop_trace(kinds, aux)
+    seq, kinds, aux = split_seq(kinds, aux)
+    assert trace is None and seq is None
+    assert aux == [b"hdr", seq_like, trace_like]
+
+
+@pytest.mark.parametrize("frames", [
+    [b"TB", b"hdr"],
+    [b"X", b"hdr"],
+    [b"\xff", b"hdr"],
+])
+def test_mismatched_layout_is_rejected(frames) -> None:
+    with pytest.raises(ValueError):
+        unpack_aux(frames)
@@ -0,0 +1,149 @@
+import json
+import time
+
+from src.core.cmb.chunking import MODE_MESSAGE, OutboundStream, Reassembler
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def _transfer(data: bytes, window: int = 4) -> OutboundStream:
+    header = {"message_id": "m1", "source": "a", "targets": ["b"]}
+    return OutboundStream(channel="CC", message=header, mode=MODE_MESSAGE, data=data, chunk_size=100, window=window)
+
+
+def test_window_limits_unacked_chunks_and_message_reassembles() -> None:
+    acks = []
+    reassembler = Reassembler(10_000, on_window_ack=lambda key, ch, n: acks.append(n))
+    stream = _transfer(bytes(range(250)) * 4)
+
+    result = None
+    while not stream.done:
+        assert stream.can_send()
+        envelope, _, chunk = stream.next_frames()
+        stream.commit()
+        event, value = reassembler.on_chunk(("a", "m1"), "CC", json.loads(envelope)["payload"], chunk)
+        if event == "message":
+            result = value
+        if acks:
+            stream.on_window_ack(acks[-1])
+
+    assert result == bytes(range(250)) * 4
+    assert acks == [2, 4, 6, 8]
+    assert reassembler.buffered_bytes == 0
+
+    blocked = _transfer(b"x" * 1000)
+    for _ in range(4):
+        blocked.next_frames()
+        blocked.commit()
+    assert not blocked.can_send()
+
+
+def test_gaps_and_buffer_overflow_abort_the_transfer() -> None:
+    reassembler = Reassembler(150, on_window_ack=lambda *a: None)
+    chunk = memoryview(b"x" * 100)
+
+    assert reassembler.on_chunk(("a", "m1"), "CC", {"mode": "message", "seq": 0, "last": False}, chunk)[0] == "progress"
+    assert reassembler.on_chunk(("a", "m1"), "CC", {"mode": "message", "seq": 2, "last": True}, chunk)[0] == "aborted"
+    assert len(reassembler) == 0
+
+    reassembler.on_chunk(("a", "m2"), "CC", {"mode": "message", "seq": 0, "last": False}, chunk)
+    event, reason = reassembler.on_chunk(("a", "m2"), "CC", {"mode": "message", "seq": 1, "last": True}, chunk)
+    assert (event, reason) == ("aborted", "reassembly buffer full")
+    assert reassembler.buffered_bytes == 0
+
+
+def test_idle_and_sender_aborted_transfers_release_their_bytes() -> None:
+    reassembler = Reassembler(1_000, on_window_ack=lambda *a: None, stream_timeout_s=5.0)
+    chunk = memoryview(b"x" * 100)
+
+    reassembler.on_chunk(("a", "m1"), "CC", {"mode": "message", "seq": 0, "last": False}, chunk)
+    reassembler.on_chunk(("a", "m2"), "CC", {"mode": "message", "seq": 0, "last": False}, chunk)
+    assert reassembler.buffered_bytes == 200
+
+    stream = _transfer(b"x" * 1000)
+    stream.next_frames()
+    stream.commit()
+    envelope = json.loads(stream.abort_frames("window ACK timeout")[0])["payload"]
+    event, reason = reassembler.on_chunk(("a", "m1"), "CC", envelope, memoryview(b""))
+    assert event == "aborted" and "window ACK timeout" in reason
+    assert reassembler.buffered_bytes == 100
+
+    assert reassembler.tick(time.monotonic()) == []
+    expired = reassembler.tick(time.monotonic() + 10.0)
+    assert [key for key, _ in expired] == [("a", "m2")]
+    assert len(reassembler) == 0 and reassembler.buffered_bytes == 0
+
+
+def test_failing_stream_source_sets_error_instead_of_raising() -> None:
+    def source():
+        yield b"x" * 150
+        raise RuntimeError("source broke")
+
+    header = {"message_id": "m1", "source": "a", "targets": ["b"]}
+    stream = OutboundStream(channel="CC", message=header, mode=MODE_MESSAGE, data=source(), chunk_size=100, window=8)
+
+    # Both slices of the first piece are read at once; the lookahead pull
+    # after the first chunk hits the failure
+    assert stream.error is None
+    stream.next_frames()
+    stream.commit()
+    assert stream.error is not None and "source broke" in stream.error
+    assert not stream.can_send()
+
+
+def test_large_message_and_stream_cross_the_router(cmb) -> None:
+    net = cmb()
+    sender, receiver = (
+        net.endpoint(name, chunk_threshold_bytes=4096, chunk_size_bytes=1024, chunk_window=4)
+        for name in ("chunk.sender", "chunk.receiver")
+    )
+
+    def message(payload: dict) -> CognitiveMessage:
+        return CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="CHUNK_TEST", msg_version="0.1.0", source="chunk.sender",
+            targets=["chunk.receiver"], context_tag=None, correlation_id=None,
+            payload=payload, priority=50,
+        )
+
+    net.start()
+    assert receiver.wait_ready(timeout=3.0)
+    assert sender.wait_ready(timeout=3.0)
+
+    big = message({"blob": "z" * 50_000})
+    sender.send("CC", "chunk.receiver", big.to_bytes())
+    received = receiver.recv(timeout=5.0)
+    assert received.message_id == big.message_id
+    assert received.payload == {"blob": "z" * 50_000}
+
+    data = bytes(range(256)) * 64
+    header = message({"name": "weights"})
+    sender.send_stream("CC", "chunk.receiver", header.to_bytes(), data)
+    streamed = receiver.recv(timeout=5.0)
+    assert streamed.message_id == header.message_id
+    assert streamed.stream.read_all() == data
+
+
+def test_chunked_message_keeps_its_place_on_an_ordered_channel(cmb) -> None:
+    net = cmb(ordered=True)
+    sender, receiver = (
+        net.endpoint(name, chunk_threshold_bytes=4096, chunk_size_bytes=1024, chunk_window=2)
+        for name in ("chunk.sender", "chunk.receiver")
+    )
+
+    net.start()
+    assert receiver.wait_ready(timeout=3.0)
+    assert sender.wait_ready(timeout=3.0)
+
+    sizes = [10, 50_000, 10, 10, 30_000, 10]
+    for n, size in enumerate(sizes):
+        msg = CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="CHUNK_TEST", msg_version="0.1.0", source="chunk.sender",
+            targets=["chunk.receiver"], context_tag=None, correlation_id=None,
+            payload={"n": n, "blob": "z" * size}, priority=50,
+        )
+        sender.send("CC", "chunk.receiver", msg.to_bytes())
+
+    received = [receiver.recv(timeout=5.0) for _ in sizes]
+    assert [m.payload["n"] for m in received] == list(range(len(sizes)))
+    assert receiver._reorder.buffered() == 0 and not receiver._transfer_seqs
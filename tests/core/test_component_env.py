@@ -0,0 +1,70 @@
+import threading
+
+from src.core.cmb.endpoint_config import TRACE_SAMPLE_RATE_ENV, MultiChannelEndpointConfig
+from src.core.modules.common_module_loop import (
+    CONCURRENT_ENV,
+    MAX_WORKERS_ENV,
+    METRICS_PORT_ENV,
+    METRICS_PUBLISH_INTERVAL_ENV,
+    CommonModuleLoop,
+)
+from src.core.utils.component_env import component_env, getenv
+
+
+def test_overlay_is_per_thread_and_restored(monkeypatch) -> None:
+    monkeypatch.setenv("AGI_TEST_OPTION", "process")
+    seen = []
+
+    with component_env({"AGI_TEST_OPTION": "component"}):
+        seen.append(getenv("AGI_TEST_OPTION"))
+        other = threading.Thread(target=lambda: seen.append(getenv("AGI_TEST_OPTION")))
+        other.start()
+        other.join()
+    seen.append(getenv("AGI_TEST_OPTION"))
+
+    assert seen == ["component", "process", "process"]
+
+
+def test_trace_sample_rate_defaults_from_component_env(monkeypatch) -> None:
+    monkeypatch.delenv(TRACE_SAMPLE_RATE_ENV, raising=False)
+    assert MultiChannelEndpointConfig.from_channel_names(module_id="A", channel_names=["CC"]).trace_sample_rate == 0.0
+
+    with component_env({TRACE_SAMPLE_RATE_ENV: "0.25"}):
+        cfg = MultiChannelEndpointConfig.from_channel_names(module_id="A", channel_names=["CC"])
+    assert cfg.trace_sample_rate == 0.25
+
+    explicit = MultiChannelEndpointConfig.from_channel_names(module_id="A", channel_names=["CC"], trace_sample_rate=1.0)
+    assert explicit.trace_sample_rate == 1.0
+
+
+def _loop(**kwargs) -> CommonModuleLoop:
+    return CommonModuleLoop(module_id="A", endpoint=object(), logger=None, on_message=lambda msg: None, **kwargs)
+
+
+def test_metrics_options_default_from_component_env(monkeypatch) -> None:
+    monkeypatch.delenv(METRICS_PORT_ENV, raising=False)
+    monkeypatch.delenv(METRICS_PUBLISH_INTERVAL_ENV, raising=False)
+    loop = _loop()
+    assert loop._metrics_http is None and loop._metrics_publisher is None
+
+    env = {METRICS_PORT_ENV: "9500", METRICS_PUBLISH_INTERVAL_ENV: "2.5", "AGI_REPLICA_INDEX": "2"}
+    with component_env(env):
+        loop = _loop()
+        explicit = _loop(metrics_port=9000)
+    assert loop._metrics_http.port == 9502
+    assert loop._metrics_publisher.interval_s == 2.5
+    assert explicit._metrics_http.port == 9000
+
+
+def test_dispatcher_mode_defaults_from_component_env(monkeypatch) -> None:
+    monkeypatch.delenv(CONCURRENT_ENV, raising=False)
+    assert _loop()._dispatcher is None
+
+    with component_env({CONCURRENT_ENV: "true", MAX_WORKERS_ENV: "2"}):
+        loop = _loop()
+        inline = _loop(concurrent=False)
+    try:
+        assert loop._dispatcher is not None
+        assert inline._dispatcher is None
+    finally:
+        loop._dispatcher.shutdown()
@@ -0,0 +1,115 @@
+import json
+import zlib
+
+from src.core.cmb.compression import (
+    DEFAULT_DICTIONARY_ID,
+    ENCODING_KEY,
+    ChannelCompressor,
+    CompressionSettings,
+    decode_message,
+    get_dictionary,
+)
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def _plan_payload(steps: int) -> dict:
+    return {
+        "plan": {
+            "plan_id": "5f0c6a4e-0000-4000-8000-00000000abcd",
+            "steps": [
+                {"step_id": f"step-{i}", "description": f"Analyze directive part {i}", "assigned_module": "EXECUTIVE"}
+                for i in range(steps)
+            ],
+            "status": "READY",
+        }
+    }
+
+
+def _message(payload: dict) -> dict:
+    return CognitiveMessage.create(
+        schema_version=str(CognitiveMessage.get_schema_version()),
+        msg_type="PLAN_READY", msg_version="0.1.0", source="planner",
+        targets=["EXEC"], context_tag=None, correlation_id=None,
+        payload=payload, priority=50,
+    ).to_dict()
+
+
+def test_compressed_envelope_round_trips_with_schema_dictionary() -> None:
+    compressor = ChannelCompressor(CompressionSettings(threshold_bytes=256))
+    message = _message(_plan_payload(20))
+
+    envelope, frame = compressor.compress(message, now=0.0)
+    assert compressor.ratio() < 0.5
+    assert b'"encoding"' in envelope and b"Analyze directive" not in envelope
+
+    restored = decode_message(json.loads(envelope), frame)
+    assert ENCODING_KEY not in restored
+    assert restored == message
+
+    # Below the threshold nothing is touched
+    assert compressor.compress(_message({"n": 1}), now=0.0) is None
+
+
+class _BufferOnlyFrame:
+    """zmq.Frame stand-in that fails if the full frame is copied."""
+
+    def __init__(self, data: bytes):
+        self.buffer = memoryview(data)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    @property
+    def bytes(self) -> bytes:
+        raise AssertionError("frame copied")
+
+
+def test_decode_does_not_copy_the_compressed_frame() -> None:
+    compressor = ChannelCompressor(CompressionSettings(threshold_bytes=256))
+    message = _message(_plan_payload(20))
+    envelope, frame = compressor.compress(message, now=0.0)
+
+    assert decode_message(json.loads(envelope), _BufferOnlyFrame(frame)) == message
+
+
+def test_schema_dictionary_beats_plain_zlib_on_small_plans() -> None:
+    raw = json.dumps(_plan_payload(3)).encode("utf-8")
+    plain = zlib.compress(raw, 6)
+    comp = zlib.compressobj(6, zdict=get_dictionary(DEFAULT_DICTIONARY_ID))
+    assert len(comp.compress(raw) + comp.flush()) < len(plain)
+
+
+def test_compression_switches_off_when_cpu_cost_exceeds_savings() -> None:
+    disabled = []
+    settings = CompressionSettings(threshold_bytes=64, link_bytes_per_s=1e15, sample_window=4, backoff_s=10.0)
+    compressor = ChannelCompressor(settings, on_disable=disabled.append)
+
+    for _ in range(4):
+        compressor.compress(_message(_plan_payload(5)), now=1.0)
+
+    assert len(disabled) == 1 and disabled[0]["cost_s"] > disabled[0]["saved_s"]
+    assert compressor.compress(_message(_plan_payload(5)), now=5.0) is None
+    assert compressor.compress(_message(_plan_payload(5)), now=11.0) is not None
+
+
+def test_router_forwards_compressed_payload_to_receiver(cmb) -> None:
+    net = cmb(ordered=True, compression=CompressionSettings(threshold_bytes=256))
+    sender, receiver = net.endpoint("zip.sender"), net.endpoint("zip.receiver")
+
+    net.start()
+    assert receiver.wait_ready(timeout=3.0)
+    assert sender.wait_ready(timeout=3.0)
+
+    payloads = [_plan_payload(30), {"n": 1}]
+    for payload in payloads:
+        msg = CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="PLAN_READY", msg_version="0.1.0", source="zip.sender",
+            targets=["zip.receiver"], context_tag=None, correlation_id=None,
+            payload=payload, priority=50,
+        )
+        sender.send("CC", "zip.receiver", msg.to_bytes())
+
+    received = [receiver.recv(timeout=3.0) for _ in payloads]
+    assert [m.payload for m in received] == payloads
+    assert sender._compressors["CC"].bytes_in > 0
@@ -0,0 +1,75 @@
+import time
+
+from src.core.cmb.delivery_groups import DeliveryGroups, GroupCompletion
+from src.core.cmb.transaction_registry import TransactionRegistry
+from src.core.messages.ack_message import AckMessage
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def _ack(ack_type: str, source: str, payload: dict | None = None) -> AckMessage:
+    return AckMessage.create(
+        msg_type="ACK", ack_type=ack_type, status="SUCCESS", source=source,
+        targets=["sender"], correlation_id="m1", payload=payload or {},
+    )
+
+
+def test_expand_dedupes_members_and_reports_unknown_groups() -> None:
+    groups = DeliveryGroups({"planners": ["p1", "p2"]})
+    groups.register("all", ["p2", "exec"])
+    assert groups.expand(["@planners", "@all", "p1", "@nope"]) == (["p1", "p2", "exec"], ["nope"])
+
+
+def test_quorum_completes_once_even_when_deliveries_precede_router_ack() -> None:
+    reg = TransactionRegistry()
+    tx = reg.create(
+        message_id="m1", channel="CC", source="sender", target="@g",
+        payload=b"", completion=GroupCompletion.parse("quorum:2"),
+    )
+
+    assert reg.apply_ack(_ack("MESSAGE_DELIVERED_ACK", "a")).reason == "MSG_DELIVERED_ACK_PARTIAL"
+    assert reg.apply_ack(_ack("MESSAGE_DELIVERED_ACK", "b")).reason == "MSG_DELIVERED_ACK_PARTIAL"
+
+    event = reg.apply_ack(_ack("ROUTER_ACK", "CMB_ROUTER", {"targets": ["a", "b", "c"]}))
+    assert event.new_state == "COMPLETED"
+    assert event.details["delivered"] == ["a", "b"]
+
+    late = reg.apply_ack(_ack("MESSAGE_DELIVERED_ACK", "c"))
+    assert late.old_state == late.new_state == "COMPLETED"
+    assert [e.new_state for e in tx.transitions].count("COMPLETED") == 1
+
+
+def test_group_without_members_fails() -> None:
+    reg = TransactionRegistry()
+    reg.create(message_id="m1", channel="CC", source="sender", target="@g",
+               payload=b"", completion=GroupCompletion())
+    event = reg.apply_ack(_ack("ROUTER_ACK", "CMB_ROUTER", {"targets": []}))
+    assert (event.new_state, event.reason) == ("ERROR", "GROUP_NO_MEMBERS")
+
+
+def test_group_send_yields_one_aggregated_completion(cmb) -> None:
+    net = cmb(router_options={"groups": {"workers": ["w1", "w2", "w3"]}})
+    endpoints = {name: net.endpoint(name) for name in ("sender", "w1", "w2", "w3")}
+
+    net.start()
+    time.sleep(0.5)
+    msg = CognitiveMessage.create(
+        schema_version=str(CognitiveMessage.get_schema_version()),
+        msg_type="GROUP_TEST", msg_version="0.1.0", source="sender",
+        targets=["@workers"], context_tag=None, correlation_id=None,
+        payload={}, priority=50,
+    )
+    endpoints["sender"].send("CC", "@workers", msg.to_bytes())
+
+    for name in ("w1", "w2", "w3"):
+        assert endpoints[name].recv(timeout=3.0).message_id == msg.message_id
+
+    acks = []
+    deadline = time.monotonic() + 3.0
+    while len(acks) < 2 and time.monotonic() < deadline:
+        ack = endpoints["sender"].recv_ack(timeout=0.1)
+        if ack is not None:
+            acks.append(ack)
+    time.sleep(0.3)
+    acks += endpoints["sender"].drain_acks()   # member ACKs must not surface
+    assert [a.ack_type for a in acks] == ["ROUTER_ACK", "MESSAGE_DELIVERED_ACK"]
+    assert sorted(acks[1].payload["delivered"]) == ["w1", "w2", "w3"]
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+import zmq
+
+from src.core.cmb.delivery_policy import DeliveryPolicy
+from src.core.cmb.transaction_registry import TransactionRegistry
+from src.core.cmb.utils import extract_routing
+from src.core.messages.ack_message import AckMessage
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def test_policy_resolution_and_registry_bookkeeping() -> None:
+    assert DeliveryPolicy.resolve(None, DeliveryPolicy.NONE) is DeliveryPolicy.NONE
+    assert DeliveryPolicy.resolve("END_TO_END", DeliveryPolicy.NONE) is DeliveryPolicy.END_TO_END
+
+    registry = TransactionRegistry()
+    common = dict(channel="DAC", source="a", target="b", payload=b"{}")
+    assert registry.create(message_id="m0", delivery=DeliveryPolicy.NONE, **common) is None
+    assert registry.get("m0") is None
+
+    tx = registry.create(message_id="m1", delivery=DeliveryPolicy.ROUTER_ONLY, **common)
+    router_ack = AckMessage.create(
+        msg_type="ACK", ack_type="ROUTER_ACK", status="SUCCESS", source="CMB_ROUTER",
+        targets=["a"], correlation_id="m1", payload={},
+    )
+    assert registry.apply_ack(router_ack).new_state == "COMPLETED"
+    assert tx.is_complete()
+
+
+def test_fire_and_forget_skips_transactions_and_acks(cmb) -> None:
+    net = cmb("DAC", delivery=DeliveryPolicy.NONE)
+    sender, receiver = net.endpoint("ff.sender"), net.endpoint("ff.receiver")
+
+    def message(delivery=None) -> CognitiveMessage:
+        return CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="METRIC_SAMPLES", msg_version="0.1.0", source="ff.sender",
+            targets=["ff.receiver"], context_tag=None, correlation_id=None,
+            payload={}, priority=10, delivery=delivery,
+        )
+
+    net.start()
+    assert sender.wait_ready(timeout=3.0)
+    assert receiver.wait_ready(timeout=3.0)
+
+    telemetry = message()
+    sender.send("DAC", "ff.receiver", telemetry.to_bytes())
+    assert receiver.recv(timeout=3.0).message_id == telemetry.message_id
+
+    # A per-message override is tracked and ROUTER_ACKed
+    tracked = message(delivery="ROUTER_ONLY")
+    sender.send("DAC", "ff.receiver", tracked.to_bytes())
+    assert receiver.recv(timeout=3.0).message_id == tracked.message_id
+    ack = sender.recv_ack(timeout=3.0)
+    assert (ack.ack_type, ack.correlation_id) == ("ROUTER_ACK", tracked.message_id)
+    time.sleep(0.2)
+
+    assert sender.recv_ack(timeout=0.1) is None
+    assert sender._tx_registry.get(telemetry.message_id) is None
+    assert receiver._tx_registry.get(telemetry.message_id) is None
+    assert sender._tx_registry.get(tracked.message_id).is_complete()
+
+
+def test_unknown_delivery_value_is_dropped_as_invalid(cmb) -> None:
+    with pytest.raises(ValueError):
+        extract_routing(b'{"message_id": "m1", "msg_type": "X", "delivery": "none"}')
+
+    net = cmb("DAC", delivery=DeliveryPolicy.NONE)
+    sender, receiver = net.endpoint("bad.sender"), net.endpoint("bad.receiver")
+
+    def message(delivery=None) -> CognitiveMessage:
+        return CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="METRIC_SAMPLES", msg_version="0.1.0", source="bad.sender",
+            targets=["bad.receiver"], context_tag=None, correlation_id=None,
+            payload={}, priority=10, delivery=delivery,
+        )
+
+    net.start()
+    raw = zmq.Context.instance().socket(zmq.DEALER)
+    try:
+        assert sender.wait_ready(timeout=3.0)
+        assert receiver.wait_ready(timeout=3.0)
+
+        # Dropped by the sending endpoint ...
+        sender.send("DAC", "bad.receiver", message(delivery="none").to_bytes())
+        # ... and by the router when it bypasses the endpoint
+        raw.connect(f"tcp://127.0.0.1:{net.channel.router_port}")
+        raw.send(message(delivery="none").to_bytes())
+
+        good = message()
+        sender.send("DAC", "bad.receiver", good.to_bytes())
+        assert receiver.recv(timeout=3.0).message_id == good.message_id
+        time.sleep(0.2)
+
+        assert sender._m_invalid.value() == 1
+        assert net.router._m_invalid.value() == 1
+        assert net.router._thread.is_alive()
+        assert receiver.recv(timeout=0.1) is None
+    finally:
+        raw.close(linger=0)
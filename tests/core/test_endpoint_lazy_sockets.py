@@ -0,0 +1,51 @@
+import json
+
+from src.core.cmb.channel_registry import ChannelConfig, InboundDelivery
+from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
+from src.core.cmb.module_endpoint import ModuleEndpoint
+
+
+def _socket_counts(ep: ModuleEndpoint) -> tuple[int, int, int]:
+    return len(ep._out_socks), len(ep._in_socks), len(ep._ack_socks)
+
+
+def test_sockets_connect_on_use_and_idle_channels_disconnect(tmp_path, monkeypatch, free_ports, wait_for) -> None:
+    monkeypatch.chdir(tmp_path)  # endpoint logs go to ./logs
+
+    # No routers needed: ZMQ connects are asynchronous. All channels share one ACK port.
+    ports = free_ports(7)
+    channels = {
+        name: ChannelConfig(
+            name=name,
+            router_port=ports[i],
+            inbound_delivery=InboundDelivery.DIRECTED,
+            inbound_port=ports[3 + i],
+            ack_port=ports[6],
+        )
+        for i, name in enumerate(["A", "B", "C"])
+    }
+    cfg = MultiChannelEndpointConfig(
+        module_id="lazy.test",
+        channels=channels,
+        host="127.0.0.1",
+        poll_timeout_ms=10,
+        subscribe=("A",),
+        idle_disconnect_s=0.3,
+    )
+    ep = ModuleEndpoint(cfg)
+    ep.start()
+    try:
+        assert wait_for(lambda: _socket_counts(ep) == (0, 1, 0))
+
+        ep.send("B", "peer", json.dumps({"message_id": "m1"}).encode("utf-8"))
+        ep.send("C", "peer", json.dumps({"message_id": "m2"}).encode("utf-8"))
+        assert wait_for(lambda: _socket_counts(ep) == (2, 1, 1))
+
+        # Idle outbound channels (and their shared ACK socket) are closed
+        assert wait_for(lambda: _socket_counts(ep) == (0, 1, 0))
+
+        ep.subscribe("B")
+        ep.unsubscribe("A")
+        assert wait_for(lambda: set(ep._in_socks) == {"B"})
+    finally:
+        ep.stop()
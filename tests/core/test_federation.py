@@ -0,0 +1,65 @@
+import time
+
+from src.core.cmb.federation import PresenceTable
+from src.core.messages.cognitive_message import CognitiveMessage
+from src.core.messages.message_id import NODE_ID_ENV
+
+
+def test_presence_table_expires_and_replaces_per_owner() -> None:
+    table = PresenceTable(ttl_s=1.0)
+    table.update("tcp://a:1", [b"x", b"y"], now=0.0)
+    assert table.lookup(b"x", now=0.5) == "tcp://a:1"
+
+    table.replace_owner("tcp://a:1", [b"y"], now=0.5)
+    assert table.lookup(b"x", now=0.6) is None
+    assert table.lookup(b"y", now=1.4) == "tcp://a:1"
+    assert table.lookup(b"y", now=1.5) is None
+    assert len(table) == 0
+
+
+def test_message_and_acks_cross_federated_routers(cmb, free_ports, monkeypatch) -> None:
+    monkeypatch.setenv(NODE_ID_ENV, "5")
+
+    # One ACK hub + CC router per simulated host, linked over federation
+    fed_ports = free_ports(2)
+    hosts = [
+        cmb(router_options={
+            "federation_port": fed_ports[i],
+            "federation_peers": [f"tcp://127.0.0.1:{fed_ports[1 - i]}"],
+            "federation_advertise": f"tcp://127.0.0.1:{fed_ports[i]}",
+            "gossip_interval_s": 0.1,
+        })
+        for i in (0, 1)
+    ]
+    ep_a = hosts[0].endpoint("fed.a")
+    ep_b = hosts[1].endpoint("fed.b")
+
+    for host in hosts:
+        host.start()
+    # Presence reaches router 2, then gossip reaches router 1
+    time.sleep(0.8)
+
+    msg = CognitiveMessage.create(
+        schema_version=str(CognitiveMessage.get_schema_version()),
+        msg_type="FED_TEST",
+        msg_version="0.1.0",
+        source="fed.a",
+        targets=["fed.b"],
+        context_tag=None,
+        correlation_id=None,
+        payload={"n": 1},
+        priority=50,
+    )
+    ep_a.send("CC", "fed.b", msg.to_bytes())
+
+    received = ep_b.recv(timeout=3.0)
+    assert received is not None
+    assert received.message_id == msg.message_id
+
+    ack_types = set()
+    deadline = time.monotonic() + 3.0
+    while len(ack_types) < 2 and time.monotonic() < deadline:
+        ack = ep_a.recv_ack(timeout=0.1)
+        if ack is not None:
+            ack_types.add(ack.ack_type)
+    assert ack_types == {"ROUTER_ACK", "MESSAGE_DELIVERED_ACK"}
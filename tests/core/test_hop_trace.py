@@ -0,0 +1,73 @@
+from src.core.cmb.hop_trace import (
+    Hop,
+    HopLatencyStats,
+    HopTrace,
+    split_hop_trace,
+)
+from src.core.monitoring.histogram import LatencyHistogram
+
+
+def test_trailer_round_trip() -> None:
+    trace = HopTrace(stamps=[(int(Hop.ENDPOINT_ENQUEUE), 1_000), (int(Hop.WIRE_SEND), 1_500)])
+    frame = trace.to_frame()
+
+    assert HopTrace.from_frame(frame).stamps == trace.stamps
+
+
+def test_split_hop_trace_only_takes_last_frame() -> None:
+    trailer = HopTrace(stamps=[(1, 10)]).to_frame()
+
+    trace, kinds, aux = split_hop_trace("TBH", [b"hdr", b"buf", trailer])
+    assert trace is not None and trace.stamps == [(1, 10)]
+    assert kinds == "TB" and aux == [b"hdr", b"buf"]
+
+    trace, kinds, aux = split_hop_trace("T", [b"hdr"])
+    assert trace is None and kinds == "T" and aux == [b"hdr"]
+
+
+def test_buffer_shaped_like_a_trailer_is_not_taken_for_one() -> None:
+    lookalike = HopTrace(stamps=[(1, 10)]).to_frame()
+
+    trace, kinds, aux = split_hop_trace("TB", [b"hdr", lookalike])
+    assert trace is None and aux == [b"hdr", lookalike]
+
+
+def test_segments_and_stats() -> None:
+    trace = HopTrace(
+        stamps=[
+            (int(Hop.ENDPOINT_ENQUEUE), 0),
+            (int(Hop.WIRE_SEND), 100),
+            (int(Hop.ROUTER_INGRESS), 300),
+            (int(Hop.ROUTER_EGRESS), 350),
+            (int(Hop.RECEIVER_POLL), 1_350),
+            (int(Hop.HANDLER_START), 1_400),
+            (int(Hop.HANDLER_END), 5_400),
+        ],
+        channel="CC",
+    )
+    segments = dict(trace.segments())
+    assert segments["endpoint_queue"] == 100
+    assert segments["router_forward"] == 50
+    assert segments["handler"] == 4_000
+    assert segments["end_to_end"] == 5_400
+
+    stats = HopLatencyStats()
+    stats.record(trace)
+    snap = stats.snapshot()
+    assert snap["CC"]["handler"]["count"] == 1
+
+
+def test_histogram_percentiles_within_bucket_error() -> None:
+    hist = LatencyHistogram()
+    for v in range(1, 10_001):
+        hist.record(v)
+
+    assert hist.count == 10_000
+    assert abs(hist.percentile(50) - 5_000) / 5_000 < 0.05
+    assert abs(hist.percentile(99) - 9_900) / 9_900 < 0.05
+    assert hist.max == 10_000
+
+    other = LatencyHistogram()
+    other.record(20_000)
+    hist.merge(other)
+    assert hist.max == 20_000 and hist.count == 10_001
@@ -0,0 +1,51 @@
+import json
+import time
+
+from src.core.logging.log_collector import LogCollector
+from src.core.logging.log_hub import CollectorLogSink, log_hub
+from src.core.logging.log_manager import Logger, LogManager
+from src.core.logging.log_severity import LogSeverity
+
+
+def test_one_hub_per_log_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    hub = log_hub()
+    assert log_hub("logs/system.jsonl") is hub
+    assert log_hub(str(tmp_path / "logs" / "system.jsonl")) is hub
+    assert log_hub("logs/other.jsonl") is not hub
+
+    Logger("HUB.A", hub).info(event_type="A", message="a")
+    Logger("HUB.B", hub).info(event_type="B", message="b")
+    assert hub.flush(timeout=2.0)
+
+    lines = (tmp_path / "logs" / "system.jsonl").read_text().splitlines()
+    assert [json.loads(line)["event_type"] for line in lines] == ["A", "B"]
+
+
+def test_collector_is_the_single_writer(tmp_path) -> None:
+    path = tmp_path / "collected.jsonl"
+    address = "tcp://127.0.0.1:20300"
+    collector = LogCollector(address, path=str(path))
+    collector.start()
+
+    sinks = [CollectorLogSink(address) for _ in range(2)]
+    try:
+        for n, sink in enumerate(sinks):
+            manager = LogManager(min_severity=LogSeverity.INFO)
+            manager.register_sink(sink)
+            for i in range(50):
+                Logger(f"PROC.{n}", manager).info(event_type="SHIPPED", message=str(i))
+        for sink in sinks:
+            sink.close()
+
+        deadline = time.monotonic() + 3.0
+        while collector.received < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        collector.stop()
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(entries) == 100
+    for n in range(2):
+        assert [e["message"] for e in entries if e["source_module"] == f"PROC.{n}"] == [str(i) for i in range(50)]
@@ -0,0 +1,89 @@
+import json
+import time
+
+from src.core.logging.async_file_log_sink import AsyncFileLogSink
+from src.core.logging.execution_context import ExecutionContext
+from src.core.logging.log_manager import LogManager, Logger
+from src.core.logging.log_rate_limit import EventLogLimit, LogRateLimiter, SUPPRESSED_EVENT_TYPE
+
+
+class _ListSink:
+    def __init__(self):
+        self.entries = []
+
+    def emit(self, entry) -> None:
+        self.entries.append(entry)
+
+
+def _manager(limits: dict) -> tuple[LogManager, _ListSink]:
+    manager = LogManager(rate_limiter=LogRateLimiter(limits, summary_interval_s=3600))
+    sink = _ListSink()
+    manager.register_sink(sink)
+    return manager, sink
+
+
+def test_sampling_and_token_bucket_bound_volume() -> None:
+    manager, sink = _manager({
+        "SENT": EventLogLimit(sample_rate=0.25),
+        "ACKED": EventLogLimit(rate_per_s=0.001, burst=3),
+    })
+    a, b = Logger("A", manager), Logger("B", manager)
+
+    for n in range(20):
+        a.info(event_type="SENT", message="%d", args=(n,))
+        a.info(event_type="ACKED", message="")
+        b.info(event_type="ACKED", message="")
+        a.info(event_type="OTHER", message="")
+
+    counts = {}
+    for e in sink.entries:
+        counts[(e.source_module, e.event_type)] = counts.get((e.source_module, e.event_type), 0) + 1
+    assert counts == {("A", "SENT"): 5, ("A", "ACKED"): 3, ("B", "ACKED"): 3, ("A", "OTHER"): 20}
+    assert [e.message for e in sink.entries if e.event_type == "SENT"] == ["0", "4", "8", "12", "16"]
+
+    sink.entries.clear()
+    manager.emit_summaries()
+    summaries = {(e.source_module, e.payload["event_type"]): e.payload for e in sink.entries}
+    assert all(e.event_type == SUPPRESSED_EVENT_TYPE for e in sink.entries)
+    assert summaries[("A", "SENT")]["sampled_out"] == 15
+    assert summaries[("A", "ACKED")]["rate_limited"] == 17
+    assert summaries[("B", "ACKED")]["suppressed"] == 17
+
+    sink.entries.clear()
+    manager.emit_summaries()
+    assert sink.entries == []
+
+
+def test_errors_and_traced_entries_always_pass() -> None:
+    manager, sink = _manager({"SENT": EventLogLimit(sample_rate=0.0)})
+    logger = Logger("A", manager)
+    traced = ExecutionContext(work_id="w1", event_id="e1", traced=True)
+
+    logger.info(event_type="SENT", message="dropped")
+    logger.info(event_type="SENT", message="traced", context=traced)
+    logger.error(event_type="SENT", message="error")
+
+    assert [e.message for e in sink.entries] == ["traced", "error"]
+
+
+def test_due_summaries_are_emitted_after_limited_events_stop(tmp_path) -> None:
+    manager = LogManager(rate_limiter=LogRateLimiter({"SENT": EventLogLimit(sample_rate=0.0)}, summary_interval_s=0.05))
+    path = tmp_path / "system.jsonl"
+    sink = AsyncFileLogSink(str(path), flush_interval_s=0.01, on_tick=manager.emit_due_summaries)
+    manager.register_sink(sink)
+    try:
+        logger = Logger("A", manager)
+        for _ in range(3):
+            logger.info(event_type="SENT", message="dropped")
+
+        # Nothing is logged any more; the writer tick emits the summary
+        deadline = time.monotonic() + 5.0
+        summaries = []
+        while not summaries and time.monotonic() < deadline:
+            time.sleep(0.02)
+            sink.flush(timeout=1.0)
+            records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+            summaries = [r for r in records if r["event_type"] == SUPPRESSED_EVENT_TYPE]
+        assert [r["payload"]["suppressed"] for r in summaries] == [3]
+    finally:
+        sink.close()
@@ -0,0 +1,118 @@
+import gzip
+import json
+
+import pytest
+
+from src.core.logging import async_file_log_sink
+from src.core.logging.async_file_log_sink import AsyncFileLogSink
+from src.core.logging.log_entry import LogEntry
+from src.core.logging.log_segments import (
+    SegmentIndex,
+    SegmentRotation,
+    build_segment,
+    closed_segments,
+    index_path,
+    read_range,
+    tail_lines,
+)
+
+
+def _write_log(path, entries: int, *, rotation: SegmentRotation) -> None:
+    sink = AsyncFileLogSink(str(path), rotation=rotation, batch_size=25)
+    for n in range(entries):
+        sink.emit(LogEntry(
+            timestamp=1000.0 + n,
+            source_module="NLP" if n % 2 else "PLANNER",
+            event_type="PLAN_READY" if n % 50 == 7 else "TICK",
+            message=str(n),
+        ))
+        if n % 25 == 24:
+            sink.flush()
+    sink.close()
+
+
+def test_rotated_segments_are_compressed_indexed_and_readable(tmp_path) -> None:
+    path = tmp_path / "system.jsonl"
+    rotation = SegmentRotation(max_bytes=6_000, index_every=10, settle_s=0.0)
+    _write_log(path, 300, rotation=rotation)
+
+    segments = closed_segments(path)
+    assert len(segments) > 3
+    assert all(s.name.endswith(".jsonl.gz") for s in segments)
+
+    # Every entry exactly once, in order, across segments + active file
+    stored = []
+    for segment in segments:
+        with gzip.open(segment, "rt") as f:
+            stored += [json.loads(line)["message"] for line in f]
+    stored += [json.loads(line)["message"] for line in path.read_text().splitlines()]
+    assert stored == [str(n) for n in range(300)]
+
+    index = SegmentIndex.load(index_path(segments[0]))
+    assert index.compressed and index.entries == sum(b[2] for b in index.blocks)
+    assert index.min_ts == 1000.0 and index.may_contain(source_module="NLP")
+    assert not index.may_contain(event_type="NOT_LOGGED")
+
+    assert [json.loads(line)["message"] for line in tail_lines(str(path), 60)] == [str(n) for n in range(240, 300)]
+    assert [r["message"] for r in read_range(str(path), 1100.0, 1209.0, event_type="PLAN_READY")] == ["107", "157", "207"]
+    assert [r["message"] for r in read_range(str(path), 1150.0, 1152.0, source_module="NLP")] == ["151"]
+
+
+def _stored_messages(path) -> list:
+    """Messages across closed (plain) segments and the active file."""
+    lines = []
+    for segment in closed_segments(path) + [path]:
+        lines += segment.read_text().splitlines()
+    return [json.loads(line)["message"] for line in lines]
+
+
+@pytest.mark.parametrize("shared_rotation", [True, False])
+def test_rotation_while_a_second_sink_holds_the_file_open(tmp_path, monkeypatch, shared_rotation) -> None:
+    # shared_rotation=False: a host that cannot rename open files, where
+    # only the exclusive sink (the LogCollector's) rotates
+    monkeypatch.setattr(async_file_log_sink, "_SHARED_ROTATION", shared_rotation)
+    path = tmp_path / "system.jsonl"
+    rotation = SegmentRotation(max_bytes=4_000, compress=False, settle_s=0.0)
+    first = AsyncFileLogSink(str(path), rotation=rotation, exclusive=True, flush_interval_s=10.0)
+    second = AsyncFileLogSink(str(path), rotation=rotation, flush_interval_s=10.0)
+    try:
+        for n in range(200):
+            sink = first if n % 2 else second
+            sink.emit(LogEntry(timestamp=1000.0 + n, source_module="A", event_type="TICK", message=str(n)))
+            assert sink.flush(timeout=5.0)
+    finally:
+        first.close()
+        second.close()
+
+    assert len(closed_segments(path)) > 3
+    assert sorted(_stored_messages(path), key=int) == [str(n) for n in range(200)]
+
+    if not shared_rotation:
+        alone = tmp_path / "other.jsonl"
+        _write_log(alone, 200, rotation=rotation)
+        assert closed_segments(alone) == []
+
+
+def test_uncompressed_segments_get_plain_offsets(tmp_path) -> None:
+    segment = tmp_path / "system.20261019-120000-000.jsonl"
+    segment.write_text("".join(
+        json.dumps({"timestamp": 10.0 + n, "source_module": "A", "event_type": "E", "message": str(n)}) + "\n"
+        for n in range(25)
+    ))
+
+    final = build_segment(segment, SegmentRotation(compress=False, index_every=10))
+    index = SegmentIndex.load(index_path(final))
+    assert final == segment and not index.compressed
+    assert [(b[2], b[3], b[4]) for b in index.blocks] == [(10, 10.0, 19.0), (10, 20.0, 29.0), (5, 30.0, 34.0)]
+    with open(segment, "rb") as f:
+        f.seek(index.blocks[2][0])
+        assert json.loads(f.readline())["message"] == "20"
+    assert [r["message"] for r in read_range(str(tmp_path / "system.jsonl"), 33.0)] == ["23", "24"]
+
+
+def test_rotation_spec() -> None:
+    rotation = SegmentRotation.parse("size=16M, age=2h, keep=5, compress=0")
+    assert (rotation.max_bytes, rotation.max_age_s, rotation.max_segments, rotation.compress) == (16 << 20, 7200.0, 5, False)
+    assert SegmentRotation.parse("off") is None
+    with pytest.raises(ValueError):
+        SegmentRotation.parse("size=big")
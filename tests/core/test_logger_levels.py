@@ -0,0 +1,68 @@
+import pytest
+
+from src.core.logging.log_hub import LogHub
+from src.core.logging.log_manager import LogManager, Logger
+from src.core.logging.log_severity import LogSeverity
+
+
+class _ListSink:
+    def __init__(self):
+        self.entries = []
+
+    def emit(self, entry) -> None:
+        self.entries.append(entry)
+
+
+def _unexpected():
+    raise AssertionError("deferred argument built for a disabled level")
+
+
+def test_disabled_levels_build_nothing() -> None:
+    manager = LogManager(min_severity=LogSeverity.INFO)
+    sink = _ListSink()
+    manager.register_sink(sink)
+    logger = Logger("LVL", manager)
+
+    assert not logger.enabled_for(LogSeverity.DEBUG)
+    logger.debug(event_type="HOT", message=_unexpected, payload=_unexpected)
+    logger.trace(event_type="HOT", message="%s", args=(object(),), payload=_unexpected)
+
+    logger.info(event_type="SENT", message="sent %s to %r", args=("CC", "dest"), payload=lambda: {"n": 1})
+    logger.error(event_type="FAILED", message=lambda: "lazy")
+
+    assert [(e.severity, e.message, e.payload) for e in sink.entries] == [
+        (LogSeverity.INFO, "sent CC to 'dest'", {"n": 1}),
+        (LogSeverity.ERROR, "lazy", {}),
+    ]
+
+
+def test_per_module_levels_apply_at_runtime() -> None:
+    manager = LogManager(min_severity=LogSeverity.INFO)
+    sink = _ListSink()
+    manager.register_sink(sink)
+    chatty, quiet = Logger("CC", manager), Logger("ACK_HUB", manager)
+
+    manager.set_level(LogSeverity.DEBUG, "CC")
+    manager.set_level(LogSeverity.ERROR, "ACK_HUB")
+    chatty.debug(event_type="CC_DEBUG", message="")
+    quiet.warning(event_type="HUB_WARNING", message="")
+
+    manager.clear_level("ACK_HUB")
+    manager.set_level(LogSeverity.WARNING)
+    chatty.debug(event_type="CC_DEBUG_2", message="")
+    quiet.info(event_type="HUB_INFO", message="")
+    quiet.warning(event_type="HUB_WARNING_2", message="")
+
+    assert [e.event_type for e in sink.entries] == ["CC_DEBUG", "CC_DEBUG_2", "HUB_WARNING_2"]
+
+
+def test_level_spec(tmp_path) -> None:
+    hub = LogHub(str(tmp_path / "levels.jsonl"))
+    hub.configure_levels("warning, CC=DEBUG ,ACK_HUB=error")
+
+    assert hub.level_for("NLP") is LogSeverity.WARNING
+    assert hub.level_for("CC") is LogSeverity.DEBUG
+    assert hub.level_for("ACK_HUB") is LogSeverity.ERROR
+    with pytest.raises(ValueError):
+        hub.configure_levels("CC=LOUD")
+    hub.system_sink.close()
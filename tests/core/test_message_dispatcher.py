@@ -0,0 +1,117 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from src.core.modules.message_dispatcher import ConcurrentDispatcher
+
+
+def _msg(n: int, context_tag: str, msg_type: str = "WORK") -> SimpleNamespace:
+    return SimpleNamespace(
+        message_id=f"m{n}",
+        msg_type=msg_type,
+        context_tag=context_tag,
+        correlation_id=f"c{n}",
+        seq=n,
+    )
+
+
+def test_order_preserved_per_key_and_keys_run_concurrently() -> None:
+    seen: dict[str, list[int]] = {}
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def handle(msg) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+            seen.setdefault(msg.context_tag, []).append(msg.seq)
+
+    dispatcher = ConcurrentDispatcher(module_id="T", handle=handle, max_workers=4)
+    for n in range(20):
+        dispatcher.submit(_msg(n, context_tag=f"ep{n % 4}"))
+
+    assert dispatcher.drain(timeout=5.0)
+    dispatcher.shutdown()
+
+    for tag, seqs in seen.items():
+        assert seqs == sorted(seqs), tag
+    assert sum(len(v) for v in seen.values()) == 20
+    assert peak > 1
+
+
+def test_handler_limit_caps_concurrency() -> None:
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def handle(msg) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+
+    dispatcher = ConcurrentDispatcher(
+        module_id="T",
+        handle=handle,
+        max_workers=8,
+        handler_limits={"LLM": 2},
+    )
+    for n in range(16):
+        dispatcher.submit(_msg(n, context_tag=f"ep{n}", msg_type="LLM"))
+
+    assert dispatcher.drain(timeout=5.0)
+    dispatcher.shutdown()
+    assert peak <= 2
+
+
+def test_lanes_at_handler_limit_do_not_hold_workers() -> None:
+    release = threading.Event()
+    work_done = threading.Event()
+
+    def handle(msg) -> None:
+        if msg.msg_type == "LLM":
+            release.wait(timeout=5.0)
+        else:
+            work_done.set()
+
+    dispatcher = ConcurrentDispatcher(
+        module_id="T",
+        handle=handle,
+        max_workers=2,
+        handler_limits={"LLM": 1},
+    )
+    for n in range(4):
+        dispatcher.submit(_msg(n, context_tag=f"llm{n}", msg_type="LLM"))
+    dispatcher.submit(_msg(9, context_tag="other"))
+
+    # Only one LLM handler runs; the parked LLM lanes leave a worker free
+    assert work_done.wait(timeout=2.0)
+    release.set()
+    assert dispatcher.drain(timeout=5.0)
+    dispatcher.shutdown()
+
+
+def test_failing_handler_does_not_stall_lane() -> None:
+    handled = []
+
+    def handle(msg) -> None:
+        if msg.seq == 0:
+            raise RuntimeError("boom")
+        handled.append(msg.seq)
+
+    dispatcher = ConcurrentDispatcher(module_id="T", handle=handle, max_pending=4)
+    dispatcher.submit(_msg(0, context_tag="ep"))
+    dispatcher.submit(_msg(1, context_tag="ep"))
+
+    assert dispatcher.drain(timeout=2.0)
+    assert handled == [1]
+    assert dispatcher.capacity() == 4
+    dispatcher.shutdown()
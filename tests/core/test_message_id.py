@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from src.core.cmb.cmb_router import ChannelRouter
+from src.core.messages.message_id import (
+    MAX_SEQUENCE,
+    NODE_ID_ENV,
+    MonotonicIdGenerator,
+    default_node_id,
+    fallback_node_id,
+    id_from_bytes,
+    id_lower_bound,
+    id_timestamp,
+    id_to_bytes,
+    require_node_id,
+)
+from src.core.supervisor.supervisor import Supervisor, SupervisorError
+from src.core.supervisor.topology import topology_from_dict
+
+
+def test_ids_stay_ordered_when_clock_stalls_or_steps_back() -> None:
+    now = [1_800_000_000_000]
+    gen = MonotonicIdGenerator(node_id=7, clock_ms=lambda: now[0])
+
+    ids = [gen.next_id() for _ in range(MAX_SEQUENCE + 10)]   # overflows one ms
+    now[0] -= 5_000
+    ids += [gen.next_id() for _ in range(10)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert all(len(i) == 16 for i in ids)
+    assert id_timestamp(ids[0]) == 1_800_000_000.0
+    assert id_lower_bound(1_800_000_000.0) <= ids[0] < id_lower_bound(1_800_000_000.002)
+
+
+def test_binary_round_trip_and_node_range() -> None:
+    gen = MonotonicIdGenerator(node_id=1)
+    text = gen.next_id()
+    assert len(id_to_bytes(text)) == 8
+    assert id_from_bytes(id_to_bytes(text)) == text
+
+    with pytest.raises(ValueError):
+        MonotonicIdGenerator(node_id=4096)
+
+
+def test_unique_across_threads() -> None:
+    gen = MonotonicIdGenerator(node_id=3)
+    out: list[list[str]] = [[] for _ in range(4)]
+
+    def work(bucket: list[str]) -> None:
+        bucket.extend(gen.next_id() for _ in range(5000))
+
+    threads = [threading.Thread(target=work, args=(b,)) for b in out]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    merged = [i for bucket in out for i in bucket]
+    assert len(set(merged)) == len(merged)
+    assert all(bucket == sorted(bucket) for bucket in out)
+
+
+def test_node_id_taken_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv(NODE_ID_ENV, "17")
+    assert default_node_id() == 17
+    assert MonotonicIdGenerator().node_id == 17
+
+    monkeypatch.setenv(NODE_ID_ENV, "2048")
+    with pytest.raises(ValueError):
+        default_node_id()
+
+
+def test_host_pid_fallback_collides_so_federation_requires_node_id(monkeypatch) -> None:
+    # 10 node bits: pids collide on one host and across hosts
+    nodes_a = {fallback_node_id("host-a", pid) for pid in range(1000, 1500)}
+    nodes_b = {fallback_node_id("host-b", pid) for pid in range(1000, 1500)}
+    assert len(nodes_a) < 500
+    assert nodes_a & nodes_b
+
+    monkeypatch.delenv(NODE_ID_ENV, raising=False)
+    with pytest.raises(ValueError, match=NODE_ID_ENV):
+        require_node_id("on federated routers")
+    with pytest.raises(ValueError, match=NODE_ID_ENV):
+        ChannelRouter("CC", "127.0.0.1", federation_port=19999)
+
+    federated = topology_from_dict({"channels": ["CC"], "router": {"args": ["--channel", "CC", "--federation-port", "6201"]}})
+    with pytest.raises(SupervisorError, match=NODE_ID_ENV):
+        Supervisor(federated)
+
+    monkeypatch.setenv(NODE_ID_ENV, "100")
+    assert require_node_id("on federated routers") == 100
+    assert Supervisor(federated).node_id == 100
@@ -0,0 +1,74 @@
+import threading
+import urllib.request
+
+from src.core.monitoring.metrics import MetricsHttpServer, MetricsPublisher, MetricsRegistry
+
+
+def test_counter_sums_per_thread_cells() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "Events", module="X")
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.value() == 4000
+    assert registry.counter("events_total", module="X") is counter
+
+
+def test_prometheus_rendering() -> None:
+    registry = MetricsRegistry()
+    registry.counter("cmb_router_messages_total", "Ingress", channel="CC").inc(3)
+    registry.gauge("cmb_endpoint_queue_depth", fn=lambda: 7, module="NLP", queue="in")
+    hist = registry.histogram("cmb_ack_latency_seconds", module="NLP")
+    hist.observe(2_000_000)      # 2 ms
+    hist.observe(200_000_000)    # 200 ms
+
+    text = registry.render_prometheus()
+    assert "# TYPE cmb_router_messages_total counter" in text
+    assert 'cmb_router_messages_total{channel="CC"} 3' in text
+    assert 'cmb_endpoint_queue_depth{module="NLP",queue="in"} 7.0' in text
+    assert 'cmb_ack_latency_seconds_bucket{module="NLP",le="0.0025"} 1' in text
+    assert 'cmb_ack_latency_seconds_bucket{module="NLP",le="+Inf"} 2' in text
+    assert 'cmb_ack_latency_seconds_count{module="NLP"} 2' in text
+
+
+def test_http_exposition() -> None:
+    registry = MetricsRegistry()
+    registry.counter("up_total").inc()
+    server = MetricsHttpServer(registry, port=0)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=2) as resp:
+            body = resp.read().decode("utf-8")
+        assert "up_total 1" in body
+    finally:
+        server.stop()
+
+
+def test_publisher_builds_metric_samples() -> None:
+    class _Endpoint:
+        def __init__(self):
+            self.sent = []
+
+        def send(self, channel, target, payload):
+            self.sent.append((channel, target, payload))
+
+    registry = MetricsRegistry()
+    registry.counter("handled_total", module="EXEC").inc(5)
+    endpoint = _Endpoint()
+
+    publisher = MetricsPublisher(endpoint, module_id="EXEC", registry=registry)
+    samples = publisher.build_samples()
+    assert samples[0]["name"] == 'handled_total{module="EXEC"}'
+    assert samples[0]["value"] == 5.0
+
+    publisher.publish_once()
+    channel, target, _ = endpoint.sent[0]
+    assert (channel, target) == ("DAC", "diagnostics")
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from src.core.cmb.progress import ResultAborted, ResultStream
+from src.core.cmb.transport_state_machine import AckState, AckStateMachine
+from src.core.messages.ack_message import AckMessage
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def test_progress_extends_deadline_and_final_result_completes() -> None:
+    sm = AckStateMachine("m1", await_result=True, exec_timeout_s=5.0, max_retries=0)
+    sm.on_send()
+    sm.on_router_ack()
+    assert sm.on_msg_delivered_ack().new_state == "EXECUTING"
+
+    deadline = sm.exec_deadline
+    assert sm.on_msg_data(details={"seq": 0}).new_state == "EXECUTING"
+    assert sm.exec_deadline >= deadline
+    assert sm.tick(now=sm.exec_deadline - 0.1) is None
+
+    assert sm.on_msg_data(details={"seq": 1}, final=True).new_state == "COMPLETED"
+    assert sm.on_msg_data(details={"seq": 2}).reason == "LATE_PROGRESS_ACK"
+
+
+def test_request_without_progress_times_out() -> None:
+    sm = AckStateMachine("m1", await_result=True, exec_timeout_s=5.0, max_retries=0)
+    sm.on_send()
+    sm.on_router_ack()
+    sm.on_msg_delivered_ack()
+
+    event = sm.tick(now=sm.exec_deadline + 0.1)
+    assert event.new_state == AckState.TIMEOUT.name
+    assert event.reason == "EXEC_TIMEOUT_FAIL"
+
+
+def test_transport_error_on_ack_ends_the_result_stream(cmb) -> None:
+    endpoint = cmb().endpoint("progress.sender")
+    stream = ResultStream("m1", timeout_s=5.0)
+    endpoint._result_streams["m1"] = stream
+    ack = AckMessage.create(
+        msg_type="ACK", ack_type="MESSAGE_DELIVERED_ACK", status="SUCCESS",
+        source="progress.receiver", targets=["progress.sender"], correlation_id="m1", payload={},
+    )
+
+    # apply_ack raised TransportError: the endpoint passes its text as the event
+    assert not endpoint._route_result(ack, "('m1', 'ERROR 1')")
+    with pytest.raises(ResultAborted):
+        stream.collect()
+
+
+def test_partial_results_stream_back_to_the_sender(cmb) -> None:
+    net = cmb()
+    client, planner = net.endpoint("progress.client"), net.endpoint("progress.planner")
+
+    def plan_in_steps() -> None:
+        request = planner.recv(timeout=5.0)
+        for step in ("analyze", "decompose"):
+            planner.send_progress(request, {"step": step})
+        planner.send_progress(request, {"step": "execute"}, final=True)
+
+    net.start()
+    handler = threading.Thread(target=plan_in_steps, daemon=True)
+    handler.start()
+    assert client.wait_ready(timeout=3.0)
+    assert planner.wait_ready(timeout=3.0)
+
+    request = CognitiveMessage.create(
+        schema_version=str(CognitiveMessage.get_schema_version()),
+        msg_type="PLAN_REQUEST", msg_version="0.1.0", source="progress.client",
+        targets=["progress.planner"], context_tag=None, correlation_id=None,
+        payload={}, priority=50,
+    )
+    results = client.send_request("CC", "progress.planner", request.to_bytes(), timeout_s=5.0)
+
+    assert [p["step"] for p in results] == ["analyze", "decompose", "execute"]
+    handler.join(timeout=2.0)
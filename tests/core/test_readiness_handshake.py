@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from src.core.cmb.handshake import LinkReadiness
+from src.core.cmb.progress import ResultAborted
+from src.core.cmb.transport_qos import TransportQoS
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def test_hello_repeats_until_ready_and_latency_is_reported_once() -> None:
+    links = LinkReadiness(hello_interval_s=0.5)
+    links.on_connect(("out", "CC"), now=10.0)
+
+    assert links.hello_due(10.0) == [("out", "CC")]
+    assert links.hello_due(10.2) == []
+    assert links.hello_due(10.5) == [("out", "CC")]
+
+    assert links.on_ready(("out", "CC"), now=10.75) == 0.75
+    assert links.on_ready(("out", "CC"), now=11.0) is None
+    assert links.is_ready(("out", "CC"))
+    assert links.hello_due(20.0) == []
+
+    links.on_disconnect(("out", "CC"))
+    assert not links.is_ready(("out", "CC"))
+
+
+def test_sends_before_router_start_are_buffered_then_delivered(cmb) -> None:
+    net = cmb(qos=TransportQoS(immediate=True))
+
+    # The router drops messages for identities it has not seen yet, so the
+    # receiver's presence must reach it before the sender's link is READY:
+    # with immediate sockets nothing is queued while the router is down, and
+    # the receiver re-announces far more often than the sender says HELLO.
+    sender = net.endpoint("hs.sender", hello_interval_s=1.0)
+    receiver = net.endpoint("hs.receiver", hello_interval_s=0.05)
+
+    net.start_endpoints()
+    assert not sender.wait_ready(timeout=0.3)
+
+    msg = CognitiveMessage.create(
+        schema_version=str(CognitiveMessage.get_schema_version()),
+        msg_type="HS_TEST", msg_version="0.1.0", source="hs.sender",
+        targets=["hs.receiver"], context_tag=None, correlation_id=None,
+        payload={}, priority=50,
+    )
+    sender.send("CC", "hs.receiver", msg.to_bytes())
+    time.sleep(0.2)
+    assert not sender.is_ready("CC")
+
+    net.start_router()
+    assert receiver.wait_ready(timeout=3.0)
+    assert sender.wait_ready(timeout=3.0)
+
+    received = receiver.recv(timeout=3.0)
+    assert received is not None and received.message_id == msg.message_id
+
+
+def test_dropped_buffered_request_ends_its_result_stream(cmb) -> None:
+    net = cmb()
+    endpoint = net.endpoint("hs.dropper", ready_buffer_limit=1)
+
+    def request(n: int) -> bytes:
+        return CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="HS_TEST", msg_version="0.1.0", source="hs.dropper",
+            targets=["nobody"], context_tag=None, correlation_id=None,
+            payload={"n": n}, priority=50,
+        ).to_bytes()
+
+    net.start_endpoints()
+    # No router: the second buffered send pushes the first one out
+    stream = endpoint.send_request("CC", "nobody", request(0), timeout_s=30.0)
+    endpoint.send("CC", "nobody", request(1))
+
+    with pytest.raises(ResultAborted, match="ready buffer full"):
+        stream.collect()
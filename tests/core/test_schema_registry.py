@@ -0,0 +1,90 @@
+import re
+
+import pytest
+
+from src.core.cmb.schema_registry import (
+    PayloadValidator,
+    SchemaRegistry,
+    SchemaValidation,
+    SchemaValidationError,
+    ValidationPoint,
+    schema_registry,
+)
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def test_compiled_validator_reports_first_error_path() -> None:
+    registry = SchemaRegistry()
+    registry.register("ORDER", "1.0", {
+        "type": "object",
+        "required": ["items"],
+        "properties": {
+            "priority": {"enum": ["low", "high"]},
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["sku"],
+                    "properties": {"qty": {"type": "integer", "minimum": 1}},
+                },
+            },
+        },
+    })
+
+    registry.validate("ORDER", "1.0", {"items": [{"sku": "a", "qty": 2}], "extra": True})
+    registry.validate("UNKNOWN", "1.0", 42)
+
+    cases = {
+        "$.items: required": {},
+        "$.items[1].sku: required": {"items": [{"sku": "a"}, {}]},
+        "$.items[0].qty: minimum is 1": {"items": [{"sku": "a", "qty": 0}]},
+        "$.items[0].qty: expected integer": {"items": [{"sku": "a", "qty": True}]},
+        "$.priority: not one of the allowed values": {"items": [], "priority": ["low"]},
+    }
+    for expected, payload in cases.items():
+        with pytest.raises(SchemaValidationError, match=re.escape(expected)):
+            registry.validate("ORDER", "1.0", payload)
+
+
+def test_sampled_validation_checks_every_nth_message_per_type() -> None:
+    validator = PayloadValidator(SchemaValidation(sample_rate=0.25), test="sampling")
+    bad = {"plan": {"steps": []}}
+
+    errors = [validator.check("PLAN_READY", "0.1.0", bad) for _ in range(8)]
+    assert sum(e is not None for e in errors) == 2
+    assert schema_registry().validator("PLAN_READY", "9.9.9") is not None
+
+
+def _plan_message(payload: dict) -> CognitiveMessage:
+    return CognitiveMessage.create(
+        schema_version=str(CognitiveMessage.get_schema_version()),
+        msg_type="PLAN_READY", msg_version="0.1.0", source="schema.sender",
+        targets=["schema.receiver"], context_tag=None, correlation_id=None,
+        payload=payload, priority=50,
+    )
+
+
+@pytest.mark.parametrize("at", [ValidationPoint.ROUTER, ValidationPoint.RECEIVER])
+def test_invalid_payloads_are_dropped(cmb, at) -> None:
+    net = cmb(validation=SchemaValidation(at=at))
+    sender, receiver = net.endpoint("schema.sender"), net.endpoint("schema.receiver")
+
+    net.start()
+    assert receiver.wait_ready(timeout=3.0)
+    assert sender.wait_ready(timeout=3.0)
+
+    invalid = _plan_message({"plan": {"plan_id": "p1"}})
+    valid = _plan_message({"plan": {"plan_id": "p2", "steps": [{"step_id": "s1"}]}})
+    sender.send("CC", "schema.receiver", invalid.to_bytes())
+    sender.send("CC", "schema.receiver", valid.to_bytes())
+
+    assert receiver.recv(timeout=3.0).message_id == valid.message_id
+    assert receiver.recv(timeout=0.3) is None
+
+    if at is ValidationPoint.ROUTER:
+        # The sender's transaction fails at once instead of timing out
+        acks = list(iter(lambda: sender.recv_ack(timeout=0.5), None))
+        rejected = [a for a in acks if a.correlation_id == invalid.message_id]
+        assert [(a.ack_type, a.status) for a in rejected] == [("ROUTER_ACK", "ERROR")]
+        assert rejected[0].payload["error"] == "$.plan.steps: required"
+        assert sender._tx_registry.get(invalid.message_id).final_state == "ERROR"
@@ -0,0 +1,102 @@
+from src.core.cmb.sequencing import ReorderBuffer, seq_frame, split_seq
+from src.core.messages.cognitive_message import CognitiveMessage
+
+
+def test_seq_trailer_round_trip() -> None:
+    seq, kinds, aux = split_seq("BQ", [b"tensor", seq_frame(7, 42, b"EXEC")])
+    assert seq == (7, 42, "EXEC")
+    assert kinds == "B" and aux == [b"tensor"]
+    assert split_seq("B", [b"tensor"]) == (None, "B", [b"tensor"])
+
+
+def test_buffer_shaped_like_a_trailer_is_not_taken_for_one() -> None:
+    lookalike = seq_frame(7, 42, b"EXEC")
+    assert split_seq("B", [lookalike]) == (None, "B", [lookalike])
+
+
+def test_reorder_buffer_orders_drops_duplicates_and_skips_gaps() -> None:
+    gaps, dups = [], []
+    buf = ReorderBuffer(window=3, gap_timeout_s=0.5,
+                        on_gap=lambda k, n: gaps.append(n), on_duplicate=lambda k, s: dups.append(s))
+
+    assert buf.push("s", 9, 0, "a", now=0.0) == ["a"]
+    assert buf.push("s", 9, 2, "c", now=0.0) == []
+    assert buf.push("s", 9, 1, "b", now=0.1) == ["b", "c"]
+    assert buf.push("s", 9, 1, "b", now=0.2) == []
+    assert dups == [1]
+
+    # Gap timeout: 3 never arrives
+    assert buf.push("s", 9, 4, "e", now=1.0) == []
+    assert buf.expire(now=1.2) == []
+    assert buf.expire(now=1.5) == ["e"]
+    assert gaps == [1]
+
+    # Window full: 5 is skipped without waiting
+    assert buf.push("s", 9, 6, "g", now=2.0) == []
+    assert buf.push("s", 9, 7, "h", now=2.0) == []
+    assert buf.push("s", 9, 8, "i", now=2.0) == ["g", "h", "i"]
+    assert gaps == [1, 1]
+    assert buf.buffered() == 0
+
+
+def test_reorder_buffer_starts_at_first_seq_and_replaces_epochs() -> None:
+    gaps = []
+    buf = ReorderBuffer(window=8, gap_timeout_s=0.5, idle_timeout_s=10.0, on_gap=lambda k, n: gaps.append(n))
+
+    # Joined mid-stream: no wait for 0..41, older stragglers pass through
+    assert buf.push("s", 1, 42, "a", now=0.0) == ["a"]
+    assert buf.push("s", 1, 40, "x", now=0.0) == ["x"]
+    assert buf.push("s", 1, 44, "c", now=0.0) == []
+
+    # Sender restarted: what the old epoch held is released first
+    assert buf.push("s", 2, 0, "new", now=0.1) == ["c", "new"]
+    assert gaps == [1]
+    assert buf.push("s", 1, 43, "late", now=0.1) == ["late"]
+    assert len(buf) == 1 and buf.buffered() == 0
+
+    # Idle streams are forgotten
+    assert buf.push("t", 1, 0, "t0", now=5.0) == ["t0"]
+    assert buf.push("t", 1, 2, "t2", now=5.0) == []
+    assert buf.expire(now=10.2) == ["t2"]
+    assert len(buf) == 1
+    assert buf.expire(now=15.0) == [] and len(buf) == 0
+
+
+def test_reserved_slot_holds_later_items_without_a_gap_timeout() -> None:
+    gaps = []
+    buf = ReorderBuffer(window=8, gap_timeout_s=0.5, on_gap=lambda k, n: gaps.append(n))
+
+    assert buf.push("s", 1, 0, "a", now=0.0) == ["a"]
+    assert buf.reserve("s", 1, 1, now=0.0) == []
+    assert buf.push("s", 1, 2, "c", now=0.0) == []
+    assert buf.expire(now=5.0) == []
+
+    # The transfer completes; an aborted one fills its slot with None
+    assert buf.push("s", 1, 1, "big", now=5.0) == ["big", "c"]
+    assert buf.reserve("s", 1, 3, now=5.0) == []
+    assert buf.push("s", 1, 4, "e", now=5.0) == []
+    assert buf.push("s", 1, 3, None, now=6.0) == [None, "e"]
+    assert gaps == [] and buf.buffered() == 0
+
+
+def test_ordered_channel_delivers_in_send_order(cmb) -> None:
+    net = cmb(ordered=True)
+    sender, receiver = net.endpoint("seq.sender"), net.endpoint("seq.receiver")
+
+    net.start()
+    assert receiver.wait_ready(timeout=3.0)
+    assert sender.wait_ready(timeout=3.0)
+
+    for n in range(50):
+        msg = CognitiveMessage.create(
+            schema_version=str(CognitiveMessage.get_schema_version()),
+            msg_type="TASK_QUEUE_UPDATE", msg_version="0.1.0", source="seq.sender",
+            targets=["seq.receiver"], context_tag=None, correlation_id=None,
+            payload={"n": n}, priority=50,
+        )
+        sender.send("CC", "seq.receiver", msg.to_bytes())
+
+    received = [receiver.recv(timeout=3.0) for _ in range(50)]
+    assert [m.payload["n"] for m in received] == list(range(50))
+    assert all(m.tensors is None for m in received)
+    assert receiver._reorder.buffered() == 0
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_module_import_defers_heavy_dependencies() -> None:
+    # Fresh interpreter: the LLM SDK and numpy must load on first use, not at import
+    code = (
+        "import sys\n"
+        "import src.core.modules.nlp_module, src.core.modules.aem\n"
+        "print(sorted(m for m in ('openai', 'numpy', 'http.server') if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "[]"
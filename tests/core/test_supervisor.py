@@ -0,0 +1,173 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.supervisor.supervisor import InstanceState, Supervisor
+from src.core.supervisor.topology import topology_from_dict
+
+
+REPO = Path(__file__).resolve().parents[2]
+COMPONENT = "tests.core.supervisor_component"
+
+
+class _Events:
+    """Supervisor logger stand-in that records event types."""
+
+    def __init__(self):
+        self.types = []
+
+    def info(self, *, event_type, **kwargs):
+        self.types.append(event_type)
+
+    warning = error = info
+
+
+def _supervisor(component: dict, *, all_in_one: bool = False) -> Supervisor:
+    topo = topology_from_dict({"components": [{"name": "sv", "module": COMPONENT, **component}]})
+    sup = Supervisor(topo, all_in_one=all_in_one, cwd=str(REPO), monitor_interval_s=0.02)
+    sup.logger = _Events()
+    return sup
+
+
+@pytest.mark.parametrize("probe", ["delay", "tcp", "log_event"])
+def test_readiness_probes_gate_startup(tmp_path, free_ports, probe) -> None:
+    port, = free_ports(1)
+    log = tmp_path / "ready.jsonl"
+    ready = {
+        "delay": {"type": "delay", "delay_s": 0.05},
+        "tcp": {"type": "tcp", "host": "127.0.0.1", "port": port},
+        "log_event": {"type": "log_event", "event_type": "SV_READY", "source_module": "SV", "log_path": str(log)},
+    }[probe]
+    sup = _supervisor({"ready": ready, "env": {"SV_PORT": str(port), "SV_READY_LOG": str(log)}})
+
+    sup.start()
+    try:
+        assert [s["state"] for s in sup.status()] == ["READY"]
+        assert "SUPERVISOR_COMPONENT_READY" in sup.logger.types
+    finally:
+        sup.shutdown()
+
+
+def test_backoff_doubles_up_to_max_and_resets_after_healthy_run() -> None:
+    sup = _supervisor({"backoff_initial_s": 0.5, "backoff_max_s": 1.5, "restart": "always"})
+    inst = sup._instances[0]
+
+    class _Exited:
+        returncode = 1
+
+        def poll(self):
+            return 1
+
+    inst.process = _Exited()
+    now = 1000.0
+    delays = []
+    for _ in range(4):
+        inst.state, inst.started_at = InstanceState.READY, now
+        sup._check_instance(inst, now)
+        assert inst.state == InstanceState.BACKOFF
+        delays.append(inst.next_restart_at - now)
+    assert delays == [0.5, 1.0, 1.5, 1.5]
+
+    inst.state, inst.started_at = InstanceState.READY, now - sup.backoff_reset_s
+    sup._check_instance(inst, now)
+    assert inst.next_restart_at - now == 0.5
+
+
+def test_failed_component_is_restarted_until_max_restarts(tmp_path, wait_for) -> None:
+    starts = tmp_path / "starts"
+    sup = _supervisor({
+        "ready": {"type": "delay", "delay_s": 0.05},
+        "restart": "on-failure",
+        "max_restarts": 2,
+        "backoff_initial_s": 0.05,
+        "env": {"SV_EXIT_AFTER": "0.2", "SV_EXIT_CODE": "3", "SV_STARTS": str(starts)},
+    })
+
+    sup.start()
+    try:
+        assert wait_for(lambda: sup.status()[0]["state"] == "FAILED", timeout=10.0)
+        status = sup.status()[0]
+        assert status["restarts"] == 2 and status["last_exit_code"] == 3
+        assert len(starts.read_text().split()) == 3
+        assert sup.logger.types.count("SUPERVISOR_COMPONENT_RESTART_SCHEDULED") == 2
+    finally:
+        sup.shutdown()
+
+
+def test_drain_interrupts_then_forces_stubborn_components() -> None:
+    sup = _supervisor({"ready": {"type": "delay", "delay_s": 0.2}})
+    sup.start()
+    sup.shutdown()
+    assert sup._instances[0].process.returncode == 0
+    assert sup.status()[0]["state"] == "STOPPED"
+    assert "SUPERVISOR_FORCED_STOP" not in sup.logger.types
+
+    sup = _supervisor({
+        "ready": {"type": "delay", "delay_s": 0.2},
+        "drain_timeout_s": 0.3,
+        "env": {"SV_MODE": "stubborn"},
+    })
+    sup.start()
+    sup.shutdown()
+    assert sup._instances[0].process.returncode != 0
+    assert "SUPERVISOR_FORCED_STOP" in sup.logger.types
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity is Linux-only")
+def test_process_inherits_cpu_affinity_from_spawn(tmp_path, wait_for) -> None:
+    cpu = min(os.sched_getaffinity(0))
+    before = os.sched_getaffinity(0)
+    recorded = tmp_path / "affinity"
+    sup = _supervisor({
+        "cpu_affinity": [cpu],
+        "ready": {"type": "delay", "delay_s": 0.2},
+        "env": {"SV_AFFINITY": str(recorded)},
+    })
+
+    sup.start()
+    try:
+        assert wait_for(lambda: recorded.exists() and recorded.read_text() == f"[{cpu}]")
+        assert os.sched_getaffinity(0) == before
+    finally:
+        sup.shutdown()
+
+
+def test_all_in_one_drains_module_loops_through_their_stop_hook(tmp_path) -> None:
+    log = tmp_path / "ready.jsonl"
+    sup = _supervisor(
+        {
+            "ready": {"type": "log_event", "event_type": "SV_READY", "log_path": str(log)},
+            "env": {"SV_MODE": "loop", "SV_READY_LOG": str(log)},
+        },
+        all_in_one=True,
+    )
+
+    sup.start()
+    inst = sup._instances[0]
+    assert inst.process is None and inst.thread.is_alive()
+    sup.shutdown()
+
+    assert not inst.thread.is_alive()
+    assert "SUPERVISOR_NO_STOP_HOOK" not in sup.logger.types
+    assert "SUPERVISOR_THREAD_NOT_STOPPED" not in sup.logger.types
+
+
+def test_all_in_one_reports_modules_without_stop_hook_and_ignored_affinity(tmp_path) -> None:
+    sup = _supervisor(
+        {
+            "cpu_affinity": [0],
+            "ready": {"type": "delay", "delay_s": 0.05},
+            "drain_timeout_s": 0.1,
+            "env": {"SV_MODE": "plain", "SV_EXIT_AFTER": "1.0"},
+        },
+        all_in_one=True,
+    )
+
+    sup.start()
+    sup.shutdown()
+
+    assert "SUPERVISOR_AFFINITY_IGNORED" in sup.logger.types
+    assert "SUPERVISOR_NO_STOP_HOOK" in sup.logger.types
+    assert "SUPERVISOR_THREAD_NOT_STOPPED" in sup.logger.types
+    assert sup._instances[0].metadata["no_stop_hook"]
@@ -0,0 +1,32 @@
+import pytest
+
+from src.core.supervisor.topology import TopologyError, topology_from_dict
+
+
+def test_channels_expand_to_routers_and_implicit_dependencies() -> None:
+    topo = topology_from_dict({
+        "channels": ["CC"],
+        "components": [
+            {"name": "gui", "module": "x.gui", "channels": ["CC"], "depends_on": ["nlp"]},
+            {"name": "nlp", "module": "x.nlp", "channels": ["CC"], "ready": {"type": "delay", "delay_s": 0.1}},
+        ],
+    })
+
+    router = topo.get("router.CC")
+    assert router.kind == "router"
+    assert router.ready.type == "tcp"
+    assert router.depends_on == ["ack_hub"]
+    assert topo.get("gui").depends_on == ["router.CC", "nlp"]
+    assert topo.get("nlp").ready.delay_s == 0.1
+    assert [c.name for c in topo.startup_order()] == ["ack_hub", "router.CC", "nlp", "gui"]
+
+
+def test_cycles_and_unknown_dependencies_are_rejected() -> None:
+    with pytest.raises(TopologyError, match="cycle"):
+        topology_from_dict({"components": [
+            {"name": "a", "module": "m.a", "depends_on": ["b"]},
+            {"name": "b", "module": "m.b", "depends_on": ["a"]},
+        ]})
+
+    with pytest.raises(TopologyError, match="unknown"):
+        topology_from_dict({"components": [{"name": "a", "module": "m.a", "depends_on": ["zzz"]}]})
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from src.core.cmb.tensor_frames import (
+    TensorFrameError,
+    decode_tensor_frames,
+    encode_tensor_frames,
+    is_tensor_header,
+)
+from src.core.cmb.utils import split_inbound_frames
+
+
+def test_round_trip_preserves_dtype_and_shape() -> None:
+    tensors = {
+        "embedding": np.arange(12, dtype=np.float32).reshape(3, 4),
+        "mask": np.array([True, False, True]),
+    }
+    frames = encode_tensor_frames(tensors)
+
+    assert is_tensor_header(frames[0])
+    wire = [frames[0]] + [bytes(memoryview(f)) for f in frames[1:]]
+
+    decoded = decode_tensor_frames(wire)
+    assert decoded["embedding"].dtype == np.float32
+    assert decoded["embedding"].shape == (3, 4)
+    np.testing.assert_array_equal(decoded["embedding"], tensors["embedding"])
+    np.testing.assert_array_equal(decoded["mask"], tensors["mask"])
+
+
+def test_non_contiguous_input_is_packed() -> None:
+    arr = np.arange(16, dtype=np.int64).reshape(4, 4).T
+    frames = encode_tensor_frames({"t": arr})
+    decoded = decode_tensor_frames([frames[0], bytes(memoryview(frames[1]))])
+    np.testing.assert_array_equal(decoded["t"], arr)
+
+
+def test_object_dtype_rejected() -> None:
+    with pytest.raises(TensorFrameError):
+        encode_tensor_frames({"bad": np.array([{"a": 1}], dtype=object)})
+
+
+def test_buffer_count_mismatch() -> None:
+    frames = encode_tensor_frames({"a": np.zeros(2), "b": np.zeros(2)})
+    with pytest.raises(TensorFrameError):
+        decode_tensor_frames(frames[:2])
+
+
+def test_split_inbound_frames_strips_delimiter() -> None:
+    payload, aux = split_inbound_frames([b"", b"{}", b"hdr", b"buf"])
+    assert payload == b"{}"
+    assert aux == [b"hdr", b"buf"]
+
+    payload, aux = split_inbound_frames([b"{}"])
+    assert payload == b"{}"
+    assert aux == []
@@ -0,0 +1,60 @@
+import time
+
+import zmq
+
+from src.core.cmb.channel_registry import ChannelConfig, ChannelRegistry, InboundDelivery
+from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
+from src.core.cmb.module_endpoint import ModuleEndpoint
+from src.core.cmb.transport_qos import BULK_QOS, STREAM_QOS, io_context
+
+
+def test_profiles_apply_and_pools_get_their_own_context() -> None:
+    ChannelRegistry.initialize()
+    assert ChannelRegistry.get("CC").qos.io_pool == "control"
+    assert ChannelRegistry.get("VB").qos == BULK_QOS
+
+    ctx = io_context("bulk")
+    assert ctx is io_context("bulk")
+    assert ctx is not zmq.Context.instance()
+    assert io_context() is zmq.Context.instance()
+
+    sock = ctx.socket(zmq.DEALER)
+    try:
+        BULK_QOS.apply(sock)
+        assert sock.getsockopt(zmq.SNDHWM) == 10_000
+        assert sock.getsockopt(zmq.LINGER) == 0
+    finally:
+        sock.close()
+
+
+def test_conflating_channel_keeps_only_newest_message(tmp_path, monkeypatch, free_ports) -> None:
+    monkeypatch.chdir(tmp_path)  # endpoint logs go to ./logs
+
+    router_port, inbound_port = free_ports(2)
+    channel = ChannelConfig(
+        name="PCX", router_port=router_port, inbound_delivery=InboundDelivery.DIRECTED,
+        inbound_port=inbound_port, qos=STREAM_QOS,
+    )
+    ep = ModuleEndpoint(MultiChannelEndpointConfig(module_id="conflate.test", channels={"PCX": channel}))
+
+    ctx = zmq.Context.instance()
+    router = ctx.socket(zmq.ROUTER)
+    router.bind(f"tcp://127.0.0.1:{inbound_port}")
+    dealer = ctx.socket(zmq.DEALER)
+    dealer.setsockopt_string(zmq.IDENTITY, "conflate.test")
+    dealer.connect(f"tcp://127.0.0.1:{inbound_port}")
+    try:
+        dealer.send(b"hello")
+        router.recv_multipart()   # connection established
+        for n in range(5):
+            router.send_multipart([b"conflate.test", b"", f"sample-{n}".encode()])
+        time.sleep(0.2)
+
+        ep._sock_to_channel[dealer] = "PCX"
+        first = dealer.recv_multipart(copy=False)
+        latest = ep._latest_if_conflating(dealer, first)
+        assert latest[-1].bytes == b"sample-4"
+        assert ep._m_conflated.value() == 4
+    finally:
+        dealer.close(linger=0)
+        router.close(linger=0)
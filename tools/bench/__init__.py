@@ -0,0 +1 @@
+"""Benchmark harnesses for the AGI system (run from the repository root)."""
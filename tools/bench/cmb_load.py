@@ -0,0 +1,435 @@
+"""
+Module: cmb_load.py
+Location: tools/bench/
+
+CMB load generator and throughput / latency benchmark.
+
+Starts an AckHub, N ChannelRouters and M synthetic ModuleEndpoints in this process
+(loopback TCP only, isolated port range), drives a configurable message
+mix through them and reports:
+
+- messages/s and deliveries/s
+- end-to-end latency percentiles (p50/p95/p99/p99.9)
+- ROUTER_ACK and MESSAGE_DELIVERED_ACK latency percentiles
+- CPU time per message and RSS growth
+
+Each run appends one JSON record to the results file (see stats.write_result).
+
+Usage (from repository root):
+    python -m tools.bench.cmb_load --routers 2 --endpoints 4 --messages 5000
+    python -m tools.bench.cmb_load --mix-file mixes.json --output artifacts/bench/cmb_load.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from tools.bench.stats import rss_bytes, summarize_ns, write_result
+
+
+# Directed channels in ChannelRegistry order; routers are assigned in this order.
+# CC is always first because endpoints return MESSAGE_DELIVERED_ACKs on CC.
+BENCH_CHANNELS = ["CC", "SMC", "VB", "BFC", "DAC", "IC", "TC"]
+
+DEFAULT_OUTPUT = "artifacts/bench/cmb_load.jsonl"
+
+
+@dataclass
+class MessageMix:
+    """One class of synthetic traffic in the load mix."""
+
+    name: str = "default"
+    channel: Optional[str] = None       # None = spread across all routers
+    payload_bytes: int = 256            # Size of the padding field in the payload
+    fan_out: int = 1                    # Number of targets per message
+    priority: int = 50                  # CognitiveMessage priority
+    ack_policy: str = "END_TO_END"      # Message delivery policy: END_TO_END | ROUTER_ONLY | NONE
+    weight: float = 1.0                 # Relative share of messages
+
+
+@dataclass
+class LoadConfig:
+    """Topology and run parameters for a benchmark run."""
+
+    routers: int = 1
+    endpoints: int = 4
+    messages: int = 2000                # Total messages across all senders
+    rate: float = 0.0                   # Target aggregate msgs/s, 0 = unthrottled
+    warmup_s: float = 0.5               # Connect time before traffic starts
+    drain_timeout_s: float = 10.0       # Max wait for outstanding deliveries
+    base_port: int = 16000              # Router i uses base_port + 10*i + {0,1}; ACK hub above them
+    ack_shards: int = 1                 # ACK hub egress shards (threads/sockets)
+    seed: int = 1
+    trace_sample_rate: float = 0.0      # Endpoint hop-trace sampling (adds hop_latency to results)
+    mixes: list[MessageMix] = field(default_factory=lambda: [MessageMix()])
+
+
+class _Collector:
+    """Thread-safe sample sink shared by all synthetic endpoints."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sent_at: dict[str, tuple[int, str]] = {}   # message_id -> (send ns, ack_policy)
+        self.e2e_ns: list[int] = []
+        self.router_ack_ns: list[int] = []
+        self.delivered_ack_ns: list[int] = []
+        self.completion_ns: list[int] = []
+        self._completed: set[str] = set()
+        self.deliveries = 0
+
+    def on_send(self, message_id: str, ack_policy: str, t_ns: int) -> None:
+        with self._lock:
+            self.sent_at[message_id] = (t_ns, ack_policy)
+
+    def on_delivery(self, sent_ns: int, now_ns: int) -> None:
+        with self._lock:
+            self.deliveries += 1
+            self.e2e_ns.append(now_ns - sent_ns)
+
+    def on_ack(self, correlation_id: str, ack_type: str, now_ns: int) -> None:
+        with self._lock:
+            sent = self.sent_at.get(correlation_id)
+            if sent is None:
+                return
+            sent_ns, policy = sent
+            latency = now_ns - sent_ns
+
+            if ack_type == "ROUTER_ACK":
+                self.router_ack_ns.append(latency)
+                completes = policy == "ROUTER_ONLY"
+            elif ack_type == "MESSAGE_DELIVERED_ACK":
+                self.delivered_ack_ns.append(latency)
+                completes = policy == "END_TO_END"
+            else:
+                return
+
+            if completes and correlation_id not in self._completed:
+                self._completed.add(correlation_id)
+                self.completion_ns.append(latency)
+
+
+def _pick_port_block(cfg: LoadConfig, index: int) -> tuple[int, int]:
+    base = cfg.base_port + 10 * index
+    return base, base + 1
+
+
+def _pick_hub_ports(cfg: LoadConfig) -> tuple[int, int]:
+    """ACK hub ingress and egress base port, after the router blocks."""
+    base = cfg.base_port + 10 * len(BENCH_CHANNELS)
+    return base, base + 1
+
+
+def _build_mix_sequence(cfg: LoadConfig, router_channels: list[str]) -> list[MessageMix]:
+    rng = random.Random(cfg.seed)
+    weights = [max(m.weight, 0.0) for m in cfg.mixes]
+    for mix in cfg.mixes:
+        if mix.channel is not None and mix.channel not in router_channels:
+            raise ValueError(
+                f"Mix '{mix.name}' uses channel {mix.channel} but only {router_channels} are running"
+            )
+    return rng.choices(cfg.mixes, weights=weights, k=cfg.messages)
+
+
+def run_load(cfg: LoadConfig) -> dict:
+    """
+    Run one benchmark and return the results dict.
+
+    Routers and endpoints log to logs/system.jsonl relative to the working
+    directory, so callers should run this from a scratch directory
+    (main() does) to keep benchmark traffic out of the repo log.
+    """
+    # Imported here so --help works without pyzmq installed
+    from src.core.cmb.ack_hub import AckHub
+    from src.core.cmb.channel_registry import ChannelConfig, InboundDelivery
+    from src.core.cmb.cmb_router import ChannelRouter
+    from src.core.cmb.hop_trace import Hop, hop_latency_stats
+    from src.core.cmb.endpoint_config import MultiChannelEndpointConfig
+    from src.core.cmb.module_endpoint import ModuleEndpoint
+    from src.core.messages.cognitive_message import CognitiveMessage
+
+    if not 1 <= cfg.routers <= len(BENCH_CHANNELS):
+        raise ValueError(f"routers must be in 1..{len(BENCH_CHANNELS)}")
+    if cfg.endpoints < 2:
+        raise ValueError("endpoints must be >= 2")
+    max_fan_out = max(m.fan_out for m in cfg.mixes)
+    if max_fan_out > cfg.endpoints - 1:
+        raise ValueError("fan_out must be < endpoints")
+
+    router_channels = BENCH_CHANNELS[: cfg.routers]
+    mix_sequence = _build_mix_sequence(cfg, router_channels)
+
+    # -----------------------------
+    # Topology
+    # -----------------------------
+    hub_ingress, hub_egress = _pick_hub_ports(cfg)
+    hub_inproc = f"inproc://bench.ack_hub.{hub_ingress}"
+    hub = AckHub(
+        "127.0.0.1",
+        ingress_port=hub_ingress,
+        egress_port=hub_egress,
+        shards=cfg.ack_shards,
+        inproc_address=hub_inproc,
+    )
+
+    routers = []
+    channels: dict[str, ChannelConfig] = {}
+    for i, ch_name in enumerate(router_channels):
+        ingress, egress = _pick_port_block(cfg, i)
+        routers.append(
+            ChannelRouter(
+                ch_name,
+                host="127.0.0.1",
+                router_port=ingress,
+                module_egress_port=egress,
+                ack_hub_address=hub_inproc,
+            )
+        )
+        channels[ch_name] = ChannelConfig(
+            name=ch_name,
+            router_port=ingress,
+            inbound_delivery=InboundDelivery.DIRECTED,
+            inbound_port=egress,
+            ack_port=hub_egress,
+        )
+
+    module_ids = [f"bench.ep.{j}" for j in range(cfg.endpoints)]
+    endpoints = [
+        ModuleEndpoint(
+            MultiChannelEndpointConfig(
+                module_id=module_id,
+                channels=dict(channels),
+                host="127.0.0.1",
+                poll_timeout_ms=5,
+                trace_sample_rate=cfg.trace_sample_rate,
+                ack_shards=cfg.ack_shards,
+            )
+        )
+        for module_id in module_ids
+    ]
+
+    collector = _Collector()
+    stop_evt = threading.Event()
+
+    def drain(ep) -> None:
+        while not stop_evt.is_set():
+            got = False
+            for msg in ep.drain_incoming(max_items=256):
+                got = True
+                sent_ns = msg.payload.get("bench_sent_ns")
+                if sent_ns is not None:
+                    collector.on_delivery(sent_ns, time.perf_counter_ns())
+                if msg.trace is not None:
+                    # No handler in the harness: close the trace at drain time
+                    msg.trace.stamp(Hop.HANDLER_START)
+                    msg.trace.stamp(Hop.HANDLER_END)
+                    hop_latency_stats().record(msg.trace)
+            for ack in ep.drain_acks(max_items=256):
+                got = True
+                collector.on_ack(ack.correlation_id, ack.ack_type, time.perf_counter_ns())
+            if not got:
+                time.sleep(0.0005)
+
+    hop_latency_stats().reset()
+    hub.start()
+    for r in routers:
+        r.start()
+    for ep in endpoints:
+        ep.start()
+
+    drainers = [
+        threading.Thread(target=drain, args=(ep,), name=f"BenchDrain[{ep.cfg.module_id}]", daemon=True)
+        for ep in endpoints
+    ]
+    for t in drainers:
+        t.start()
+
+    time.sleep(cfg.warmup_s)
+
+    # -----------------------------
+    # Drive load
+    # -----------------------------
+    per_sender = [mix_sequence[j::cfg.endpoints] for j in range(cfg.endpoints)]
+    per_sender_rate = cfg.rate / cfg.endpoints if cfg.rate > 0 else 0.0
+    expected_deliveries = sum(m.fan_out for m in mix_sequence)
+
+    def sender(index: int) -> None:
+        ep = endpoints[index]
+        source = module_ids[index]
+        others = [m for m in module_ids if m != source]
+        interval = 1.0 / per_sender_rate if per_sender_rate else 0.0
+        next_at = time.perf_counter()
+
+        for n, mix in enumerate(per_sender[index]):
+            channel = mix.channel or router_channels[n % len(router_channels)]
+            start = (index + n) % len(others)
+            targets = [others[(start + k) % len(others)] for k in range(mix.fan_out)]
+
+            msg = CognitiveMessage.create(
+                schema_version=str(CognitiveMessage.get_schema_version()),
+                msg_type="BENCH_LOAD",
+                msg_version="0.1.0",
+                source=source,
+                targets=targets,
+                context_tag=mix.name,
+                correlation_id=None,
+                payload={"pad": "x" * mix.payload_bytes},
+                priority=mix.priority,
+                delivery=mix.ack_policy,
+            )
+
+            t_ns = time.perf_counter_ns()
+            msg.payload["bench_sent_ns"] = t_ns
+            collector.on_send(msg.message_id, mix.ack_policy, t_ns)
+            ep.send(channel, targets[0], msg.to_bytes())
+
+            if interval:
+                next_at += interval
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+    rss_before = rss_bytes()
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+
+    senders = [
+        threading.Thread(target=sender, args=(j,), name=f"BenchSend[{j}]", daemon=True)
+        for j in range(cfg.endpoints)
+    ]
+    for t in senders:
+        t.start()
+    for t in senders:
+        t.join()
+    send_done = time.perf_counter()
+
+    deadline = send_done + cfg.drain_timeout_s
+    while time.perf_counter() < deadline:
+        with collector._lock:
+            if collector.deliveries >= expected_deliveries:
+                break
+        time.sleep(0.01)
+
+    wall = time.perf_counter() - wall_before
+    cpu = time.process_time() - cpu_before
+    rss_after = rss_bytes()
+
+    # Allow trailing ACKs to land before shutdown
+    time.sleep(0.2)
+    stop_evt.set()
+    for t in drainers:
+        t.join(timeout=1.0)
+    for ep in endpoints:
+        ep.stop()
+    for r in routers:
+        r.stop()
+    hub.stop()
+
+    with collector._lock:
+        deliveries = collector.deliveries
+        results = {
+            "messages_sent": cfg.messages,
+            "expected_deliveries": expected_deliveries,
+            "deliveries": deliveries,
+            "lost": max(0, expected_deliveries - deliveries),
+            "send_phase_s": round(send_done - wall_before, 6),
+            "duration_s": round(wall, 6),
+            "msgs_per_s": round(cfg.messages / wall, 2) if wall else 0.0,
+            "deliveries_per_s": round(deliveries / wall, 2) if wall else 0.0,
+            "e2e_latency": summarize_ns(collector.e2e_ns),
+            "router_ack_latency": summarize_ns(collector.router_ack_ns),
+            "delivered_ack_latency": summarize_ns(collector.delivered_ack_ns),
+            "ack_completion_latency": summarize_ns(collector.completion_ns),
+            "cpu_s": round(cpu, 6),
+            "cpu_us_per_msg": round(cpu / cfg.messages * 1e6, 3) if cfg.messages else 0.0,
+            "rss_before_bytes": rss_before,
+            "rss_after_bytes": rss_after,
+            "rss_growth_bytes": rss_after - rss_before,
+        }
+
+    if cfg.trace_sample_rate > 0:
+        results["hop_latency_us"] = hop_latency_stats().snapshot()
+
+    return results
+
+
+def _load_mixes(path: str) -> list[MessageMix]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("mixes", [])
+    return [MessageMix(**item) for item in data]
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="CMB load generator / benchmark")
+    parser.add_argument("--routers", type=int, default=1, help="Number of channel routers (1-7)")
+    parser.add_argument("--endpoints", type=int, default=4, help="Number of synthetic endpoints")
+    parser.add_argument("--messages", type=int, default=2000, help="Total messages to send")
+    parser.add_argument("--rate", type=float, default=0.0, help="Target msgs/s (0 = unthrottled)")
+    parser.add_argument("--payload-bytes", type=int, default=256)
+    parser.add_argument("--fan-out", type=int, default=1)
+    parser.add_argument("--priority", type=int, default=50)
+    parser.add_argument("--channel", default=None, help="Pin traffic to one channel")
+    parser.add_argument("--ack-policy", default="END_TO_END", choices=["END_TO_END", "ROUTER_ONLY", "NONE"])
+    parser.add_argument("--mix-file", default=None, help="JSON list of MessageMix objects")
+    parser.add_argument("--base-port", type=int, default=16000)
+    parser.add_argument("--drain-timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--ack-shards", type=int, default=1, help="ACK hub egress shards")
+    parser.add_argument("--trace-sample-rate", type=float, default=0.0, help="Hop-trace sampling rate (0-1)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL results file (appended)")
+    parser.add_argument("--label", default="", help="Free-form tag stored with the record")
+    args = parser.parse_args(argv)
+
+    if args.mix_file:
+        mixes = _load_mixes(args.mix_file)
+    else:
+        mixes = [
+            MessageMix(
+                channel=args.channel,
+                payload_bytes=args.payload_bytes,
+                fan_out=args.fan_out,
+                priority=args.priority,
+                ack_policy=args.ack_policy,
+            )
+        ]
+
+    cfg = LoadConfig(
+        routers=args.routers,
+        endpoints=args.endpoints,
+        messages=args.messages,
+        rate=args.rate,
+        drain_timeout_s=args.drain_timeout,
+        base_port=args.base_port,
+        seed=args.seed,
+        trace_sample_rate=args.trace_sample_rate,
+        ack_shards=args.ack_shards,
+        mixes=mixes,
+    )
+
+    output = Path(args.output).resolve()
+    repo_cwd = os.getcwd()
+
+    # Keep router/endpoint logs out of the repo's logs/system.jsonl
+    with tempfile.TemporaryDirectory(prefix="cmb_bench_") as scratch:
+        os.chdir(scratch)
+        try:
+            results = run_load(cfg)
+        finally:
+            os.chdir(repo_cwd)
+
+    record = write_result(output, "cmb_load", asdict(cfg), results, label=args.label)
+    print(json.dumps(record["results"], indent=2))
+    return record
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Module: compression.py
+Location: tools/bench/
+
+Payload compression benchmark: ratio and CPU cost per codec / dictionary.
+
+For plan, task-queue and intent payloads of a few sizes it measures, per
+setting (zlib, zlib + schema dictionary, zstd [+ dictionary] when the
+zstandard package is installed):
+
+- ratio: compressed / raw bytes
+- compress / decompress: microseconds per payload
+- break_even_MBps: link speed above which compressing costs more time than
+  the bytes it saves (the point where ChannelCompressor switches itself off)
+
+Usage (from repository root):
+    python -m tools.bench.compression
+    python -m tools.bench.compression --count 2000 --dictionary-samples 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from src.core.cmb.compression import (
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    DEFAULT_DICTIONARY_ID,
+    codec_available,
+    compress_bytes,
+    decompress_bytes,
+    get_dictionary,
+    train_dictionary,
+)
+from tools.bench.stats import write_result
+
+
+DEFAULT_OUTPUT = "artifacts/bench/compression.jsonl"
+
+SIZES = {"small": 3, "medium": 20, "large": 200}
+
+
+def _plan(steps: int) -> dict:
+    return {
+        "plan": {
+            "plan_id": str(uuid.uuid4()),
+            "created_at": time.time(),
+            "steps": [
+                {"step_id": f"step-{i}", "description": f"Execute sub-goal {i} of the directive",
+                 "assigned_module": "EXECUTIVE"}
+                for i in range(steps)
+            ],
+            "status": "READY",
+        }
+    }
+
+
+def _task_queue(tasks: int) -> dict:
+    return {
+        "task_queue": {
+            "queue_id": str(uuid.uuid4()),
+            "created_at": time.time(),
+            "task_count": tasks,
+            "tasks": [
+                {"task_id": str(uuid.uuid4()), "task_index": i, "name": f"Execute sub-goal {i}",
+                 "assigned_module": "behavior", "created_at": time.time(), "status": "QUEUED"}
+                for i in range(tasks)
+            ],
+        }
+    }
+
+
+def _intent(entities: int) -> dict:
+    return {
+        "intent_id": str(uuid.uuid4()),
+        "directive_text": "move the arm to the red block and report back",
+        "directive_source": "GUI",
+        "intent": {
+            "intent_type": "MANIPULATE",
+            "confidence": 0.92,
+            "entities": {f"entity_{i}": {"type": "object", "value": f"block-{i}"} for i in range(entities)},
+            "constraints": {},
+        },
+        "nlp_received_at": time.time(),
+    }
+
+
+PAYLOADS = {"plan": _plan, "task_queue": _task_queue, "intent": _intent}
+
+
+def _settings(trained: bytes) -> dict:
+    settings = {
+        "zlib": (CODEC_ZLIB, 6, None),
+        "zlib+schema_dict": (CODEC_ZLIB, 6, get_dictionary(DEFAULT_DICTIONARY_ID)),
+        "zlib+trained_dict": (CODEC_ZLIB, 6, trained),
+    }
+    if codec_available(CODEC_ZSTD):
+        settings["zstd"] = (CODEC_ZSTD, 3, None)
+        settings["zstd+trained_dict"] = (CODEC_ZSTD, 3, trained)
+    return settings
+
+
+def measure(raw: list[bytes], codec: str, level: int, dictionary: Optional[bytes]) -> dict:
+    start = time.perf_counter_ns()
+    packed = [compress_bytes(r, codec, level, dictionary) for r in raw]
+    comp_ns = time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    for p in packed:
+        decompress_bytes(p, codec, dictionary)
+    decomp_ns = time.perf_counter_ns() - start
+
+    raw_bytes = sum(len(r) for r in raw)
+    saved = raw_bytes - sum(len(p) for p in packed)
+    cost_s = (comp_ns + decomp_ns) / 1e9
+    return {
+        "ratio": round((raw_bytes - saved) / raw_bytes, 4),
+        "compress_us": round(comp_ns / len(raw) / 1e3, 2),
+        "decompress_us": round(decomp_ns / len(raw) / 1e3, 2),
+        "break_even_MBps": round(saved / cost_s / 1e6, 1) if cost_s and saved > 0 else 0.0,
+    }
+
+
+def run_compression(args: argparse.Namespace) -> dict:
+    samples = [
+        json.dumps(make(SIZES["medium"])).encode("utf-8")
+        for make in PAYLOADS.values()
+        for _ in range(args.dictionary_samples)
+    ]
+    trained = train_dictionary(samples)
+    settings = _settings(trained)
+
+    results = {}
+    for kind, make in PAYLOADS.items():
+        for size_name, n in SIZES.items():
+            raw = [json.dumps(make(n)).encode("utf-8") for _ in range(args.count)]
+            key = f"{kind}/{size_name}"
+            results[key] = {"raw_bytes": len(raw[0])}
+            for name, (codec, level, dictionary) in settings.items():
+                results[key][name] = measure(raw, codec, level, dictionary)
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Payload compression ratio / CPU benchmark")
+    parser.add_argument("--count", type=int, default=500, help="Payloads per kind and size")
+    parser.add_argument("--dictionary-samples", type=int, default=50, help="Samples per kind for the trained dictionary")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL results file (appended)")
+    parser.add_argument("--label", default="", help="Free-form tag stored with the record")
+    args = parser.parse_args(argv)
+
+    results = run_compression(args)
+    config = {"count": args.count, "dictionary_samples": args.dictionary_samples, "sizes": SIZES}
+    write_result(Path(args.output).resolve(), "compression", config, results, label=args.label)
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+"""
+Module: delivery_policy.py
+Location: tools/bench/
+
+Delivery policy benchmark: END_TO_END vs ROUTER_ONLY vs NONE on DAC.
+
+Runs the cmb_load harness once per policy with all traffic pinned to the
+DAC channel (telemetry-sized messages) and reports per policy:
+
+- msgs/s and CPU time per message
+- end-to-end latency percentiles
+- speedup in msgs/s relative to END_TO_END
+
+Usage (from repository root):
+    python -m tools.bench.delivery_policy
+    python -m tools.bench.delivery_policy --messages 20000 --repeats 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from tools.bench.cmb_load import BENCH_CHANNELS, LoadConfig, MessageMix, run_load
+from tools.bench.stats import write_result
+
+
+DEFAULT_OUTPUT = "artifacts/bench/delivery_policy.jsonl"
+
+POLICIES = ["END_TO_END", "ROUTER_ONLY", "NONE"]
+CHANNEL = "DAC"
+
+
+def run_policy(policy: str, args: argparse.Namespace, base_port: int) -> dict:
+    cfg = LoadConfig(
+        routers=BENCH_CHANNELS.index(CHANNEL) + 1,
+        endpoints=args.endpoints,
+        messages=args.messages,
+        base_port=base_port,
+        mixes=[MessageMix(name=policy, channel=CHANNEL, payload_bytes=args.payload_bytes, ack_policy=policy)],
+    )
+    return run_load(cfg)
+
+
+def run_delivery_policy(args: argparse.Namespace) -> dict:
+    results = {}
+    for i, policy in enumerate(POLICIES):
+        runs = [
+            run_policy(policy, args, args.base_port + 100 * (i * args.repeats + r))
+            for r in range(args.repeats)
+        ]
+        results[policy] = {
+            "msgs_per_s": statistics.median(r["msgs_per_s"] for r in runs),
+            "cpu_us_per_msg": statistics.median(r["cpu_us_per_msg"] for r in runs),
+            "e2e_p50_us": statistics.median(r["e2e_latency"]["p50_us"] for r in runs),
+            "e2e_p99_us": statistics.median(r["e2e_latency"]["p99_us"] for r in runs),
+            "lost": max(r["lost"] for r in runs),
+        }
+
+    baseline = results["END_TO_END"]["msgs_per_s"]
+    for summary in results.values():
+        summary["speedup"] = round(summary["msgs_per_s"] / baseline, 3) if baseline else None
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Delivery policy throughput benchmark (DAC channel)")
+    parser.add_argument("--messages", type=int, default=5000, help="Messages per run")
+    parser.add_argument("--endpoints", type=int, default=4)
+    parser.add_argument("--payload-bytes", type=int, default=256)
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--base-port", type=int, default=17000)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL results file (appended)")
+    parser.add_argument("--label", default="", help="Free-form tag stored with the record")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output).resolve()
+    repo_cwd = os.getcwd()
+
+    # Keep router/endpoint logs out of the repo's logs/system.jsonl
+    with tempfile.TemporaryDirectory(prefix="cmb_bench_") as scratch:
+        os.chdir(scratch)
+        try:
+            results = run_delivery_policy(args)
+        finally:
+            os.chdir(repo_cwd)
+
+    config = {
+        "channel": CHANNEL,
+        "messages": args.messages,
+        "endpoints": args.endpoints,
+        "payload_bytes": args.payload_bytes,
+        "repeats": args.repeats,
+    }
+    write_result(output, "delivery_policy", config, results, label=args.label)
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,144 @@
+"""
+Module: log_sink.py
+Location: tools/bench/
+
+Log sink benchmark: synchronous FileLogSink vs AsyncFileLogSink, plus the
+cost of the same calls with their level disabled (async_disabled) and with
+the default per-event rate limits (async_limited).
+
+Replays the logging a ModuleEndpoint does per message (transaction
+created, sent, received ACK, created inbound transaction) through a
+LogManager + Logger from one or more threads and reports per sink:
+
+- caller_us_per_msg: time spent in logger calls per message on the
+  calling thread (the cost on the message path)
+- drain_s: time until everything is on disk (flush barrier for the async
+  sink)
+- entries_per_s: end-to-end entry throughput
+- dropped: entries dropped by the async sink's overflow policy
+- written: entries that reached the file
+
+Usage (from repository root):
+    python -m tools.bench.log_sink
+    python -m tools.bench.log_sink --messages 50000 --threads 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.core.logging.async_file_log_sink import AsyncFileLogSink
+from src.core.logging.file_log_sink import FileLogSink
+from src.core.logging.log_manager import LogManager, Logger
+from src.core.logging.log_rate_limit import LogRateLimiter
+from src.core.logging.log_severity import LogSeverity
+from tools.bench.stats import write_result
+
+
+DEFAULT_OUTPUT = "artifacts/bench/log_sink.jsonl"
+
+EVENTS_PER_MESSAGE = (
+    "ENDPOINT_TRANSACTION_CREATED",
+    "ENDPOINT_SENT_MESSAGE",
+    "ENDPOINT_RECEIVED_ACK",
+    "ENDPOINT_CREATED_TRANSACTION",
+)
+CHANNELS = ["CC", "SMC", "VB", "BFC", "DAC", "IC", "TC"]
+
+
+def _channels_payload() -> dict:
+    return {"channels": list(CHANNELS)}
+
+
+def _log_messages(logger: Logger, messages: int, timings: list) -> None:
+    start = time.perf_counter_ns()
+    for n in range(messages):
+        for event_type in EVENTS_PER_MESSAGE:
+            logger.info(
+                event_type=event_type,
+                message="ModuleEndpoint %s channel: %s message_id=%s",
+                args=("bench.module", "CC", n),
+                payload=_channels_payload,
+            )
+    timings.append(time.perf_counter_ns() - start)
+
+
+def run_sink(kind: str, path: Path, args: argparse.Namespace) -> dict:
+    sink = FileLogSink(str(path)) if kind == "sync" else AsyncFileLogSink(str(path))
+    limiter = LogRateLimiter() if kind == "async_limited" else None
+    manager = LogManager(min_severity=LogSeverity.INFO, rate_limiter=limiter)
+    manager.register_sink(sink)
+    if kind == "async_disabled":
+        manager.set_level(LogSeverity.WARNING)
+
+    timings: list = []
+    threads = [
+        threading.Thread(target=_log_messages, args=(Logger(f"bench.{i}", manager), args.messages, timings))
+        for i in range(args.threads)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if kind != "sync":
+        sink.flush()
+    drain_s = time.perf_counter() - start
+    sink.close()
+
+    entries = args.messages * args.threads * len(EVENTS_PER_MESSAGE)
+    with open(path, encoding="utf-8") as f:
+        written = sum(1 for _ in f)
+    return {
+        "caller_us_per_msg": round(statistics.mean(timings) / args.messages / 1e3, 3),
+        "drain_s": round(drain_s, 3),
+        "entries_per_s": round(entries / drain_s),
+        "dropped": sink.dropped if kind != "sync" else 0,
+        "written": written,
+    }
+
+
+def run_log_sink(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="cmb_log_bench_") as scratch:
+        for kind in ("sync", "async", "async_disabled", "async_limited"):
+            runs = [run_sink(kind, Path(scratch) / f"{kind}_{r}.jsonl", args) for r in range(args.repeats)]
+            results[kind] = {key: statistics.median(r[key] for r in runs) for key in runs[0]}
+
+    sync_us = results["sync"]["caller_us_per_msg"]
+    for kind in ("async", "async_disabled", "async_limited"):
+        results[kind]["caller_speedup"] = round(sync_us / max(results[kind]["caller_us_per_msg"], 1e-3), 2)
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Per-message logging overhead: sync vs async file sink")
+    parser.add_argument("--messages", type=int, default=20000, help="Messages per thread")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL results file (appended)")
+    parser.add_argument("--label", default="", help="Free-form tag stored with the record")
+    args = parser.parse_args(argv)
+
+    results = run_log_sink(args)
+    config = {
+        "messages": args.messages,
+        "threads": args.threads,
+        "repeats": args.repeats,
+        "entries_per_message": len(EVENTS_PER_MESSAGE),
+    }
+    write_result(Path(args.output).resolve(), "log_sink", config, results, label=args.label)
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
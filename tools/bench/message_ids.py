@@ -0,0 +1,109 @@
+"""
+Module: message_ids.py
+Location: tools/bench/
+
+Message id benchmark: uuid4 strings vs compact time-ordered ids.
+
+For each generator it measures:
+
+- generation: ns per id (single thread)
+- dict insert / lookup: ns per operation on a dict keyed by the ids, as done
+  by TransactionRegistry
+- size: bytes per id in JSON payloads (string form) and in binary frames
+
+Usage (from repository root):
+    python -m tools.bench.message_ids
+    python -m tools.bench.message_ids --count 500000 --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.core.messages.message_id import MonotonicIdGenerator, UuidIdGenerator, id_to_bytes
+from tools.bench.stats import write_result
+
+
+DEFAULT_OUTPUT = "artifacts/bench/message_ids.jsonl"
+
+GENERATORS: dict[str, Callable[[], object]] = {
+    "uuid4": UuidIdGenerator,
+    "monotonic64": MonotonicIdGenerator,
+}
+
+
+def _time_ns(fn: Callable[[], None]) -> int:
+    start = time.perf_counter_ns()
+    fn()
+    return time.perf_counter_ns() - start
+
+
+def measure_generator(name: str, count: int) -> dict:
+    gen = GENERATORS[name]()
+    next_id = gen.next_id
+    ids: list[str] = []
+
+    gen_ns = _time_ns(lambda: ids.extend(next_id() for _ in range(count)))
+
+    table: dict[str, int] = {}
+
+    def insert() -> None:
+        for i, key in enumerate(ids):
+            table[key] = i
+
+    def lookup() -> None:
+        for key in ids:
+            table[key]
+
+    insert_ns = _time_ns(insert)
+    lookup_ns = _time_ns(lookup)
+
+    sample = ids[0]
+    binary = len(id_to_bytes(sample)) if name != "uuid4" else 16
+    return {
+        "generate_ns": gen_ns / count,
+        "dict_insert_ns": insert_ns / count,
+        "dict_lookup_ns": lookup_ns / count,
+        "string_bytes": len(sample),
+        "binary_bytes": binary,
+        "ordered": ids == sorted(ids),
+    }
+
+
+def run_message_ids(count: int, repeats: int) -> dict:
+    results = {}
+    for name in GENERATORS:
+        runs = [measure_generator(name, count) for _ in range(repeats)]
+        summary = {
+            key: statistics.median(r[key] for r in runs)
+            for key in ("generate_ns", "dict_insert_ns", "dict_lookup_ns")
+        }
+        summary.update({k: runs[-1][k] for k in ("string_bytes", "binary_bytes", "ordered")})
+        results[name] = summary
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Message id generation / dict benchmark")
+    parser.add_argument("--count", type=int, default=200_000, help="Ids per run")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL results file (appended)")
+    parser.add_argument("--label", default="", help="Free-form tag stored with the record")
+    args = parser.parse_args(argv)
+
+    results = run_message_ids(args.count, args.repeats)
+
+    config = {"count": args.count, "repeats": args.repeats}
+    write_result(Path(args.output).resolve(), "message_ids", config, results, label=args.label)
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,220 @@
+"""
+Module: startup.py
+Location: tools/bench/
+
+Module cold-start benchmark with a startup-time budget.
+
+For each module it measures, in fresh interpreters:
+
+- import time: cumulative time of the module's own import, taken from
+  ``python -X importtime`` (also reports the heaviest transitive imports)
+- time-to-ready: wall time from spawning ``python -m <module>`` until the
+  module logs its readiness event (e.g. NLP_START) to logs/system.jsonl
+
+Medians over --repeats runs are compared with tools/bench/startup_budgets.json;
+with --check the process exits non-zero when any module is over budget, so
+a regression in startup (e.g. a heavy SDK imported at module load) fails CI.
+
+Modules run in a scratch directory, so their logs stay out of the repo.
+No router is needed: ZMQ connects are asynchronous.
+
+Usage (from repository root):
+    python -m tools.bench.startup --check
+    python -m tools.bench.startup --module nlp --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from tools.bench.stats import write_result
+
+
+@dataclass(frozen=True)
+class StartupTarget:
+    name: str
+    module: str
+    ready_event: str
+
+
+TARGETS = {
+    t.name: t
+    for t in (
+        StartupTarget("nlp", "src.core.modules.nlp_module", "NLP_START"),
+        StartupTarget("planner", "src.core.modules.planner_module", "PLANNER_START"),
+        StartupTarget("aem", "src.core.modules.aem", "AEM_READY"),
+    )
+}
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BUDGETS = Path(__file__).with_name("startup_budgets.json")
+DEFAULT_OUTPUT = "artifacts/bench/startup.jsonl"
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+# ----------------------------
+# Import time (-X importtime)
+# ----------------------------
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def measure_import(target: StartupTarget, scratch: str, top: int = 5) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target.module}"],
+        cwd=scratch,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {target.module} failed:\n{proc.stderr[-2000:]}")
+
+    rows = parse_importtime(proc.stderr)
+    total_us = next(cum for name, _, cum in rows if name == target.module)
+    heaviest = sorted(rows, key=lambda r: r[1], reverse=True)[:top]
+    return {
+        "import_ms": total_us / 1000.0,
+        "heaviest_self_ms": {name: self_us / 1000.0 for name, self_us, _ in heaviest},
+    }
+
+
+# ----------------------------
+# Time to ready
+# ----------------------------
+
+def _ready_at(log_path: Path, event_type: str) -> Optional[float]:
+    try:
+        text = log_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in text.splitlines():
+        if event_type not in line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get("event_type") == event_type:
+            return record["timestamp"]
+    return None
+
+
+def measure_ready(target: StartupTarget, scratch: str, timeout_s: float = 30.0) -> float:
+    """Milliseconds from spawn to the module's readiness log event."""
+    log_path = Path(scratch) / "logs" / "system.jsonl"
+    if log_path.exists():
+        log_path.unlink()
+
+    spawned_at = time.time()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", target.module],
+        cwd=scratch,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            ready = _ready_at(log_path, target.ready_event)
+            if ready is not None:
+                return (ready - spawned_at) * 1000.0
+            if proc.poll() is not None:
+                raise RuntimeError(f"{target.module} exited with {proc.returncode} before ready")
+            time.sleep(0.01)
+        raise RuntimeError(f"{target.module} not ready within {timeout_s}s")
+    finally:
+        if proc.poll() is None:
+            proc.send_signal(signal.SIGINT)
+            try:
+                proc.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+
+# ----------------------------
+# Budget check
+# ----------------------------
+
+def run_startup(targets: list[StartupTarget], repeats: int) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="startup_bench_") as scratch:
+        for target in targets:
+            imports = [measure_import(target, scratch) for _ in range(repeats)]
+            ready = [measure_ready(target, scratch) for _ in range(repeats)]
+            results[target.name] = {
+                "module": target.module,
+                "import_ms": statistics.median(r["import_ms"] for r in imports),
+                "ready_ms": statistics.median(ready),
+                "heaviest_self_ms": imports[-1]["heaviest_self_ms"],
+            }
+    return results
+
+
+def check_budgets(results: dict, budgets: dict) -> list[str]:
+    """Return human-readable budget violations (empty when within budget)."""
+    violations = []
+    for name, measured in results.items():
+        for metric, limit in budgets.get(name, {}).items():
+            value = measured.get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{name}: {metric} {value:.1f} > budget {limit:.1f}")
+    return violations
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Module startup benchmark / budget check")
+    parser.add_argument("--module", action="append", choices=sorted(TARGETS), help="Module(s) to measure (default: all)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budgets", default=str(DEFAULT_BUDGETS), help="JSON budgets file")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a module is over budget")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL results file (appended)")
+    parser.add_argument("--label", default="", help="Free-form tag stored with the record")
+    args = parser.parse_args(argv)
+
+    targets = [TARGETS[n] for n in (args.module or sorted(TARGETS))]
+    results = run_startup(targets, args.repeats)
+
+    config = {"repeats": args.repeats, "targets": [asdict(t) for t in targets]}
+    write_result(Path(args.output).resolve(), "startup", config, results, label=args.label)
+    print(json.dumps(results, indent=2))
+
+    budgets = json.loads(Path(args.budgets).read_text(encoding="utf-8"))
+    violations = check_budgets(results, budgets)
+    for v in violations:
+        print(f"[startup] OVER BUDGET {v}")
+
+    return 1 if (args.check and violations) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Module: stats.py
+Location: tools/bench/
+
+Shared helpers for benchmark harnesses:
+- percentile summaries of latency samples
+- process CPU / RSS probes
+- append-only JSONL result records for regression tracking across commits
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(round(q / 100.0 * len(sorted_values), 9)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_ns(samples_ns: Iterable[int]) -> dict[str, Any]:
+    """Summarize nanosecond samples as microsecond percentiles."""
+    values = sorted(v / 1000.0 for v in samples_ns)
+    if not values:
+        return {"count": 0}
+
+    summary: dict[str, Any] = {"count": len(values)}
+    for q in PERCENTILES:
+        summary[f"p{q:g}_us"] = round(percentile(values, q), 3)
+    summary["mean_us"] = round(sum(values) / len(values), 3)
+    summary["max_us"] = round(values[-1], 3)
+    return summary
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process (best effort)."""
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+
+    try:
+        import resource
+
+        # ru_maxrss is KiB on Linux, bytes on macOS; peak rather than current
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if platform.system() == "Darwin" else rss * 1024
+    except Exception:
+        return 0
+
+
+def git_commit(cwd: Optional[str] = None) -> Optional[str]:
+    """Short hash of HEAD, or None outside a git checkout."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def write_result(path: str | Path, benchmark: str, config: dict, results: dict, *, label: str = "") -> dict:
+    """
+    Append one benchmark record to a JSONL results file.
+
+    Each record carries the commit and host so runs can be compared over time.
+    """
+    record = {
+        "benchmark": benchmark,
+        "label": label,
+        "timestamp": time.time(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": config,
+        "results": results,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+    return record